@@ -0,0 +1,212 @@
+# -*- coding: utf-8 -*-
+
+"""
+Copyright 2025 kichiro-kun (Kei)
+Apache license, version 2.0 (Apache-2.0 license)
+"""
+
+__all__: list[str] = [
+    'KeyLoadHandle',
+    'BatchKeyLoader',
+]
+
+__author__ = 'kichiro-kun (Kei)'
+__version__ = '0.1.0'
+
+# =======================================================================================
+import threading
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Sequence
+
+from database_core.single_connection_database_component.single_connection_database \
+    import SingleConnectionDataBase
+from dbms_interaction.row_factory_component.row_factory import RowConverterFactory
+from query_core.query_builder_component.query_builder import QueryBuilder
+
+from shared.constants.global_configuration import DEFAULT_KEY_LOADER_BATCH_SIZE
+from shared.exceptions.common import InvalidArgumentTypeError, InvalidArgumentValueError
+from shared.utils.toolkit import ToolKit
+
+
+# _______________________________________________________________________________________
+class KeyLoadHandle:
+
+    # -----------------------------------------------------------------------------------
+    def __init__(self, loader: 'BatchKeyLoader', key: Hashable) -> None:
+        self.__loader: BatchKeyLoader = loader
+        self.__key: Hashable = key
+
+    # -----------------------------------------------------------------------------------
+    def get_key(self) -> Hashable:
+        return self.__key
+
+    # -----------------------------------------------------------------------------------
+    def get(self) -> Optional[Any]:
+        # Первое обращение выбирает одним запросом все ключи, накопленные к этому моменту
+        return self.__loader.resolve(key=self.__key)
+
+
+# _______________________________________________________________________________________
+class BatchKeyLoader:
+
+    # -----------------------------------------------------------------------------------
+    def __init__(self, database: SingleConnectionDataBase, table: str, key_column: str,
+                 columns: Sequence[str] = ('*',), key_position: int = 0,
+                 max_batch_size: int = DEFAULT_KEY_LOADER_BATCH_SIZE) -> None:
+        ToolKit.ensure_instance(
+            obj=database,
+            expected_type=SingleConnectionDataBase,
+            arg_name='database'
+        )
+        for arg_name, value in (('table', table), ('key_column', key_column)):
+            ToolKit.ensure_instance(
+                obj=value,
+                expected_type=str,
+                arg_name=arg_name
+            )
+        for arg_name, value in (('key_position', key_position), ('max_batch_size', max_batch_size)):
+            ToolKit.ensure_instance(
+                obj=value,
+                expected_type=int,
+                arg_name=arg_name
+            )
+
+        if not table or not key_column or not columns:
+            raise InvalidArgumentValueError(
+                "Error! Arguments: *table*, *key_column* and *columns* - should not be empty!"
+            )
+
+        if max_batch_size <= 0:
+            raise InvalidArgumentValueError(
+                f"Error! Argument: *max_batch_size* - should be positive! But given: *{max_batch_size}*!"
+            )
+
+        columns = tuple(columns)
+
+        # Ключ нужен в результате, чтобы раздать строки вызывающим
+        if '*' not in columns:
+            if key_column not in columns:
+                columns = (key_column, *columns)
+
+            key_position = columns.index(key_column)
+
+        self.__database: SingleConnectionDataBase = database
+        self.__table: str = table
+        self.__key_column: str = key_column
+        self.__columns: Sequence[str] = columns
+        self.__key_position: int = key_position
+        self.__max_batch_size: int = max_batch_size
+
+        self.__lock = threading.RLock()
+
+        # Память области: каждый ключ выбирается один раз, отсутствующий ключ запоминается как None
+        self.__memo: Dict[Hashable, Optional[Any]] = {}
+        self.__pending_keys: Dict[Hashable, None] = {}
+
+    # -----------------------------------------------------------------------------------
+    def load(self, key: Hashable) -> KeyLoadHandle:
+        self.__ensure_key(key=key)
+
+        with self.__lock:
+            if key not in self.__memo:
+                self.__pending_keys[key] = None
+
+        return KeyLoadHandle(loader=self, key=key)
+
+    # -----------------------------------------------------------------------------------
+    def load_many(self, keys: Iterable[Hashable]) -> List[Optional[Any]]:
+        handles: List[KeyLoadHandle] = [self.load(key=key) for key in keys]
+
+        return [handle.get() for handle in handles]
+
+    # -----------------------------------------------------------------------------------
+    def resolve(self, key: Hashable) -> Optional[Any]:
+        self.__ensure_key(key=key)
+
+        with self.__lock:
+            if key not in self.__memo:
+                # Ключ мог быть сброшен вместе с памятью области после вызова load
+                self.__pending_keys[key] = None
+                self.dispatch()
+
+            return self.__memo[key]
+
+    # -----------------------------------------------------------------------------------
+    def dispatch(self) -> int:
+        queries_count: int = 0
+
+        with self.__lock:
+            while self.__pending_keys:
+                batch: List[Hashable] = list(self.__pending_keys)[:self.__max_batch_size]
+                self.__load_batch(keys=batch)
+
+                for key in batch:
+                    del self.__pending_keys[key]
+
+                queries_count += 1
+
+        return queries_count
+
+    # -----------------------------------------------------------------------------------
+    def prime(self, key: Hashable, row: Optional[Any]) -> None:
+        self.__ensure_key(key=key)
+
+        # Строка, уже полученная другим запросом, не выбирается повторно
+        with self.__lock:
+            self.__memo[key] = row
+            self.__pending_keys.pop(key, None)
+
+    # -----------------------------------------------------------------------------------
+    def clear(self, key: Optional[Hashable] = None) -> None:
+        # После изменения строк память сбрасывается, чтобы не отдавать устаревшие данные
+        with self.__lock:
+            if key is None:
+                self.__memo.clear()
+                self.__pending_keys.clear()
+            else:
+                self.__memo.pop(key, None)
+
+    # -----------------------------------------------------------------------------------
+    def __enter__(self) -> 'BatchKeyLoader':
+        return self
+
+    # -----------------------------------------------------------------------------------
+    def __exit__(self, *exc_info: Any) -> None:
+        self.clear()
+
+    # -----------------------------------------------------------------------------------
+    def __load_batch(self, keys: Sequence[Hashable]) -> None:
+        query: str = QueryBuilder.build_key_lookup_query(
+            table=self.__table,
+            columns=self.__columns,
+            key_column=self.__key_column,
+            keys_count=len(keys),
+            placeholder=self.__database.query_param_placeholder
+        )
+
+        rows: Sequence[Any] = self.__database.execute_query_returns_all(*keys, query=query)
+
+        loaded_rows: Dict[Hashable, Any] = {}
+        for row in rows:
+            row_key: Hashable = RowConverterFactory.get_row_value(
+                row=row, column_name=self.__key_column, column_position=self.__key_position
+            )
+            loaded_rows.setdefault(row_key, row)
+
+        for key in keys:
+            self.__memo[key] = loaded_rows.get(key)
+
+    # -----------------------------------------------------------------------------------
+    @staticmethod
+    def __ensure_key(key: Hashable) -> None:
+        try:
+            hash(key)
+        except TypeError:
+            raise InvalidArgumentTypeError(
+                f"Error! Argument: *key* - should be a *Hashable*!\n"
+                f"But given: *{key}* - is Type of *{type(key).__name__}*!"
+            ) from None
+
+        if key is None:
+            raise InvalidArgumentValueError(
+                "Error! Argument: *key* - should not be None!"
+            )
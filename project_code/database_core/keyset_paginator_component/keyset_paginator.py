@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+
+"""
+Copyright 2025 kichiro-kun (Kei)
+Apache license, version 2.0 (Apache-2.0 license)
+"""
+
+__all__: list[str] = [
+    'KeysetPaginator',
+]
+
+__author__ = 'kichiro-kun (Kei)'
+__version__ = '0.1.2'
+
+# =======================================================================================
+from typing import Any, Iterable, Iterator, Optional, Sequence
+
+from database_core.single_connection_database_component.single_connection_database \
+    import SingleConnectionDataBase
+from dbms_interaction.row_factory_component.row_factory import RowConverterFactory
+from query_core.query_builder_component.query_builder import QueryBuilder
+
+from shared.constants.global_configuration import DEFAULT_KEYSET_PAGE_SIZE
+from shared.exceptions.common import InvalidArgumentValueError
+from shared.utils.toolkit import ToolKit
+
+
+# _______________________________________________________________________________________
+class KeysetPaginator(Iterable[Any]):
+
+    # -----------------------------------------------------------------------------------
+    def __init__(self, database: SingleConnectionDataBase, query: str, key_column: str,
+                 params: Sequence[Any] = (), page_size: int = DEFAULT_KEYSET_PAGE_SIZE,
+                 key_position: int = 0, descending: bool = False,
+                 timeout: Optional[float] = None) -> None:
+        ToolKit.ensure_instance(
+            obj=database,
+            expected_type=SingleConnectionDataBase,
+            arg_name='database'
+        )
+        for arg_name, value in (('query', query), ('key_column', key_column)):
+            ToolKit.ensure_instance(
+                obj=value,
+                expected_type=str,
+                arg_name=arg_name
+            )
+        for arg_name, value in (('page_size', page_size), ('key_position', key_position)):
+            ToolKit.ensure_instance(
+                obj=value,
+                expected_type=int,
+                arg_name=arg_name
+            )
+        ToolKit.ensure_instance(
+            obj=descending,
+            expected_type=bool,
+            arg_name='descending'
+        )
+
+        if page_size <= 0:
+            raise InvalidArgumentValueError(
+                f"Error! Argument: *page_size* - should be positive! But given: *{page_size}*!"
+            )
+
+        if not key_column:
+            raise InvalidArgumentValueError(
+                "Error! Argument: *key_column* - should not be empty!"
+            )
+
+        # Неподходящие исходный запрос или колонка ключа отклоняются сразу, а не на первой странице
+        QueryBuilder.build_keyset_page_query(
+            query=query,
+            key_column=key_column,
+            page_size=page_size,
+            placeholder=database.query_param_placeholder,
+            is_first_page=False,
+            descending=descending
+        )
+
+        self.__database: SingleConnectionDataBase = database
+        self.__query: str = query
+        self.__key_column: str = key_column
+        self.__params: tuple = tuple(params)
+        self.__page_size: int = page_size
+        self.__key_position: int = key_position
+        self.__descending: bool = descending
+        self.__timeout: Optional[float] = timeout
+
+        # Ключ последней отданной строки: по нему продолжается обход или строится ссылка на следующую страницу
+        self.__last_key: Any = None
+
+    # -----------------------------------------------------------------------------------
+    def fetch_page(self, after_key: Any = None) -> Sequence[Any]:
+        # Страница ищется по индексу ключа, а не пропуском OFFSET строк, поэтому её цена не растёт с глубиной
+        is_first_page: bool = after_key is None
+        page_query: str = QueryBuilder.build_keyset_page_query(
+            query=self.__query,
+            key_column=self.__key_column,
+            page_size=self.__page_size,
+            placeholder=self.__database.query_param_placeholder,
+            is_first_page=is_first_page,
+            descending=self.__descending
+        )
+        page_params: tuple = self.__params if is_first_page else (*self.__params, after_key)
+
+        page: Sequence[Any] = self.__database.execute_query_returns_all(
+            *page_params, query=page_query, timeout=self.__timeout
+        )
+
+        if page:
+            self.__last_key = RowConverterFactory.get_row_value(
+                row=page[-1], column_name=self.__key_column, column_position=self.__key_position
+            )
+
+        return page
+
+    # -----------------------------------------------------------------------------------
+    def iter_pages(self, after_key: Any = None) -> Iterator[Sequence[Any]]:
+        while True:
+            page: Sequence[Any] = self.fetch_page(after_key=after_key)
+
+            if page:
+                yield page
+
+            # Неполная страница - последняя, лишний пустой запрос не выполняется
+            if len(page) < self.__page_size:
+                return
+
+            after_key = self.__last_key
+
+    # -----------------------------------------------------------------------------------
+    def __iter__(self) -> Iterator[Any]:
+        for page in self.iter_pages():
+            yield from page
+
+    # -----------------------------------------------------------------------------------
+    def get_last_key(self) -> Any:
+        return self.__last_key
@@ -0,0 +1,232 @@
+# -*- coding: utf-8 -*-
+
+"""
+Copyright 2025 kichiro-kun (Kei)
+Apache license, version 2.0 (Apache-2.0 license)
+"""
+
+__all__: list[str] = [
+    'ReplicaBalancing',
+    'ReplicatedDataBase',
+]
+
+__author__ = 'kichiro-kun (Kei)'
+__version__ = '0.3.0'
+
+# =======================================================================================
+import threading
+import time
+from abc import ABCMeta
+from enum import Enum
+from typing import Any, Callable, Iterable, List, Optional, Sequence, Tuple
+
+from database_core.abstract_database_component.database import DataBase
+from database_core.single_connection_database_component.single_connection_database \
+    import SingleConnectionDataBase
+from query_core.query_interface_component.query_interface import QueryInterface
+
+from dbms_interaction.transaction_manager_component.transaction_manager \
+    import TransactionManager, NoTransactionManager
+
+from shared.constants.global_configuration import DEFAULT_READ_YOUR_WRITES_WINDOW
+from shared.exceptions.common import InvalidArgumentTypeError, InvalidArgumentValueError
+from shared.types.bulk_load_types import BulkLoadResult
+from shared.utils.toolkit import ToolKit
+
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+class ReplicaBalancing(Enum):
+    ROUND_ROBIN = 1
+    LEAST_OUTSTANDING = 2
+
+
+# _______________________________________________________________________________________
+class ReplicatedDataBase(DataBase, QueryInterface, metaclass=ABCMeta):
+
+    # -----------------------------------------------------------------------------------
+    def __init__(self, primary: SingleConnectionDataBase,
+                 replicas: Sequence[SingleConnectionDataBase] = (),
+                 balancing: ReplicaBalancing = ReplicaBalancing.ROUND_ROBIN,
+                 read_your_writes_window: float = DEFAULT_READ_YOUR_WRITES_WINDOW) -> None:
+        ToolKit.ensure_instance(
+            obj=primary,
+            expected_type=SingleConnectionDataBase,
+            arg_name='primary'
+        )
+        for replica in replicas:
+            ToolKit.ensure_instance(
+                obj=replica,
+                expected_type=SingleConnectionDataBase,
+                arg_name='replicas'
+            )
+        ToolKit.ensure_instance(
+            obj=balancing,
+            expected_type=ReplicaBalancing,
+            arg_name='balancing'
+        )
+        if isinstance(read_your_writes_window, bool) or not isinstance(read_your_writes_window, (int, float)):
+            raise InvalidArgumentTypeError(
+                f"Error! Argument: *read_your_writes_window* - should be a *float*!\n"
+                f"But given: *{read_your_writes_window}* - is Type of "
+                f"*{type(read_your_writes_window).__name__}*!"
+            )
+
+        if read_your_writes_window < 0:
+            raise InvalidArgumentValueError(
+                f"Error! Argument: *read_your_writes_window* - should not be negative! "
+                f"But given: *{read_your_writes_window}*!"
+            )
+
+        DataBase.__init__(self=self, query_param_placeholder=primary.query_param_placeholder)
+
+        self._primary: SingleConnectionDataBase = primary
+        self._replicas: Tuple[SingleConnectionDataBase, ...] = tuple(replicas)
+        self._transaction_manager: TransactionManager = NoTransactionManager()
+
+        self.__balancing: ReplicaBalancing = balancing
+        self.__read_your_writes_window: float = read_your_writes_window
+
+        self.__routing_lock = threading.Lock()
+        self.__next_replica_index: int = 0
+        self.__outstanding_requests: List[int] = [0 for _ in self._replicas]
+
+        # Окно чтения своих записей отсчитывается для каждого потока отдельно
+        self.__session = threading.local()
+
+    # -----------------------------------------------------------------------------------
+    def set_new_transaction_manager(self, new_manager: TransactionManager) -> None:
+        # Транзакции выполняются только на основном сервере
+        self._primary.set_new_transaction_manager(new_manager=new_manager)
+
+        self._transaction_manager = new_manager
+
+    # -----------------------------------------------------------------------------------
+    def change_query_param_placeholder(self, new_placeholder: str = '') -> None:
+        DataBase.change_query_param_placeholder(self=self, new_placeholder=new_placeholder)
+
+        for database in (self._primary, *self._replicas):
+            database.change_query_param_placeholder(new_placeholder=new_placeholder)
+
+    # -----------------------------------------------------------------------------------
+    def get_outstanding_requests(self) -> Tuple[int, ...]:
+        with self.__routing_lock:
+            return tuple(self.__outstanding_requests)
+
+    # -----------------------------------------------------------------------------------
+    def execute_query_no_returns(self, *params, query: str, autocommit: Optional[bool] = None,
+                                 timeout: Optional[float] = None) -> None:
+        try:
+            self._primary.execute_query_no_returns(query=query, autocommit=autocommit, timeout=timeout, *params)
+        finally:
+            self.__mark_write()
+
+    # -----------------------------------------------------------------------------------
+    def execute_batch_no_returns(self, query: str, params_sequence: Sequence[Sequence[Any]]) -> None:
+        try:
+            self._primary.execute_batch_no_returns(query=query, params_sequence=params_sequence)
+        finally:
+            self.__mark_write()
+
+    # -----------------------------------------------------------------------------------
+    def execute_bulk_load(self, table: str, columns: Sequence[str],
+                          rows: Iterable[Sequence[Any]] = (), file_path: str = '') -> BulkLoadResult:
+        try:
+            return self._primary.execute_bulk_load(
+                table=table, columns=columns, rows=rows, file_path=file_path
+            )
+        finally:
+            self.__mark_write()
+
+    # -----------------------------------------------------------------------------------
+    def execute_query_returns_one(self, *params, query: str, raw: bool = False,
+                                  cache_ttl: Optional[float] = None,
+                                  timeout: Optional[float] = None) -> Sequence:
+        return self.__route_read(
+            lambda database: database.execute_query_returns_one(
+                query=query, raw=raw, cache_ttl=cache_ttl, timeout=timeout, *params
+            )
+        )
+
+    # -----------------------------------------------------------------------------------
+    def execute_query_returns_many(self, *params, query: str, returns_count: int = 0,
+                                   raw: bool = False, cache_ttl: Optional[float] = None,
+                                   timeout: Optional[float] = None) -> Sequence[Any]:
+        return self.__route_read(
+            lambda database: database.execute_query_returns_many(
+                query=query, returns_count=returns_count, raw=raw, cache_ttl=cache_ttl,
+                timeout=timeout, *params
+            )
+        )
+
+    # -----------------------------------------------------------------------------------
+    def execute_query_returns_all(self, *params, query: str, raw: bool = False,
+                                  cache_ttl: Optional[float] = None,
+                                  timeout: Optional[float] = None) -> Sequence[Any]:
+        return self.__route_read(
+            lambda database: database.execute_query_returns_all(
+                query=query, raw=raw, cache_ttl=cache_ttl, timeout=timeout, *params
+            )
+        )
+
+    # -----------------------------------------------------------------------------------
+    def __route_read(self, read_operation: Callable[[SingleConnectionDataBase], Any]) -> Any:
+        if self.__should_read_from_primary():
+            return read_operation(self._primary)
+
+        replica_index: int = self.__acquire_replica()
+
+        try:
+            return read_operation(self._replicas[replica_index])
+        finally:
+            with self.__routing_lock:
+                self.__outstanding_requests[replica_index] -= 1
+
+    # -----------------------------------------------------------------------------------
+    def __should_read_from_primary(self) -> bool:
+        if not self._replicas:
+            return True
+
+        last_write_time: float = getattr(self.__session, 'last_write_time', None) or 0.0
+
+        transaction_manager: TransactionManager = self._transaction_manager
+        if not isinstance(transaction_manager, NoTransactionManager):
+            # Чтения после begin должны видеть изменения транзакции, даже до её первого запроса
+            if transaction_manager.is_in_transaction():
+                return True
+
+            # Записи транзакции становятся видны на репликах не сразу после фиксации
+            last_write_time = max(last_write_time, transaction_manager.get_last_commit_time())
+
+        return last_write_time > 0 and time.monotonic() - last_write_time < self.__read_your_writes_window
+
+    # -----------------------------------------------------------------------------------
+    def __acquire_replica(self) -> int:
+        with self.__routing_lock:
+            replicas_count: int = len(self._replicas)
+            start_index: int = self.__next_replica_index
+            self.__next_replica_index = (start_index + 1) % replicas_count
+
+            if self.__balancing is ReplicaBalancing.LEAST_OUTSTANDING:
+                # Обход начинается со смещённой позиции, чтобы равные реплики чередовались
+                outstanding: List[int] = self.__outstanding_requests
+                replica_index: int = min(
+                    ((start_index + offset) % replicas_count for offset in range(replicas_count)),
+                    key=lambda index: outstanding[index]
+                )
+            else:
+                replica_index = start_index
+
+            self.__outstanding_requests[replica_index] += 1
+
+            return replica_index
+
+    # -----------------------------------------------------------------------------------
+    def __mark_write(self) -> None:
+        if self.__read_your_writes_window > 0:
+            self.__session.last_write_time = time.monotonic()
+
+    # -----------------------------------------------------------------------------------
+    def deconstruct_database_and_components(self) -> None:
+        for database in (getattr(self, '_primary', None), *getattr(self, '_replicas', ())):
+            if database is not None:
+                database.deconstruct_database_and_components()
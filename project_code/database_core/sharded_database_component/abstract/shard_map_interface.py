@@ -0,0 +1,29 @@
+# -*- coding: utf-8 -*-
+
+"""
+Copyright 2025 kichiro-kun (Kei)
+Apache license, version 2.0 (Apache-2.0 license)
+"""
+
+__all__: list[str] = [
+    'ShardMapInterface',
+]
+
+__author__ = 'kichiro-kun (Kei)'
+__version__ = '0.1.0'
+
+# =======================================================================================
+from abc import ABC, abstractmethod
+from typing import Any
+
+
+# _______________________________________________________________________________________
+class ShardMapInterface(ABC):
+
+    # -----------------------------------------------------------------------------------
+    @abstractmethod
+    def get_shard_index(self, shard_key: Any) -> int: ...
+
+    # -----------------------------------------------------------------------------------
+    @abstractmethod
+    def get_shards_count(self) -> int: ...
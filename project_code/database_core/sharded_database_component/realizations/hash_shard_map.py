@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+
+"""
+Copyright 2025 kichiro-kun (Kei)
+Apache license, version 2.0 (Apache-2.0 license)
+"""
+
+__all__: list[str] = [
+    'HashShardMap',
+]
+
+__author__ = 'kichiro-kun (Kei)'
+__version__ = '0.1.0'
+
+# =======================================================================================
+import zlib
+from typing import Any
+
+from database_core.sharded_database_component.abstract.shard_map_interface import ShardMapInterface
+
+from shared.exceptions.common import InvalidArgumentTypeError, InvalidArgumentValueError
+from shared.utils.toolkit import ToolKit
+
+
+# _______________________________________________________________________________________
+class HashShardMap(ShardMapInterface):
+
+    # -----------------------------------------------------------------------------------
+    def __init__(self, shards_count: int) -> None:
+        ToolKit.ensure_instance(
+            obj=shards_count,
+            expected_type=int,
+            arg_name='shards_count'
+        )
+
+        if shards_count <= 0:
+            raise InvalidArgumentValueError(
+                f"Error! Argument: *shards_count* - should be positive! But given: *{shards_count}*!"
+            )
+
+        self.__shards_count: int = shards_count
+
+    # -----------------------------------------------------------------------------------
+    def get_shard_index(self, shard_key: Any) -> int:
+        # Встроенный hash() для строк меняется между процессами, поэтому используется crc32
+        if isinstance(shard_key, int) and not isinstance(shard_key, bool):
+            return shard_key % self.__shards_count
+
+        if isinstance(shard_key, str):
+            shard_key = shard_key.encode('utf-8')
+
+        if not isinstance(shard_key, (bytes, bytearray)):
+            raise InvalidArgumentTypeError(
+                f"Error! Argument: *shard_key* - should be a *int*, *str* or *bytes*!\n"
+                f"But given: *{shard_key}* - is Type of *{type(shard_key).__name__}*!"
+            )
+
+        return zlib.crc32(shard_key) % self.__shards_count
+
+    # -----------------------------------------------------------------------------------
+    def get_shards_count(self) -> int:
+        return self.__shards_count
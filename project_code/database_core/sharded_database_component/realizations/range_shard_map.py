@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+
+"""
+Copyright 2025 kichiro-kun (Kei)
+Apache license, version 2.0 (Apache-2.0 license)
+"""
+
+__all__: list[str] = [
+    'RangeShardMap',
+]
+
+__author__ = 'kichiro-kun (Kei)'
+__version__ = '0.1.0'
+
+# =======================================================================================
+from bisect import bisect_right
+from typing import Any, List, Sequence
+
+from database_core.sharded_database_component.abstract.shard_map_interface import ShardMapInterface
+
+from shared.exceptions.common import InvalidArgumentValueError
+
+
+# _______________________________________________________________________________________
+class RangeShardMap(ShardMapInterface):
+
+    # -----------------------------------------------------------------------------------
+    def __init__(self, lower_bounds: Sequence[Any]) -> None:
+        # Шард i хранит ключи из диапазона [lower_bounds[i], lower_bounds[i + 1])
+        bounds: List[Any] = list(lower_bounds)
+
+        if not bounds or any(left >= right for left, right in zip(bounds, bounds[1:])):
+            raise InvalidArgumentValueError(
+                f"Error! Argument: *lower_bounds* - should be non-empty and strictly increasing!\n"
+                f"But given: *{lower_bounds}*!"
+            )
+
+        self.__lower_bounds: List[Any] = bounds
+
+    # -----------------------------------------------------------------------------------
+    def get_shard_index(self, shard_key: Any) -> int:
+        shard_index: int = bisect_right(self.__lower_bounds, shard_key) - 1
+
+        if shard_index < 0:
+            raise InvalidArgumentValueError(
+                f"Error! Shard key: *{shard_key}* - is lower than the first range "
+                f"*{self.__lower_bounds[0]}*!"
+            )
+
+        return shard_index
+
+    # -----------------------------------------------------------------------------------
+    def get_shards_count(self) -> int:
+        return len(self.__lower_bounds)
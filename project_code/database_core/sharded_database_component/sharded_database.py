@@ -0,0 +1,277 @@
+# -*- coding: utf-8 -*-
+
+"""
+Copyright 2025 kichiro-kun (Kei)
+Apache license, version 2.0 (Apache-2.0 license)
+"""
+
+__all__: list[str] = [
+    'ShardedDataBase',
+]
+
+__author__ = 'kichiro-kun (Kei)'
+__version__ = '0.4.0'
+
+# =======================================================================================
+import threading
+from abc import ABCMeta
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import chain
+from typing import Any, Callable, Iterable, List, Optional, Sequence, Tuple
+
+from database_core.abstract_database_component.database import DataBase
+from database_core.single_connection_database_component.single_connection_database \
+    import SingleConnectionDataBase
+from database_core.sharded_database_component.abstract.shard_map_interface import ShardMapInterface
+from query_core.query_interface_component.query_interface import QueryInterface
+from query_core.result_stream_component.cursor_row_stream import CursorRowStream
+from query_core.result_stream_component.ordered_stream_merger import OrderedStreamMerger, SortKey
+
+from shared.constants.global_configuration import DEFAULT_STREAM_CHUNK_SIZE
+from shared.exceptions.common import InvalidArgumentValueError
+from shared.types.bulk_load_types import BulkLoadResult
+from shared.utils.toolkit import ToolKit
+
+
+ShardRead = Callable[[SingleConnectionDataBase], Any]
+
+
+# _______________________________________________________________________________________
+class ShardedDataBase(DataBase, QueryInterface, metaclass=ABCMeta):
+
+    # -----------------------------------------------------------------------------------
+    def __init__(self, shards: Sequence[SingleConnectionDataBase], shard_map: ShardMapInterface,
+                 max_workers: int = 0) -> None:
+        # Пул потоков создаётся при первом обращении ко всем шардам
+        self.__executor: Optional[ThreadPoolExecutor] = None
+        self.__executor_lock = threading.Lock()
+
+        for shard in shards:
+            ToolKit.ensure_instance(
+                obj=shard,
+                expected_type=SingleConnectionDataBase,
+                arg_name='shards'
+            )
+        ToolKit.ensure_instance(
+            obj=shard_map,
+            expected_type=ShardMapInterface,
+            arg_name='shard_map'
+        )
+        ToolKit.ensure_instance(
+            obj=max_workers,
+            expected_type=int,
+            arg_name='max_workers'
+        )
+
+        if not shards or shard_map.get_shards_count() != len(shards):
+            raise InvalidArgumentValueError(
+                f"Error! Shard map describes *{shard_map.get_shards_count()}* shards!\n"
+                f"But given: *{len(shards)}* databases!"
+            )
+
+        DataBase.__init__(self=self, query_param_placeholder=shards[0].query_param_placeholder)
+
+        self._shards: Tuple[SingleConnectionDataBase, ...] = tuple(shards)
+        self._shard_map: ShardMapInterface = shard_map
+        self.__max_workers: int = max_workers if max_workers > 0 else len(shards)
+
+        # Пул потоков общий для всех вызовов: параллельные fan_out и запросы по ключу
+        # работают с соединением одного шарда по очереди
+        self.__shard_locks: Tuple[threading.RLock, ...] = tuple(threading.RLock() for _ in shards)
+
+    # -----------------------------------------------------------------------------------
+    def get_shard(self, shard_key: Any) -> SingleConnectionDataBase:
+        return self._shards[self._shard_map.get_shard_index(shard_key=shard_key)]
+
+    # -----------------------------------------------------------------------------------
+    def get_shards(self) -> Tuple[SingleConnectionDataBase, ...]:
+        return self._shards
+
+    # -----------------------------------------------------------------------------------
+    def change_query_param_placeholder(self, new_placeholder: str = '') -> None:
+        DataBase.change_query_param_placeholder(self=self, new_placeholder=new_placeholder)
+
+        for shard in self._shards:
+            shard.change_query_param_placeholder(new_placeholder=new_placeholder)
+
+    # -----------------------------------------------------------------------------------
+    def execute_query_no_returns(self, *params, query: str, shard_key: Any = None,
+                                 autocommit: Optional[bool] = None, timeout: Optional[float] = None) -> None:
+        self.__run_on_write_shard(
+            shard_key=shard_key,
+            operation=lambda shard: shard.execute_query_no_returns(
+                query=query, autocommit=autocommit, timeout=timeout, *params
+            )
+        )
+
+    # -----------------------------------------------------------------------------------
+    def execute_batch_no_returns(self, query: str, params_sequence: Sequence[Sequence[Any]],
+                                 shard_key: Any = None) -> None:
+        self.__run_on_write_shard(
+            shard_key=shard_key,
+            operation=lambda shard: shard.execute_batch_no_returns(
+                query=query, params_sequence=params_sequence
+            )
+        )
+
+    # -----------------------------------------------------------------------------------
+    def execute_bulk_load(self, table: str, columns: Sequence[str],
+                          rows: Iterable[Sequence[Any]] = (), file_path: str = '',
+                          shard_key: Any = None) -> BulkLoadResult:
+        return self.__run_on_write_shard(
+            shard_key=shard_key,
+            operation=lambda shard: shard.execute_bulk_load(
+                table=table, columns=columns, rows=rows, file_path=file_path
+            )
+        )
+
+    # -----------------------------------------------------------------------------------
+    def execute_query_returns_one(self, *params, query: str, shard_key: Any = None,
+                                  raw: bool = False, cache_ttl: Optional[float] = None,
+                                  timeout: Optional[float] = None) -> Sequence:
+        def read(shard: SingleConnectionDataBase) -> Sequence:
+            return shard.execute_query_returns_one(
+                query=query, raw=raw, cache_ttl=cache_ttl, timeout=timeout, *params
+            )
+
+        if shard_key is not None:
+            return self.__run_on_key_shard(shard_key=shard_key, operation=read)
+
+        # Без ключа возвращается первая найденная строка в порядке шардов
+        for row in self.fan_out(read_operation=read):
+            if row:
+                return row
+
+        return tuple()
+
+    # -----------------------------------------------------------------------------------
+    def execute_query_returns_many(self, *params, query: str, returns_count: int = 0,
+                                   shard_key: Any = None, raw: bool = False,
+                                   cache_ttl: Optional[float] = None,
+                                   timeout: Optional[float] = None) -> Sequence[Any]:
+        def read(shard: SingleConnectionDataBase) -> Sequence[Any]:
+            return shard.execute_query_returns_many(
+                query=query, returns_count=returns_count, raw=raw, cache_ttl=cache_ttl,
+                timeout=timeout, *params
+            )
+
+        if shard_key is not None:
+            return self.__run_on_key_shard(shard_key=shard_key, operation=read)
+
+        rows: Tuple[Any, ...] = tuple(chain.from_iterable(self.fan_out(read_operation=read)))
+
+        return rows[:returns_count] if returns_count > 0 else rows
+
+    # -----------------------------------------------------------------------------------
+    def execute_query_returns_all(self, *params, query: str, shard_key: Any = None,
+                                  raw: bool = False, cache_ttl: Optional[float] = None,
+                                  timeout: Optional[float] = None) -> Sequence[Any]:
+        def read(shard: SingleConnectionDataBase) -> Sequence[Any]:
+            return shard.execute_query_returns_all(
+                query=query, raw=raw, cache_ttl=cache_ttl, timeout=timeout, *params
+            )
+
+        if shard_key is not None:
+            return self.__run_on_key_shard(shard_key=shard_key, operation=read)
+
+        return tuple(chain.from_iterable(self.fan_out(read_operation=read)))
+
+    # -----------------------------------------------------------------------------------
+    def execute_query_returns_merged(self, *params, query: str, sort_key: SortKey, limit: int = 0,
+                                     reverse: bool = False,
+                                     chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE) -> OrderedStreamMerger:
+        # Шарды должны возвращать строки в том же порядке (ORDER BY ... LIMIT в самом запросе),
+        # тогда каждый поток читается лениво и не дальше общего лимита
+        if limit > 0:
+            chunk_size = min(chunk_size, limit)
+
+        # Блокировки шардов берутся по порядку индексов и держатся до закрытия объединённого
+        # результата: запросы по ключу не попадают на подключение с непрочитанными строками.
+        # Поток занимает блокировки открывшего его потока выполнения, поэтому открывается здесь, а не в пуле
+        acquired_locks: List[threading.RLock] = []
+        opened: List[CursorRowStream] = []
+
+        def release_shards() -> None:
+            while acquired_locks:
+                acquired_locks.pop().release()
+
+        try:
+            for shard_lock, shard in zip(self.__shard_locks, self._shards):
+                shard_lock.acquire()
+                acquired_locks.append(shard_lock)
+
+                opened.append(shard.execute_query_returns_stream(query=query, chunk_size=chunk_size, *params))
+
+            return OrderedStreamMerger(
+                streams=opened, sort_key=sort_key, limit=limit, reverse=reverse, on_close=release_shards
+            )
+        except Exception:
+            # Уже открытые потоки других шардов не должны удерживать соединения
+            try:
+                for stream in opened:
+                    stream.close()
+            finally:
+                release_shards()
+
+            raise
+
+    # -----------------------------------------------------------------------------------
+    def fan_out(self, read_operation: ShardRead) -> List[Any]:
+        # Результаты возвращаются в порядке шардов, а не в порядке завершения
+        if len(self._shards) == 1:
+            return [self.__run_on_shard(shard_index=0, operation=read_operation)]
+
+        executor: ThreadPoolExecutor = self.__get_executor()
+        futures: List[Future] = [
+            executor.submit(self.__run_on_shard, shard_index, read_operation)
+            for shard_index in range(len(self._shards))
+        ]
+
+        try:
+            return [future.result() for future in futures]
+        finally:
+            # При ошибке одного шарда не начатые запросы к остальным отменяются
+            for future in futures:
+                future.cancel()
+
+    # -----------------------------------------------------------------------------------
+    def __run_on_shard(self, shard_index: int, operation: ShardRead) -> Any:
+        with self.__shard_locks[shard_index]:
+            return operation(self._shards[shard_index])
+
+    # -----------------------------------------------------------------------------------
+    def __run_on_key_shard(self, shard_key: Any, operation: ShardRead) -> Any:
+        return self.__run_on_shard(
+            shard_index=self._shard_map.get_shard_index(shard_key=shard_key),
+            operation=operation
+        )
+
+    # -----------------------------------------------------------------------------------
+    def __run_on_write_shard(self, shard_key: Any, operation: ShardRead) -> Any:
+        # Запись без ключа шарда могла бы попасть не на тот сервер
+        if shard_key is None:
+            raise InvalidArgumentValueError(
+                "Error! Argument: *shard_key* - is required for write operations!"
+            )
+
+        return self.__run_on_key_shard(shard_key=shard_key, operation=operation)
+
+    # -----------------------------------------------------------------------------------
+    def __get_executor(self) -> ThreadPoolExecutor:
+        with self.__executor_lock:
+            if self.__executor is None:
+                self.__executor = ThreadPoolExecutor(
+                    max_workers=self.__max_workers, thread_name_prefix='ShardFanOut'
+                )
+
+            return self.__executor
+
+    # -----------------------------------------------------------------------------------
+    def deconstruct_database_and_components(self) -> None:
+        executor: Optional[ThreadPoolExecutor] = self.__executor
+
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+        for shard in getattr(self, '_shards', ()):
+            shard.deconstruct_database_and_components()
@@ -6,26 +6,52 @@ Apache license, version 2.0 (Apache-2.0 license)
 """
 
 __author__ = 'kichiro-kun (Kei)'
-__version__ = '0.12.0'
+__version__ = '0.33.0'
 
 # =======================================================================================
+import threading
 from abc import ABCMeta
-from typing import Any, Sequence, Dict, Optional, Callable
+from typing import Any, BinaryIO, FrozenSet, Hashable, Iterable, List, Sequence, Dict, Optional, \
+    Callable, Union
 
 from database_core.abstract_database_component.database import DataBase
+from database_core.write_behind_queue_component.write_behind_queue \
+    import WriteBehindQueue, NoWriteBehindQueue
 from query_core.query_interface_component.query_interface import QueryInterface
+from query_core.query_builder_component.query_builder import QueryBuilder
+from query_core.result_stream_component.cursor_row_stream import CursorRowStream
+from query_core.result_stream_component.adaptive_chunk_sizer import AdaptiveChunkSizer
+from query_core.result_stream_component.spillable_result_set import SpillableResultSet
+from query_core.query_cache_component.abstract.query_cache_interface \
+    import QueryCacheInterface, NoQueryCache
+from query_core.query_cache_component.sql_table_extractor import SQLTableExtractor
+from query_core.single_flight_component.single_flight_group \
+    import SingleFlightGroup, NoSingleFlightGroup
 
 from dbms_interaction.adapters_component.connection.abstract.connection_interface\
     import ConnectionInterface
+from dbms_interaction.circuit_breaker_component.circuit_breaker \
+    import CircuitBreaker, NoCircuitBreaker
 from dbms_interaction.adapters_component.cursor.abstract.cursor_interface\
     import CursorInterface
+from dbms_interaction.query_watchdog_component.query_watchdog import QueryWatchdog, NoQueryWatchdog
+from dbms_interaction.row_factory_component.row_factory import RowFactory, RowConverterFactory
 from dbms_interaction.single_connection_manager_component.single_connection_manager\
     import SingleConnectionManager, NoSingleConnectionManager
 from dbms_interaction.transaction_manager_component.transaction_manager\
     import TransactionManager, NoTransactionManager
 
-from shared.exceptions.common import OperationFailedConnectionIsNotActive
+from os_interaction.result_export_component.result_exporter import ExportFormat, ResultExporter
 
+from shared.constants.global_configuration import MYSQL_MAX_ALLOWED_PACKET_QUERY, \
+    BULK_INSERT_PACKET_USAGE_RATIO, DEFAULT_UPSERT_CHUNK_SIZE, DEFAULT_STREAM_CHUNK_SIZE, \
+    DEFAULT_COLUMNAR_CHUNK_SIZE, DEFAULT_BLOB_SLICE_SIZE, MYSQL_MAX_EXECUTION_TIME_EXCEEDED_ERROR_CODE, \
+    DEFAULT_SPILL_MEMORY_LIMIT, MYSQL_START_SNAPSHOT_TRANSACTION_QUERY
+from shared.exceptions.common import OperationFailedConnectionIsNotActive, InvalidArgumentValueError, \
+    InvalidArgumentTypeError, OperationFailedQueryTimeoutExceeded, OperationFailedWritesAreLost, \
+    OperationFailedValueChangedDuringRead
+
+from shared.types.bulk_load_types import BulkLoadResult
 from shared.utils.toolkit import ToolKit
 
 
@@ -47,7 +73,19 @@ class SingleConnectionDataBase(DataBase, QueryInterface, metaclass=ABCMeta):
 
         self._perform_connection_manager = NoSingleConnectionManager()
         self._transaction_manager = NoTransactionManager()
+        self._write_behind_queue = NoWriteBehindQueue()
+        self._query_cache = NoQueryCache()
+        self._single_flight_group = NoSingleFlightGroup()
+        self._circuit_breaker = NoCircuitBreaker()
+        self._query_watchdog = NoQueryWatchdog()
         self._config = dict()
+        # None оставляет режим сессии, заданный конфигурацией подключения, без изменений
+        self._autocommit_mode: Optional[bool] = None
+        self._max_allowed_packet: int = 0
+        self._row_factory: RowFactory = RowFactory.TUPLE
+
+        # Единственное подключение не допускает одновременных запросов из разных потоков
+        self._connection_lock = threading.RLock()
 
     # -----------------------------------------------------------------------------------
     def set_new_connection_config(self, new_config: Dict[str, Any]) -> None:
@@ -58,6 +96,7 @@ class SingleConnectionDataBase(DataBase, QueryInterface, metaclass=ABCMeta):
         )
 
         self._config: Dict[str, Any] = new_config
+        self._max_allowed_packet = 0
         self._perform_connection_manager.set_new_config(new_config=new_config)
 
     # -----------------------------------------------------------------------------------
@@ -69,6 +108,7 @@ class SingleConnectionDataBase(DataBase, QueryInterface, metaclass=ABCMeta):
         )
 
         self._perform_connection_manager: SingleConnectionManager = new_manager
+        self._max_allowed_packet = 0
 
     # -----------------------------------------------------------------------------------
     def set_new_transaction_manager(self, new_manager: TransactionManager) -> None:
@@ -83,9 +123,65 @@ class SingleConnectionDataBase(DataBase, QueryInterface, metaclass=ABCMeta):
         # Prepare new TransactionManager
         new_manager.query_param_placeholder = self.query_param_placeholder
         new_manager.active_connection = active_connection
+        new_manager.query_cache = self._query_cache
+        new_manager.connection_lock = self._connection_lock
 
         self._transaction_manager: TransactionManager = new_manager
 
+    # -----------------------------------------------------------------------------------
+    def set_new_write_behind_queue(self, new_queue: WriteBehindQueue) -> None:
+        ToolKit.ensure_instance(
+            obj=new_queue,
+            expected_type=WriteBehindQueue,
+            arg_name='new_queue'
+        )
+
+        self._write_behind_queue: WriteBehindQueue = new_queue
+
+    # -----------------------------------------------------------------------------------
+    def set_new_query_cache(self, new_cache: QueryCacheInterface) -> None:
+        ToolKit.ensure_instance(
+            obj=new_cache,
+            expected_type=QueryCacheInterface,
+            arg_name='new_cache'
+        )
+
+        self._query_cache: QueryCacheInterface = new_cache
+
+        # Записи внутри транзакций инвалидируют тот же кэш
+        transaction_manager: TransactionManager = self._transaction_manager
+        transaction_manager.query_cache = new_cache
+
+    # -----------------------------------------------------------------------------------
+    def set_new_single_flight_group(self, new_group: SingleFlightGroup) -> None:
+        ToolKit.ensure_instance(
+            obj=new_group,
+            expected_type=SingleFlightGroup,
+            arg_name='new_group'
+        )
+
+        self._single_flight_group: SingleFlightGroup = new_group
+
+    # -----------------------------------------------------------------------------------
+    def set_new_circuit_breaker(self, new_breaker: CircuitBreaker) -> None:
+        ToolKit.ensure_instance(
+            obj=new_breaker,
+            expected_type=CircuitBreaker,
+            arg_name='new_breaker'
+        )
+
+        self._circuit_breaker: CircuitBreaker = new_breaker
+
+    # -----------------------------------------------------------------------------------
+    def set_new_query_watchdog(self, new_watchdog: QueryWatchdog) -> None:
+        ToolKit.ensure_instance(
+            obj=new_watchdog,
+            expected_type=QueryWatchdog,
+            arg_name='new_watchdog'
+        )
+
+        self._query_watchdog: QueryWatchdog = new_watchdog
+
     # -----------------------------------------------------------------------------------
     def change_query_param_placeholder(self, new_placeholder: str = '') -> None:
         DataBase.change_query_param_placeholder(self=self, new_placeholder=new_placeholder)
@@ -93,60 +189,768 @@ class SingleConnectionDataBase(DataBase, QueryInterface, metaclass=ABCMeta):
 
         transaction_manager.query_param_placeholder = new_placeholder
 
+    # -----------------------------------------------------------------------------------
+    def set_autocommit_mode(self, enabled: bool) -> None:
+        ToolKit.ensure_instance(
+            obj=enabled,
+            expected_type=bool,
+            arg_name='enabled'
+        )
+
+        self._autocommit_mode = enabled
+
+    # -----------------------------------------------------------------------------------
+    def set_row_factory(self, factory: RowFactory) -> None:
+        ToolKit.ensure_instance(
+            obj=factory,
+            expected_type=RowFactory,
+            arg_name='factory'
+        )
+
+        self._row_factory = factory
+
+    # -----------------------------------------------------------------------------------
+    def __open_cursor(self, adapter: ConnectionInterface, unbuffered: bool = False,
+                      raw: bool = False) -> CursorInterface:
+        # Адаптеру передаются только отличающиеся от значений по умолчанию режимы курсора
+        cursor_options: Dict[str, bool] = {}
+
+        if unbuffered:
+            cursor_options['unbuffered'] = True
+
+        if raw:
+            cursor_options['raw'] = True
+
+        return adapter.get_cursor(
+            special_placeholder=self.query_param_placeholder,
+            **cursor_options
+        )
+
+    # -----------------------------------------------------------------------------------
+    def __prepare_cursor(self, cur: CursorInterface) -> None:
+        # Кортежи курсора используются по умолчанию и не требуют настройки
+        if self._row_factory is not RowFactory.TUPLE:
+            cur.set_row_factory(factory=self._row_factory)
+
+    # -----------------------------------------------------------------------------------
+    def __call_through_circuit_breaker(self, operation: Callable[[], Any]) -> Any:
+        circuit_breaker: CircuitBreaker = self._circuit_breaker
+
+        if isinstance(circuit_breaker, NoCircuitBreaker):
+            return operation()
+
+        # При открытом предохранителе вызов отклоняется без обращения к серверу
+        return circuit_breaker.call(operation=operation)
+
     # -----------------------------------------------------------------------------------
     def __execute_query(self, *params, query_string: str,
-                        fetch_processor: Optional[Callable[[CursorInterface], Any]] = None) -> Sequence:
-        conn_manager: SingleConnectionManager = self._perform_connection_manager
+                        fetch_processor: Optional[Callable[[CursorInterface], Any]] = None,
+                        autocommit: Optional[bool] = None,
+                        params_sequence: Optional[Sequence[Sequence[Any]]] = None,
+                        unbuffered: bool = False,
+                        raw: bool = False,
+                        apply_row_factory: bool = True,
+                        timeout: Optional[float] = None) -> Sequence:
+        return self.__call_through_circuit_breaker(
+            operation=lambda: self.__execute_query_on_connection(
+                *params, query_string=query_string,
+                fetch_processor=fetch_processor,
+                autocommit=autocommit,
+                params_sequence=params_sequence,
+                unbuffered=unbuffered,
+                raw=raw,
+                apply_row_factory=apply_row_factory,
+                timeout=timeout
+            )
+        )
 
-        conn_is_active: bool = conn_manager.check_connection_status()
-        if conn_is_active:
-            adapter: ConnectionInterface = conn_manager.get_connection()
-            fetched_data = []
+    # -----------------------------------------------------------------------------------
+    def __execute_query_on_connection(self, *params, query_string: str,
+                                      fetch_processor: Optional[Callable[[CursorInterface], Any]],
+                                      autocommit: Optional[bool],
+                                      params_sequence: Optional[Sequence[Sequence[Any]]],
+                                      unbuffered: bool,
+                                      raw: bool,
+                                      apply_row_factory: bool,
+                                      timeout: Optional[float]) -> Sequence:
+        # Запрос и выборка результата выполняются целиком, пока подключение занято этим потоком
+        with self._connection_lock:
+            conn_manager: SingleConnectionManager = self._perform_connection_manager
+
+            conn_is_active: bool = conn_manager.check_connection_status()
+            if conn_is_active:
+                adapter: ConnectionInterface = conn_manager.get_connection()
+
+                # Режим, отличный от настроенного для сессии, действует только на этот запрос
+                previous_autocommit: Optional[bool] = None
+                if autocommit is not None:
+                    if autocommit is not self._autocommit_mode:
+                        previous_autocommit = adapter.get_autocommit()
+
+                    # Адаптер отправляет смену режима на сервер только при её фактическом изменении
+                    adapter.set_autocommit(enabled=autocommit)
+
+                try:
+                    cur: CursorInterface = self.__open_cursor(
+                        adapter=adapter, unbuffered=unbuffered, raw=raw
+                    )
+
+                    if apply_row_factory:
+                        self.__prepare_cursor(cur=cur)
+
+                    def run_query(actual_query: str) -> Sequence:
+                        if params_sequence is None:
+                            cur.execute(query=actual_query, *params)
+                        else:
+                            cur.executemany(query=actual_query, data=params_sequence)
+
+                        if fetch_processor:
+                            return fetch_processor(cur)
+
+                        return []
+
+                    fetched_data: Sequence = self.__run_with_timeout(
+                        adapter=adapter, query_string=query_string, timeout=timeout, run_query=run_query
+                    )
+
+                    cur.close()
+
+                    if fetched_data:
+                        return fetched_data
+                    else:
+                        return tuple()
+                finally:
+                    if previous_autocommit is not None:
+                        adapter.set_autocommit(enabled=previous_autocommit)
+            else:
+                raise OperationFailedConnectionIsNotActive()
 
-            cur: CursorInterface = adapter.get_cursor(
-                special_placeholder=self.query_param_placeholder
+    # -----------------------------------------------------------------------------------
+    def __run_with_timeout(self, adapter: ConnectionInterface, query_string: str,
+                           timeout: Optional[float], run_query: Callable[[str], Sequence]) -> Sequence:
+        if timeout is None:
+            return run_query(query_string)
+
+        # Читающий SELECT ограничивается самим сервером, без отдельного соединения
+        if QueryBuilder.supports_max_execution_time_hint(query_string):
+            try:
+                return run_query(QueryBuilder.build_max_execution_time_query(query_string, timeout))
+            except Exception as error:
+                if getattr(error, 'errno', None) == MYSQL_MAX_EXECUTION_TIME_EXCEEDED_ERROR_CODE:
+                    raise OperationFailedQueryTimeoutExceeded() from error
+                raise
+
+        query_watchdog: QueryWatchdog = self._query_watchdog
+
+        if isinstance(query_watchdog, NoQueryWatchdog):
+            raise InvalidArgumentValueError(
+                "Error! Argument: *timeout* - requires a query watchdog for non-SELECT queries!"
             )
-            cur.execute(query=query_string, *params)
 
-            if fetch_processor:
-                fetched_data: Sequence = fetch_processor(cur)
+        # По истечении срока сторож прерывает запрос через KILL QUERY из управляющего соединения
+        watch_token: int = query_watchdog.watch(connection_id=adapter.get_connection_id(), timeout=timeout)
 
-            cur.close()
+        try:
+            result: Sequence = run_query(query_string)
+        except Exception as error:
+            if query_watchdog.unwatch(token=watch_token) is False:
+                raise OperationFailedQueryTimeoutExceeded() from error
+            raise
 
-            if fetched_data:
-                return fetched_data
-            else:
-                return tuple()
+        query_watchdog.unwatch(token=watch_token)
+
+        return result
+
+    # -----------------------------------------------------------------------------------
+    @staticmethod
+    def __ensure_timeout(timeout: Optional[float]) -> None:
+        if timeout is None:
+            return
+
+        if isinstance(timeout, bool) or not isinstance(timeout, (int, float)):
+            raise InvalidArgumentTypeError(
+                f"Error! Argument: *timeout* - should be a *float*!\n"
+                f"But given: *{timeout}* - is Type of *{type(timeout).__name__}*!"
+            )
+
+        if timeout <= 0:
+            raise InvalidArgumentValueError(
+                f"Error! Argument: *timeout* - should be positive! But given: *{timeout}*!"
+            )
+
+    # -----------------------------------------------------------------------------------
+    def execute_query_no_returns(self, *params, query: str, autocommit: Optional[bool] = None,
+                                 timeout: Optional[float] = None) -> None:
+        if autocommit is None:
+            autocommit = self._autocommit_mode
         else:
-            raise OperationFailedConnectionIsNotActive()
+            ToolKit.ensure_instance(
+                obj=autocommit,
+                expected_type=bool,
+                arg_name='autocommit'
+            )
+
+        self.__ensure_timeout(timeout=timeout)
+        self.__execute_query(query_string=query, *params, autocommit=autocommit, timeout=timeout)
+        self.__invalidate_query_cache(query=query)
 
     # -----------------------------------------------------------------------------------
-    def execute_query_no_returns(self, *params, query: str) -> None:
-        self.__execute_query(query_string=query, *params)
+    def execute_batch_no_returns(self, query: str, params_sequence: Sequence[Sequence[Any]]) -> None:
+        ToolKit.ensure_instance(
+            obj=query,
+            expected_type=str,
+            arg_name='query'
+        )
+
+        # Один запрос с набором параметров отправляется за одно обращение к курсору
+        if params_sequence:
+            self.__execute_query(
+                query_string=query,
+                params_sequence=params_sequence,
+                autocommit=self._autocommit_mode
+            )
+            self.__invalidate_query_cache(query=query)
 
     # -----------------------------------------------------------------------------------
-    def execute_query_returns_one(self, *params, query: str) -> Sequence:
-        result_data: Sequence[str] = self.__execute_query(
+    def execute_query_returns_one(self, *params, query: str, raw: bool = False,
+                                  cache_ttl: Optional[float] = None,
+                                  timeout: Optional[float] = None) -> Sequence:
+        result_data: Sequence[str] = self.__execute_read_query(
             query_string=query, *params,
-            fetch_processor=lambda cur: cur.fetchone()
+            fetch_processor=lambda cur: cur.fetchone(),
+            cache_key_prefix=('one',),
+            raw=raw,
+            cache_ttl=cache_ttl,
+            timeout=timeout
         )
 
         return result_data
 
     # -----------------------------------------------------------------------------------
-    def execute_query_returns_many(self, *params, query: str, returns_count: int = 0) -> Sequence[Any]:
-        return self.__execute_query(
+    def execute_query_returns_many(self, *params, query: str, returns_count: int = 0,
+                                   raw: bool = False, cache_ttl: Optional[float] = None,
+                                   timeout: Optional[float] = None) -> Sequence[Any]:
+        return self.__execute_read_query(
             query_string=query, *params,
-            fetch_processor=lambda cur: cur.fetchmany(count=returns_count)
+            fetch_processor=lambda cur: cur.fetchmany(count=returns_count),
+            cache_key_prefix=('many', returns_count),
+            raw=raw,
+            cache_ttl=cache_ttl,
+            timeout=timeout
         )
 
     # -----------------------------------------------------------------------------------
-    def execute_query_returns_all(self, *params, query: str) -> Sequence[Any]:
-        return self.__execute_query(
+    def execute_query_returns_all(self, *params, query: str, raw: bool = False,
+                                  cache_ttl: Optional[float] = None,
+                                  timeout: Optional[float] = None) -> Sequence[Any]:
+        return self.__execute_read_query(
             query_string=query, *params,
-            fetch_processor=lambda cur: cur.fetchall()
+            fetch_processor=lambda cur: cur.fetchall(),
+            cache_key_prefix=('all',),
+            raw=raw,
+            cache_ttl=cache_ttl,
+            timeout=timeout
+        )
+
+    # -----------------------------------------------------------------------------------
+    def __execute_read_query(self, *params, query_string: str,
+                             fetch_processor: Callable[[CursorInterface], Any],
+                             cache_key_prefix: tuple, raw: bool = False,
+                             cache_ttl: Optional[float] = None,
+                             timeout: Optional[float] = None) -> Sequence:
+        self.__ensure_timeout(timeout=timeout)
+
+        query_cache: QueryCacheInterface = self._query_cache
+        single_flight_group: SingleFlightGroup = self._single_flight_group
+        is_read_only: bool = SQLTableExtractor.is_cacheable_query(query_string)
+
+        # Кэш подключается явно, нулевой TTL отключает его для отдельного запроса
+        use_cache: bool = is_read_only and cache_ttl != 0 \
+            and not isinstance(query_cache, NoQueryCache)
+        use_single_flight: bool = is_read_only \
+            and not isinstance(single_flight_group, NoSingleFlightGroup)
+
+        read_key: Hashable = (
+            *cache_key_prefix, query_string, params,
+            self.query_param_placeholder, raw, self._row_factory
+        )
+
+        if use_cache or use_single_flight:
+            try:
+                hash(read_key)
+            except TypeError:
+                # Нехэшируемые параметры (списки, словари) не кэшируются и не объединяются
+                use_cache = use_single_flight = False
+
+        if use_cache:
+            is_found, cached_data = query_cache.get(key=read_key)
+
+            if is_found:
+                return self.__copy_shared_rows(result_data=cached_data)
+
+        def read_from_database() -> Sequence:
+            result_data: Any = self.__execute_query(
+                query_string=query_string, *params,
+                fetch_processor=fetch_processor,
+                raw=raw,
+                timeout=timeout
+            )
+
+            # Общий результат отдаётся кортежем, чтобы один вызывающий код не менял его для других
+            if isinstance(result_data, list) and (use_cache or use_single_flight):
+                result_data = tuple(result_data)
+
+            if use_cache:
+                query_cache.put(
+                    key=read_key,
+                    value=result_data,
+                    tables=SQLTableExtractor.extract_tables(query_string),
+                    ttl=cache_ttl
+                )
+
+            return result_data
+
+        # Одновременные одинаковые чтения ожидают одно выполнение запроса
+        if use_single_flight:
+            return self.__copy_shared_rows(
+                result_data=single_flight_group.execute(key=read_key, operation=read_from_database)
+            )
+
+        if use_cache:
+            return self.__copy_shared_rows(result_data=read_from_database())
+
+        return read_from_database()
+
+    # -----------------------------------------------------------------------------------
+    def __copy_shared_rows(self, result_data: Any) -> Any:
+        # Словари и записи изменяемы: каждый вызывающий код получает свои копии строк
+        if self._row_factory not in (RowFactory.DICT, RowFactory.RECORD):
+            return result_data
+
+        if isinstance(result_data, tuple):
+            return tuple(RowConverterFactory.copy_row(row) for row in result_data)
+
+        return RowConverterFactory.copy_row(result_data)
+
+    # -----------------------------------------------------------------------------------
+    def __invalidate_query_cache(self, query: str = '', tables: FrozenSet[str] = frozenset()) -> None:
+        query_cache: QueryCacheInterface = self._query_cache
+
+        if isinstance(query_cache, NoQueryCache):
+            return
+
+        if query:
+            if not SQLTableExtractor.is_data_modifying_query(query):
+                return
+
+            tables = SQLTableExtractor.extract_tables(query)
+
+        # Запрос без распознанных таблиц может изменить что угодно
+        if tables:
+            query_cache.invalidate_tables(tables=tables)
+        else:
+            query_cache.clear()
+
+    # -----------------------------------------------------------------------------------
+    def execute_query_returns_columnar(self, *params, query: str,
+                                       chunk_size: int = DEFAULT_COLUMNAR_CHUNK_SIZE,
+                                       use_numpy: bool = True) -> Dict[str, Any]:
+        # Небуферизованный курсор не держит в памяти копию результата в виде кортежей
+        result: Any = self.__execute_query(
+            query_string=query, *params,
+            fetch_processor=lambda cur: cur.fetch_columnar(chunk_size=chunk_size, use_numpy=use_numpy),
+            unbuffered=True,
+            apply_row_factory=False
+        )
+
+        return dict(result)
+
+    # -----------------------------------------------------------------------------------
+    def execute_query_returns_stream(self, *params, query: str,
+                                     chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE,
+                                     raw: bool = False,
+                                     chunk_sizer: Optional[AdaptiveChunkSizer] = None) -> CursorRowStream:
+        return self.__call_through_circuit_breaker(
+            operation=lambda: self.__open_row_stream(
+                *params, query=query, chunk_size=chunk_size, raw=raw, chunk_sizer=chunk_sizer
+            )
+        )
+
+    # -----------------------------------------------------------------------------------
+    def __open_row_stream(self, *params, query: str, chunk_size: int, raw: bool,
+                          chunk_sizer: Optional[AdaptiveChunkSizer],
+                          apply_row_factory: bool = True) -> CursorRowStream:
+        conn_manager: SingleConnectionManager = self._perform_connection_manager
+
+        conn_is_active: bool = conn_manager.check_connection_status()
+        if conn_is_active is False:
+            raise OperationFailedConnectionIsNotActive()
+
+        adapter: ConnectionInterface = conn_manager.get_connection()
+
+        # Непрочитанный результат занимает подключение: блокировка держится до закрытия или
+        # исчерпания потока, поэтому поток читается и закрывается в открывшем его потоке выполнения
+        connection_lock: threading.RLock = self._connection_lock
+        connection_lock.acquire()
+
+        try:
+            # Строки читаются с сервера по мере обхода потока, а не загружаются целиком
+            cur: CursorInterface = self.__open_cursor(
+                adapter=adapter, unbuffered=True, raw=raw
+            )
+        except Exception:
+            connection_lock.release()
+            raise
+
+        try:
+            if apply_row_factory:
+                self.__prepare_cursor(cur=cur)
+
+            cur.execute(query=query, *params)
+
+            return CursorRowStream(
+                cursor=cur, chunk_size=chunk_size, chunk_sizer=chunk_sizer, on_close=connection_lock.release
+            )
+        except Exception:
+            try:
+                cur.close()
+            finally:
+                connection_lock.release()
+            raise
+
+    # -----------------------------------------------------------------------------------
+    def execute_query_returns_spillable(self, *params, query: str,
+                                        memory_limit: int = DEFAULT_SPILL_MEMORY_LIMIT,
+                                        spill_directory: Optional[str] = None,
+                                        chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE,
+                                        raw: bool = False) -> SpillableResultSet:
+        # Результат читается потоком, чтобы сверх лимита в памяти не было даже буфера драйвера
+        with self.execute_query_returns_stream(query=query, chunk_size=chunk_size, raw=raw, *params) as stream:
+            return SpillableResultSet(
+                rows=stream,
+                memory_limit=memory_limit,
+                spill_directory=spill_directory
+            )
+
+    # -----------------------------------------------------------------------------------
+    def export_query_results(self, *params, query: str, file_path: str,
+                             export_format: ExportFormat = ExportFormat.CSV, compress: bool = False,
+                             chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE) -> int:
+        # Экспортёр пишет значения по позициям колонок, поэтому строки остаются кортежами
+        stream: CursorRowStream = self.__call_through_circuit_breaker(
+            operation=lambda: self.__open_row_stream(
+                *params, query=query, chunk_size=chunk_size, raw=False, chunk_sizer=None,
+                apply_row_factory=False
+            )
+        )
+
+        with stream:
+            return ResultExporter.export_chunks(
+                chunks=stream.iter_chunks(),
+                column_names=stream.get_column_names(),
+                file_path=file_path,
+                export_format=export_format,
+                compress=compress
+            )
+
+    # -----------------------------------------------------------------------------------
+    def execute_blob_stream(self, *params, table: str, column: str, where: str,
+                            sink: Union[BinaryIO, memoryview, bytearray],
+                            slice_size: int = DEFAULT_BLOB_SLICE_SIZE) -> int:
+        for arg_name, value in (('table', table), ('column', column), ('where', where)):
+            ToolKit.ensure_instance(
+                obj=value,
+                expected_type=str,
+                arg_name=arg_name
+            )
+        ToolKit.ensure_instance(
+            obj=slice_size,
+            expected_type=int,
+            arg_name='slice_size'
+        )
+
+        if slice_size <= 0:
+            raise InvalidArgumentValueError(
+                f"Error! Argument: *slice_size* - should be positive! But given: *{slice_size}*!"
+            )
+
+        if not isinstance(sink, (memoryview, bytearray)) and not callable(getattr(sink, 'write', None)):
+            raise InvalidArgumentTypeError(
+                f"Error! Argument: *sink* - should be a writable file or *memoryview*!\n"
+                f"But given: *{sink}* - is Type of *{type(sink).__name__}*!"
+            )
+
+        length_query: str = QueryBuilder.build_blob_length_query(table=table, column=column, where=where)
+        slice_query: str = QueryBuilder.build_blob_slice_query(
+            table=table, column=column, where=where, placeholder=self.query_param_placeholder
+        )
+
+        # Окна читаются подряд на одном подключении, без чужих запросов между ними
+        with self._connection_lock:
+            conn_manager: SingleConnectionManager = self._perform_connection_manager
+
+            if conn_manager.check_connection_status() is False:
+                raise OperationFailedConnectionIsNotActive()
+
+            adapter: ConnectionInterface = conn_manager.get_connection()
+
+            # В режиме autocommit каждое окно читалось бы из своего снимка данных.
+            # Внутри уже открытой транзакции снимок и так общий для всех запросов
+            use_snapshot: bool = adapter.get_autocommit() is True
+            if use_snapshot:
+                self.__execute_query(
+                    query_string=MYSQL_START_SNAPSHOT_TRANSACTION_QUERY,
+                    apply_row_factory=False
+                )
+
+            try:
+                return self.__read_blob_slices(
+                    *params, length_query=length_query, slice_query=slice_query,
+                    sink=sink, slice_size=slice_size
+                )
+            finally:
+                if use_snapshot:
+                    adapter.commit()
+
+    # -----------------------------------------------------------------------------------
+    def __read_blob_slices(self, *params, length_query: str, slice_query: str,
+                           sink: Union[BinaryIO, memoryview, bytearray], slice_size: int) -> int:
+        length_row: Sequence = self.__execute_query(
+            query_string=length_query, *params,
+            fetch_processor=lambda cur: cur.fetchone(),
+            apply_row_factory=False
+        )
+
+        # Отсутствующая строка и NULL значение не содержат данных для записи
+        if not length_row or length_row[0] is None:
+            return 0
+
+        blob_length: int = int(length_row[0])
+
+        is_buffer_sink: bool = isinstance(sink, (memoryview, bytearray))
+        if is_buffer_sink:
+            sink = memoryview(sink).cast('B')
+
+            if sink.nbytes < blob_length:
+                raise InvalidArgumentValueError(
+                    f"Error! Argument: *sink* - has *{sink.nbytes}* bytes, "
+                    f"but BLOB size is *{blob_length}* bytes!"
+                )
+
+        written_bytes: int = 0
+
+        # Значение читается окнами фиксированного размера: в памяти не больше одного окна
+        while written_bytes < blob_length:
+            slice_row: Sequence = self.__execute_query(
+                written_bytes + 1, slice_size, *params,
+                query_string=slice_query,
+                fetch_processor=lambda cur: cur.fetchone(),
+                raw=True,
+                apply_row_factory=False
+            )
+
+            # При уровне READ COMMITTED снимок не сохраняется между запросами
+            if not slice_row or slice_row[1] is None or int(slice_row[1]) != blob_length:
+                raise OperationFailedValueChangedDuringRead()
+
+            chunk: bytes = slice_row[0]
+            if not chunk:
+                break
+
+            if is_buffer_sink:
+                sink[written_bytes:written_bytes + len(chunk)] = chunk
+            else:
+                sink.write(chunk)
+
+            written_bytes += len(chunk)
+
+        return written_bytes
+
+    # -----------------------------------------------------------------------------------
+    def execute_bulk_insert(self, table: str, columns: Sequence[str],
+                            rows: Iterable[Sequence[Any]]) -> int:
+        ToolKit.ensure_instance(
+            obj=table,
+            expected_type=str,
+            arg_name='table'
+        )
+
+        columns_count: int = len(columns)
+        header: str = QueryBuilder.build_insert_header(table=table, columns=columns)
+        values_group: str = QueryBuilder.build_values_group(
+            columns_count=columns_count, placeholder=self.query_param_placeholder
+        )
+
+        statement_limit: int = int(self.__get_max_allowed_packet() * BULK_INSERT_PACKET_USAGE_RATIO)
+        inserted_rows_count: int = 0
+
+        batch_params: List[Any] = []
+        batch_rows_count: int = 0
+        batch_size: int = len(header)
+
+        for row in rows:
+            if len(row) != columns_count:
+                raise InvalidArgumentValueError(
+                    f"Error! Row: *{row}* - should contain *{columns_count}* values!"
+                )
+
+            row_size: int = QueryBuilder.estimate_row_size(row=row)
+
+            # Текущая пачка отправляется, когда следующая строка не помещается в пакет
+            if batch_rows_count > 0 and batch_size + row_size > statement_limit:
+                self.execute_query_no_returns(
+                    query=header + ','.join(values_group for _ in range(batch_rows_count)),
+                    *batch_params
+                )
+                inserted_rows_count += batch_rows_count
+
+                batch_params = []
+                batch_rows_count = 0
+                batch_size = len(header)
+
+            batch_params.extend(row)
+            batch_rows_count += 1
+            batch_size += row_size
+
+        if batch_rows_count > 0:
+            self.execute_query_no_returns(
+                query=header + ','.join(values_group for _ in range(batch_rows_count)),
+                *batch_params
+            )
+            inserted_rows_count += batch_rows_count
+
+        return inserted_rows_count
+
+    # -----------------------------------------------------------------------------------
+    def execute_upsert(self, table: str, columns: Sequence[str], rows: Iterable[Sequence[Any]],
+                       conflict_columns: Sequence[str], update_columns: Optional[Sequence[str]] = None,
+                       chunk_size: int = DEFAULT_UPSERT_CHUNK_SIZE) -> int:
+        ToolKit.ensure_instance(
+            obj=table,
+            expected_type=str,
+            arg_name='table'
+        )
+        ToolKit.ensure_instance(
+            obj=chunk_size,
+            expected_type=int,
+            arg_name='chunk_size'
+        )
+
+        if chunk_size <= 0:
+            raise InvalidArgumentValueError(
+                f"Error! Argument: *chunk_size* - should be positive! But given: *{chunk_size}*!"
+            )
+
+        unknown_columns: List[str] = [
+            column for column in (*conflict_columns, *(update_columns or ()))
+            if column not in columns
+        ]
+        if not conflict_columns or unknown_columns:
+            raise InvalidArgumentValueError(
+                f"Error! Conflict and update columns should be a part of *{columns}*!\n"
+                f"But given conflict: *{conflict_columns}*, update: *{update_columns}*!"
+            )
+
+        # По умолчанию обновляются все колонки, не входящие в ключ конфликта
+        if update_columns is None:
+            update_columns = [column for column in columns if column not in conflict_columns]
+
+        columns_count: int = len(columns)
+        query: str = QueryBuilder.build_upsert_query(
+            table=table,
+            columns=columns,
+            update_columns=update_columns,
+            placeholder=self.query_param_placeholder
         )
 
+        upserted_rows_count: int = 0
+        chunk: List[Sequence[Any]] = []
+
+        for row in rows:
+            if len(row) != columns_count:
+                raise InvalidArgumentValueError(
+                    f"Error! Row: *{row}* - should contain *{columns_count}* values!"
+                )
+
+            chunk.append(row)
+
+            if len(chunk) == chunk_size:
+                self.execute_batch_no_returns(query=query, params_sequence=chunk)
+                upserted_rows_count += len(chunk)
+                chunk = []
+
+        if chunk:
+            self.execute_batch_no_returns(query=query, params_sequence=chunk)
+            upserted_rows_count += len(chunk)
+
+        return upserted_rows_count
+
+    # -----------------------------------------------------------------------------------
+    def execute_bulk_load(self, table: str, columns: Sequence[str],
+                          rows: Iterable[Sequence[Any]] = (), file_path: str = '') -> BulkLoadResult:
+        ToolKit.ensure_instance(
+            obj=table,
+            expected_type=str,
+            arg_name='table'
+        )
+        ToolKit.ensure_instance(
+            obj=file_path,
+            expected_type=str,
+            arg_name='file_path'
+        )
+
+        result: BulkLoadResult = self.__call_through_circuit_breaker(
+            operation=lambda: self.__load_on_connection(
+                table=table, columns=columns, rows=rows, file_path=file_path
+            )
+        )
+        self.__invalidate_query_cache(tables=frozenset({SQLTableExtractor.normalize_table_name(table)}))
+
+        return result
+
+    # -----------------------------------------------------------------------------------
+    def __load_on_connection(self, table: str, columns: Sequence[str],
+                             rows: Iterable[Sequence[Any]], file_path: str) -> BulkLoadResult:
+        conn_manager: SingleConnectionManager = self._perform_connection_manager
+
+        conn_is_active: bool = conn_manager.check_connection_status()
+        if conn_is_active is False:
+            raise OperationFailedConnectionIsNotActive()
+
+        adapter: ConnectionInterface = conn_manager.get_connection()
+
+        with self._connection_lock:
+            # Загрузка фиксируется по тем же правилам, что и остальные записи сессии
+            if self._autocommit_mode is not None:
+                adapter.set_autocommit(enabled=self._autocommit_mode)
+
+            return adapter.bulk_load(
+                table=table, columns=columns, rows=rows, file_path=file_path
+            )
+
+    # -----------------------------------------------------------------------------------
+    def __get_max_allowed_packet(self) -> int:
+        # Значение запрашивается у сервера один раз и сбрасывается при смене подключения
+        if self._max_allowed_packet == 0:
+            result: Sequence = self.__execute_query(
+                query_string=MYSQL_MAX_ALLOWED_PACKET_QUERY,
+                fetch_processor=lambda cur: cur.fetchone(),
+                apply_row_factory=False
+            )
+
+            self._max_allowed_packet = int(result[0])
+
+        return self._max_allowed_packet
+
     # -----------------------------------------------------------------------------------
     def deconstruct_database_and_components(self) -> None:
-        pass
+        # Атрибут может отсутствовать, если конструктор завершился ошибкой
+        write_behind_queue: WriteBehindQueue = getattr(self, '_write_behind_queue', NoWriteBehindQueue())
+
+        # Отложенные строки записываются до освобождения подключения
+        if not isinstance(write_behind_queue, NoWriteBehindQueue):
+            try:
+                write_behind_queue.close()
+            except OperationFailedWritesAreLost:
+                # Потерянные пакеты уже переданы наблюдателям логирования, освобождение продолжается
+                pass
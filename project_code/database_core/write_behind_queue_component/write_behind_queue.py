@@ -0,0 +1,235 @@
+# -*- coding: utf-8 -*-
+
+"""
+Copyright 2025 kichiro-kun (Kei)
+Apache license, version 2.0 (Apache-2.0 license)
+"""
+
+__all__: list[str] = [
+    'WriteBehindQueue',
+    'NoWriteBehindQueue',
+]
+
+__author__ = 'kichiro-kun (Kei)'
+__version__ = '0.2.0'
+
+# =======================================================================================
+import queue
+import threading
+import time
+from typing import Any, List, NoReturn, Optional, Sequence, Tuple
+
+from database_core.abstract_database_component.database import DataBase
+from query_core.query_interface_component.query_interface import QueryInterface
+
+from _logging.log_entry_component.abstract.log_entry_dto import LogEntryDTO
+
+from shared.constants.global_configuration import DEFAULT_WRITE_BEHIND_MAX_QUEUE_SIZE, \
+    DEFAULT_WRITE_BEHIND_BATCH_SIZE, DEFAULT_WRITE_BEHIND_FLUSH_INTERVAL_MS
+from shared.exceptions.common import InvalidArgumentTypeError, IsNullObjectOperation, \
+    OperationFailedComponentIsClosed, OperationFailedQueueIsFull, OperationFailedWritesAreLost
+from shared.utils.toolkit import ToolKit
+
+
+PendingWrite = Tuple[str, Sequence[Any]]
+
+_STOP_SIGNAL = object()
+
+
+# _______________________________________________________________________________________
+class WriteBehindQueue:
+
+    # -----------------------------------------------------------------------------------
+    def __init__(self, database: DataBase,
+                 max_queue_size: int = DEFAULT_WRITE_BEHIND_MAX_QUEUE_SIZE,
+                 batch_size: int = DEFAULT_WRITE_BEHIND_BATCH_SIZE,
+                 flush_interval_ms: float = DEFAULT_WRITE_BEHIND_FLUSH_INTERVAL_MS) -> None:
+        ToolKit.ensure_instance(
+            obj=database,
+            expected_type=DataBase,
+            arg_name='database'
+        )
+        ToolKit.ensure_instance(
+            obj=database,
+            expected_type=QueryInterface,
+            arg_name='database'
+        )
+        ToolKit.ensure_instance(
+            obj=max_queue_size,
+            expected_type=int,
+            arg_name='max_queue_size'
+        )
+        ToolKit.ensure_instance(
+            obj=batch_size,
+            expected_type=int,
+            arg_name='batch_size'
+        )
+        if isinstance(flush_interval_ms, bool) or not isinstance(flush_interval_ms, (int, float)):
+            raise InvalidArgumentTypeError(
+                f"Error! Argument: *flush_interval_ms* - should be a *float*!\n"
+                f"But given: *{flush_interval_ms}* - is Type of *{type(flush_interval_ms).__name__}*!"
+            )
+
+        self.__database: DataBase = database
+        self.__batch_size: int = max(1, batch_size)
+        self.__flush_interval: float = flush_interval_ms / 1000
+
+        self.__pending_writes: queue.Queue = queue.Queue(maxsize=max(1, max_queue_size))
+        self.__state_lock = threading.Lock()
+        self.__is_closed: bool = False
+
+        # Ошибки записи копятся обработчиком и выбрасываются вызывающему из flush и close.
+        # Отдельная блокировка: обработчик не должен ждать close, который ждёт места в очереди
+        self.__errors_lock = threading.Lock()
+        self.__write_errors: List[Exception] = []
+        self.__lost_rows_count: int = 0
+
+        self.__worker = threading.Thread(
+            target=self.__process_pending_writes,
+            name='WriteBehindWorker',
+            daemon=True
+        )
+        self.__worker.start()
+
+    # -----------------------------------------------------------------------------------
+    def enqueue(self, *params, query: str, timeout: Optional[float] = None) -> None:
+        ToolKit.ensure_instance(
+            obj=query,
+            expected_type=str,
+            arg_name='query'
+        )
+
+        # Проверка и постановка в очередь атомарны: строка не может попасть в очередь после сигнала остановки
+        with self.__state_lock:
+            if self.__is_closed:
+                raise OperationFailedComponentIsClosed()
+
+            # Заполненная очередь блокирует производителя, пока обработчик не освободит место
+            try:
+                self.__pending_writes.put((query, params), timeout=timeout)
+            except queue.Full:
+                raise OperationFailedQueueIsFull() from None
+
+    # -----------------------------------------------------------------------------------
+    def flush(self) -> None:
+        # Ожидание записи всех принятых к этому моменту строк
+        self.__pending_writes.join()
+        self.__raise_write_errors()
+
+    # -----------------------------------------------------------------------------------
+    def get_pending_count(self) -> int:
+        return self.__pending_writes.qsize()
+
+    # -----------------------------------------------------------------------------------
+    def close(self) -> None:
+        with self.__state_lock:
+            if self.__is_closed:
+                return
+
+            self.__is_closed = True
+            self.__pending_writes.put(_STOP_SIGNAL)
+
+        # Уже принятые строки записываются до остановки обработчика
+        self.__worker.join()
+        self.__raise_write_errors()
+
+    # -----------------------------------------------------------------------------------
+    def __process_pending_writes(self) -> None:
+        is_stopped: bool = False
+
+        while is_stopped is False:
+            batch, is_stopped = self.__collect_batch()
+
+            if batch:
+                self.__write_batch(batch=batch)
+
+            for _ in range(len(batch) + int(is_stopped)):
+                self.__pending_writes.task_done()
+
+    # -----------------------------------------------------------------------------------
+    def __collect_batch(self) -> Tuple[List[PendingWrite], bool]:
+        pending_writes: queue.Queue = self.__pending_writes
+
+        first_item = pending_writes.get()
+        if first_item is _STOP_SIGNAL:
+            return [], True
+
+        batch: List[PendingWrite] = [first_item]
+        deadline: float = time.monotonic() + self.__flush_interval
+
+        while len(batch) < self.__batch_size:
+            remaining_time: float = deadline - time.monotonic()
+            if remaining_time <= 0:
+                break
+
+            try:
+                item = pending_writes.get(timeout=remaining_time)
+            except queue.Empty:
+                break
+
+            if item is _STOP_SIGNAL:
+                return batch, True
+
+            batch.append(item)
+
+        return batch, False
+
+    # -----------------------------------------------------------------------------------
+    def __write_batch(self, batch: List[PendingWrite]) -> None:
+        database: DataBase = self.__database
+
+        # Объединяются только подряд идущие строки одного запроса, иначе порядок инструкций нарушится
+        coalesced_writes: List[Tuple[str, List[Sequence[Any]]]] = []
+        for query, params in batch:
+            if coalesced_writes and coalesced_writes[-1][0] == query:
+                coalesced_writes[-1][1].append(params)
+            else:
+                coalesced_writes.append((query, [params]))
+
+        for query, params_sequence in coalesced_writes:
+            try:
+                database.execute_batch_no_returns(query=query, params_sequence=params_sequence)
+            except Exception as write_error:
+                # Ошибка одной группы не останавливает обработчик, но передаётся в flush и close
+                with self.__errors_lock:
+                    self.__write_errors.append(write_error)
+                    self.__lost_rows_count += len(params_sequence)
+
+                log_entry: LogEntryDTO = database.log_entry_factory.create_new_log_entry(
+                    level='Error',
+                    msg_text=f'Write-behind batch of *{len(params_sequence)}* rows is lost: {write_error!r}',
+                    context=f'WriteBehindQueue: {query}'
+                )
+                database.notify_logger_observers(log_entry=log_entry)
+
+    # -----------------------------------------------------------------------------------
+    def __raise_write_errors(self) -> None:
+        with self.__errors_lock:
+            write_errors: List[Exception] = self.__write_errors
+            lost_rows_count: int = self.__lost_rows_count
+
+            self.__write_errors = []
+            self.__lost_rows_count = 0
+
+        if write_errors:
+            raise OperationFailedWritesAreLost(
+                f"Failure! *{lost_rows_count}* deferred rows in *{len(write_errors)}* batches are not written!"
+            ) from write_errors[0]
+
+
+# _______________________________________________________________________________________
+class NoWriteBehindQueue(WriteBehindQueue):
+    def __init__(self) -> None:
+        pass
+
+    def enqueue(self, *params, query: str, timeout: Optional[float] = None) -> NoReturn:
+        raise IsNullObjectOperation
+
+    def flush(self) -> NoReturn:
+        raise IsNullObjectOperation
+
+    def get_pending_count(self) -> NoReturn:
+        raise IsNullObjectOperation
+
+    def close(self) -> NoReturn:
+        raise IsNullObjectOperation
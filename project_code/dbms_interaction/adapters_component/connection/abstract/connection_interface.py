@@ -10,14 +10,16 @@ __all__: list[str] = [
 ]
 
 __author__ = 'kichiro-kun (Kei)'
-__version__ = '0.6.0'
+__version__ = '0.12.0'
 
 # =======================================================================================
 from abc import abstractmethod, ABC
-from typing import Any, Dict
+from typing import Any, Dict, Iterable, Sequence
 
 from dbms_interaction.adapters_component.cursor.abstract.cursor_interface import CursorInterface
 
+from shared.types.bulk_load_types import BulkLoadResult
+
 
 # _______________________________________________________________________________________
 class ConnectionInterface(ABC):
@@ -31,7 +33,8 @@ class ConnectionInterface(ABC):
 
     # -----------------------------------------------------------------------------------
     @abstractmethod
-    def get_cursor(self, special_placeholder: str = '') -> CursorInterface: ...
+    def get_cursor(self, special_placeholder: str = '', unbuffered: bool = False,
+                   raw: bool = False) -> CursorInterface: ...
 
     # -----------------------------------------------------------------------------------
     @abstractmethod
@@ -52,3 +55,20 @@ class ConnectionInterface(ABC):
     # -----------------------------------------------------------------------------------
     @abstractmethod
     def rollback(self) -> bool: ...
+
+    # -----------------------------------------------------------------------------------
+    @abstractmethod
+    def set_autocommit(self, enabled: bool) -> bool: ...
+
+    # -----------------------------------------------------------------------------------
+    @abstractmethod
+    def get_autocommit(self) -> bool: ...
+
+    # -----------------------------------------------------------------------------------
+    @abstractmethod
+    def get_connection_id(self) -> int: ...
+
+    # -----------------------------------------------------------------------------------
+    @abstractmethod
+    def bulk_load(self, table: str, columns: Sequence[str],
+                  rows: Iterable[Sequence[Any]] = (), file_path: str = '') -> BulkLoadResult: ...
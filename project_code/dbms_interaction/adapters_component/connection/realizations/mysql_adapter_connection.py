@@ -10,13 +10,17 @@ __all__: list[str] = [
 ]
 
 __author__ = 'kichiro-kun (Kei)'
-__version__ = '0.6.0'
+__version__ = '0.12.0'
 
 
 # =======================================================================================
-from typing import Any, Dict
+import csv
+import os
+import tempfile
+from typing import Any, BinaryIO, Dict, Iterable, Optional, Sequence, Tuple
 
 from mysql.connector import MySQLConnection
+from mysql.connector.cursor import MySQLCursor
 
 from dbms_interaction.adapters_component.connection.abstract.connection_interface\
     import ConnectionInterface
@@ -24,7 +28,32 @@ from dbms_interaction.adapters_component.connection.abstract.connection_interfac
 from dbms_interaction.adapters_component.cursor.realizations.mysql_adapter_cursor\
     import MySQLAdapterCursor
 
+from shared.constants.global_configuration import BULK_LOAD_FILE_BUFFER_SIZE
 from shared.exceptions.common import OperationFailedConnectionIsNotActive
+from shared.types.bulk_load_types import BulkLoadResult
+from shared.utils.toolkit import ToolKit
+
+
+# Экранирование для LOAD DATA с FIELDS ESCAPED BY '\\' (обратный слеш заменяется первым)
+_LOAD_DATA_ESCAPE_SEQUENCES: Tuple[Tuple[bytes, bytes], ...] = (
+    (b'\\', b'\\\\'),
+    (b'\t', b'\\t'),
+    (b'\n', b'\\n'),
+    (b'\r', b'\\r'),
+    (b'\x00', b'\\0'),
+)
+_LOAD_DATA_NULL_VALUE: bytes = b'\\N'
+
+_LOAD_DATA_ROWS_STATEMENT: str = (
+    "LOAD DATA LOCAL INFILE %s INTO TABLE {table} CHARACTER SET utf8mb4 "
+    "FIELDS TERMINATED BY '\\t' ESCAPED BY '\\\\' "
+    "LINES TERMINATED BY '\\n' ({columns})"
+)
+_LOAD_DATA_CSV_STATEMENT: str = (
+    "LOAD DATA LOCAL INFILE %s INTO TABLE {table} CHARACTER SET utf8mb4 "
+    "FIELDS TERMINATED BY ',' OPTIONALLY ENCLOSED BY '\"' ESCAPED BY '' "
+    "LINES TERMINATED BY '\\n' ({columns})"
+)
 
 
 # _______________________________________________________________________________________
@@ -33,6 +62,7 @@ class MySQLAdapterConnection(ConnectionInterface):
     # -----------------------------------------------------------------------------------
     def __init__(self, connector: MySQLConnection) -> None:
         self.__adaptee: MySQLConnection = connector
+        self.__autocommit_mode: Optional[bool] = None
 
     # -----------------------------------------------------------------------------------
     def connect(self, config: Dict[str, Any]) -> bool:
@@ -40,6 +70,9 @@ class MySQLAdapterConnection(ConnectionInterface):
 
         connector.connect(**config)
 
+        # Коннектор сам устанавливает режим autocommit сессии при подключении
+        self.__autocommit_mode = bool(config.get('autocommit', False))
+
         return True
 
     # -----------------------------------------------------------------------------------
@@ -55,22 +88,30 @@ class MySQLAdapterConnection(ConnectionInterface):
         return True
 
     # -----------------------------------------------------------------------------------
-    def get_cursor(self, special_placeholder: str = '') -> MySQLAdapterCursor:
+    def get_cursor(self, special_placeholder: str = '', unbuffered: bool = False,
+                   raw: bool = False) -> MySQLAdapterCursor:
         connector: MySQLConnection = self.__adaptee
 
         connector_is_connected: bool = self.is_active()
         if connector_is_connected is False:
             raise OperationFailedConnectionIsNotActive()
 
-        if special_placeholder == '':
-            cur = MySQLAdapterCursor(
-                connector=connector
-            )
-        else:
-            cur = MySQLAdapterCursor(
-                connector=connector,
-                special_placeholder=special_placeholder
-            )
+        # Курсору передаются только отличающиеся от значений по умолчанию параметры
+        cursor_options: Dict[str, Any] = {}
+
+        if special_placeholder != '':
+            cursor_options['special_placeholder'] = special_placeholder
+
+        if unbuffered:
+            cursor_options['unbuffered'] = True
+
+        if raw:
+            cursor_options['raw'] = True
+
+        cur = MySQLAdapterCursor(
+            connector=connector,
+            **cursor_options
+        )
 
         return cur
 
@@ -118,5 +159,153 @@ class MySQLAdapterConnection(ConnectionInterface):
 
     # -----------------------------------------------------------------------------------
     def rollback(self) -> bool:
-        # Реализовать метод rollback для отката
-        pass
+        connector: MySQLConnection = self.__adaptee
+
+        connector_is_connected: bool = self.is_active()
+        if connector_is_connected is False:
+            return False
+
+        connector.rollback()
+
+        return True
+
+    # -----------------------------------------------------------------------------------
+    def set_autocommit(self, enabled: bool) -> bool:
+        ToolKit.ensure_instance(
+            obj=enabled,
+            expected_type=bool,
+            arg_name='enabled'
+        )
+
+        connector: MySQLConnection = self.__adaptee
+
+        connector_is_connected: bool = self.is_active()
+        if connector_is_connected is False:
+            return False
+
+        # Режим уже установлен - повторная отправка SET на сервер не требуется
+        if self.__autocommit_mode is enabled:
+            return False
+
+        connector.autocommit = enabled
+        self.__autocommit_mode = enabled
+
+        return True
+
+    # -----------------------------------------------------------------------------------
+    def get_autocommit(self) -> bool:
+        # Режим известен после подключения, обращение к серверу не требуется
+        if self.__autocommit_mode is not None:
+            return self.__autocommit_mode
+
+        connector: MySQLConnection = self.__adaptee
+
+        connector_is_connected: bool = self.is_active()
+        if connector_is_connected is False:
+            return False
+
+        return bool(connector.autocommit)
+
+    # -----------------------------------------------------------------------------------
+    def get_connection_id(self) -> int:
+        connector: MySQLConnection = self.__adaptee
+
+        connector_is_connected: bool = self.is_active()
+        if connector_is_connected is False:
+            raise OperationFailedConnectionIsNotActive()
+
+        # Идентификатор серверного потока, который принимает KILL QUERY
+        return connector.connection_id
+
+    # -----------------------------------------------------------------------------------
+    def bulk_load(self, table: str, columns: Sequence[str],
+                  rows: Iterable[Sequence[Any]] = (), file_path: str = '') -> BulkLoadResult:
+        connector_is_connected: bool = self.is_active()
+        if connector_is_connected is False:
+            raise OperationFailedConnectionIsNotActive()
+
+        columns_string: str = ', '.join(columns)
+
+        if file_path != '':
+            sent_rows_count: int = self.__count_csv_records(file_path=file_path)
+
+            return self.__execute_load_data(
+                statement=_LOAD_DATA_CSV_STATEMENT.format(table=table, columns=columns_string),
+                file_path=file_path,
+                sent_rows_count=sent_rows_count
+            )
+
+        # Временный файл вместо канала: LOCAL INFILE на Windows не умеет читать из pipe
+        temp_file = tempfile.NamedTemporaryFile(
+            mode='wb', suffix='.tsv', delete=False, buffering=BULK_LOAD_FILE_BUFFER_SIZE
+        )
+        try:
+            with temp_file:
+                sent_rows_count = self.__write_load_data_file(
+                    file=temp_file, rows=rows
+                )
+
+            return self.__execute_load_data(
+                statement=_LOAD_DATA_ROWS_STATEMENT.format(table=table, columns=columns_string),
+                file_path=temp_file.name,
+                sent_rows_count=sent_rows_count
+            )
+        finally:
+            os.remove(temp_file.name)
+
+    # -----------------------------------------------------------------------------------
+    def __execute_load_data(self, statement: str, file_path: str, sent_rows_count: int) -> BulkLoadResult:
+        connector: MySQLConnection = self.__adaptee
+
+        cur: MySQLCursor = connector.cursor()
+        try:
+            cur.execute(statement, (file_path,))
+
+            loaded_rows_count: int = max(cur.rowcount, 0)
+            warnings_count: int = cur.warning_count
+        finally:
+            cur.close()
+
+        return BulkLoadResult(
+            loaded_rows=loaded_rows_count,
+            skipped_rows=max(sent_rows_count - loaded_rows_count, 0),
+            warnings=warnings_count
+        )
+
+    # -----------------------------------------------------------------------------------
+    @staticmethod
+    def __write_load_data_file(file: BinaryIO, rows: Iterable[Sequence[Any]]) -> int:
+        encode_value = MySQLAdapterConnection.__encode_load_data_value
+        written_rows_count: int = 0
+
+        for row in rows:
+            file.write(b'\t'.join([encode_value(value) for value in row]) + b'\n')
+            written_rows_count += 1
+
+        return written_rows_count
+
+    # -----------------------------------------------------------------------------------
+    @staticmethod
+    def __encode_load_data_value(value: Any) -> bytes:
+        if value is None:
+            return _LOAD_DATA_NULL_VALUE
+
+        if isinstance(value, bool):
+            return b'1' if value else b'0'
+
+        if isinstance(value, (bytes, bytearray, memoryview)):
+            raw_value: bytes = bytes(value)
+        else:
+            raw_value = str(value).encode('utf-8')
+
+        for special_sequence, escaped_sequence in _LOAD_DATA_ESCAPE_SEQUENCES:
+            if special_sequence in raw_value:
+                raw_value = raw_value.replace(special_sequence, escaped_sequence)
+
+        return raw_value
+
+    # -----------------------------------------------------------------------------------
+    @staticmethod
+    def __count_csv_records(file_path: str) -> int:
+        with open(file_path, mode='r', encoding='utf-8', newline='') as csv_file:
+            return sum(1 for _ in csv.reader(csv_file))
@@ -10,12 +10,14 @@ __all__: list[str] = [
 ]
 
 __author__ = 'kichiro-kun (Kei)'
-__version__ = '0.3.1'
+__version__ = '0.6.0'
 
 # =======================================================================================
 from abc import ABC, abstractmethod
 from ast import TypeVar
-from typing import Any, TypeVar, Generic, Sequence
+from typing import Any, Dict, TypeVar, Generic, Sequence
+
+from dbms_interaction.row_factory_component.row_factory import RowFactory
 
 
 RowType = TypeVar('RowType')
@@ -47,6 +49,18 @@ class CursorInterface(ABC, Generic[RowType]):
     @abstractmethod
     def fetchall(self) -> Sequence[RowType]: ...
 
+    # -----------------------------------------------------------------------------------
+    @abstractmethod
+    def set_row_factory(self, factory: RowFactory) -> None: ...
+
+    # -----------------------------------------------------------------------------------
+    @abstractmethod
+    def fetch_columnar(self, chunk_size: int, use_numpy: bool = True) -> Dict[str, Any]: ...
+
+    # -----------------------------------------------------------------------------------
+    @abstractmethod
+    def get_column_names(self) -> Sequence[str]: ...
+
     # -----------------------------------------------------------------------------------
     @abstractmethod
     def _replace_placeholder_to_dbms_default(self, query: str) -> str: ...
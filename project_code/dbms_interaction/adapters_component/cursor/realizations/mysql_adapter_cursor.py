@@ -10,27 +10,44 @@ __all__: list[str] = [
 ]
 
 __author__ = 'kichiro-kun (Kei)'
-__version__ = '0.3.1'
+__version__ = '0.7.0'
 
 # ========================================================================================
-from typing import Any, Sequence
+from typing import Any, Dict, Optional, Sequence
 
 from mysql.connector import MySQLConnection
 from mysql.connector.cursor import MySQLCursor
 
 from dbms_interaction.adapters_component.cursor.abstract.cursor_interface \
     import CursorInterface
+from dbms_interaction.columnar_fetch_component.columnar_result_builder \
+    import ColumnarResultBuilder
+from dbms_interaction.row_factory_component.row_factory \
+    import RowConverter, RowConverterFactory, RowFactory
 
-from shared.constants.global_configuration import MYSQL_QUERY_PLACEHOLDER
+from shared.constants.global_configuration import MYSQL_QUERY_PLACEHOLDER, DEFAULT_COLUMNAR_CHUNK_SIZE
+from shared.utils.toolkit import ToolKit
 
 
 # _______________________________________________________________________________________
 class MySQLAdapterCursor(CursorInterface):
 
     # -----------------------------------------------------------------------------------
-    def __init__(self, connector: MySQLConnection, special_placeholder: str = '') -> None:
-        self.__adaptee: MySQLCursor = connector.cursor()
+    def __init__(self, connector: MySQLConnection, special_placeholder: str = '',
+                 unbuffered: bool = False, raw: bool = False) -> None:
+        cursor_options: Dict[str, Any] = {}
+
+        # Небуферизованный курсор читает строки с сервера по мере выборки
+        if unbuffered:
+            cursor_options['buffered'] = False
+
+        # Сырой курсор возвращает значения байтами, без преобразования в типы Python
+        if raw:
+            cursor_options['raw'] = True
+
+        self.__adaptee: MySQLCursor = connector.cursor(**cursor_options)
         self.__special_placeholder: str = special_placeholder
+        self.__row_factory: RowFactory = RowFactory.TUPLE
 
     # -----------------------------------------------------------------------------------
     def execute(self, *params: Sequence[Any], query: str) -> None:
@@ -59,13 +76,27 @@ class MySQLAdapterCursor(CursorInterface):
     def close(self) -> None:
         self.__adaptee.close()
 
+    # -----------------------------------------------------------------------------------
+    def set_row_factory(self, factory: RowFactory) -> None:
+        ToolKit.ensure_instance(
+            obj=factory,
+            expected_type=RowFactory,
+            arg_name='factory'
+        )
+
+        self.__row_factory = factory
+
     # -----------------------------------------------------------------------------------
     def fetchone(self) -> Any:
         cur: MySQLCursor = self.__adaptee
 
         result = cur.fetchone()
 
-        return result
+        converter: Optional[RowConverter] = self.__get_row_converter()
+        if converter is None or result is None:
+            return result
+
+        return converter(result)
 
     # -----------------------------------------------------------------------------------
     def fetchmany(self, count: int = 1) -> Sequence:
@@ -73,7 +104,11 @@ class MySQLAdapterCursor(CursorInterface):
 
         result = cur.fetchmany(size=count)
 
-        return result
+        converter: Optional[RowConverter] = self.__get_row_converter()
+        if converter is None:
+            return result
+
+        return [converter(row) for row in result]
 
     # -----------------------------------------------------------------------------------
     def fetchall(self) -> Sequence:
@@ -81,7 +116,44 @@ class MySQLAdapterCursor(CursorInterface):
 
         result = cur.fetchall()
 
-        return result
+        converter: Optional[RowConverter] = self.__get_row_converter()
+        if converter is None:
+            return result
+
+        return [converter(row) for row in result]
+
+    # -----------------------------------------------------------------------------------
+    def fetch_columnar(self, chunk_size: int = DEFAULT_COLUMNAR_CHUNK_SIZE,
+                       use_numpy: bool = True) -> Dict[str, Any]:
+        cur: MySQLCursor = self.__adaptee
+        builder = ColumnarResultBuilder(column_names=self.get_column_names())
+
+        # Строки чанка сразу раскладываются по колонкам и не копятся списком кортежей
+        while True:
+            rows = cur.fetchmany(size=chunk_size)
+            if not rows:
+                break
+
+            builder.append_rows(rows=rows)
+
+        return builder.build(use_numpy=use_numpy)
+
+    # -----------------------------------------------------------------------------------
+    def get_column_names(self) -> Sequence[str]:
+        cur: MySQLCursor = self.__adaptee
+
+        return tuple(cur.column_names)
+
+    # -----------------------------------------------------------------------------------
+    def __get_row_converter(self) -> Optional[RowConverter]:
+        # Преобразователь берётся из кэша один раз на вызов выборки, а не на строку
+        if self.__row_factory is RowFactory.TUPLE:
+            return None
+
+        return RowConverterFactory.get_row_converter(
+            factory=self.__row_factory,
+            column_names=self.get_column_names()
+        )
 
     # -----------------------------------------------------------------------------------
     def get_default_placeholder(self) -> str:
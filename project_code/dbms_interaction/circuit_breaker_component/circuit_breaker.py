@@ -0,0 +1,269 @@
+# -*- coding: utf-8 -*-
+
+"""
+Copyright 2025 kichiro-kun (Kei)
+Apache license, version 2.0 (Apache-2.0 license)
+"""
+
+__all__: list[str] = [
+    'CircuitBreakerState',
+    'CircuitBreaker',
+    'NoCircuitBreaker',
+]
+
+__author__ = 'kichiro-kun (Kei)'
+__version__ = '0.2.0'
+
+# =======================================================================================
+import threading
+import time
+from collections import deque
+from enum import Enum
+from typing import Any, Callable, Deque, NoReturn, Tuple, Type
+
+from mysql.connector.errors import InterfaceError, OperationalError
+
+from shared.constants.global_configuration import DEFAULT_CIRCUIT_BREAKER_WINDOW_SIZE, \
+    DEFAULT_CIRCUIT_BREAKER_MINIMUM_CALLS, DEFAULT_CIRCUIT_BREAKER_FAILURE_RATE, \
+    DEFAULT_CIRCUIT_BREAKER_SLOW_CALL_DURATION, DEFAULT_CIRCUIT_BREAKER_SLOW_CALL_RATE, \
+    DEFAULT_CIRCUIT_BREAKER_OPEN_DURATION, DEFAULT_CIRCUIT_BREAKER_HALF_OPEN_CALLS
+from shared.exceptions.common import InvalidArgumentTypeError, InvalidArgumentValueError, \
+    IsNullObjectOperation, OperationFailedCircuitIsOpen, OperationFailedConnectionIsNotActive, \
+    OperationFailedQueryTimeoutExceeded, OperationFailedAllHostsUnavailable
+from shared.utils.toolkit import ToolKit
+
+
+# Недоступность сервера: обрыв соединения, таймауты и операционные ошибки драйвера
+_DEFAULT_RECORDED_EXCEPTIONS: Tuple[Type[Exception], ...] = (
+    OSError, InterfaceError, OperationalError, OperationFailedConnectionIsNotActive,
+    OperationFailedQueryTimeoutExceeded, OperationFailedAllHostsUnavailable,
+)
+
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+class CircuitBreakerState(Enum):
+    CLOSED = 1
+    OPEN = 2
+    HALF_OPEN = 3
+
+
+# _______________________________________________________________________________________
+class CircuitBreaker:
+
+    # -----------------------------------------------------------------------------------
+    def __init__(self, window_size: int = DEFAULT_CIRCUIT_BREAKER_WINDOW_SIZE,
+                 minimum_calls: int = DEFAULT_CIRCUIT_BREAKER_MINIMUM_CALLS,
+                 failure_rate_threshold: float = DEFAULT_CIRCUIT_BREAKER_FAILURE_RATE,
+                 slow_call_duration: float = DEFAULT_CIRCUIT_BREAKER_SLOW_CALL_DURATION,
+                 slow_call_rate_threshold: float = DEFAULT_CIRCUIT_BREAKER_SLOW_CALL_RATE,
+                 open_duration: float = DEFAULT_CIRCUIT_BREAKER_OPEN_DURATION,
+                 half_open_calls: int = DEFAULT_CIRCUIT_BREAKER_HALF_OPEN_CALLS,
+                 recorded_exceptions: Tuple[Type[Exception], ...] = _DEFAULT_RECORDED_EXCEPTIONS) -> None:
+        for arg_name, value in (('window_size', window_size), ('minimum_calls', minimum_calls),
+                                ('half_open_calls', half_open_calls)):
+            ToolKit.ensure_instance(
+                obj=value,
+                expected_type=int,
+                arg_name=arg_name
+            )
+
+            if value <= 0:
+                raise InvalidArgumentValueError(
+                    f"Error! Argument: *{arg_name}* - should be positive! But given: *{value}*!"
+                )
+
+        for arg_name, value in (('failure_rate_threshold', failure_rate_threshold),
+                                ('slow_call_duration', slow_call_duration),
+                                ('slow_call_rate_threshold', slow_call_rate_threshold),
+                                ('open_duration', open_duration)):
+            self.__ensure_positive_number(value=value, arg_name=arg_name)
+
+        ToolKit.ensure_instance(
+            obj=recorded_exceptions,
+            expected_type=tuple,
+            arg_name='recorded_exceptions'
+        )
+
+        for exception_type in recorded_exceptions:
+            if not isinstance(exception_type, type) or not issubclass(exception_type, Exception):
+                raise InvalidArgumentTypeError(
+                    f"Error! Argument: *recorded_exceptions* - should contain *Exception* subclasses!\n"
+                    f"But given: *{exception_type}*!"
+                )
+
+        self.__window_size: int = window_size
+        self.__minimum_calls: int = min(minimum_calls, window_size)
+        self.__failure_rate_threshold: float = failure_rate_threshold
+        self.__slow_call_duration: float = slow_call_duration
+        self.__slow_call_rate_threshold: float = slow_call_rate_threshold
+        self.__open_duration: float = open_duration
+        self.__half_open_calls: int = half_open_calls
+        self.__recorded_exceptions: Tuple[Type[Exception], ...] = recorded_exceptions
+
+        self.__lock = threading.Lock()
+        self.__state: CircuitBreakerState = CircuitBreakerState.CLOSED
+        self.__opened_at: float = 0.0
+
+        # Скользящее окно последних вызовов: (ошибка, медленный) и счётчики по нему
+        self.__outcomes: Deque[Tuple[bool, bool]] = deque()
+        self.__failures_count: int = 0
+        self.__slow_calls_count: int = 0
+
+        # Пробные вызовы в полуоткрытом состоянии
+        self.__trial_calls_in_flight: int = 0
+        self.__trial_successes_count: int = 0
+
+    # -----------------------------------------------------------------------------------
+    def call(self, operation: Callable[[], Any]) -> Any:
+        if not callable(operation):
+            raise InvalidArgumentTypeError(
+                f"Error! Argument: *operation* - should be a *Callable*!\n"
+                f"But given: *{operation}* - is Type of *{type(operation).__name__}*!"
+            )
+
+        is_trial_call: bool = self.__acquire_permission()
+        started_at: float = time.monotonic()
+
+        try:
+            result: Any = operation()
+        except self.__recorded_exceptions:
+            self.__record_outcome(is_trial_call=is_trial_call, failed=True,
+                                  duration=time.monotonic() - started_at)
+            raise
+        except BaseException:
+            # Ошибки запроса (дубликат ключа, синтаксис), ошибки вызывающего кода и прерывания
+            # не говорят о доступности сервера: пробный вызов освобождается без записи в окно
+            self.__release_trial_call(is_trial_call=is_trial_call)
+            raise
+
+        self.__record_outcome(is_trial_call=is_trial_call, failed=False,
+                              duration=time.monotonic() - started_at)
+
+        return result
+
+    # -----------------------------------------------------------------------------------
+    def get_state(self) -> CircuitBreakerState:
+        with self.__lock:
+            self.__move_to_half_open_if_expired(now=time.monotonic())
+
+            return self.__state
+
+    # -----------------------------------------------------------------------------------
+    def reset(self) -> None:
+        with self.__lock:
+            self.__transition_to(new_state=CircuitBreakerState.CLOSED)
+
+    # -----------------------------------------------------------------------------------
+    def __acquire_permission(self) -> bool:
+        with self.__lock:
+            state: CircuitBreakerState = self.__move_to_half_open_if_expired(now=time.monotonic())
+
+            if state is CircuitBreakerState.CLOSED:
+                return False
+
+            # Открытый предохранитель отклоняет вызов сразу, не дожидаясь таймаутов сервера
+            if state is CircuitBreakerState.OPEN \
+                    or self.__trial_calls_in_flight + self.__trial_successes_count >= self.__half_open_calls:
+                raise OperationFailedCircuitIsOpen()
+
+            self.__trial_calls_in_flight += 1
+
+            return True
+
+    # -----------------------------------------------------------------------------------
+    def __release_trial_call(self, is_trial_call: bool) -> None:
+        if is_trial_call:
+            with self.__lock:
+                self.__trial_calls_in_flight -= 1
+
+    # -----------------------------------------------------------------------------------
+    def __record_outcome(self, is_trial_call: bool, failed: bool, duration: float) -> None:
+        is_slow: bool = duration >= self.__slow_call_duration
+
+        with self.__lock:
+            if is_trial_call:
+                self.__trial_calls_in_flight -= 1
+
+                # Состояние могло смениться, пока выполнялся пробный вызов
+                if self.__state is not CircuitBreakerState.HALF_OPEN:
+                    return
+
+                if failed or is_slow:
+                    self.__transition_to(new_state=CircuitBreakerState.OPEN)
+                    return
+
+                self.__trial_successes_count += 1
+
+                if self.__trial_successes_count >= self.__half_open_calls:
+                    self.__transition_to(new_state=CircuitBreakerState.CLOSED)
+
+                return
+
+            if self.__state is not CircuitBreakerState.CLOSED:
+                return
+
+            outcomes: Deque[Tuple[bool, bool]] = self.__outcomes
+            outcomes.append((failed, is_slow))
+            self.__failures_count += failed
+            self.__slow_calls_count += is_slow
+
+            if len(outcomes) > self.__window_size:
+                old_failed, old_is_slow = outcomes.popleft()
+                self.__failures_count -= old_failed
+                self.__slow_calls_count -= old_is_slow
+
+            calls_count: int = len(outcomes)
+
+            if calls_count < self.__minimum_calls:
+                return
+
+            if self.__failures_count / calls_count >= self.__failure_rate_threshold \
+                    or self.__slow_calls_count / calls_count >= self.__slow_call_rate_threshold:
+                self.__transition_to(new_state=CircuitBreakerState.OPEN)
+
+    # -----------------------------------------------------------------------------------
+    def __move_to_half_open_if_expired(self, now: float) -> CircuitBreakerState:
+        if self.__state is CircuitBreakerState.OPEN and now - self.__opened_at >= self.__open_duration:
+            self.__transition_to(new_state=CircuitBreakerState.HALF_OPEN)
+
+        return self.__state
+
+    # -----------------------------------------------------------------------------------
+    def __transition_to(self, new_state: CircuitBreakerState) -> None:
+        self.__state = new_state
+        self.__outcomes.clear()
+        self.__failures_count = 0
+        self.__slow_calls_count = 0
+        self.__trial_successes_count = 0
+
+        if new_state is CircuitBreakerState.OPEN:
+            self.__opened_at = time.monotonic()
+
+    # -----------------------------------------------------------------------------------
+    @staticmethod
+    def __ensure_positive_number(value: Any, arg_name: str) -> None:
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            raise InvalidArgumentTypeError(
+                f"Error! Argument: *{arg_name}* - should be a *float*!\n"
+                f"But given: *{value}* - is Type of *{type(value).__name__}*!"
+            )
+
+        if value <= 0:
+            raise InvalidArgumentValueError(
+                f"Error! Argument: *{arg_name}* - should be positive! But given: *{value}*!"
+            )
+
+
+# _______________________________________________________________________________________
+class NoCircuitBreaker(CircuitBreaker):
+    def __init__(self) -> None:
+        pass
+
+    def call(self, operation: Callable[[], Any]) -> NoReturn:
+        raise IsNullObjectOperation
+
+    def get_state(self) -> NoReturn:
+        raise IsNullObjectOperation
+
+    def reset(self) -> NoReturn:
+        raise IsNullObjectOperation
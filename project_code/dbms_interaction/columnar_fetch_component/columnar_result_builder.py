@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+
+"""
+Copyright 2025 kichiro-kun (Kei)
+Apache license, version 2.0 (Apache-2.0 license)
+"""
+
+__all__: list[str] = [
+    'ColumnarResultBuilder',
+]
+
+__author__ = 'kichiro-kun (Kei)'
+__version__ = '0.1.1'
+
+# =======================================================================================
+from array import array
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+from shared.utils.toolkit import ToolKit
+
+try:
+    import numpy as np
+except ImportError:  # NumPy - необязательная зависимость
+    np = None
+
+
+Column = Union[array, List[Any]]
+
+# Коды типов array для значений, которые драйвер СУБД возвращает как int и float
+_ARRAY_TYPECODES: Dict[type, str] = {
+    int: 'q',
+    float: 'd',
+}
+
+
+# _______________________________________________________________________________________
+class ColumnarResultBuilder:
+
+    # -----------------------------------------------------------------------------------
+    def __init__(self, column_names: Sequence[str]) -> None:
+        self.__column_names: List[str] = list(column_names)
+        self.__columns: List[Optional[Column]] = [None for _ in self.__column_names]
+        self.__rows_count: int = 0
+
+    # -----------------------------------------------------------------------------------
+    def append_rows(self, rows: Sequence[Sequence[Any]]) -> None:
+        if not rows:
+            return
+
+        columns: List[Optional[Column]] = self.__columns
+
+        # Чанк транспонируется один раз, дальше каждая колонка расширяется целиком
+        for index, values in enumerate(zip(*rows)):
+            column: Optional[Column] = columns[index]
+
+            if column is None:
+                columns[index] = self.__create_column(values=values)
+                continue
+
+            if isinstance(column, list):
+                column.extend(values)
+                continue
+
+            # Чанк сначала собирается в отдельный буфер: частично расширенная колонка
+            # после ошибки содержала бы начало чанка дважды
+            try:
+                chunk_column: array = array(column.typecode, values)
+            except (TypeError, OverflowError):
+                # Значение не помещается в типизированный буфер (NULL, другой тип, переполнение)
+                columns[index] = column.tolist() + list(values)
+            else:
+                column.extend(chunk_column)
+
+        self.__rows_count += len(rows)
+
+    # -----------------------------------------------------------------------------------
+    def get_rows_count(self) -> int:
+        return self.__rows_count
+
+    # -----------------------------------------------------------------------------------
+    def build(self, use_numpy: bool = True) -> Dict[str, Any]:
+        ToolKit.ensure_instance(
+            obj=use_numpy,
+            expected_type=bool,
+            arg_name='use_numpy'
+        )
+
+        result: Dict[str, Any] = {}
+
+        for name, column in zip(self.__column_names, self.__columns):
+            if column is None:
+                column = []
+
+            if use_numpy and np is not None and isinstance(column, array):
+                # Массив NumPy разделяет память с буфером array без копирования
+                column = np.frombuffer(column, dtype=np.dtype(column.typecode))
+
+            result[name] = column
+
+        return result
+
+    # -----------------------------------------------------------------------------------
+    @staticmethod
+    def __create_column(values: Sequence[Any]) -> Column:
+        typecode: Optional[str] = _ARRAY_TYPECODES.get(type(values[0]))
+
+        if typecode is None:
+            return list(values)
+
+        try:
+            return array(typecode, values)
+        except (TypeError, OverflowError):
+            return list(values)
@@ -0,0 +1,199 @@
+# -*- coding: utf-8 -*-
+
+"""
+Copyright 2025 kichiro-kun (Kei)
+Apache license, version 2.0 (Apache-2.0 license)
+"""
+
+__all__: list[str] = [
+    'GroupCommitManager',
+]
+
+__author__ = 'kichiro-kun (Kei)'
+__version__ = '0.2.0'
+
+# =======================================================================================
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, List, Tuple
+
+from dbms_interaction.transaction_manager_component.transaction_manager import TransactionManager
+
+from shared.constants.global_configuration import DEFAULT_GROUP_COMMIT_MAX_BATCH_SIZE, \
+    DEFAULT_GROUP_COMMIT_MAX_DELAY_MS
+from shared.exceptions.common import InvalidArgumentTypeError, OperationFailedComponentIsClosed
+from shared.utils.toolkit import ToolKit
+
+
+WriteUnit = Callable[[TransactionManager], Any]
+PendingUnit = Tuple[WriteUnit, Future]
+
+_STOP_SIGNAL = object()
+
+
+# _______________________________________________________________________________________
+class GroupCommitManager:
+
+    # -----------------------------------------------------------------------------------
+    def __init__(self, transaction_manager: TransactionManager,
+                 max_batch_size: int = DEFAULT_GROUP_COMMIT_MAX_BATCH_SIZE,
+                 max_delay_ms: float = DEFAULT_GROUP_COMMIT_MAX_DELAY_MS) -> None:
+        ToolKit.ensure_instance(
+            obj=transaction_manager,
+            expected_type=TransactionManager,
+            arg_name='transaction_manager'
+        )
+        ToolKit.ensure_instance(
+            obj=max_batch_size,
+            expected_type=int,
+            arg_name='max_batch_size'
+        )
+        if isinstance(max_delay_ms, bool) or not isinstance(max_delay_ms, (int, float)):
+            raise InvalidArgumentTypeError(
+                f"Error! Argument: *max_delay_ms* - should be a *float*!\n"
+                f"But given: *{max_delay_ms}* - is Type of *{type(max_delay_ms).__name__}*!"
+            )
+
+        self.__transaction_manager: TransactionManager = transaction_manager
+        self.__max_batch_size: int = max(1, max_batch_size)
+        self.__max_delay: float = max_delay_ms / 1000
+
+        self.__pending_units: queue.Queue = queue.Queue()
+        self.__state_lock = threading.Lock()
+        self.__is_closed: bool = False
+
+        self.__worker = threading.Thread(
+            target=self.__process_pending_units,
+            name='GroupCommitWorker',
+            daemon=True
+        )
+
+        # Пакеты ведут состояние менеджера транзакций: прямые вызовы из других потоков
+        # переключили бы его посреди пакета, поэтому до закрытия он отдаётся обработчику
+        transaction_manager.reserve_for_thread(owner=self.__worker)
+        self.__worker.start()
+
+    # -----------------------------------------------------------------------------------
+    def submit(self, unit: WriteUnit) -> Future:
+        if not callable(unit):
+            raise InvalidArgumentTypeError(
+                f"Error! Argument: *unit* - should be a *Callable*!\n"
+                f"But given: *{unit}* - is Type of *{type(unit).__name__}*!"
+            )
+
+        future: Future = Future()
+
+        with self.__state_lock:
+            if self.__is_closed:
+                raise OperationFailedComponentIsClosed()
+
+            self.__pending_units.put((unit, future))
+
+        return future
+
+    # -----------------------------------------------------------------------------------
+    def close(self) -> None:
+        with self.__state_lock:
+            if self.__is_closed:
+                return
+
+            self.__is_closed = True
+            self.__pending_units.put(_STOP_SIGNAL)
+
+        # Уже принятые единицы записи применяются до остановки обработчика
+        self.__worker.join()
+        self.__transaction_manager.release_reservation()
+
+    # -----------------------------------------------------------------------------------
+    def __process_pending_units(self) -> None:
+        is_stopped: bool = False
+
+        while is_stopped is False:
+            batch, is_stopped = self.__collect_batch()
+
+            if batch:
+                self.__apply_batch(batch=batch)
+
+    # -----------------------------------------------------------------------------------
+    def __collect_batch(self) -> Tuple[List[PendingUnit], bool]:
+        pending_units: queue.Queue = self.__pending_units
+
+        first_item = pending_units.get()
+        if first_item is _STOP_SIGNAL:
+            return [], True
+
+        batch: List[PendingUnit] = [first_item]
+        deadline: float = time.monotonic() + self.__max_delay
+
+        while len(batch) < self.__max_batch_size:
+            remaining_time: float = deadline - time.monotonic()
+            if remaining_time <= 0:
+                break
+
+            try:
+                item = pending_units.get(timeout=remaining_time)
+            except queue.Empty:
+                break
+
+            if item is _STOP_SIGNAL:
+                return batch, True
+
+            batch.append(item)
+
+        return batch, False
+
+    # -----------------------------------------------------------------------------------
+    def __apply_batch(self, batch: List[PendingUnit]) -> None:
+        transaction_manager: TransactionManager = self.__transaction_manager
+
+        # Подключение общее с вызывающим кодом: пакет занимает его целиком до фиксации
+        with transaction_manager.connection_lock:
+            self.__apply_batch_on_connection(batch=batch)
+
+    # -----------------------------------------------------------------------------------
+    def __apply_batch_on_connection(self, batch: List[PendingUnit]) -> None:
+        transaction_manager: TransactionManager = self.__transaction_manager
+        applied_units: List[Tuple[Future, Any]] = []
+
+        try:
+            transaction_manager.begin()
+
+            for index, (unit, future) in enumerate(batch):
+                if not future.set_running_or_notify_cancel():
+                    continue
+
+                savepoint: str = f'group_commit_unit_{index}'
+                transaction_manager.execute_in_active_transaction(query=f'SAVEPOINT {savepoint}')
+
+                try:
+                    result: Any = unit(transaction_manager)
+                except Exception as unit_error:
+                    # Ошибка единицы записи откатывает только её собственные изменения
+                    transaction_manager.execute_in_active_transaction(
+                        query=f'ROLLBACK TO SAVEPOINT {savepoint}'
+                    )
+                    future.set_exception(unit_error)
+                else:
+                    transaction_manager.execute_in_active_transaction(
+                        query=f'RELEASE SAVEPOINT {savepoint}'
+                    )
+                    applied_units.append((future, result))
+
+            transaction_manager.commit()
+        except Exception as batch_error:
+            # Ошибка отката не должна останавливать обработчик: вызывающие получат batch_error
+            try:
+                transaction_manager.rollback()
+            except Exception:
+                pass
+
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(batch_error)
+
+            return
+
+        for future, result in applied_units:
+            future.set_result(result)
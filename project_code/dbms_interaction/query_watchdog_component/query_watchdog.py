@@ -0,0 +1,188 @@
+# -*- coding: utf-8 -*-
+
+"""
+Copyright 2025 kichiro-kun (Kei)
+Apache license, version 2.0 (Apache-2.0 license)
+"""
+
+__all__: list[str] = [
+    'QueryWatchdog',
+    'NoQueryWatchdog',
+]
+
+__author__ = 'kichiro-kun (Kei)'
+__version__ = '0.1.0'
+
+# =======================================================================================
+import heapq
+import itertools
+import threading
+import time
+from typing import Dict, Iterator, List, NoReturn, Optional, Tuple
+
+from dbms_interaction.adapters_component.connection.abstract.connection_interface \
+    import ConnectionInterface
+from dbms_interaction.adapters_component.cursor.abstract.cursor_interface import CursorInterface
+from dbms_interaction.single_connection_manager_component.single_connection_manager \
+    import SingleConnectionManager
+
+from shared.constants.global_configuration import MYSQL_KILL_QUERY_STATEMENT
+from shared.exceptions.common import InvalidArgumentTypeError, InvalidArgumentValueError, \
+    IsNullObjectOperation, OperationFailedComponentIsClosed
+from shared.utils.toolkit import ToolKit
+
+
+# Срок, токен наблюдения, идентификатор соединения
+WatchEntry = Tuple[float, int, int]
+
+
+# _______________________________________________________________________________________
+class QueryWatchdog:
+
+    # -----------------------------------------------------------------------------------
+    def __init__(self, control_manager: SingleConnectionManager) -> None:
+        ToolKit.ensure_instance(
+            obj=control_manager,
+            expected_type=SingleConnectionManager,
+            arg_name='control_manager'
+        )
+
+        # Отдельное управляющее соединение: рабочее занято зависшим запросом
+        self.__control_manager: SingleConnectionManager = control_manager
+
+        self.__condition = threading.Condition()
+        self.__deadlines: List[WatchEntry] = []
+        self.__active_watches: Dict[int, int] = {}
+        self.__tokens: Iterator[int] = itertools.count(1)
+        self.__killed_queries_count: int = 0
+        self.__is_closed: bool = False
+
+        # Поток запускается при первом наблюдении
+        self.__worker: Optional[threading.Thread] = None
+
+    # -----------------------------------------------------------------------------------
+    def watch(self, connection_id: int, timeout: float) -> int:
+        ToolKit.ensure_instance(
+            obj=connection_id,
+            expected_type=int,
+            arg_name='connection_id'
+        )
+        if isinstance(timeout, bool) or not isinstance(timeout, (int, float)):
+            raise InvalidArgumentTypeError(
+                f"Error! Argument: *timeout* - should be a *float*!\n"
+                f"But given: *{timeout}* - is Type of *{type(timeout).__name__}*!"
+            )
+
+        if timeout <= 0:
+            raise InvalidArgumentValueError(
+                f"Error! Argument: *timeout* - should be positive! But given: *{timeout}*!"
+            )
+
+        with self.__condition:
+            if self.__is_closed:
+                raise OperationFailedComponentIsClosed()
+
+            token: int = next(self.__tokens)
+            self.__active_watches[token] = connection_id
+            heapq.heappush(self.__deadlines, (time.monotonic() + timeout, token, connection_id))
+
+            self.__ensure_worker_started()
+            self.__condition.notify()
+
+        return token
+
+    # -----------------------------------------------------------------------------------
+    def unwatch(self, token: int) -> bool:
+        # False означает, что срок уже истёк и запрос был прерван
+        with self.__condition:
+            return self.__active_watches.pop(token, None) is not None
+
+    # -----------------------------------------------------------------------------------
+    def get_killed_queries_count(self) -> int:
+        with self.__condition:
+            return self.__killed_queries_count
+
+    # -----------------------------------------------------------------------------------
+    def close(self) -> None:
+        with self.__condition:
+            if self.__is_closed:
+                return
+
+            self.__is_closed = True
+            self.__active_watches.clear()
+            self.__condition.notify()
+
+            worker: Optional[threading.Thread] = self.__worker
+
+        if worker is not None:
+            worker.join()
+
+    # -----------------------------------------------------------------------------------
+    def __ensure_worker_started(self) -> None:
+        if self.__worker is None:
+            self.__worker = threading.Thread(
+                target=self.__watch_deadlines,
+                name='QueryWatchdog',
+                daemon=True
+            )
+            self.__worker.start()
+
+    # -----------------------------------------------------------------------------------
+    def __watch_deadlines(self) -> None:
+        with self.__condition:
+            while not self.__is_closed:
+                deadlines: List[WatchEntry] = self.__deadlines
+
+                # Завершённые запросы снимаются с наблюдения без поиска в куче
+                while deadlines and deadlines[0][1] not in self.__active_watches:
+                    heapq.heappop(deadlines)
+
+                if not deadlines:
+                    self.__condition.wait()
+                    continue
+
+                remaining_time: float = deadlines[0][0] - time.monotonic()
+                if remaining_time > 0:
+                    self.__condition.wait(timeout=remaining_time)
+                    continue
+
+                _, token, connection_id = heapq.heappop(deadlines)
+                del self.__active_watches[token]
+
+                # KILL выполняется под блокировкой: unwatch не вернётся, пока прерывание не завершено,
+                # поэтому оно не может задеть следующий запрос того же соединения
+                self.__kill_query(connection_id=connection_id)
+
+    # -----------------------------------------------------------------------------------
+    def __kill_query(self, connection_id: int) -> None:
+        try:
+            adapter: ConnectionInterface = self.__control_manager.get_connection()
+            cur: CursorInterface = adapter.get_cursor()
+
+            try:
+                cur.execute(query=MYSQL_KILL_QUERY_STATEMENT.format(connection_id=connection_id))
+            finally:
+                cur.close()
+        except Exception:
+            # Недоступное управляющее соединение не должно останавливать наблюдение за остальными
+            return
+
+        self.__killed_queries_count += 1
+
+
+# _______________________________________________________________________________________
+class NoQueryWatchdog(QueryWatchdog):
+    def __init__(self) -> None:
+        pass
+
+    def watch(self, connection_id: int, timeout: float) -> NoReturn:
+        raise IsNullObjectOperation
+
+    def unwatch(self, token: int) -> NoReturn:
+        raise IsNullObjectOperation
+
+    def get_killed_queries_count(self) -> NoReturn:
+        raise IsNullObjectOperation
+
+    def close(self) -> NoReturn:
+        raise IsNullObjectOperation
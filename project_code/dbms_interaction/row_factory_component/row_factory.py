@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+
+"""
+Copyright 2025 kichiro-kun (Kei)
+Apache license, version 2.0 (Apache-2.0 license)
+"""
+
+__all__: list[str] = [
+    'RowFactory',
+    'RowConverter',
+    'RowConverterFactory',
+]
+
+__author__ = 'kichiro-kun (Kei)'
+__version__ = '0.3.0'
+
+# =======================================================================================
+from collections import namedtuple
+from enum import Enum
+from functools import lru_cache
+from typing import Any, Callable, Dict, Mapping, Optional, Sequence, Tuple
+
+from shared.constants.global_configuration import ROW_CONVERTER_CACHE_SIZE
+
+
+RowConverter = Callable[[Sequence[Any]], Any]
+
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+class RowFactory(Enum):
+    TUPLE = 1
+    DICT = 2
+    NAMEDTUPLE = 3
+    RECORD = 4
+
+
+# _______________________________________________________________________________________
+class RowConverterFactory:
+
+    # -----------------------------------------------------------------------------------
+    @staticmethod
+    def get_row_converter(factory: RowFactory, column_names: Sequence[str]) -> Optional[RowConverter]:
+        # Кортежи драйвера возвращаются без преобразования
+        if factory is RowFactory.TUPLE:
+            return None
+
+        return RowConverterFactory.__build_row_converter(factory, tuple(column_names))
+
+    # -----------------------------------------------------------------------------------
+    @staticmethod
+    def get_row_value(row: Any, column_name: str, column_position: int) -> Any:
+        if isinstance(row, Mapping):
+            return row[column_name]
+
+        # Обычные кортежи драйвера читаются по позиции, строки фабрик записей - по имени колонки
+        if type(row) in (tuple, list):
+            return row[column_position]
+
+        return getattr(row, column_name)
+
+    # -----------------------------------------------------------------------------------
+    @staticmethod
+    def copy_row(row: Any) -> Any:
+        # Изменяемые строки (словари и записи) копируются, неизменяемые возвращаются как есть
+        if isinstance(row, dict):
+            return dict(row)
+
+        if hasattr(row, '_fields') and not isinstance(row, tuple):
+            return type(row)(*row)
+
+        return row
+
+    # -----------------------------------------------------------------------------------
+    @staticmethod
+    @lru_cache(maxsize=ROW_CONVERTER_CACHE_SIZE)
+    def __build_row_converter(factory: RowFactory, column_names: Tuple[str, ...]) -> RowConverter:
+        # Класс записи создаётся один раз на каждый уникальный набор колонок
+        if factory is RowFactory.DICT:
+            return lambda row: dict(zip(column_names, row))
+
+        # Имена колонок, не являющиеся идентификаторами Python, заменяются на _0, _1, ...
+        row_cls = namedtuple('Row', column_names, rename=True)
+
+        if factory is RowFactory.NAMEDTUPLE:
+            return row_cls._make
+
+        record_cls: type = RowConverterFactory.__create_record_cls(field_names=row_cls._fields)
+
+        return lambda row: record_cls(*row)
+
+    # -----------------------------------------------------------------------------------
+    @staticmethod
+    def __create_record_cls(field_names: Tuple[str, ...]) -> type:
+        arguments: str = ', '.join(field_names)
+        assignments: str = '\n'.join(f'    _self.{name} = {name}' for name in field_names) or '    pass'
+
+        # Конструктор генерируется кодом, как в namedtuple: одно присваивание на поле без циклов.
+        # Имена полей после rename не начинаются с '_', поэтому _self не конфликтует с колонками
+        namespace: Dict[str, Any] = {}
+        exec(f'def __init__(_self, {arguments}):\n{assignments}', namespace)
+
+        def __iter__(self) -> Any:
+            return (getattr(self, name) for name in field_names)
+
+        def __eq__(self, other: Any) -> bool:
+            if type(other) is not type(self):
+                return NotImplemented
+
+            return tuple(self) == tuple(other)
+
+        def __repr__(self) -> str:
+            values: str = ', '.join(f'{name}={getattr(self, name)!r}' for name in field_names)
+
+            return f'Record({values})'
+
+        return type('Record', (), {
+            '__slots__': field_names,
+            '__init__': namespace['__init__'],
+            '__iter__': __iter__,
+            '__eq__': __eq__,
+            '__hash__': None,
+            '__repr__': __repr__,
+            '_fields': field_names,
+        })
@@ -10,30 +10,57 @@ __all__: list[str] = [
 ]
 
 __author__ = 'kichiro-kun (Kei)'
-__version__ = '0.7.0'
+__version__ = '0.8.1'
 
 # =======================================================================================
-from typing import Any, Dict, NoReturn
+from typing import Any, Dict, List, NoReturn, Optional, Sequence, Tuple
 
 from dbms_interaction.adapters_component.connection.abstract.connection_interface \
     import ConnectionInterface
 
-from shared.exceptions.common import IsNullObjectOperation
+from shared.constants.global_configuration import DEFAULT_FAILOVER_CONNECT_TIMEOUT, \
+    FAILOVER_HOST_HEALTH_PENALTY, MYSQL_CONNECT_TIMEOUT_CONFIG_KEY
+from shared.exceptions.common import InvalidArgumentValueError, IsNullObjectOperation, \
+    OperationFailedAllHostsUnavailable
 from shared.utils.toolkit import ToolKit
 
 
 # _______________________________________________________________________________________
 class SingleConnectionManager:
-    def __init__(self, adapter: ConnectionInterface, config: Dict[str, Any]) -> None:
+    def __init__(self, adapter: ConnectionInterface, config: Dict[str, Any],
+                 hosts: Sequence[Dict[str, Any]] = (),
+                 connect_timeout: int = DEFAULT_FAILOVER_CONNECT_TIMEOUT) -> None:
         ToolKit.ensure_instance(
             obj=adapter,
             expected_type=ConnectionInterface,
             arg_name='adapter'
         )
+        for host in hosts:
+            ToolKit.ensure_instance(
+                obj=host,
+                expected_type=dict,
+                arg_name='hosts'
+            )
+        ToolKit.ensure_instance(
+            obj=connect_timeout,
+            expected_type=int,
+            arg_name='connect_timeout'
+        )
+
+        if connect_timeout <= 0:
+            raise InvalidArgumentValueError(
+                f"Error! Argument: *connect_timeout* - should be positive! But given: *{connect_timeout}*!"
+            )
 
         self.__perform_adapter: ConnectionInterface = adapter
         self.__config: Dict[str, Any] = config
 
+        # Хосты перечислены в порядке приоритета и дополняют общий config (host, port, ...)
+        self.__hosts: Tuple[Dict[str, Any], ...] = tuple(hosts)
+        self.__host_health_scores: List[float] = [1.0] * len(self.__hosts)
+        self.__connect_timeout: int = connect_timeout
+        self.__last_good_host_index: Optional[int] = None
+
     # -----------------------------------------------------------------------------------
     def set_new_adapter(self, new_adapter: ConnectionInterface) -> bool:
         ToolKit.ensure_instance(
@@ -82,6 +109,19 @@ class SingleConnectionManager:
 
         return adapter
 
+    # -----------------------------------------------------------------------------------
+    def get_active_host(self) -> Dict[str, Any]:
+        host_index: Optional[int] = self.__last_good_host_index
+
+        if host_index is None:
+            return {}
+
+        return dict(self.__hosts[host_index])
+
+    # -----------------------------------------------------------------------------------
+    def get_host_health_scores(self) -> Tuple[float, ...]:
+        return tuple(self.__host_health_scores)
+
     # -----------------------------------------------------------------------------------
     def initialize_new_connection(self) -> bool:
         adapter: ConnectionInterface = self.__perform_adapter
@@ -90,6 +130,9 @@ class SingleConnectionManager:
         if adapter.is_active():
             adapter.close()
 
+        if self.__hosts:
+            return self.__connect_with_failover()
+
         adapter.connect(config=actual_config)
 
         return True
@@ -99,12 +142,73 @@ class SingleConnectionManager:
         adapter: ConnectionInterface = self.__perform_adapter
 
         if adapter.is_active():
-            adapter.reconnect()
-        else:
-            self.initialize_new_connection()
+            try:
+                adapter.reconnect()
+
+                return True
+            except Exception:
+                if not self.__hosts:
+                    raise
+
+        # Соединение с текущим хостом потеряно: он штрафуется до выбора следующего кандидата,
+        # иначе неактивный адаптер снова начал бы с того же хоста
+        self.__mark_host_failed(host_index=self.__last_good_host_index)
+
+        self.initialize_new_connection()
 
         return True
 
+    # -----------------------------------------------------------------------------------
+    def __connect_with_failover(self) -> bool:
+        adapter: ConnectionInterface = self.__perform_adapter
+        last_error: Optional[Exception] = None
+
+        for host_index in self.__get_hosts_order():
+            # Короткий таймаут на попытку: мёртвый хост стоит одного ожидания, а не всего connect timeout
+            attempt_config: Dict[str, Any] = {
+                **self.__config,
+                **self.__hosts[host_index],
+                MYSQL_CONNECT_TIMEOUT_CONFIG_KEY: self.__connect_timeout,
+            }
+
+            try:
+                adapter.connect(config=attempt_config)
+            except Exception as error:
+                last_error = error
+                self.__mark_host_failed(host_index=host_index)
+                continue
+
+            self.__host_health_scores[host_index] = 1.0
+            self.__last_good_host_index = host_index
+
+            return True
+
+        raise OperationFailedAllHostsUnavailable() from last_error
+
+    # -----------------------------------------------------------------------------------
+    def __get_hosts_order(self) -> List[int]:
+        scores: List[float] = self.__host_health_scores
+
+        # Сначала последний рабочий хост, затем остальные по убыванию здоровья (при равенстве - по приоритету)
+        order: List[int] = sorted(range(len(self.__hosts)), key=lambda index: -scores[index])
+        last_good_index: Optional[int] = self.__last_good_host_index
+
+        if last_good_index is not None:
+            order.remove(last_good_index)
+            order.insert(0, last_good_index)
+
+        return order
+
+    # -----------------------------------------------------------------------------------
+    def __mark_host_failed(self, host_index: Optional[int]) -> None:
+        if host_index is None:
+            return
+
+        self.__host_health_scores[host_index] *= FAILOVER_HOST_HEALTH_PENALTY
+
+        if self.__last_good_host_index == host_index:
+            self.__last_good_host_index = None
+
     # -----------------------------------------------------------------------------------
     def check_connection_status(self) -> bool:
         adapter: ConnectionInterface = self.__perform_adapter
@@ -140,6 +244,12 @@ class NoSingleConnectionManager(SingleConnectionManager):
     def get_connection(self) -> NoReturn:
         raise IsNullObjectOperation
 
+    def get_active_host(self) -> NoReturn:
+        raise IsNullObjectOperation
+
+    def get_host_health_scores(self) -> NoReturn:
+        raise IsNullObjectOperation
+
     def initialize_new_connection(self) -> NoReturn:
         raise IsNullObjectOperation
 
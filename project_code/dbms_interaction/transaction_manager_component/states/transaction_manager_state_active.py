@@ -6,7 +6,7 @@ Apache license, version 2.0 (Apache-2.0 license)
 """
 
 __author__ = 'kichiro-kun (Kei)'
-__version__ = '0.2.0'
+__version__ = '0.3.1'
 
 # =======================================================================================
 from dbms_interaction.transaction_manager_component.abstract.transaction_state_interface \
@@ -18,6 +18,8 @@ if TYPE_CHECKING:
         import TransactionManager
     from dbms_interaction.transaction_manager_component.states.transaction_manager_state_committed \
         import TransactionManagerStateCommitted
+    from dbms_interaction.transaction_manager_component.states.transaction_manager_state_rolledback \
+        import TransactionManagerStateRolledBack
     from dbms_interaction.adapters_component.connection.abstract.connection_interface \
         import ConnectionInterface
 
@@ -37,8 +39,12 @@ class TransactionManagerStateActive(TransactionStateInterface):
     def execute_in_active_transaction(self, *params, query: str) -> None:
         conn: 'ConnectionInterface' = self.root.active_connection
 
-        cur = conn.get_cursor()
-        cur.execute(query, *params)
+        cur = conn.get_cursor(special_placeholder=self.root.query_param_placeholder)
+
+        try:
+            cur.execute(query=query, *params)
+        finally:
+            cur.close()
 
     # -----------------------------------------------------------------------------------
     def commit(self) -> None:
@@ -52,4 +58,10 @@ class TransactionManagerStateActive(TransactionStateInterface):
 
     # -----------------------------------------------------------------------------------
     def rollback(self) -> None:
-        return
+        next_state: 'TransactionManagerStateRolledBack' = self.root.rolledback_state
+
+        # Set next state
+        self.root.set_state(new_state=next_state)
+
+        # Delegate operation to next state
+        self.root.rollback()
@@ -6,7 +6,7 @@ Apache license, version 2.0 (Apache-2.0 license)
 """
 
 __author__ = 'kichiro-kun (Kei)'
-__version__ = '0.2.0'
+__version__ = '0.3.0'
 
 # =======================================================================================
 from dbms_interaction.transaction_manager_component.abstract.transaction_state_interface \
@@ -18,6 +18,8 @@ if TYPE_CHECKING:
         import TransactionManager
     from dbms_interaction.transaction_manager_component.states.transaction_manager_state_rolledback \
         import TransactionManagerStateRolledBack
+    from dbms_interaction.transaction_manager_component.states.transaction_manager_state_initialized \
+        import TransactionManagerStateInitialized
     from dbms_interaction.adapters_component.connection.abstract.connection_interface \
         import ConnectionInterface
 
@@ -31,7 +33,13 @@ class TransactionManagerStateCommitted(TransactionStateInterface):
 
     # -----------------------------------------------------------------------------------
     def begin(self) -> None:
-        return
+        next_state: 'TransactionManagerStateInitialized' = self.root.initialized_state
+
+        # Set next state
+        self.root.set_state(new_state=next_state)
+
+        # Delegate operation to next state
+        self.root.begin()
 
     # -----------------------------------------------------------------------------------
     def execute_in_active_transaction(self, *params, query: str) -> None:
@@ -6,7 +6,7 @@ Apache license, version 2.0 (Apache-2.0 license)
 """
 
 __author__ = 'kichiro-kun (Kei)'
-__version__ = '0.3.0'
+__version__ = '0.5.0'
 
 # =======================================================================================
 from dbms_interaction.transaction_manager_component.abstract.transaction_state_interface \
@@ -36,6 +36,13 @@ class TransactionManagerStateInitialized(TransactionStateInterface):
         if conn.is_active() is False:
             conn.reconnect()
 
+        # Режим сессии возвращается после фиксации или отката транзакции
+        if self.root.previous_autocommit_mode is None:
+            self.root.previous_autocommit_mode = conn.get_autocommit()
+
+        # Транзакция не должна выполняться в режиме autocommit
+        conn.set_autocommit(enabled=False)
+
     # -----------------------------------------------------------------------------------
     def execute_in_active_transaction(self, *params, query: str) -> None:
         next_state: 'TransactionManagerStateActive' = self.root.active_state
@@ -44,7 +51,7 @@ class TransactionManagerStateInitialized(TransactionStateInterface):
         self.root.set_state(new_state=next_state)
 
         # Delegate operation to next state
-        self.root.execute_in_active_transaction(query=query)
+        self.root.execute_in_active_transaction(query=query, *params)
 
     # -----------------------------------------------------------------------------------
     def commit(self) -> None:
@@ -6,11 +6,14 @@ Apache license, version 2.0 (Apache-2.0 license)
 """
 
 __author__ = 'kichiro-kun (Kei)'
-__version__ = '0.5.0'
+__version__ = '0.13.0'
 
 # =======================================================================================
+import random
+import threading
+import time
 from enum import Enum
-from typing import NoReturn
+from typing import Any, Callable, Dict, FrozenSet, NamedTuple, NoReturn, Optional, Sequence, Set
 
 from dbms_interaction.transaction_manager_component.abstract.transaction_state_interface \
     import TransactionStateInterface
@@ -18,8 +21,16 @@ from dbms_interaction.transaction_manager_component.states import *
 
 from dbms_interaction.adapters_component.connection.abstract.connection_interface import ConnectionInterface
 
+from query_core.query_cache_component.abstract.query_cache_interface \
+    import QueryCacheInterface, NoQueryCache
+from query_core.query_cache_component.sql_table_extractor import SQLTableExtractor
+
+from shared.constants.global_configuration import RETRYABLE_TRANSACTION_ERROR_CODES, \
+    DEFAULT_TRANSACTION_RETRY_ATTEMPTS, DEFAULT_TRANSACTION_RETRY_BASE_DELAY, \
+    DEFAULT_TRANSACTION_RETRY_MAX_DELAY
 from shared.utils.toolkit import ToolKit
-from shared.exceptions.common import InvalidArgumentTypeError, IsNullObjectOperation
+from shared.exceptions.common import InvalidArgumentTypeError, IsNullObjectOperation, \
+    TransactionRetryLimitExceeded, OperationFailedComponentIsReserved
 
 
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
@@ -30,6 +41,13 @@ class IsolationLevel(Enum):
     SERIALIZABLE = 4
 
 
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+class TransactionRetryStatistics(NamedTuple):
+    retried_attempts: int
+    exhausted_transactions: int
+    retries_by_error_code: Dict[int, int]
+
+
 # _______________________________________________________________________________________
 class TransactionManager(TransactionStateInterface):
 
@@ -46,6 +64,31 @@ class TransactionManager(TransactionStateInterface):
         self.__state: TransactionStateInterface = self.initialized_state
 
         self.active_connection: ConnectionInterface = None
+        self.query_param_placeholder = ''
+
+        # Режим autocommit сессии до начала транзакции
+        self.previous_autocommit_mode: Optional[bool] = None
+
+        # Транзакция начата вызовом begin, даже если в ней ещё не выполнено ни одного запроса
+        self.__is_begun: bool = False
+        self.__last_commit_time: float = 0.0
+
+        # Поток, которому менеджер отдан целиком (например, групповому коммиту)
+        self.__owner_thread: Optional[threading.Thread] = None
+        self.__reservation_lock = threading.Lock()
+
+        # Общая блокировка подключения: база данных передаёт сюда свою, чтобы фоновые потоки
+        # не выполняли запросы на том же подключении одновременно с ней
+        self.connection_lock = threading.RLock()
+        self.retryable_error_codes: Sequence[int] = RETRYABLE_TRANSACTION_ERROR_CODES
+        self.query_cache: QueryCacheInterface = NoQueryCache()
+
+        self.__touched_tables: Set[str] = set()
+        self.__touches_unknown_tables: bool = False
+
+        self.__retried_attempts: int = 0
+        self.__exhausted_transactions: int = 0
+        self.__retries_by_error_code: Dict[int, int] = dict()
 
     # -----------------------------------------------------------------------------------
     def apply_isolation_level(self, new_level: IsolationLevel) -> None:
@@ -70,25 +113,207 @@ class TransactionManager(TransactionStateInterface):
 
         self.__state = new_state
 
+    # -----------------------------------------------------------------------------------
+    def is_active(self) -> bool:
+        return self.__state is self.active_state
+
+    # -----------------------------------------------------------------------------------
+    def reserve_for_thread(self, owner: threading.Thread) -> None:
+        ToolKit.ensure_instance(
+            obj=owner,
+            expected_type=threading.Thread,
+            arg_name='owner'
+        )
+
+        with self.__reservation_lock:
+            if self.__owner_thread is not None:
+                raise OperationFailedComponentIsReserved()
+
+            self.__owner_thread = owner
+
+    # -----------------------------------------------------------------------------------
+    def release_reservation(self) -> None:
+        with self.__reservation_lock:
+            self.__owner_thread = None
+
+    # -----------------------------------------------------------------------------------
+    def is_in_transaction(self) -> bool:
+        return self.__is_begun
+
+    # -----------------------------------------------------------------------------------
+    def get_last_commit_time(self) -> float:
+        return self.__last_commit_time
+
     # -----------------------------------------------------------------------------------
     def begin(self) -> None:
+        self.__ensure_not_reserved()
+
         current_state: TransactionStateInterface = self.__state
         current_state.begin()
+        self.__is_begun = True
 
     # -----------------------------------------------------------------------------------
     def execute_in_active_transaction(self, *params, query: str) -> None:
+        self.__ensure_not_reserved()
+
         current_state: TransactionStateInterface = self.__state
         current_state.execute_in_active_transaction(query=query, *params)
 
+        # Точки сохранения и команды сессии (в том числе от группового коммита) не сбрасывают кэш
+        if not SQLTableExtractor.is_data_modifying_query(query):
+            return
+
+        # Чтения на этом же подключении уже видят незафиксированные изменения
+
+        tables: FrozenSet[str] = SQLTableExtractor.extract_tables(query)
+        self.__touched_tables.update(tables)
+        self.__touches_unknown_tables = self.__touches_unknown_tables or not tables
+        self.__invalidate_query_cache(tables=tables, clear_all=not tables)
+
     # -----------------------------------------------------------------------------------
     def commit(self) -> None:
+        self.__ensure_not_reserved()
+
         current_state: TransactionStateInterface = self.__state
         current_state.commit()
+        self.__restore_autocommit()
+
+        # Время фиксации начинает окно чтения своих записей для реплицированной базы
+        if self.__is_begun:
+            self.__is_begun = False
+            self.__last_commit_time = time.monotonic()
+
+        # Повторная инвалидация убирает результаты, закэшированные во время транзакции
+        self.__invalidate_touched_tables()
 
     # -----------------------------------------------------------------------------------
     def rollback(self) -> None:
+        self.__ensure_not_reserved()
+
         current_state: TransactionStateInterface = self.__state
         current_state.rollback()
+        self.__restore_autocommit()
+        self.__is_begun = False
+
+        # Закэшированные внутри транзакции результаты могли видеть отменённые изменения
+        self.__invalidate_touched_tables()
+
+    # -----------------------------------------------------------------------------------
+    def execute_retryable_transaction(self, operation: Callable[['TransactionManager'], Any],
+                                      max_attempts: int = DEFAULT_TRANSACTION_RETRY_ATTEMPTS,
+                                      base_delay: float = DEFAULT_TRANSACTION_RETRY_BASE_DELAY,
+                                      max_delay: float = DEFAULT_TRANSACTION_RETRY_MAX_DELAY) -> Any:
+        if not callable(operation):
+            raise InvalidArgumentTypeError(
+                f"Error! Argument: *operation* - should be a *Callable*!\n"
+                f"But given: *{operation}* - is Type of *{type(operation).__name__}*!"
+            )
+
+        ToolKit.ensure_instance(
+            obj=max_attempts,
+            expected_type=int,
+            arg_name='max_attempts'
+        )
+
+        # Иначе отказ begin ушёл бы в rollback и был бы повторно выброшен из обработчика ошибки
+        self.__ensure_not_reserved()
+
+        attempt: int = 0
+        while True:
+            attempt += 1
+
+            try:
+                self.begin()
+                result: Any = operation(self)
+                self.commit()
+            except Exception as error:
+                self.rollback()
+
+                # Повторяются только конфликты блокировок, остальные ошибки пробрасываются как есть
+                error_code = getattr(error, 'errno', None)
+                if error_code not in self.retryable_error_codes:
+                    raise
+
+                self.__retried_attempts += 1
+                self.__retries_by_error_code[error_code] = \
+                    self.__retries_by_error_code.get(error_code, 0) + 1
+
+                if attempt >= max_attempts:
+                    self.__exhausted_transactions += 1
+                    raise TransactionRetryLimitExceeded(
+                        f"Failure! Transaction retry limit is exceeded after *{attempt}* attempts!"
+                    ) from error
+
+                time.sleep(
+                    self.__calculate_backoff_delay(
+                        attempt=attempt, base_delay=base_delay, max_delay=max_delay
+                    )
+                )
+            else:
+                return result
+
+    # -----------------------------------------------------------------------------------
+    def get_retry_statistics(self) -> TransactionRetryStatistics:
+        return TransactionRetryStatistics(
+            retried_attempts=self.__retried_attempts,
+            exhausted_transactions=self.__exhausted_transactions,
+            retries_by_error_code=dict(self.__retries_by_error_code)
+        )
+
+    # -----------------------------------------------------------------------------------
+    def reset_retry_statistics(self) -> None:
+        self.__retried_attempts = 0
+        self.__exhausted_transactions = 0
+        self.__retries_by_error_code = dict()
+
+    # -----------------------------------------------------------------------------------
+    def __ensure_not_reserved(self) -> None:
+        # Одно подключение не может вести две транзакции: чужие вызовы отклоняются
+        owner_thread: Optional[threading.Thread] = self.__owner_thread
+
+        if owner_thread is not None and owner_thread is not threading.current_thread():
+            raise OperationFailedComponentIsReserved()
+
+    # -----------------------------------------------------------------------------------
+    def __restore_autocommit(self) -> None:
+        previous_mode: Optional[bool] = self.previous_autocommit_mode
+
+        if previous_mode is None:
+            return
+
+        # Иначе последующие запросы сессии остались бы в открытой транзакции
+        self.previous_autocommit_mode = None
+        self.active_connection.set_autocommit(enabled=previous_mode)
+
+    # -----------------------------------------------------------------------------------
+    def __invalidate_touched_tables(self) -> None:
+        self.__invalidate_query_cache(
+            tables=self.__touched_tables, clear_all=self.__touches_unknown_tables
+        )
+
+        self.__touched_tables = set()
+        self.__touches_unknown_tables = False
+
+    # -----------------------------------------------------------------------------------
+    def __invalidate_query_cache(self, tables: Set[str], clear_all: bool) -> None:
+        query_cache: QueryCacheInterface = self.query_cache
+
+        if isinstance(query_cache, NoQueryCache):
+            return
+
+        # Запрос без распознанных таблиц может изменить что угодно
+        if clear_all:
+            query_cache.clear()
+        elif tables:
+            query_cache.invalidate_tables(tables=tables)
+
+    # -----------------------------------------------------------------------------------
+    @staticmethod
+    def __calculate_backoff_delay(attempt: int, base_delay: float, max_delay: float) -> float:
+        # Экспоненциальная задержка с полным джиттером (full jitter)
+        ceiling: float = min(max_delay, base_delay * (2 ** (attempt - 1)))
+
+        return random.uniform(0, ceiling)
 
 
 # _______________________________________________________________________________________
@@ -99,6 +324,21 @@ class NoTransactionManager(TransactionManager):
     def apply_isolation_level(self, new_level: IsolationLevel) -> NoReturn:
         raise IsNullObjectOperation
 
+    def is_active(self) -> NoReturn:
+        raise IsNullObjectOperation
+
+    def is_in_transaction(self) -> NoReturn:
+        raise IsNullObjectOperation
+
+    def reserve_for_thread(self, owner: threading.Thread) -> NoReturn:
+        raise IsNullObjectOperation
+
+    def release_reservation(self) -> NoReturn:
+        raise IsNullObjectOperation
+
+    def get_last_commit_time(self) -> NoReturn:
+        raise IsNullObjectOperation
+
     def begin(self) -> NoReturn:
         raise IsNullObjectOperation
 
@@ -110,3 +350,9 @@ class NoTransactionManager(TransactionManager):
 
     def rollback(self) -> NoReturn:
         raise IsNullObjectOperation
+
+    def execute_retryable_transaction(self, operation: Callable[['TransactionManager'], Any],
+                                      max_attempts: int = DEFAULT_TRANSACTION_RETRY_ATTEMPTS,
+                                      base_delay: float = DEFAULT_TRANSACTION_RETRY_BASE_DELAY,
+                                      max_delay: float = DEFAULT_TRANSACTION_RETRY_MAX_DELAY) -> NoReturn:
+        raise IsNullObjectOperation
@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+
+"""
+Copyright 2025 kichiro-kun (Kei)
+Apache license, version 2.0 (Apache-2.0 license)
+"""
+
+__all__: list[str] = [
+    'ExportFormat',
+    'ResultExporter',
+]
+
+__author__ = 'kichiro-kun (Kei)'
+__version__ = '0.1.0'
+
+# =======================================================================================
+import csv
+import gzip
+import json
+from datetime import date, time, timedelta
+from decimal import Decimal
+from enum import Enum
+from itertools import islice
+from typing import Any, Iterable, Iterator, List, Sequence, TextIO
+
+from shared.constants.global_configuration import DEFAULT_EXPORT_CHUNK_SIZE, EXPORT_FILE_BUFFER_SIZE
+from shared.exceptions.common import InvalidArgumentValueError
+from shared.utils.toolkit import ToolKit
+
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+class ExportFormat(Enum):
+    CSV = 1
+    JSONL = 2
+
+
+# _______________________________________________________________________________________
+class ResultExporter:
+
+    # -----------------------------------------------------------------------------------
+    @staticmethod
+    def export_rows(rows: Iterable[Sequence[Any]], column_names: Sequence[str], file_path: str,
+                    export_format: ExportFormat = ExportFormat.CSV, compress: bool = False,
+                    chunk_size: int = DEFAULT_EXPORT_CHUNK_SIZE) -> int:
+        ToolKit.ensure_instance(
+            obj=chunk_size,
+            expected_type=int,
+            arg_name='chunk_size'
+        )
+
+        if chunk_size <= 0:
+            raise InvalidArgumentValueError(
+                f"Error! Argument: *chunk_size* - should be positive! But given: *{chunk_size}*!"
+            )
+
+        return ResultExporter.export_chunks(
+            chunks=ResultExporter.__split_into_chunks(rows=rows, chunk_size=chunk_size),
+            column_names=column_names,
+            file_path=file_path,
+            export_format=export_format,
+            compress=compress
+        )
+
+    # -----------------------------------------------------------------------------------
+    @staticmethod
+    def export_chunks(chunks: Iterable[Sequence[Sequence[Any]]], column_names: Sequence[str],
+                      file_path: str, export_format: ExportFormat = ExportFormat.CSV,
+                      compress: bool = False) -> int:
+        ToolKit.ensure_instance(
+            obj=file_path,
+            expected_type=str,
+            arg_name='file_path'
+        )
+        ToolKit.ensure_instance(
+            obj=export_format,
+            expected_type=ExportFormat,
+            arg_name='export_format'
+        )
+        ToolKit.ensure_instance(
+            obj=compress,
+            expected_type=bool,
+            arg_name='compress'
+        )
+
+        exported_rows_count: int = 0
+
+        with ResultExporter.__open_export_file(file_path=file_path, compress=compress) as export_file:
+            if export_format is ExportFormat.CSV:
+                writer = csv.writer(export_file)
+                writer.writerow(column_names)
+
+                for chunk in chunks:
+                    writer.writerows(chunk)
+                    exported_rows_count += len(chunk)
+            else:
+                columns: List[str] = list(column_names)
+                encode = json.JSONEncoder(ensure_ascii=False, default=ResultExporter.__to_json_value).encode
+
+                # Строки чанка собираются в один текстовый блок и пишутся одним вызовом
+                for chunk in chunks:
+                    export_file.write(
+                        ''.join(encode(dict(zip(columns, row))) + '\n' for row in chunk)
+                    )
+                    exported_rows_count += len(chunk)
+
+        return exported_rows_count
+
+    # -----------------------------------------------------------------------------------
+    @staticmethod
+    def __open_export_file(file_path: str, compress: bool) -> TextIO:
+        if compress:
+            return gzip.open(file_path, mode='wt', encoding='utf-8', newline='')
+
+        return open(file_path, mode='w', encoding='utf-8', newline='', buffering=EXPORT_FILE_BUFFER_SIZE)
+
+    # -----------------------------------------------------------------------------------
+    @staticmethod
+    def __split_into_chunks(rows: Iterable[Sequence[Any]], chunk_size: int) -> Iterator[List[Sequence[Any]]]:
+        rows_iterator: Iterator[Sequence[Any]] = iter(rows)
+
+        while True:
+            chunk: List[Sequence[Any]] = list(islice(rows_iterator, chunk_size))
+            if not chunk:
+                return
+
+            yield chunk
+
+    # -----------------------------------------------------------------------------------
+    @staticmethod
+    def __to_json_value(value: Any) -> Any:
+        # Типы СУБД, которые не сериализуются json по умолчанию
+        if isinstance(value, (date, time)):
+            return value.isoformat()
+
+        if isinstance(value, (Decimal, timedelta)):
+            return str(value)
+
+        if isinstance(value, (bytes, bytearray, memoryview)):
+            return bytes(value).hex()
+
+        if isinstance(value, set):
+            return sorted(value)
+
+        raise TypeError(f'Object of type {type(value).__name__} is not JSON serializable')
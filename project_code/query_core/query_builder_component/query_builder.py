@@ -0,0 +1,225 @@
+# -*- coding: utf-8 -*-
+
+"""
+Copyright 2025 kichiro-kun (Kei)
+Apache license, version 2.0 (Apache-2.0 license)
+"""
+
+__all__: list[str] = [
+    'QueryBuilder',
+]
+
+__author__ = 'kichiro-kun (Kei)'
+__version__ = '0.6.0'
+
+# =======================================================================================
+import math
+import re
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from typing import Any, Pattern, Sequence
+
+from query_core.query_cache_component.sql_table_extractor import SQLTableExtractor
+
+from shared.constants.global_configuration import KEYSET_PAGE_ALIAS
+from shared.exceptions.common import InvalidArgumentValueError
+
+
+_SELECT_KEYWORD_PATTERN: Pattern[str] = re.compile(r'^\s*SELECT\b', re.IGNORECASE)
+
+# Производная таблица с группировкой, агрегатами, DISTINCT, LIMIT или UNION не сливается с внешним запросом
+_UNMERGEABLE_QUERY_PATTERN: Pattern[str] = re.compile(
+    r'\b(?:GROUP\s+BY|HAVING|DISTINCT|DISTINCTROW|LIMIT|UNION|OVER)\b'
+    r'|\b(?:COUNT|SUM|AVG|MIN|MAX|GROUP_CONCAT|JSON_ARRAYAGG|JSON_OBJECTAGG|BIT_AND|BIT_OR|BIT_XOR|'
+    r'STD|STDDEV|STDDEV_POP|STDDEV_SAMP|VARIANCE|VAR_POP|VAR_SAMP)\s*\(',
+    re.IGNORECASE
+)
+_BARE_COLUMN_PATTERN: Pattern[str] = re.compile(r'^(?:[\w$]+|`[^`]+`)$')
+_TABLE_NAME_PATTERN: Pattern[str] = re.compile(r'^(?:[\w$]+|`[^`]+`)(?:\.(?:[\w$]+|`[^`]+`))?$')
+
+# Значения условия передаются параметрами: разделители запросов и комментарии в нём не нужны
+_UNSAFE_CONDITION_PATTERN: Pattern[str] = re.compile(r';|--|#|/\*|\*/')
+
+
+# _______________________________________________________________________________________
+class QueryBuilder:
+
+    # -----------------------------------------------------------------------------------
+    @staticmethod
+    def build_values_group(columns_count: int, placeholder: str) -> str:
+        if columns_count <= 0:
+            raise InvalidArgumentValueError(
+                f"Error! Argument: *columns_count* - should be positive! But given: *{columns_count}*!"
+            )
+
+        return '(' + ', '.join(placeholder for _ in range(columns_count)) + ')'
+
+    # -----------------------------------------------------------------------------------
+    @staticmethod
+    def build_insert_header(table: str, columns: Sequence[str]) -> str:
+        if not columns:
+            raise InvalidArgumentValueError(
+                "Error! Argument: *columns* - should contain at least one column!"
+            )
+
+        return f'INSERT INTO {table} ({", ".join(columns)}) VALUES '
+
+    # -----------------------------------------------------------------------------------
+    @staticmethod
+    def build_insert_query(table: str, columns: Sequence[str], rows_count: int, placeholder: str) -> str:
+        header: str = QueryBuilder.build_insert_header(table=table, columns=columns)
+        values_group: str = QueryBuilder.build_values_group(
+            columns_count=len(columns), placeholder=placeholder
+        )
+
+        return header + ','.join(values_group for _ in range(rows_count))
+
+    # -----------------------------------------------------------------------------------
+    @staticmethod
+    def build_upsert_query(table: str, columns: Sequence[str], update_columns: Sequence[str],
+                           placeholder: str) -> str:
+        insert_query: str = QueryBuilder.build_insert_query(
+            table=table, columns=columns, rows_count=1, placeholder=placeholder
+        )
+
+        if update_columns:
+            assignments: str = ', '.join(f'{column} = VALUES({column})' for column in update_columns)
+        else:
+            # Без обновляемых колонок дубликат остаётся нетронутым
+            assignments: str = f'{columns[0]} = {columns[0]}'
+
+        return f'{insert_query} ON DUPLICATE KEY UPDATE {assignments}'
+
+    # -----------------------------------------------------------------------------------
+    @staticmethod
+    def estimate_literal_size(value: Any) -> int:
+        # Оценка размера значения после подстановки в текст запроса.
+        # Для строк и байтов берётся худший случай экранирования (каждый символ удваивается).
+        if value is None:
+            return 4
+
+        if isinstance(value, (bool, int, float, Decimal)):
+            return len(str(value))
+
+        if isinstance(value, str):
+            return len(value.encode('utf-8')) * 2 + 2
+
+        if isinstance(value, (bytes, bytearray, memoryview)):
+            return len(value) * 2 + 10
+
+        if isinstance(value, (datetime, date, time, timedelta)):
+            return 28
+
+        return len(str(value).encode('utf-8')) * 2 + 2
+
+    # -----------------------------------------------------------------------------------
+    @staticmethod
+    def estimate_row_size(row: Sequence[Any]) -> int:
+        # Значения, разделители и скобки группы VALUES
+        return sum(QueryBuilder.estimate_literal_size(value) for value in row) + 2 * len(row) + 2
+
+    # -----------------------------------------------------------------------------------
+    @staticmethod
+    def supports_max_execution_time_hint(query: str) -> bool:
+        # Сервер применяет MAX_EXECUTION_TIME только к читающим SELECT верхнего уровня
+        return _SELECT_KEYWORD_PATTERN.match(query) is not None \
+            and SQLTableExtractor.is_cacheable_query(query)
+
+    # -----------------------------------------------------------------------------------
+    @staticmethod
+    def build_max_execution_time_query(query: str, timeout: float) -> str:
+        if not QueryBuilder.supports_max_execution_time_hint(query):
+            raise InvalidArgumentValueError(
+                f"Error! Argument: *query* - MAX_EXECUTION_TIME hint is applicable only to SELECT!\n"
+                f"But given: *{query}*!"
+            )
+
+        timeout_ms: int = max(1, math.ceil(timeout * 1000))
+
+        return _SELECT_KEYWORD_PATTERN.sub(
+            lambda match: f'{match.group(0)} /*+ MAX_EXECUTION_TIME({timeout_ms}) */', query, count=1
+        )
+
+    # -----------------------------------------------------------------------------------
+    @staticmethod
+    def build_keyset_page_query(query: str, key_column: str, page_size: int, placeholder: str,
+                                is_first_page: bool, descending: bool = False) -> str:
+        if page_size <= 0:
+            raise InvalidArgumentValueError(
+                f"Error! Argument: *page_size* - should be positive! But given: *{page_size}*!"
+            )
+
+        # Колонка ставится после псевдонима производной таблицы: keyset_page.t.id недопустимо
+        if _BARE_COLUMN_PATTERN.match(key_column) is None:
+            raise InvalidArgumentValueError(
+                f"Error! Argument: *key_column* - should be a bare column name without table prefix!\n"
+                f"But given: *{key_column}*!"
+            )
+
+        # Исходный запрос оборачивается производной таблицей: его собственный WHERE не разбирается,
+        # а оптимизатор сливает её с внешним запросом и использует индекс по ключу
+        base_query: str = query.strip().rstrip(';')
+
+        # Иначе MySQL материализует весь результат исходного запроса на каждой странице
+        if _UNMERGEABLE_QUERY_PATTERN.search(base_query) is not None:
+            raise InvalidArgumentValueError(
+                f"Error! Argument: *query* - should not use GROUP BY, HAVING, DISTINCT, LIMIT, UNION, "
+                f"window or aggregate functions!\nBut given: *{base_query}*!"
+            )
+        key: str = f'{KEYSET_PAGE_ALIAS}.{key_column}'
+        order: str = 'DESC' if descending else 'ASC'
+
+        condition: str = ''
+        if not is_first_page:
+            condition = f' WHERE {key} {"<" if descending else ">"} {placeholder}'
+
+        return f'SELECT * FROM ({base_query}) AS {KEYSET_PAGE_ALIAS}{condition} ' \
+               f'ORDER BY {key} {order} LIMIT {page_size}'
+
+    # -----------------------------------------------------------------------------------
+    @staticmethod
+    def build_key_lookup_query(table: str, columns: Sequence[str], key_column: str,
+                               keys_count: int, placeholder: str) -> str:
+        if not columns:
+            raise InvalidArgumentValueError(
+                "Error! Argument: *columns* - should contain at least one column!"
+            )
+
+        keys_group: str = QueryBuilder.build_values_group(columns_count=keys_count, placeholder=placeholder)
+
+        return f'SELECT {", ".join(columns)} FROM {table} WHERE {key_column} IN {keys_group}'
+
+    # -----------------------------------------------------------------------------------
+    @staticmethod
+    def build_blob_length_query(table: str, column: str, where: str) -> str:
+        QueryBuilder.__ensure_blob_source(table=table, column=column, where=where)
+
+        return f'SELECT OCTET_LENGTH({column}) FROM {table} WHERE {where}'
+
+    # -----------------------------------------------------------------------------------
+    @staticmethod
+    def build_blob_slice_query(table: str, column: str, where: str, placeholder: str) -> str:
+        QueryBuilder.__ensure_blob_source(table=table, column=column, where=where)
+
+        # Длина читается вместе с окном, чтобы заметить изменение значения между окнами
+        return f'SELECT SUBSTRING({column}, {placeholder}, {placeholder}), OCTET_LENGTH({column}) ' \
+               f'FROM {table} WHERE {where}'
+
+    # -----------------------------------------------------------------------------------
+    @staticmethod
+    def __ensure_blob_source(table: str, column: str, where: str) -> None:
+        if _TABLE_NAME_PATTERN.match(table) is None:
+            raise InvalidArgumentValueError(
+                f"Error! Argument: *table* - should be a table name!\nBut given: *{table}*!"
+            )
+
+        if _BARE_COLUMN_PATTERN.match(column) is None:
+            raise InvalidArgumentValueError(
+                f"Error! Argument: *column* - should be a bare column name!\nBut given: *{column}*!"
+            )
+
+        if not where.strip() or _UNSAFE_CONDITION_PATTERN.search(where) is not None:
+            raise InvalidArgumentValueError(
+                f"Error! Argument: *where* - should be a single condition without comments "
+                f"and statement separators!\nBut given: *{where}*!"
+            )
@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+
+"""
+Copyright 2025 kichiro-kun (Kei)
+Apache license, version 2.0 (Apache-2.0 license)
+"""
+
+__all__: list[str] = [
+    'QueryCacheInterface',
+    'QueryCacheStatistics',
+    'NoQueryCache',
+]
+
+__author__ = 'kichiro-kun (Kei)'
+__version__ = '0.1.0'
+
+# =======================================================================================
+from abc import ABC, abstractmethod
+from typing import Any, Hashable, Iterable, NamedTuple, NoReturn, Optional, Tuple
+
+from shared.exceptions.common import IsNullObjectOperation
+
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+class QueryCacheStatistics(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    invalidations: int
+    entries: int
+    size_bytes: int
+
+
+# _______________________________________________________________________________________
+class QueryCacheInterface(ABC):
+
+    # -----------------------------------------------------------------------------------
+    @abstractmethod
+    def get(self, key: Hashable) -> Tuple[bool, Any]: ...
+
+    # -----------------------------------------------------------------------------------
+    @abstractmethod
+    def put(self, key: Hashable, value: Any, tables: Iterable[str], ttl: Optional[float] = None) -> None: ...
+
+    # -----------------------------------------------------------------------------------
+    @abstractmethod
+    def invalidate_tables(self, tables: Iterable[str]) -> int: ...
+
+    # -----------------------------------------------------------------------------------
+    @abstractmethod
+    def clear(self) -> None: ...
+
+    # -----------------------------------------------------------------------------------
+    @abstractmethod
+    def get_statistics(self) -> QueryCacheStatistics: ...
+
+
+# _______________________________________________________________________________________
+class NoQueryCache(QueryCacheInterface):
+
+    # -----------------------------------------------------------------------------------
+    def get(self, key: Hashable) -> NoReturn:
+        raise IsNullObjectOperation
+
+    # -----------------------------------------------------------------------------------
+    def put(self, key: Hashable, value: Any, tables: Iterable[str], ttl: Optional[float] = None) -> NoReturn:
+        raise IsNullObjectOperation
+
+    # -----------------------------------------------------------------------------------
+    def invalidate_tables(self, tables: Iterable[str]) -> NoReturn:
+        raise IsNullObjectOperation
+
+    # -----------------------------------------------------------------------------------
+    def clear(self) -> NoReturn:
+        raise IsNullObjectOperation
+
+    # -----------------------------------------------------------------------------------
+    def get_statistics(self) -> NoReturn:
+        raise IsNullObjectOperation
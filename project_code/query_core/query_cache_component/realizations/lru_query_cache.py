@@ -0,0 +1,255 @@
+# -*- coding: utf-8 -*-
+
+"""
+Copyright 2025 kichiro-kun (Kei)
+Apache license, version 2.0 (Apache-2.0 license)
+"""
+
+__all__: list[str] = [
+    'LRUQueryCache',
+]
+
+__author__ = 'kichiro-kun (Kei)'
+__version__ = '0.2.0'
+
+# =======================================================================================
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, FrozenSet, Hashable, Iterable, NamedTuple, Optional, Set, Tuple
+
+from query_core.query_cache_component.abstract.query_cache_interface \
+    import QueryCacheInterface, QueryCacheStatistics
+
+from shared.constants.global_configuration import DEFAULT_QUERY_CACHE_MAX_ENTRIES, \
+    DEFAULT_QUERY_CACHE_MAX_BYTES, DEFAULT_QUERY_CACHE_TTL
+from shared.exceptions.common import InvalidArgumentTypeError, InvalidArgumentValueError
+from shared.utils.toolkit import ToolKit
+
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+class _CacheEntry(NamedTuple):
+    value: Any
+    tables: FrozenSet[str]
+    expires_at: float
+    size_bytes: int
+
+
+# _______________________________________________________________________________________
+class LRUQueryCache(QueryCacheInterface):
+
+    # -----------------------------------------------------------------------------------
+    def __init__(self, max_entries: int = DEFAULT_QUERY_CACHE_MAX_ENTRIES,
+                 max_bytes: int = DEFAULT_QUERY_CACHE_MAX_BYTES,
+                 default_ttl: float = DEFAULT_QUERY_CACHE_TTL) -> None:
+        ToolKit.ensure_instance(
+            obj=max_entries,
+            expected_type=int,
+            arg_name='max_entries'
+        )
+        ToolKit.ensure_instance(
+            obj=max_bytes,
+            expected_type=int,
+            arg_name='max_bytes'
+        )
+        LRUQueryCache.__ensure_ttl(ttl=default_ttl, arg_name='default_ttl')
+
+        if max_entries <= 0:
+            raise InvalidArgumentValueError(
+                f"Error! Argument: *max_entries* - should be positive! But given: *{max_entries}*!"
+            )
+
+        if max_bytes <= 0:
+            raise InvalidArgumentValueError(
+                f"Error! Argument: *max_bytes* - should be positive! But given: *{max_bytes}*!"
+            )
+
+        self.__max_entries: int = max_entries
+        self.__max_bytes: int = max_bytes
+        self.__default_ttl: float = default_ttl
+
+        # Порядок OrderedDict - порядок использования: в начале самые давние записи
+        self.__entries: OrderedDict[Hashable, _CacheEntry] = OrderedDict()
+        self.__keys_by_table: Dict[str, Set[Hashable]] = {}
+        self.__size_bytes: int = 0
+        self.__lock = threading.Lock()
+
+        # Поколения инвалидаций: результат, прочитанный до инвалидации его таблиц, не сохраняется
+        self.__generation: int = 0
+        self.__cleared_generation: int = 0
+        self.__table_generations: Dict[str, int] = {}
+        self.__local = threading.local()
+
+        self.__hits: int = 0
+        self.__misses: int = 0
+        self.__evictions: int = 0
+        self.__invalidations: int = 0
+
+    # -----------------------------------------------------------------------------------
+    def get(self, key: Hashable) -> Tuple[bool, Any]:
+        with self.__lock:
+            entry: Optional[_CacheEntry] = self.__entries.get(key)
+
+            if entry is None or entry.expires_at <= time.monotonic():
+                if entry is not None:
+                    self.__remove_entry(key=key)
+
+                # Поколение фиксируется до выполнения запроса: инвалидация во время чтения
+                # из СУБД сделает последующую запись устаревшей
+                self.__local.miss = (key, self.__generation)
+                self.__misses += 1
+                return False, None
+
+            self.__entries.move_to_end(key)
+            self.__hits += 1
+
+            return True, entry.value
+
+    # -----------------------------------------------------------------------------------
+    def put(self, key: Hashable, value: Any, tables: Iterable[str], ttl: Optional[float] = None) -> None:
+        if ttl is None:
+            ttl = self.__default_ttl
+        else:
+            LRUQueryCache.__ensure_ttl(ttl=ttl, arg_name='ttl')
+
+        # Нулевой TTL означает, что результат кэшировать не нужно
+        if ttl == 0:
+            return
+
+        size_bytes: int = LRUQueryCache.__estimate_size(obj=value)
+
+        # Результат, который больше всего бюджета памяти, вытеснил бы весь кэш
+        if size_bytes > self.__max_bytes:
+            return
+
+        entry = _CacheEntry(
+            value=value,
+            tables=frozenset(table.lower() for table in tables),
+            expires_at=time.monotonic() + ttl,
+            size_bytes=size_bytes
+        )
+
+        miss: Optional[Tuple[Hashable, int]] = getattr(self.__local, 'miss', None)
+        self.__local.miss = None
+
+        with self.__lock:
+            if miss is not None and miss[0] == key and self.__is_invalidated_since(
+                    generation=miss[1], tables=entry.tables):
+                return
+
+            if key in self.__entries:
+                self.__remove_entry(key=key)
+
+            self.__entries[key] = entry
+            self.__size_bytes += size_bytes
+
+            for table in entry.tables:
+                self.__keys_by_table.setdefault(table, set()).add(key)
+
+            while len(self.__entries) > self.__max_entries or self.__size_bytes > self.__max_bytes:
+                self.__remove_entry(key=next(iter(self.__entries)))
+                self.__evictions += 1
+
+    # -----------------------------------------------------------------------------------
+    def invalidate_tables(self, tables: Iterable[str]) -> int:
+        removed_count: int = 0
+
+        with self.__lock:
+            self.__generation += 1
+
+            for table in tables:
+                self.__table_generations[table.lower()] = self.__generation
+
+                for key in self.__keys_by_table.pop(table.lower(), ()):
+                    if key in self.__entries:
+                        self.__remove_entry(key=key)
+                        removed_count += 1
+
+            self.__invalidations += removed_count
+
+        return removed_count
+
+    # -----------------------------------------------------------------------------------
+    def clear(self) -> None:
+        with self.__lock:
+            self.__generation += 1
+            self.__cleared_generation = self.__generation
+            self.__table_generations.clear()
+
+            self.__invalidations += len(self.__entries)
+            self.__entries.clear()
+            self.__keys_by_table.clear()
+            self.__size_bytes = 0
+
+    # -----------------------------------------------------------------------------------
+    def get_statistics(self) -> QueryCacheStatistics:
+        with self.__lock:
+            return QueryCacheStatistics(
+                hits=self.__hits,
+                misses=self.__misses,
+                evictions=self.__evictions,
+                invalidations=self.__invalidations,
+                entries=len(self.__entries),
+                size_bytes=self.__size_bytes
+            )
+
+    # -----------------------------------------------------------------------------------
+    def __is_invalidated_since(self, generation: int, tables: FrozenSet[str]) -> bool:
+        # Вызывается только под блокировкой
+        if self.__cleared_generation > generation:
+            return True
+
+        return any(self.__table_generations.get(table, 0) > generation for table in tables)
+
+    # -----------------------------------------------------------------------------------
+    def __remove_entry(self, key: Hashable) -> None:
+        # Вызывается только под блокировкой
+        entry: _CacheEntry = self.__entries.pop(key)
+        self.__size_bytes -= entry.size_bytes
+
+        for table in entry.tables:
+            table_keys: Optional[Set[Hashable]] = self.__keys_by_table.get(table)
+
+            if table_keys is None:
+                continue
+
+            table_keys.discard(key)
+
+            if not table_keys:
+                del self.__keys_by_table[table]
+
+    # -----------------------------------------------------------------------------------
+    @staticmethod
+    def __estimate_size(obj: Any) -> int:
+        # Оценка снизу: контейнеры результата (кортежи, списки, словари) и их значения
+        size: int = sys.getsizeof(obj)
+
+        if isinstance(obj, dict):
+            return size + sum(
+                LRUQueryCache.__estimate_size(obj=key) + LRUQueryCache.__estimate_size(obj=value)
+                for key, value in obj.items()
+            )
+
+        if isinstance(obj, (tuple, list)):
+            return size + sum(LRUQueryCache.__estimate_size(obj=item) for item in obj)
+
+        # Записи RowFactory.RECORD хранят значения в слотах и итерируются как кортеж
+        if hasattr(obj, '_fields'):
+            return size + sum(LRUQueryCache.__estimate_size(obj=item) for item in obj)
+
+        return size
+
+    # -----------------------------------------------------------------------------------
+    @staticmethod
+    def __ensure_ttl(ttl: Any, arg_name: str) -> None:
+        if isinstance(ttl, bool) or not isinstance(ttl, (int, float)):
+            raise InvalidArgumentTypeError(
+                f"Error! Argument: *{arg_name}* - should be a *float*!\n"
+                f"But given: *{ttl}* - is Type of *{type(ttl).__name__}*!"
+            )
+
+        if ttl < 0:
+            raise InvalidArgumentValueError(
+                f"Error! Argument: *{arg_name}* - should not be negative! But given: *{ttl}*!"
+            )
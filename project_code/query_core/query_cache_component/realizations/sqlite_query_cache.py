@@ -0,0 +1,340 @@
+# -*- coding: utf-8 -*-
+
+"""
+Copyright 2025 kichiro-kun (Kei)
+Apache license, version 2.0 (Apache-2.0 license)
+"""
+
+__all__: list[str] = [
+    'SQLiteQueryCache',
+]
+
+__author__ = 'kichiro-kun (Kei)'
+__version__ = '0.1.0'
+
+# =======================================================================================
+import hashlib
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from typing import Any, FrozenSet, Hashable, Iterable, List, Optional, Tuple
+
+from query_core.query_cache_component.abstract.query_cache_interface \
+    import QueryCacheInterface, QueryCacheStatistics
+
+from shared.constants.global_configuration import DEFAULT_SHARED_QUERY_CACHE_MAX_BYTES, \
+    DEFAULT_QUERY_CACHE_TTL, SHARED_QUERY_CACHE_BUSY_TIMEOUT
+from shared.exceptions.common import InvalidArgumentTypeError, InvalidArgumentValueError
+from shared.utils.toolkit import ToolKit
+
+
+# Версия '*' инвалидирует все записи сразу (clear)
+_ALL_TABLES: str = '*'
+
+_SCHEMA: Tuple[str, ...] = (
+    'CREATE TABLE IF NOT EXISTS cache_entries ('
+    'key_hash TEXT PRIMARY KEY, value BLOB NOT NULL, tables TEXT NOT NULL, '
+    'size_bytes INTEGER NOT NULL, generation INTEGER NOT NULL, '
+    'expires_at REAL NOT NULL, created_at REAL NOT NULL)',
+    'CREATE INDEX IF NOT EXISTS cache_entries_created_at ON cache_entries (created_at)',
+    'CREATE TABLE IF NOT EXISTS cache_entry_tables ('
+    'key_hash TEXT NOT NULL, table_name TEXT NOT NULL, PRIMARY KEY (table_name, key_hash))',
+    'CREATE INDEX IF NOT EXISTS cache_entry_tables_key ON cache_entry_tables (key_hash)',
+    'CREATE TABLE IF NOT EXISTS table_versions ('
+    'table_name TEXT PRIMARY KEY, version INTEGER NOT NULL)',
+)
+
+
+# _______________________________________________________________________________________
+class SQLiteQueryCache(QueryCacheInterface):
+
+    # -----------------------------------------------------------------------------------
+    def __init__(self, file_path: str,
+                 max_bytes: int = DEFAULT_SHARED_QUERY_CACHE_MAX_BYTES,
+                 default_ttl: float = DEFAULT_QUERY_CACHE_TTL) -> None:
+        ToolKit.ensure_instance(
+            obj=file_path,
+            expected_type=str,
+            arg_name='file_path'
+        )
+        ToolKit.ensure_instance(
+            obj=max_bytes,
+            expected_type=int,
+            arg_name='max_bytes'
+        )
+        if isinstance(default_ttl, bool) or not isinstance(default_ttl, (int, float)):
+            raise InvalidArgumentTypeError(
+                f"Error! Argument: *default_ttl* - should be a *float*!\n"
+                f"But given: *{default_ttl}* - is Type of *{type(default_ttl).__name__}*!"
+            )
+
+        if max_bytes <= 0:
+            raise InvalidArgumentValueError(
+                f"Error! Argument: *max_bytes* - should be positive! But given: *{max_bytes}*!"
+            )
+
+        if default_ttl < 0:
+            raise InvalidArgumentValueError(
+                f"Error! Argument: *default_ttl* - should not be negative! But given: *{default_ttl}*!"
+            )
+
+        self.__file_path: str = file_path
+        self.__max_bytes: int = max_bytes
+        self.__default_ttl: float = default_ttl
+
+        # Подключение SQLite нельзя разделять между потоками и процессами после fork
+        self.__local = threading.local()
+        self.__stats_lock = threading.Lock()
+
+        self.__hits: int = 0
+        self.__misses: int = 0
+        self.__evictions: int = 0
+        self.__invalidations: int = 0
+
+        connection: sqlite3.Connection = self.__get_connection()
+        with connection:
+            for statement in _SCHEMA:
+                connection.execute(statement)
+
+    # -----------------------------------------------------------------------------------
+    def get(self, key: Hashable) -> Tuple[bool, Any]:
+        key_hash: str = SQLiteQueryCache.__hash_key(key=key)
+        connection: sqlite3.Connection = self.__get_connection()
+
+        row: Optional[Tuple[Any, ...]] = connection.execute(
+            'SELECT value, tables, generation, expires_at FROM cache_entries WHERE key_hash = ?',
+            (key_hash,)
+        ).fetchone()
+
+        is_found: bool = row is not None and row[3] > time.time() \
+            and self.__get_max_version(connection=connection, tables=row[1].split(',')) <= row[2]
+
+        if not is_found:
+            # Поколение фиксируется до выполнения запроса: инвалидация во время чтения
+            # из СУБД сделает последующую запись устаревшей
+            self.__local.miss = (key_hash, self.__get_max_version(connection=connection, tables=()))
+            self.__count(misses=1)
+
+            if row is not None:
+                self.__delete_entries(connection=connection, key_hashes=[key_hash])
+
+            return False, None
+
+        try:
+            value: Any = pickle.loads(row[0])
+        except Exception:
+            self.__count(misses=1)
+            return False, None
+
+        self.__count(hits=1)
+
+        return True, value
+
+    # -----------------------------------------------------------------------------------
+    def put(self, key: Hashable, value: Any, tables: Iterable[str], ttl: Optional[float] = None) -> None:
+        if ttl is None:
+            ttl = self.__default_ttl
+        elif isinstance(ttl, bool) or not isinstance(ttl, (int, float)):
+            raise InvalidArgumentTypeError(
+                f"Error! Argument: *ttl* - should be a *float*!\n"
+                f"But given: *{ttl}* - is Type of *{type(ttl).__name__}*!"
+            )
+        elif ttl < 0:
+            raise InvalidArgumentValueError(
+                f"Error! Argument: *ttl* - should not be negative! But given: *{ttl}*!"
+            )
+
+        if ttl == 0:
+            return
+
+        try:
+            payload: bytes = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            # Динамические классы записей (RowFactory.RECORD) не сериализуются
+            return
+
+        if len(payload) > self.__max_bytes:
+            return
+
+        key_hash: str = SQLiteQueryCache.__hash_key(key=key)
+        table_names: FrozenSet[str] = frozenset(table.lower() for table in tables)
+        connection: sqlite3.Connection = self.__get_connection()
+
+        miss: Optional[Tuple[str, int]] = getattr(self.__local, 'miss', None)
+        self.__local.miss = None
+
+        if miss is not None and miss[0] == key_hash:
+            generation: int = miss[1]
+        else:
+            generation = self.__get_max_version(connection=connection, tables=())
+
+        now: float = time.time()
+
+        with connection:
+            connection.execute('BEGIN IMMEDIATE')
+            connection.execute('DELETE FROM cache_entry_tables WHERE key_hash = ?', (key_hash,))
+            connection.execute(
+                'INSERT OR REPLACE INTO cache_entries '
+                '(key_hash, value, tables, size_bytes, generation, expires_at, created_at) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?)',
+                (key_hash, payload, ','.join(sorted(table_names)), len(payload),
+                 generation, now + ttl, now)
+            )
+            connection.executemany(
+                'INSERT INTO cache_entry_tables (key_hash, table_name) VALUES (?, ?)',
+                [(key_hash, table) for table in table_names]
+            )
+
+            self.__enforce_size_limit(connection=connection, now=now)
+
+    # -----------------------------------------------------------------------------------
+    def invalidate_tables(self, tables: Iterable[str]) -> int:
+        return self.__bump_versions(tables=frozenset(table.lower() for table in tables))
+
+    # -----------------------------------------------------------------------------------
+    def clear(self) -> None:
+        self.__bump_versions(tables=frozenset({_ALL_TABLES}))
+
+    # -----------------------------------------------------------------------------------
+    def get_statistics(self) -> QueryCacheStatistics:
+        entries, size_bytes = self.__get_connection().execute(
+            'SELECT COUNT(*), COALESCE(SUM(size_bytes), 0) FROM cache_entries'
+        ).fetchone()
+
+        with self.__stats_lock:
+            return QueryCacheStatistics(
+                hits=self.__hits,
+                misses=self.__misses,
+                evictions=self.__evictions,
+                invalidations=self.__invalidations,
+                entries=entries,
+                size_bytes=size_bytes
+            )
+
+    # -----------------------------------------------------------------------------------
+    def __bump_versions(self, tables: FrozenSet[str]) -> int:
+        if not tables:
+            return 0
+
+        connection: sqlite3.Connection = self.__get_connection()
+
+        with connection:
+            connection.execute('BEGIN IMMEDIATE')
+
+            # Новая версия больше любого поколения, зафиксированного записями до инвалидации
+            new_version: int = self.__get_max_version(connection=connection, tables=()) + 1
+
+            connection.executemany(
+                'INSERT OR REPLACE INTO table_versions (table_name, version) VALUES (?, ?)',
+                [(table, new_version) for table in tables]
+            )
+
+            if _ALL_TABLES in tables:
+                key_hashes: List[str] = [
+                    row[0] for row in connection.execute('SELECT key_hash FROM cache_entries')
+                ]
+            else:
+                key_hashes = [
+                    row[0] for row in connection.execute(
+                        'SELECT DISTINCT key_hash FROM cache_entry_tables WHERE table_name IN '
+                        f'({",".join("?" for _ in tables)})',
+                        tuple(tables)
+                    )
+                ]
+
+            self.__delete_entries(connection=connection, key_hashes=key_hashes)
+
+        self.__count(invalidations=len(key_hashes))
+
+        return len(key_hashes)
+
+    # -----------------------------------------------------------------------------------
+    def __enforce_size_limit(self, connection: sqlite3.Connection, now: float) -> None:
+        connection.execute(
+            'DELETE FROM cache_entry_tables WHERE key_hash IN '
+            '(SELECT key_hash FROM cache_entries WHERE expires_at <= ?)',
+            (now,)
+        )
+        connection.execute('DELETE FROM cache_entries WHERE expires_at <= ?', (now,))
+
+        size_bytes: int = connection.execute(
+            'SELECT COALESCE(SUM(size_bytes), 0) FROM cache_entries'
+        ).fetchone()[0]
+
+        if size_bytes <= self.__max_bytes:
+            return
+
+        # Без записи времени доступа при каждом чтении вытесняются самые старые записи
+        evicted_hashes: List[str] = []
+        for key_hash, entry_size in connection.execute(
+                'SELECT key_hash, size_bytes FROM cache_entries ORDER BY created_at'):
+            if size_bytes <= self.__max_bytes:
+                break
+
+            evicted_hashes.append(key_hash)
+            size_bytes -= entry_size
+
+        self.__delete_entries(connection=connection, key_hashes=evicted_hashes)
+        self.__count(evictions=len(evicted_hashes))
+
+    # -----------------------------------------------------------------------------------
+    @staticmethod
+    def __delete_entries(connection: sqlite3.Connection, key_hashes: List[str]) -> None:
+        params: List[Tuple[str]] = [(key_hash,) for key_hash in key_hashes]
+
+        connection.executemany('DELETE FROM cache_entry_tables WHERE key_hash = ?', params)
+        connection.executemany('DELETE FROM cache_entries WHERE key_hash = ?', params)
+
+    # -----------------------------------------------------------------------------------
+    @staticmethod
+    def __get_max_version(connection: sqlite3.Connection, tables: Iterable[str]) -> int:
+        # Без списка таблиц возвращается текущее поколение всего кэша
+        table_names: Tuple[str, ...] = tuple(tables)
+
+        if table_names:
+            query: str = 'SELECT MAX(version) FROM table_versions WHERE table_name IN ' \
+                         f'({",".join("?" for _ in table_names)}, ?)'
+            params: Tuple[str, ...] = (*table_names, _ALL_TABLES)
+        else:
+            query = 'SELECT MAX(version) FROM table_versions'
+            params = ()
+
+        return connection.execute(query, params).fetchone()[0] or 0
+
+    # -----------------------------------------------------------------------------------
+    def __get_connection(self) -> sqlite3.Connection:
+        connection: Optional[sqlite3.Connection] = getattr(self.__local, 'connection', None)
+
+        if connection is not None and self.__local.pid == os.getpid():
+            return connection
+
+        # Автокоммит: транзакции записи открываются явно через BEGIN IMMEDIATE
+        connection = sqlite3.connect(
+            self.__file_path, timeout=SHARED_QUERY_CACHE_BUSY_TIMEOUT, isolation_level=None
+        )
+        connection.execute('PRAGMA journal_mode=WAL')
+        connection.execute('PRAGMA synchronous=NORMAL')
+
+        self.__local.connection = connection
+        self.__local.pid = os.getpid()
+        self.__local.miss = None
+
+        return connection
+
+    # -----------------------------------------------------------------------------------
+    def __count(self, hits: int = 0, misses: int = 0, evictions: int = 0, invalidations: int = 0) -> None:
+        with self.__stats_lock:
+            self.__hits += hits
+            self.__misses += misses
+            self.__evictions += evictions
+            self.__invalidations += invalidations
+
+    # -----------------------------------------------------------------------------------
+    @staticmethod
+    def __hash_key(key: Hashable) -> str:
+        # Ключ должен оставаться хэшируемым, как и для кэша в памяти процесса
+        hash(key)
+
+        return hashlib.sha1(pickle.dumps(key, protocol=pickle.HIGHEST_PROTOCOL)).hexdigest()
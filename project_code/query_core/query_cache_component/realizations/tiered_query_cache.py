@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+
+"""
+Copyright 2025 kichiro-kun (Kei)
+Apache license, version 2.0 (Apache-2.0 license)
+"""
+
+__all__: list[str] = [
+    'TieredQueryCache',
+]
+
+__author__ = 'kichiro-kun (Kei)'
+__version__ = '0.1.0'
+
+# =======================================================================================
+from typing import Any, FrozenSet, Hashable, Iterable, Optional, Tuple
+
+from query_core.query_cache_component.abstract.query_cache_interface \
+    import QueryCacheInterface, QueryCacheStatistics
+
+from shared.constants.global_configuration import DEFAULT_LOCAL_QUERY_CACHE_TTL
+from shared.exceptions.common import InvalidArgumentTypeError
+from shared.utils.toolkit import ToolKit
+
+
+# _______________________________________________________________________________________
+class TieredQueryCache(QueryCacheInterface):
+
+    # -----------------------------------------------------------------------------------
+    def __init__(self, local_cache: QueryCacheInterface, shared_cache: QueryCacheInterface,
+                 local_ttl: float = DEFAULT_LOCAL_QUERY_CACHE_TTL) -> None:
+        ToolKit.ensure_instance(
+            obj=local_cache,
+            expected_type=QueryCacheInterface,
+            arg_name='local_cache'
+        )
+        ToolKit.ensure_instance(
+            obj=shared_cache,
+            expected_type=QueryCacheInterface,
+            arg_name='shared_cache'
+        )
+        if isinstance(local_ttl, bool) or not isinstance(local_ttl, (int, float)):
+            raise InvalidArgumentTypeError(
+                f"Error! Argument: *local_ttl* - should be a *float*!\n"
+                f"But given: *{local_ttl}* - is Type of *{type(local_ttl).__name__}*!"
+            )
+
+        self.__local_cache: QueryCacheInterface = local_cache
+        self.__shared_cache: QueryCacheInterface = shared_cache
+
+        # Инвалидации из других процессов не доходят до локального уровня,
+        # поэтому его время жизни ограничивает окно устаревания
+        self.__local_ttl: float = local_ttl
+
+    # -----------------------------------------------------------------------------------
+    def get(self, key: Hashable) -> Tuple[bool, Any]:
+        is_found, value = self.__local_cache.get(key=key)
+
+        if is_found:
+            return True, value
+
+        is_found, shared_value = self.__shared_cache.get(key=key)
+
+        if not is_found:
+            return False, None
+
+        # Общий уровень хранит таблицы вместе со значением, чтобы заполнить локальный уровень
+        tables, value = shared_value
+        self.__local_cache.put(key=key, value=value, tables=tables, ttl=self.__local_ttl)
+
+        return True, value
+
+    # -----------------------------------------------------------------------------------
+    def put(self, key: Hashable, value: Any, tables: Iterable[str], ttl: Optional[float] = None) -> None:
+        table_names: FrozenSet[str] = frozenset(tables)
+        local_ttl: float = self.__local_ttl if ttl is None else min(ttl, self.__local_ttl)
+
+        self.__local_cache.put(key=key, value=value, tables=table_names, ttl=local_ttl)
+        self.__shared_cache.put(key=key, value=(table_names, value), tables=table_names, ttl=ttl)
+
+    # -----------------------------------------------------------------------------------
+    def invalidate_tables(self, tables: Iterable[str]) -> int:
+        table_names: FrozenSet[str] = frozenset(tables)
+
+        self.__local_cache.invalidate_tables(tables=table_names)
+
+        return self.__shared_cache.invalidate_tables(tables=table_names)
+
+    # -----------------------------------------------------------------------------------
+    def clear(self) -> None:
+        self.__local_cache.clear()
+        self.__shared_cache.clear()
+
+    # -----------------------------------------------------------------------------------
+    def get_statistics(self) -> QueryCacheStatistics:
+        local_statistics: QueryCacheStatistics = self.__local_cache.get_statistics()
+        shared_statistics: QueryCacheStatistics = self.__shared_cache.get_statistics()
+
+        # Промах локального уровня с попаданием в общий считается попаданием
+        return QueryCacheStatistics(
+            hits=local_statistics.hits + shared_statistics.hits,
+            misses=shared_statistics.misses,
+            evictions=local_statistics.evictions + shared_statistics.evictions,
+            invalidations=shared_statistics.invalidations,
+            entries=shared_statistics.entries,
+            size_bytes=local_statistics.size_bytes + shared_statistics.size_bytes
+        )
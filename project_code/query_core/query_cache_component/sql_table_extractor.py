@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+
+"""
+Copyright 2025 kichiro-kun (Kei)
+Apache license, version 2.0 (Apache-2.0 license)
+"""
+
+__all__: list[str] = [
+    'SQLTableExtractor',
+]
+
+__author__ = 'kichiro-kun (Kei)'
+__version__ = '0.2.0'
+
+# =======================================================================================
+import re
+from functools import lru_cache
+from typing import FrozenSet, Pattern, Set
+
+from shared.constants.global_configuration import SQL_TABLE_EXTRACTOR_CACHE_SIZE
+
+
+_TABLE_NAME: str = r'[`"\w$.]+'
+
+# Псевдоним таблицы не может быть ключевым словом, с которого начинается следующая часть запроса
+_TABLE_ALIAS: str = r'(?:\s+(?:AS\s+)?(?!(?:JOIN|INNER|LEFT|RIGHT|CROSS|NATURAL|STRAIGHT_JOIN|ON|USING|WHERE|' \
+                    r'GROUP|ORDER|LIMIT|HAVING|SET|VALUES|VALUE|SELECT|UNION|WINDOW|FOR|LOCK|PARTITION)\b)\w+)?'
+
+# Имя таблицы после ключевого слова, включая списки через запятую: FROM a, b AS c
+_TABLE_REFERENCE_PATTERN: Pattern = re.compile(
+    r'\b(?:FROM|JOIN|UPDATE|INTO(?:\s+TABLE)?|TRUNCATE(?:\s+TABLE)?|(?:ALTER|DROP|CREATE)\s+TABLE'
+    r'(?:\s+IF\s+(?:NOT\s+)?EXISTS)?)\s+'
+    rf'({_TABLE_NAME}{_TABLE_ALIAS}(?:\s*,\s*{_TABLE_NAME}{_TABLE_ALIAS})*)',
+    re.IGNORECASE
+)
+
+_READ_QUERY_PATTERN: Pattern = re.compile(r'^\s*\(?\s*(?:SELECT|WITH)\b', re.IGNORECASE)
+_LOCKING_READ_PATTERN: Pattern = re.compile(
+    r'\bFOR\s+(?:UPDATE|SHARE)\b|\bLOCK\s+IN\s+SHARE\s+MODE\b|\bINTO\s+(?:@|OUTFILE|DUMPFILE)',
+    re.IGNORECASE
+)
+
+# Служебные команды сессии и транзакции не меняют данные таблиц. ROLLBACK сюда не входит:
+# откат к точке сохранения возвращает изменённые строки
+_NON_MODIFYING_QUERY_PATTERN: Pattern = re.compile(
+    r'^\s*\(?\s*(?:SELECT|SAVEPOINT|RELEASE|SET|START\s+TRANSACTION|BEGIN|COMMIT|USE|SHOW|'
+    r'DESCRIBE|DESC|EXPLAIN|(?:UN)?LOCK\s+TABLES?)\b',
+    re.IGNORECASE
+)
+
+
+# _______________________________________________________________________________________
+class SQLTableExtractor:
+
+    # -----------------------------------------------------------------------------------
+    @staticmethod
+    @lru_cache(maxsize=SQL_TABLE_EXTRACTOR_CACHE_SIZE)
+    def extract_tables(query: str) -> FrozenSet[str]:
+        # Лёгкий разбор без полноценного парсера: лишние совпадения дают только лишнюю инвалидацию
+        tables: Set[str] = set()
+
+        for table_list in _TABLE_REFERENCE_PATTERN.findall(query):
+            for table_reference in table_list.split(','):
+                table_name: str = SQLTableExtractor.normalize_table_name(table_reference.split()[0])
+
+                if table_name:
+                    tables.add(table_name)
+
+        return frozenset(tables)
+
+    # -----------------------------------------------------------------------------------
+    @staticmethod
+    def normalize_table_name(table_name: str) -> str:
+        # Схема отбрасывается: db.berry и berry считаются одной таблицей
+        return table_name.replace('`', '').replace('"', '').split('.')[-1].lower()
+
+    # -----------------------------------------------------------------------------------
+    @staticmethod
+    def is_cacheable_query(query: str) -> bool:
+        # Кэшируются только чтения без блокировок и побочных эффектов
+        return bool(_READ_QUERY_PATTERN.match(query)) and not _LOCKING_READ_PATTERN.search(query)
+
+    # -----------------------------------------------------------------------------------
+    @staticmethod
+    def is_data_modifying_query(query: str) -> bool:
+        # Неизвестные команды считаются изменяющими данные: лишняя инвалидация безопаснее устаревшего кэша
+        return not _NON_MODIFYING_QUERY_PATTERN.match(query)
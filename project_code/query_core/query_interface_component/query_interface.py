@@ -15,7 +15,9 @@
     * запросы без возвращаемых строк (например, `INSERT`, `UPDATE`, `DELETE`);
     * запросы, возвращающие одну запись;
     * запросы, возвращающие все записи;
-    * запросы, возвращающие ограниченное число записей.
+    * запросы, возвращающие ограниченное число записей;
+    * пакетное выполнение одного запроса с набором параметров;
+    * массовая загрузка строк в таблицу средствами СУБД.
 
 
 Реализации `QueryInterface` должны обеспечивать:
@@ -41,11 +43,13 @@
 """
 
 __author__ = 'kichiro-kun (Kei)'
-__version__ = '0.1.3'
+__version__ = '0.6.0'
 
 # =======================================================================================
 from abc import ABC, abstractmethod
-from typing import Sequence
+from typing import Any, Iterable, Optional, Sequence
+
+from shared.types.bulk_load_types import BulkLoadResult
 
 
 # _______________________________________________________________________________________
@@ -61,7 +65,7 @@ class QueryInterface(ABC):
 
     # -----------------------------------------------------------------------------------
     @abstractmethod
-    def execute_query_no_returns(self, *params, query: str) -> None:
+    def execute_query_no_returns(self, *params, query: str, timeout: Optional[float] = None) -> None:
         """
         Выполнение SQL запроса без возвращаемых строк результата.
 
@@ -74,6 +78,10 @@ class QueryInterface(ABC):
         Args:
             *params: Параметры, подставляемые в плейсхолдеры SQL запроса.
             query (str): Строка SQL запроса с плейсхолдерами для параметров.
+            timeout (Optional[float]): Предельное время выполнения запроса (в секундах).
+                                       Читающий `SELECT` ограничивается подсказкой
+                                       `MAX_EXECUTION_TIME`, остальные запросы прерываются
+                                       через `KILL QUERY`. `None` - без ограничения.
 
 
         Raises:
@@ -82,7 +90,9 @@ class QueryInterface(ABC):
 
     # -----------------------------------------------------------------------------------
     @abstractmethod
-    def execute_query_returns_one(self, *params, query: str) -> Sequence:
+    def execute_query_returns_one(self, *params, query: str, raw: bool = False,
+                                  cache_ttl: Optional[float] = None,
+                                  timeout: Optional[float] = None) -> Sequence:
         """
         Выполнение SQL запроса с возвратом одной записи результата.
 
@@ -97,6 +107,15 @@ class QueryInterface(ABC):
         Args:
             *params: Параметры, подставляемые в плейсхолдеры SQL запроса.
             query (str): Строка SQL запроса с плейсхолдерами для параметров.
+            raw (bool): Вернуть значения колонок неразобранными байтами драйвера,
+                        без преобразования в типы Python (для проксирования данных).
+            cache_ttl (Optional[float]): Время жизни результата в кэше запросов (в секундах),
+                                         если кэш подключён. `None` - время жизни кэша
+                                         по умолчанию, `0` - выполнить запрос мимо кэша.
+            timeout (Optional[float]): Предельное время выполнения запроса (в секундах).
+                                       Читающий `SELECT` ограничивается подсказкой
+                                       `MAX_EXECUTION_TIME`, остальные запросы прерываются
+                                       через `KILL QUERY`. `None` - без ограничения.
 
 
         Returns:
@@ -110,7 +129,9 @@ class QueryInterface(ABC):
 
     # -----------------------------------------------------------------------------------
     @abstractmethod
-    def execute_query_returns_all(self, *params, query: str) -> Sequence:
+    def execute_query_returns_all(self, *params, query: str, raw: bool = False,
+                                  cache_ttl: Optional[float] = None,
+                                  timeout: Optional[float] = None) -> Sequence:
         """
         Выполнение SQL запроса с возвратом всех строк результата.
 
@@ -124,6 +145,15 @@ class QueryInterface(ABC):
         Args:
             *params: Параметры, подставляемые в плейсхолдеры SQL запроса.
             query (str): Строка SQL запроса с плейсхолдерами для параметров.
+            raw (bool): Вернуть значения колонок неразобранными байтами драйвера,
+                        без преобразования в типы Python (для проксирования данных).
+            cache_ttl (Optional[float]): Время жизни результата в кэше запросов (в секундах),
+                                         если кэш подключён. `None` - время жизни кэша
+                                         по умолчанию, `0` - выполнить запрос мимо кэша.
+            timeout (Optional[float]): Предельное время выполнения запроса (в секундах).
+                                       Читающий `SELECT` ограничивается подсказкой
+                                       `MAX_EXECUTION_TIME`, остальные запросы прерываются
+                                       через `KILL QUERY`. `None` - без ограничения.
 
 
         Returns:
@@ -138,7 +168,9 @@ class QueryInterface(ABC):
 
     # -----------------------------------------------------------------------------------
     @abstractmethod
-    def execute_query_returns_many(self, *params, query: str, returns_count: int) -> Sequence:
+    def execute_query_returns_many(self, *params, query: str, returns_count: int,
+                                   raw: bool = False, cache_ttl: Optional[float] = None,
+                                   timeout: Optional[float] = None) -> Sequence:
         """
         Выполнение SQL запроса с возвратом ограниченного числа строк.
 
@@ -152,6 +184,15 @@ class QueryInterface(ABC):
             *params: Параметры, подставляемые в плейсхолдеры SQL запроса.
             query (str): Строка SQL запроса с плейсхолдерами для параметров.
             returns_count (int): Максимальное количество возвращаемых строк.
+            raw (bool): Вернуть значения колонок неразобранными байтами драйвера,
+                        без преобразования в типы Python (для проксирования данных).
+            cache_ttl (Optional[float]): Время жизни результата в кэше запросов (в секундах),
+                                         если кэш подключён. `None` - время жизни кэша
+                                         по умолчанию, `0` - выполнить запрос мимо кэша.
+            timeout (Optional[float]): Предельное время выполнения запроса (в секундах).
+                                       Читающий `SELECT` ограничивается подсказкой
+                                       `MAX_EXECUTION_TIME`, остальные запросы прерываются
+                                       через `KILL QUERY`. `None` - без ограничения.
 
 
         Returns:
@@ -163,3 +204,53 @@ class QueryInterface(ABC):
         Raises:
             Exception: В случае ошибки выполнения SQL запроса.
         """
+
+    # -----------------------------------------------------------------------------------
+    @abstractmethod
+    def execute_batch_no_returns(self, query: str, params_sequence: Sequence[Sequence[Any]]) -> None:
+        """
+        Пакетное выполнение SQL запроса без возвращаемых строк результата.
+
+
+        Один и тот же запрос выполняется для каждого набора параметров из `params_sequence`
+        за одно обращение к курсору (`executemany`). Метод подходит для серий однотипных
+        `INSERT`/`UPDATE` запросов, когда отдельный вызов на каждую строку слишком дорог.
+
+
+        Args:
+            query (str): Строка SQL запроса с плейсхолдерами для параметров.
+            params_sequence (Sequence[Sequence[Any]]): Наборы параметров, по одному на выполнение.
+                                                        Пустая последовательность не выполняет запрос.
+
+
+        Raises:
+            Exception: В случае ошибки выполнения SQL запроса.
+        """
+
+    # -----------------------------------------------------------------------------------
+    @abstractmethod
+    def execute_bulk_load(self, table: str, columns: Sequence[str],
+                          rows: Iterable[Sequence[Any]] = (), file_path: str = '') -> BulkLoadResult:
+        """
+        Массовая загрузка строк в таблицу штатным механизмом СУБД.
+
+
+        Метод предназначен для крупных загрузок данных, когда даже многострочные `INSERT`
+        оказываются слишком медленными (для MySQL - `LOAD DATA LOCAL INFILE`).
+        Источником служат либо строки итерируемого объекта, либо готовый CSV файл.
+
+
+        Args:
+            table (str): Имя таблицы, в которую загружаются данные.
+            columns (Sequence[str]): Колонки таблицы в порядке значений строк.
+            rows (Iterable[Sequence[Any]]): Загружаемые строки, если не указан `file_path`.
+            file_path (str): Путь к CSV файлу. При непустом значении `rows` игнорируется.
+
+
+        Returns:
+            BulkLoadResult: Количество загруженных и пропущенных строк, а также число предупреждений.
+
+
+        Raises:
+            Exception: В случае ошибки выполнения загрузки.
+        """
@@ -0,0 +1,177 @@
+# -*- coding: utf-8 -*-
+
+"""
+Copyright 2025 kichiro-kun (Kei)
+Apache license, version 2.0 (Apache-2.0 license)
+"""
+
+__all__: list[str] = [
+    'ChunkSizerStatistics',
+    'AdaptiveChunkSizer',
+]
+
+__author__ = 'kichiro-kun (Kei)'
+__version__ = '0.1.1'
+
+# =======================================================================================
+import threading
+from typing import Any, Iterable, Mapping, NamedTuple, Sequence, Union
+
+from shared.constants.global_configuration import DEFAULT_STREAM_CHUNK_SIZE, \
+    DEFAULT_ADAPTIVE_CHUNK_TARGET_BYTES, DEFAULT_ADAPTIVE_CHUNK_MAX_BYTES, \
+    DEFAULT_ADAPTIVE_CHUNK_MIN_SIZE, DEFAULT_ADAPTIVE_CHUNK_MAX_SIZE, \
+    DEFAULT_ADAPTIVE_CHUNK_MAX_FETCH_LATENCY, ADAPTIVE_CHUNK_SAMPLE_ROWS, ADAPTIVE_CHUNK_SMOOTHING
+from shared.exceptions.common import InvalidArgumentTypeError, InvalidArgumentValueError
+from shared.utils.toolkit import ToolKit
+
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+class ChunkSizerStatistics(NamedTuple):
+    chunk_size: int
+    row_bytes: float
+    bytes_per_second: float
+    fetches: int
+
+
+# _______________________________________________________________________________________
+class AdaptiveChunkSizer:
+
+    # -----------------------------------------------------------------------------------
+    def __init__(self, target_chunk_bytes: int = DEFAULT_ADAPTIVE_CHUNK_TARGET_BYTES,
+                 max_chunk_bytes: int = DEFAULT_ADAPTIVE_CHUNK_MAX_BYTES,
+                 min_chunk_size: int = DEFAULT_ADAPTIVE_CHUNK_MIN_SIZE,
+                 max_chunk_size: int = DEFAULT_ADAPTIVE_CHUNK_MAX_SIZE,
+                 initial_chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE,
+                 max_fetch_latency: float = DEFAULT_ADAPTIVE_CHUNK_MAX_FETCH_LATENCY) -> None:
+        for arg_name, value in (('target_chunk_bytes', target_chunk_bytes),
+                                ('max_chunk_bytes', max_chunk_bytes),
+                                ('min_chunk_size', min_chunk_size),
+                                ('max_chunk_size', max_chunk_size),
+                                ('initial_chunk_size', initial_chunk_size)):
+            ToolKit.ensure_instance(
+                obj=value,
+                expected_type=int,
+                arg_name=arg_name
+            )
+
+            if value <= 0:
+                raise InvalidArgumentValueError(
+                    f"Error! Argument: *{arg_name}* - should be positive! But given: *{value}*!"
+                )
+
+        if isinstance(max_fetch_latency, bool) or not isinstance(max_fetch_latency, (int, float)):
+            raise InvalidArgumentTypeError(
+                f"Error! Argument: *max_fetch_latency* - should be a *float*!\n"
+                f"But given: *{max_fetch_latency}* - is Type of *{type(max_fetch_latency).__name__}*!"
+            )
+
+        if min_chunk_size > max_chunk_size or target_chunk_bytes > max_chunk_bytes:
+            raise InvalidArgumentValueError(
+                f"Error! Chunk bounds are inconsistent: *{min_chunk_size}..{max_chunk_size}* rows, "
+                f"*{target_chunk_bytes}* of *{max_chunk_bytes}* bytes!"
+            )
+
+        self.__target_chunk_bytes: int = target_chunk_bytes
+        self.__max_chunk_bytes: int = max_chunk_bytes
+        self.__min_chunk_size: int = min_chunk_size
+        self.__max_chunk_size: int = max_chunk_size
+
+        # Ноль отключает ограничение по задержке одной выборки
+        self.__max_fetch_latency: float = max(0.0, float(max_fetch_latency))
+
+        self.__lock = threading.Lock()
+        self.__row_bytes: float = 0.0
+        self.__bytes_per_second: float = 0.0
+        self.__fetches_count: int = 0
+        self.__chunk_size: int = self.__clamp(initial_chunk_size)
+
+    # -----------------------------------------------------------------------------------
+    def get_chunk_size(self) -> int:
+        with self.__lock:
+            return self.__chunk_size
+
+    # -----------------------------------------------------------------------------------
+    def record_fetch(self, rows: Sequence[Sequence[Any]], duration: float) -> int:
+        if not rows:
+            return self.get_chunk_size()
+
+        # Размер строки оценивается по равномерной выборке, чтобы учёт не стоил O(n) на чанк
+        step: int = max(1, len(rows) // ADAPTIVE_CHUNK_SAMPLE_ROWS)
+        sample: Sequence[Sequence[Any]] = rows[::step]
+        sample_row_bytes: float = sum(self.estimate_row_bytes(row) for row in sample) / len(sample)
+        fetched_bytes: float = sample_row_bytes * len(rows)
+
+        with self.__lock:
+            self.__fetches_count += 1
+
+            # Экспоненциальное сглаживание гасит колебания между соседними чанками
+            self.__row_bytes = sample_row_bytes if self.__row_bytes == 0 \
+                else self.__smooth(self.__row_bytes, sample_row_bytes)
+
+            if duration > 0:
+                current_throughput: float = fetched_bytes / duration
+                self.__bytes_per_second = current_throughput if self.__bytes_per_second == 0 \
+                    else self.__smooth(self.__bytes_per_second, current_throughput)
+
+            desired_size: float = self.__target_chunk_bytes / self.__row_bytes
+
+            # Медленный сервер или сеть: чанк уменьшается, чтобы одна выборка укладывалась в задержку
+            if self.__max_fetch_latency > 0 and self.__bytes_per_second > 0:
+                desired_size = min(
+                    desired_size,
+                    self.__max_fetch_latency * self.__bytes_per_second / self.__row_bytes
+                )
+
+            # Шаг изменения ограничен вдвое в любую сторону
+            current_size: int = self.__chunk_size
+            desired_size = min(max(desired_size, current_size / 2), current_size * 2)
+
+            self.__chunk_size = self.__clamp(int(desired_size))
+
+            return self.__chunk_size
+
+    # -----------------------------------------------------------------------------------
+    def get_statistics(self) -> ChunkSizerStatistics:
+        with self.__lock:
+            return ChunkSizerStatistics(
+                chunk_size=self.__chunk_size,
+                row_bytes=self.__row_bytes,
+                bytes_per_second=self.__bytes_per_second,
+                fetches=self.__fetches_count
+            )
+
+    # -----------------------------------------------------------------------------------
+    def __clamp(self, chunk_size: int) -> int:
+        upper_bound: int = self.__max_chunk_size
+
+        # Верхняя граница памяти на один чанк при уже известном размере строки
+        if self.__row_bytes > 0:
+            upper_bound = min(upper_bound, int(self.__max_chunk_bytes / self.__row_bytes))
+
+        return max(self.__min_chunk_size, min(chunk_size, upper_bound))
+
+    # -----------------------------------------------------------------------------------
+    @staticmethod
+    def __smooth(previous: float, current: float) -> float:
+        return previous + ADAPTIVE_CHUNK_SMOOTHING * (current - previous)
+
+    # -----------------------------------------------------------------------------------
+    @staticmethod
+    def estimate_row_bytes(row: Union[Sequence[Any], Mapping[str, Any]]) -> int:
+        row_bytes: int = 0
+
+        # Строки словарной фабрики оцениваются по значениям, а не по именам колонок
+        values: Iterable[Any] = row.values() if isinstance(row, Mapping) else row
+
+        for value in values:
+            if value is None:
+                row_bytes += 1
+            elif isinstance(value, (bytes, bytearray, memoryview)):
+                row_bytes += len(value)
+            elif isinstance(value, str):
+                row_bytes += len(value)
+            else:
+                # Числа, даты и десятичные значения передаются в пределах нескольких байт
+                row_bytes += 8
+
+        return max(row_bytes, 1)
@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+
+"""
+Copyright 2025 kichiro-kun (Kei)
+Apache license, version 2.0 (Apache-2.0 license)
+"""
+
+__all__: list[str] = [
+    'CursorRowStream',
+]
+
+__author__ = 'kichiro-kun (Kei)'
+__version__ = '0.3.0'
+
+# =======================================================================================
+import time
+from typing import Any, Callable, Iterator, Optional, Sequence
+
+from dbms_interaction.adapters_component.cursor.abstract.cursor_interface import CursorInterface
+from query_core.result_stream_component.adaptive_chunk_sizer import AdaptiveChunkSizer
+
+from shared.constants.global_configuration import DEFAULT_STREAM_CHUNK_SIZE
+from shared.exceptions.common import InvalidArgumentTypeError, InvalidArgumentValueError
+from shared.utils.toolkit import ToolKit
+
+
+# _______________________________________________________________________________________
+class CursorRowStream(Iterator[Sequence[Any]]):
+
+    # -----------------------------------------------------------------------------------
+    def __init__(self, cursor: CursorInterface, chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE,
+                 chunk_sizer: Optional[AdaptiveChunkSizer] = None,
+                 on_close: Optional[Callable[[], None]] = None) -> None:
+        ToolKit.ensure_instance(
+            obj=cursor,
+            expected_type=CursorInterface,
+            arg_name='cursor'
+        )
+        ToolKit.ensure_instance(
+            obj=chunk_size,
+            expected_type=int,
+            arg_name='chunk_size'
+        )
+
+        if chunk_size <= 0:
+            raise InvalidArgumentValueError(
+                f"Error! Argument: *chunk_size* - should be positive! But given: *{chunk_size}*!"
+            )
+
+        if chunk_sizer is not None:
+            ToolKit.ensure_instance(
+                obj=chunk_sizer,
+                expected_type=AdaptiveChunkSizer,
+                arg_name='chunk_sizer'
+            )
+
+        if on_close is not None and not callable(on_close):
+            raise InvalidArgumentTypeError(
+                f"Error! Argument: *on_close* - should be a *Callable*!\n"
+                f"But given: *{on_close}* - is Type of *{type(on_close).__name__}*!"
+            )
+
+        self.__cursor: CursorInterface = cursor
+        self.__chunk_size: int = chunk_size
+
+        # Адаптивный подбор заменяет фиксированный размер чанка
+        self.__chunk_sizer: Optional[AdaptiveChunkSizer] = chunk_sizer
+
+        # Вызывается один раз после закрытия курсора: владелец освобождает занятое потоком соединение
+        self.__on_close: Optional[Callable[[], None]] = on_close
+
+        self.__current_chunk: Sequence[Sequence[Any]] = ()
+        self.__position: int = 0
+        self.__is_exhausted: bool = False
+        self.__is_closed: bool = False
+
+    # -----------------------------------------------------------------------------------
+    def get_column_names(self) -> Sequence[str]:
+        return self.__cursor.get_column_names()
+
+    # -----------------------------------------------------------------------------------
+    def iter_chunks(self) -> Iterator[Sequence[Sequence[Any]]]:
+        # Остаток текущего чанка отдаётся первым, если строки уже читались поштучно
+        if self.__position < len(self.__current_chunk):
+            remaining_rows: Sequence[Sequence[Any]] = self.__current_chunk[self.__position:]
+            self.__position = len(self.__current_chunk)
+
+            yield remaining_rows
+
+        while True:
+            chunk: Sequence[Sequence[Any]] = self.__fetch_next_chunk()
+            if not chunk:
+                return
+
+            yield chunk
+
+    # -----------------------------------------------------------------------------------
+    def __iter__(self) -> 'CursorRowStream':
+        return self
+
+    # -----------------------------------------------------------------------------------
+    def __next__(self) -> Sequence[Any]:
+        if self.__position >= len(self.__current_chunk):
+            self.__current_chunk = self.__fetch_next_chunk()
+            self.__position = 0
+
+            if not self.__current_chunk:
+                raise StopIteration
+
+        row: Sequence[Any] = self.__current_chunk[self.__position]
+        self.__position += 1
+
+        return row
+
+    # -----------------------------------------------------------------------------------
+    def close(self) -> None:
+        if self.__is_closed:
+            return
+
+        self.__is_closed = True
+        self.__current_chunk = ()
+        cur: CursorInterface = self.__cursor
+
+        try:
+            # Непрочитанный остаток результата занимает соединение, поэтому он выбирается до закрытия
+            if self.__is_exhausted is False:
+                while cur.fetchmany(count=self.__get_chunk_size()):
+                    pass
+        finally:
+            try:
+                cur.close()
+            finally:
+                if self.__on_close is not None:
+                    self.__on_close()
+
+    # -----------------------------------------------------------------------------------
+    def __enter__(self) -> 'CursorRowStream':
+        return self
+
+    # -----------------------------------------------------------------------------------
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    # -----------------------------------------------------------------------------------
+    def __fetch_next_chunk(self) -> Sequence[Sequence[Any]]:
+        if self.__is_closed:
+            return ()
+
+        chunk_sizer: Optional[AdaptiveChunkSizer] = self.__chunk_sizer
+
+        if chunk_sizer is None:
+            chunk: Sequence[Sequence[Any]] = self.__cursor.fetchmany(count=self.__chunk_size)
+        else:
+            started_at: float = time.perf_counter()
+            chunk = self.__cursor.fetchmany(count=chunk_sizer.get_chunk_size())
+            chunk_sizer.record_fetch(rows=chunk, duration=time.perf_counter() - started_at)
+
+        # Исчерпанный результат освобождает курсор без явного вызова close
+        if not chunk:
+            self.__is_exhausted = True
+            self.close()
+
+        return chunk
+
+    # -----------------------------------------------------------------------------------
+    def __get_chunk_size(self) -> int:
+        chunk_sizer: Optional[AdaptiveChunkSizer] = self.__chunk_sizer
+
+        if chunk_sizer is None:
+            return self.__chunk_size
+
+        return chunk_sizer.get_chunk_size()
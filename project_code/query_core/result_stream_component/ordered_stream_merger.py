@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+
+"""
+Copyright 2025 kichiro-kun (Kei)
+Apache license, version 2.0 (Apache-2.0 license)
+"""
+
+__all__: list[str] = [
+    'OrderedStreamMerger',
+]
+
+__author__ = 'kichiro-kun (Kei)'
+__version__ = '0.2.0'
+
+# =======================================================================================
+import heapq
+from itertools import islice
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Sequence
+
+from shared.exceptions.common import InvalidArgumentTypeError, InvalidArgumentValueError
+from shared.utils.toolkit import ToolKit
+
+
+SortKey = Callable[[Sequence[Any]], Any]
+
+
+# _______________________________________________________________________________________
+class OrderedStreamMerger(Iterator[Sequence[Any]]):
+
+    # -----------------------------------------------------------------------------------
+    def __init__(self, streams: Iterable[Iterable[Sequence[Any]]], sort_key: SortKey,
+                 limit: int = 0, reverse: bool = False,
+                 on_close: Optional[Callable[[], None]] = None) -> None:
+        if not callable(sort_key):
+            raise InvalidArgumentTypeError(
+                f"Error! Argument: *sort_key* - should be a *Callable*!\n"
+                f"But given: *{sort_key}* - is Type of *{type(sort_key).__name__}*!"
+            )
+        if on_close is not None and not callable(on_close):
+            raise InvalidArgumentTypeError(
+                f"Error! Argument: *on_close* - should be a *Callable*!\n"
+                f"But given: *{on_close}* - is Type of *{type(on_close).__name__}*!"
+            )
+        ToolKit.ensure_instance(
+            obj=limit,
+            expected_type=int,
+            arg_name='limit'
+        )
+        ToolKit.ensure_instance(
+            obj=reverse,
+            expected_type=bool,
+            arg_name='reverse'
+        )
+
+        if limit < 0:
+            raise InvalidArgumentValueError(
+                f"Error! Argument: *limit* - should not be negative! But given: *{limit}*!"
+            )
+
+        self.__streams: List[Iterable[Sequence[Any]]] = list(streams)
+
+        # Куча хранит по одной текущей строке из каждого потока: память O(k), а не O(n)
+        merged_rows: Iterator[Sequence[Any]] = heapq.merge(*self.__streams, key=sort_key, reverse=reverse)
+
+        # После достижения общего лимита строки из потоков больше не запрашиваются
+        self.__rows: Iterator[Sequence[Any]] = islice(merged_rows, limit) if limit > 0 else merged_rows
+        self.__is_closed: bool = False
+
+        # Вызывается один раз после закрытия всех потоков
+        self.__on_close: Optional[Callable[[], None]] = on_close
+
+    # -----------------------------------------------------------------------------------
+    def __iter__(self) -> 'OrderedStreamMerger':
+        return self
+
+    # -----------------------------------------------------------------------------------
+    def __next__(self) -> Sequence[Any]:
+        if self.__is_closed:
+            raise StopIteration
+
+        try:
+            return next(self.__rows)
+        except Exception:
+            # Исчерпание, лимит или ошибка одного из потоков освобождают курсоры всех шардов
+            self.close()
+            raise
+
+    # -----------------------------------------------------------------------------------
+    def close(self) -> None:
+        if self.__is_closed:
+            return
+
+        self.__is_closed = True
+        first_error: Optional[Exception] = None
+
+        # Каждый поток закрывается даже при ошибке закрытия соседнего
+        for stream in self.__streams:
+            close: Callable[[], None] = getattr(stream, 'close', None)
+
+            if close is None:
+                continue
+
+            try:
+                close()
+            except Exception as error:
+                first_error = first_error or error
+
+        if self.__on_close is not None:
+            self.__on_close()
+
+        if first_error is not None:
+            raise first_error
+
+    # -----------------------------------------------------------------------------------
+    def __enter__(self) -> 'OrderedStreamMerger':
+        return self
+
+    # -----------------------------------------------------------------------------------
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
@@ -0,0 +1,215 @@
+# -*- coding: utf-8 -*-
+
+"""
+Copyright 2025 kichiro-kun (Kei)
+Apache license, version 2.0 (Apache-2.0 license)
+"""
+
+__all__: list[str] = [
+    'SpillableResultSet',
+]
+
+__author__ = 'kichiro-kun (Kei)'
+__version__ = '0.1.1'
+
+# =======================================================================================
+import mmap
+import pickle
+import sys
+import tempfile
+from array import array
+from typing import Any, BinaryIO, Iterable, Iterator, List, Mapping, Optional, Sequence, Union
+
+from shared.constants.global_configuration import DEFAULT_SPILL_MEMORY_LIMIT, SPILL_FILE_BUFFER_SIZE, \
+    SPILL_ROW_REFERENCE_SIZE
+from shared.exceptions.common import InvalidArgumentValueError, OperationFailedComponentIsClosed
+from shared.utils.toolkit import ToolKit
+
+
+# _______________________________________________________________________________________
+class SpillableResultSet(Sequence[Any]):
+
+    # -----------------------------------------------------------------------------------
+    def __init__(self, rows: Iterable[Sequence[Any]], memory_limit: int = DEFAULT_SPILL_MEMORY_LIMIT,
+                 spill_directory: Optional[str] = None) -> None:
+        ToolKit.ensure_instance(
+            obj=memory_limit,
+            expected_type=int,
+            arg_name='memory_limit'
+        )
+
+        if memory_limit <= 0:
+            raise InvalidArgumentValueError(
+                f"Error! Argument: *memory_limit* - should be positive! But given: *{memory_limit}*!"
+            )
+
+        if spill_directory is not None:
+            ToolKit.ensure_instance(
+                obj=spill_directory,
+                expected_type=str,
+                arg_name='spill_directory'
+            )
+
+        self.__memory_limit: int = memory_limit
+        self.__spill_directory: Optional[str] = spill_directory
+
+        self.__rows: List[Any] = []
+
+        # Границы закодированных строк в файле: строка i занимает [offsets[i], offsets[i + 1])
+        self.__offsets: array = array('Q', [0])
+        self.__spill_file: Optional[BinaryIO] = None
+        self.__mapped_file: Optional[mmap.mmap] = None
+
+        # Тип строк фабрики восстанавливается при чтении: динамические классы записей не сериализуются
+        self.__row_type: Optional[type] = None
+        self.__is_closed: bool = False
+
+        try:
+            self.__consume_rows(rows=rows)
+        except Exception:
+            self.close()
+            raise
+
+    # -----------------------------------------------------------------------------------
+    def is_spilled(self) -> bool:
+        return self.__spill_file is not None
+
+    # -----------------------------------------------------------------------------------
+    def get_spilled_bytes(self) -> int:
+        if self.__spill_file is None:
+            return 0
+
+        return self.__offsets[-1]
+
+    # -----------------------------------------------------------------------------------
+    def __len__(self) -> int:
+        if self.__spill_file is None:
+            return len(self.__rows)
+
+        return len(self.__offsets) - 1
+
+    # -----------------------------------------------------------------------------------
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        self.__ensure_is_open()
+
+        if isinstance(index, slice):
+            return [self.__get_row(position) for position in range(*index.indices(len(self)))]
+
+        ToolKit.ensure_instance(
+            obj=index,
+            expected_type=int,
+            arg_name='index'
+        )
+
+        rows_count: int = len(self)
+        position: int = index + rows_count if index < 0 else index
+
+        if not 0 <= position < rows_count:
+            raise IndexError(f"Error! Result set index *{index}* is out of range!")
+
+        return self.__get_row(position)
+
+    # -----------------------------------------------------------------------------------
+    def __iter__(self) -> Iterator[Any]:
+        self.__ensure_is_open()
+
+        if self.__spill_file is None:
+            return iter(self.__rows)
+
+        return (self.__get_row(position) for position in range(len(self)))
+
+    # -----------------------------------------------------------------------------------
+    def close(self) -> None:
+        if self.__is_closed:
+            return
+
+        self.__is_closed = True
+        self.__rows = []
+
+        if self.__mapped_file is not None:
+            self.__mapped_file.close()
+
+        # Временный файл удаляется системой при закрытии
+        if self.__spill_file is not None:
+            self.__spill_file.close()
+
+    # -----------------------------------------------------------------------------------
+    def __enter__(self) -> 'SpillableResultSet':
+        return self
+
+    # -----------------------------------------------------------------------------------
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    # -----------------------------------------------------------------------------------
+    def __consume_rows(self, rows: Iterable[Sequence[Any]]) -> None:
+        rows_in_memory: List[Any] = self.__rows
+        memory_usage: int = 0
+
+        for row in rows:
+            if self.__spill_file is not None:
+                self.__write_row(row=row)
+                continue
+
+            rows_in_memory.append(row)
+            memory_usage += self.__estimate_row_memory(row=row)
+
+            # После превышения лимита все строки, включая уже прочитанные, переносятся в файл
+            if memory_usage > self.__memory_limit:
+                self.__spill_file = tempfile.TemporaryFile(
+                    mode='w+b', buffering=SPILL_FILE_BUFFER_SIZE, dir=self.__spill_directory
+                )
+
+                for buffered_row in rows_in_memory:
+                    self.__write_row(row=buffered_row)
+
+                self.__rows = rows_in_memory = []
+
+        if self.__spill_file is not None:
+            self.__spill_file.flush()
+            self.__mapped_file = mmap.mmap(self.__spill_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    # -----------------------------------------------------------------------------------
+    @staticmethod
+    def __estimate_row_memory(row: Any) -> int:
+        # Учитываются заголовки объектов Python и ссылка в списке: строка из трёх чисел
+        # занимает в памяти около 150 байт, а не 24 байта своих значений
+        values: Iterable[Any] = row.values() if isinstance(row, Mapping) else row
+
+        # Имена колонок словарной строки общие для всех строк и не учитываются
+        values_size: int = sum(sys.getsizeof(value) for value in values)
+
+        return sys.getsizeof(row) + values_size + SPILL_ROW_REFERENCE_SIZE
+
+    # -----------------------------------------------------------------------------------
+    def __write_row(self, row: Any) -> None:
+        if self.__row_type is None:
+            self.__row_type = type(row)
+
+        values: Any = row if isinstance(row, Mapping) else tuple(row)
+        payload: bytes = pickle.dumps(values, protocol=pickle.HIGHEST_PROTOCOL)
+
+        self.__spill_file.write(payload)
+        self.__offsets.append(self.__offsets[-1] + len(payload))
+
+    # -----------------------------------------------------------------------------------
+    def __get_row(self, position: int) -> Any:
+        if self.__mapped_file is None:
+            return self.__rows[position]
+
+        offsets: array = self.__offsets
+        values: Any = pickle.loads(self.__mapped_file[offsets[position]:offsets[position + 1]])
+        row_type: Optional[type] = self.__row_type
+
+        if isinstance(values, Mapping) or row_type is tuple:
+            return values
+
+        if row_type is list:
+            return list(values)
+
+        return row_type(*values)
+
+    # -----------------------------------------------------------------------------------
+    def __ensure_is_open(self) -> None:
+        if self.__is_closed:
+            raise OperationFailedComponentIsClosed()
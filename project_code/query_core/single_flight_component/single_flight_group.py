@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+
+"""
+Copyright 2025 kichiro-kun (Kei)
+Apache license, version 2.0 (Apache-2.0 license)
+"""
+
+__all__: list[str] = [
+    'SingleFlightGroup',
+    'NoSingleFlightGroup',
+]
+
+__author__ = 'kichiro-kun (Kei)'
+__version__ = '0.1.0'
+
+# =======================================================================================
+import threading
+from typing import Any, Callable, Dict, Hashable, NoReturn, Optional
+
+from shared.exceptions.common import InvalidArgumentTypeError, IsNullObjectOperation
+
+
+# _______________________________________________________________________________________
+class _InFlightCall:
+
+    # -----------------------------------------------------------------------------------
+    def __init__(self) -> None:
+        self.done_event = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+# _______________________________________________________________________________________
+class SingleFlightGroup:
+
+    # -----------------------------------------------------------------------------------
+    def __init__(self) -> None:
+        self.__calls: Dict[Hashable, _InFlightCall] = {}
+        self.__lock = threading.Lock()
+        self.__shared_calls_count: int = 0
+
+    # -----------------------------------------------------------------------------------
+    def execute(self, key: Hashable, operation: Callable[[], Any]) -> Any:
+        if not callable(operation):
+            raise InvalidArgumentTypeError(
+                f"Error! Argument: *operation* - should be a *Callable*!\n"
+                f"But given: *{operation}* - is Type of *{type(operation).__name__}*!"
+            )
+
+        with self.__lock:
+            call: Optional[_InFlightCall] = self.__calls.get(key)
+            is_leader: bool = call is None
+
+            if is_leader:
+                call = _InFlightCall()
+                self.__calls[key] = call
+            else:
+                self.__shared_calls_count += 1
+
+        # Ведомые вызовы ждут результат ведущего вместо повторного запроса к СУБД
+        if not is_leader:
+            call.done_event.wait()
+
+            if call.error is not None:
+                raise call.error
+
+            return call.result
+
+        try:
+            call.result = operation()
+        except BaseException as error:
+            call.error = error
+            raise
+        finally:
+            # Вызовы, пришедшие после завершения, выполняют операцию заново
+            with self.__lock:
+                del self.__calls[key]
+
+            call.done_event.set()
+
+        return call.result
+
+    # -----------------------------------------------------------------------------------
+    def get_in_flight_count(self) -> int:
+        with self.__lock:
+            return len(self.__calls)
+
+    # -----------------------------------------------------------------------------------
+    def get_shared_calls_count(self) -> int:
+        with self.__lock:
+            return self.__shared_calls_count
+
+
+# _______________________________________________________________________________________
+class NoSingleFlightGroup(SingleFlightGroup):
+    def __init__(self) -> None:
+        pass
+
+    def execute(self, key: Hashable, operation: Callable[[], Any]) -> NoReturn:
+        raise IsNullObjectOperation
+
+    def get_in_flight_count(self) -> NoReturn:
+        raise IsNullObjectOperation
+
+    def get_shared_calls_count(self) -> NoReturn:
+        raise IsNullObjectOperation
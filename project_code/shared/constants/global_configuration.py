@@ -1,2 +1,100 @@
 DEFAULT_QUERY_PLACEHOLDER = '?'
 MYSQL_QUERY_PLACEHOLDER = '%s'
+
+# Transaction retry
+MYSQL_LOCK_WAIT_TIMEOUT_ERROR_CODE = 1205
+MYSQL_DEADLOCK_ERROR_CODE = 1213
+RETRYABLE_TRANSACTION_ERROR_CODES = (
+    MYSQL_LOCK_WAIT_TIMEOUT_ERROR_CODE,
+    MYSQL_DEADLOCK_ERROR_CODE,
+)
+DEFAULT_TRANSACTION_RETRY_ATTEMPTS = 5
+DEFAULT_TRANSACTION_RETRY_BASE_DELAY = 0.05
+DEFAULT_TRANSACTION_RETRY_MAX_DELAY = 2.0
+
+# Group commit
+DEFAULT_GROUP_COMMIT_MAX_BATCH_SIZE = 100
+DEFAULT_GROUP_COMMIT_MAX_DELAY_MS = 5.0
+
+# Bulk insert
+MYSQL_MAX_ALLOWED_PACKET_QUERY = 'SELECT @@max_allowed_packet'
+BULK_INSERT_PACKET_USAGE_RATIO = 0.9
+
+# Upsert
+DEFAULT_UPSERT_CHUNK_SIZE = 1000
+
+# Write-behind queue
+DEFAULT_WRITE_BEHIND_MAX_QUEUE_SIZE = 10000
+DEFAULT_WRITE_BEHIND_BATCH_SIZE = 500
+DEFAULT_WRITE_BEHIND_FLUSH_INTERVAL_MS = 50.0
+
+# Result streaming & export
+DEFAULT_STREAM_CHUNK_SIZE = 1000
+DEFAULT_EXPORT_CHUNK_SIZE = 1000
+EXPORT_FILE_BUFFER_SIZE = 1024 * 1024
+
+# Adaptive stream chunking
+DEFAULT_ADAPTIVE_CHUNK_TARGET_BYTES = 1024 * 1024
+DEFAULT_ADAPTIVE_CHUNK_MAX_BYTES = 16 * 1024 * 1024
+DEFAULT_ADAPTIVE_CHUNK_MIN_SIZE = 16
+DEFAULT_ADAPTIVE_CHUNK_MAX_SIZE = 100000
+DEFAULT_ADAPTIVE_CHUNK_MAX_FETCH_LATENCY = 0.25
+ADAPTIVE_CHUNK_SAMPLE_ROWS = 16
+ADAPTIVE_CHUNK_SMOOTHING = 0.3
+
+# Spillable result sets
+DEFAULT_SPILL_MEMORY_LIMIT = 64 * 1024 * 1024
+SPILL_FILE_BUFFER_SIZE = 1024 * 1024
+SPILL_ROW_REFERENCE_SIZE = 8
+
+# Keyset pagination
+DEFAULT_KEYSET_PAGE_SIZE = 1000
+KEYSET_PAGE_ALIAS = 'keyset_page'
+
+# Batched key lookups
+DEFAULT_KEY_LOADER_BATCH_SIZE = 1000
+
+# Columnar fetch
+DEFAULT_COLUMNAR_CHUNK_SIZE = 10000
+
+# Row factories
+ROW_CONVERTER_CACHE_SIZE = 256
+
+# BLOB streaming
+DEFAULT_BLOB_SLICE_SIZE = 1024 * 1024
+MYSQL_START_SNAPSHOT_TRANSACTION_QUERY = 'START TRANSACTION WITH CONSISTENT SNAPSHOT, READ ONLY'
+
+# Query result cache
+DEFAULT_QUERY_CACHE_MAX_ENTRIES = 10000
+DEFAULT_QUERY_CACHE_MAX_BYTES = 64 * 1024 * 1024
+DEFAULT_QUERY_CACHE_TTL = 60.0
+SQL_TABLE_EXTRACTOR_CACHE_SIZE = 1024
+
+# Shared (cross-process) query result cache
+DEFAULT_SHARED_QUERY_CACHE_MAX_BYTES = 256 * 1024 * 1024
+DEFAULT_LOCAL_QUERY_CACHE_TTL = 1.0
+SHARED_QUERY_CACHE_BUSY_TIMEOUT = 5.0
+
+# Primary/replica routing
+DEFAULT_READ_YOUR_WRITES_WINDOW = 0.0
+
+# Multi-host failover
+MYSQL_CONNECT_TIMEOUT_CONFIG_KEY = 'connection_timeout'
+DEFAULT_FAILOVER_CONNECT_TIMEOUT = 2
+FAILOVER_HOST_HEALTH_PENALTY = 0.5
+
+# Circuit breaker
+DEFAULT_CIRCUIT_BREAKER_WINDOW_SIZE = 50
+DEFAULT_CIRCUIT_BREAKER_MINIMUM_CALLS = 10
+DEFAULT_CIRCUIT_BREAKER_FAILURE_RATE = 0.5
+DEFAULT_CIRCUIT_BREAKER_SLOW_CALL_DURATION = 2.0
+DEFAULT_CIRCUIT_BREAKER_SLOW_CALL_RATE = 0.8
+DEFAULT_CIRCUIT_BREAKER_OPEN_DURATION = 5.0
+DEFAULT_CIRCUIT_BREAKER_HALF_OPEN_CALLS = 3
+
+# Query timeouts
+MYSQL_MAX_EXECUTION_TIME_EXCEEDED_ERROR_CODE = 3024
+MYSQL_KILL_QUERY_STATEMENT = 'KILL QUERY {connection_id}'
+
+# Bulk load
+BULK_LOAD_FILE_BUFFER_SIZE = 1024 * 1024
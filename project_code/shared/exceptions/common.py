@@ -1,7 +1,17 @@
 __all__: list[str] = [
     'InvalidArgumentTypeError',
+    'InvalidArgumentValueError',
     'OperationFailedConnectionIsNotActive',
     'IsNullObjectOperation',
+    'TransactionRetryLimitExceeded',
+    'OperationFailedComponentIsClosed',
+    'OperationFailedQueueIsFull',
+    'OperationFailedAllHostsUnavailable',
+    'OperationFailedCircuitIsOpen',
+    'OperationFailedQueryTimeoutExceeded',
+    'OperationFailedWritesAreLost',
+    'OperationFailedValueChangedDuringRead',
+    'OperationFailedComponentIsReserved',
 ]
 
 
@@ -9,6 +19,10 @@ class InvalidArgumentTypeError(Exception):
     pass
 
 
+class InvalidArgumentValueError(Exception):
+    pass
+
+
 class OperationFailedConnectionIsNotActive(Exception):
     def __init__(self, message: str = "Failure! Connection is not active!") -> None:
         super().__init__(message)
@@ -17,3 +31,48 @@ class OperationFailedConnectionIsNotActive(Exception):
 class IsNullObjectOperation(Exception):
     def __init__(self, message: str = "It's NullObject operation! Please check your object's!") -> None:
         super().__init__(message)
+
+
+class TransactionRetryLimitExceeded(Exception):
+    def __init__(self, message: str = "Failure! Transaction retry limit is exceeded!") -> None:
+        super().__init__(message)
+
+
+class OperationFailedComponentIsClosed(Exception):
+    def __init__(self, message: str = "Failure! Component is already closed!") -> None:
+        super().__init__(message)
+
+
+class OperationFailedQueueIsFull(Exception):
+    def __init__(self, message: str = "Failure! Queue is full!") -> None:
+        super().__init__(message)
+
+
+class OperationFailedAllHostsUnavailable(Exception):
+    def __init__(self, message: str = "Failure! All database hosts are unavailable!") -> None:
+        super().__init__(message)
+
+
+class OperationFailedCircuitIsOpen(Exception):
+    def __init__(self, message: str = "Failure! Circuit breaker is open, database calls are rejected!") -> None:
+        super().__init__(message)
+
+
+class OperationFailedQueryTimeoutExceeded(Exception):
+    def __init__(self, message: str = "Failure! Query execution timeout is exceeded!") -> None:
+        super().__init__(message)
+
+
+class OperationFailedWritesAreLost(Exception):
+    def __init__(self, message: str = "Failure! Deferred writes are not applied to the database!") -> None:
+        super().__init__(message)
+
+
+class OperationFailedValueChangedDuringRead(Exception):
+    def __init__(self, message: str = "Failure! Value is changed by another session during read!") -> None:
+        super().__init__(message)
+
+
+class OperationFailedComponentIsReserved(Exception):
+    def __init__(self, message: str = "Failure! Component is reserved by another thread!") -> None:
+        super().__init__(message)
@@ -0,0 +1 @@
+from .bulk_load_types import *
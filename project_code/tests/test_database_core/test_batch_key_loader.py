@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+
+"""
+Copyright 2025 kichiro-kun (Kei)
+Apache license, version 2.0 (Apache-2.0 license)
+"""
+
+__all__: list[str] = [
+    'TestComponentPositive',
+    'TestComponentNegative',
+]
+
+__author__ = 'kichiro-kun (Kei)'
+__version__ = '0.1.0'
+
+# ========================================================================================
+from unittest import mock as UM
+from typing import Any, List
+
+from database_core.batch_key_loader_component.batch_key_loader \
+    import KeyLoadHandle, BatchKeyLoader as tested_cls
+from database_core.single_connection_database_component.single_connection_database \
+    import SingleConnectionDataBase
+
+from shared.exceptions.common import InvalidArgumentTypeError, InvalidArgumentValueError
+
+from tests.utils.base_test_case_cls import BaseTestCase
+
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+class BaseTestComponent(BaseTestCase[tested_cls]):
+
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    def setUp(self) -> None:
+        super().setUp()
+
+        self._database: UM.MagicMock = UM.MagicMock(spec=SingleConnectionDataBase)
+        self._database.query_param_placeholder = '%s'
+
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    def get_instance_of_tested_cls(self, **kwargs) -> tested_cls:
+        kwargs.setdefault('database', self._database)
+        kwargs.setdefault('table', 'berry')
+        kwargs.setdefault('key_column', 'id')
+
+        return tested_cls(**kwargs)
+
+
+# _______________________________________________________________________________________
+class TestComponentPositive(BaseTestComponent):
+
+    # -----------------------------------------------------------------------------------
+    def test_load_behavior_collapses_lookups_into_one_query(self) -> None:
+        # Build
+        instance = self.get_instance_of_tested_cls(columns=('title',))
+
+        # Prepare mock
+        self._database.execute_query_returns_all.return_value = [(3, 'c'), (1, 'a')]
+
+        # Operate
+        handles: List[KeyLoadHandle] = [instance.load(key=key) for key in (1, 2, 3, 1)]
+        op_result: List[Any] = [handle.get() for handle in handles]
+
+        # Check
+        self.assertListEqual(
+            list1=op_result,
+            list2=[(1, 'a'), None, (3, 'c'), (1, 'a')]
+        )
+        self._database.execute_query_returns_all.assert_called_once_with(
+            1, 2, 3, query='SELECT id, title FROM berry WHERE id IN (%s, %s, %s)'
+        )
+
+        # Operate: ключи из памяти области не запрашиваются повторно
+        instance.load_many(keys=(3, 2))
+
+        # Post-Check
+        self._database.execute_query_returns_all.assert_called_once()
+
+    # -----------------------------------------------------------------------------------
+    def test_dispatch_behavior_splits_keys_by_max_batch_size(self) -> None:
+        # Build
+        instance = self.get_instance_of_tested_cls(max_batch_size=2)
+
+        # Prepare mock
+        self._database.execute_query_returns_all.side_effect = [
+            [{'id': 1, 'title': 'a'}, {'id': 2, 'title': 'b'}], [{'id': 3, 'title': 'c'}]
+        ]
+
+        # Operate
+        op_result: List[Any] = instance.load_many(keys=(1, 2, 3))
+
+        # Check
+        self.assertListEqual(
+            list1=op_result,
+            list2=[{'id': 1, 'title': 'a'}, {'id': 2, 'title': 'b'}, {'id': 3, 'title': 'c'}]
+        )
+        self.assertListEqual(
+            list1=self._database.execute_query_returns_all.call_args_list,
+            list2=[
+                UM.call(1, 2, query='SELECT * FROM berry WHERE id IN (%s, %s)'),
+                UM.call(3, query='SELECT * FROM berry WHERE id IN (%s)'),
+            ]
+        )
+
+    # -----------------------------------------------------------------------------------
+    def test_scope_behavior_clears_memo_on_exit(self) -> None:
+        # Prepare mock
+        self._database.execute_query_returns_all.return_value = [(1, 'a')]
+
+        # Operate
+        with self.get_instance_of_tested_cls() as instance:
+            instance.prime(key=5, row=(5, 'e'))
+            instance.load_many(keys=(1, 5))
+
+        instance.load(key=1).get()
+
+        # Check
+        self.assertEqual(
+            first=self._database.execute_query_returns_all.call_count,
+            second=2
+        )
+        self._database.execute_query_returns_all.assert_called_with(
+            1, query='SELECT * FROM berry WHERE id IN (%s)'
+        )
+
+
+# _______________________________________________________________________________________
+class TestComponentNegative(BaseTestComponent):
+
+    # -----------------------------------------------------------------------------------
+    def test_load_behavior_when_pass_invalid_keys(self) -> None:
+        # Build
+        instance = self.get_instance_of_tested_cls()
+
+        # Check
+        with self.assertRaises(expected_exception=InvalidArgumentTypeError):
+            # Operate
+            instance.load(key=[1, 2])
+
+        # Check
+        with self.assertRaises(expected_exception=InvalidArgumentValueError):
+            # Operate
+            instance.load(key=None)
+
+    # -----------------------------------------------------------------------------------
+    def test_constructor_behavior_when_pass_invalid_arguments(self) -> None:
+        # Check
+        with self.assertRaises(expected_exception=InvalidArgumentTypeError):
+            # Operate
+            self.get_instance_of_tested_cls(database=UM.MagicMock())
+
+        # Check
+        with self.assertRaises(expected_exception=InvalidArgumentValueError):
+            # Operate
+            self.get_instance_of_tested_cls(columns=())
+
+        # Check
+        with self.assertRaises(expected_exception=InvalidArgumentValueError):
+            # Operate
+            self.get_instance_of_tested_cls(max_batch_size=0)
@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+
+"""
+Copyright 2025 kichiro-kun (Kei)
+Apache license, version 2.0 (Apache-2.0 license)
+"""
+
+__all__: list[str] = [
+    'TestComponentPositive',
+    'TestComponentNegative',
+]
+
+__author__ = 'kichiro-kun (Kei)'
+__version__ = '0.2.0'
+
+# ========================================================================================
+from collections import namedtuple
+from unittest import mock as UM
+from typing import Any, List
+
+from database_core.keyset_paginator_component.keyset_paginator import KeysetPaginator as tested_cls
+from database_core.single_connection_database_component.single_connection_database \
+    import SingleConnectionDataBase
+
+from shared.exceptions.common import InvalidArgumentTypeError, InvalidArgumentValueError
+
+from tests.utils.base_test_case_cls import BaseTestCase
+
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+class BaseTestComponent(BaseTestCase[tested_cls]):
+
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    def setUp(self) -> None:
+        super().setUp()
+
+        self._database: UM.MagicMock = UM.MagicMock(spec=SingleConnectionDataBase)
+        self._database.query_param_placeholder = '?'
+
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    def get_instance_of_tested_cls(self, **kwargs) -> tested_cls:
+        kwargs.setdefault('database', self._database)
+        kwargs.setdefault('query', 'SELECT id, title FROM berry WHERE cost > ?')
+        kwargs.setdefault('key_column', 'id')
+
+        return tested_cls(**kwargs)
+
+
+# _______________________________________________________________________________________
+class TestComponentPositive(BaseTestComponent):
+
+    # -----------------------------------------------------------------------------------
+    def test_iteration_behavior_seeks_each_page_by_last_key(self) -> None:
+        # Build
+        instance = self.get_instance_of_tested_cls(params=(10,), page_size=2)
+        base_query: str = 'SELECT * FROM (SELECT id, title FROM berry WHERE cost > ?) AS keyset_page'
+
+        # Prepare mock
+        self._database.execute_query_returns_all.side_effect = [
+            [(1, 'a'), (2, 'b')], [(5, 'c'), (7, 'd')], [(9, 'e')]
+        ]
+
+        # Operate
+        op_result: List[Any] = list(instance)
+
+        # Check
+        self.assertListEqual(
+            list1=op_result,
+            list2=[(1, 'a'), (2, 'b'), (5, 'c'), (7, 'd'), (9, 'e')]
+        )
+        self.assertListEqual(
+            list1=self._database.execute_query_returns_all.call_args_list,
+            list2=[
+                UM.call(10, query=f'{base_query} ORDER BY keyset_page.id ASC LIMIT 2', timeout=None),
+                UM.call(10, 2, query=f'{base_query} WHERE keyset_page.id > ? ORDER BY keyset_page.id ASC LIMIT 2',
+                        timeout=None),
+                UM.call(10, 7, query=f'{base_query} WHERE keyset_page.id > ? ORDER BY keyset_page.id ASC LIMIT 2',
+                        timeout=None),
+            ]
+        )
+
+        # Post-Check
+        self.assertEqual(
+            first=instance.get_last_key(),
+            second=9
+        )
+
+    # -----------------------------------------------------------------------------------
+    def test_fetch_page_behavior_reads_key_from_factory_rows_in_descending_order(self) -> None:
+        # Build
+        Row = namedtuple('Row', ('title', 'id'))
+        instance = self.get_instance_of_tested_cls(query='SELECT title, id FROM berry;', descending=True)
+
+        # Prepare mock
+        self._database.execute_query_returns_all.return_value = [Row('b', 8), Row('a', 3)]
+
+        # Operate
+        instance.fetch_page(after_key=10)
+
+        # Check
+        self.assertEqual(
+            first=instance.get_last_key(),
+            second=3
+        )
+        self._database.execute_query_returns_all.assert_called_once_with(
+            10,
+            query='SELECT * FROM (SELECT title, id FROM berry) AS keyset_page '
+                  'WHERE keyset_page.id < ? ORDER BY keyset_page.id DESC LIMIT 1000',
+            timeout=None
+        )
+
+        # Operate
+        self._database.execute_query_returns_all.return_value = [{'title': 'z', 'id': 1}]
+        instance.fetch_page(after_key=3)
+
+        # Check
+        self.assertEqual(
+            first=instance.get_last_key(),
+            second=1
+        )
+
+
+# _______________________________________________________________________________________
+class TestComponentNegative(BaseTestComponent):
+
+    # -----------------------------------------------------------------------------------
+    def test_constructor_behavior_when_pass_invalid_arguments(self) -> None:
+        # Check
+        with self.assertRaises(expected_exception=InvalidArgumentTypeError):
+            # Operate
+            self.get_instance_of_tested_cls(database=UM.MagicMock())
+
+        # Check
+        with self.assertRaises(expected_exception=InvalidArgumentTypeError):
+            # Operate
+            self.get_instance_of_tested_cls(page_size='100')
+
+        # Check
+        with self.assertRaises(expected_exception=InvalidArgumentValueError):
+            # Operate
+            self.get_instance_of_tested_cls(page_size=0)
+
+        # Check
+        with self.assertRaises(expected_exception=InvalidArgumentValueError):
+            # Operate
+            self.get_instance_of_tested_cls(key_column='')
+
+        # Check
+        with self.assertRaises(expected_exception=InvalidArgumentValueError):
+            # Operate
+            self.get_instance_of_tested_cls(query='SELECT id, title FROM berry', key_column='berry.id')
+
+        # Check
+        with self.assertRaises(expected_exception=InvalidArgumentValueError):
+            # Operate
+            self.get_instance_of_tested_cls(query='SELECT cost AS id, COUNT(*) FROM berry GROUP BY cost')
+
+        # Post-Check
+        self._database.execute_query_returns_all.assert_not_called()
@@ -0,0 +1,266 @@
+# -*- coding: utf-8 -*-
+
+"""
+Copyright 2025 kichiro-kun (Kei)
+Apache license, version 2.0 (Apache-2.0 license)
+"""
+
+__all__: list[str] = [
+    'TestComponentPositive',
+    'TestComponentNegative',
+]
+
+__author__ = 'kichiro-kun (Kei)'
+__version__ = '0.3.0'
+
+# ========================================================================================
+import threading
+from unittest import mock as UM
+from typing import Any, List
+
+import database_core.replicated_database_component.replicated_database as tested_module
+from database_core.replicated_database_component.replicated_database \
+    import ReplicaBalancing, ReplicatedDataBase as tested_cls
+from database_core.single_connection_database_component.single_connection_database \
+    import SingleConnectionDataBase
+from dbms_interaction.transaction_manager_component.transaction_manager import TransactionManager
+
+from shared.exceptions.common import InvalidArgumentTypeError, InvalidArgumentValueError
+
+from tests.utils.base_test_case_cls import BaseTestCase
+from tests.utils.toolkit import GeneratingToolKit
+
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+class BaseTestComponent(BaseTestCase[tested_cls]):
+
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    def setUp(self) -> None:
+        super().setUp()
+
+        self.primary = self.get_mock_database(name='primary')
+        self.replicas: List[UM.MagicMock] = [
+            self.get_mock_database(name=f'replica_{index}') for index in range(2)
+        ]
+
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    def get_mock_database(self, name: str) -> UM.MagicMock:
+        database = UM.MagicMock(spec=SingleConnectionDataBase, name=name)
+        database.query_param_placeholder = '%s'
+        database.execute_query_returns_all.return_value = (name,)
+
+        return database
+
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    def get_instance_of_tested_cls(self, **kwargs) -> tested_cls:
+        kwargs.setdefault('primary', self.primary)
+        kwargs.setdefault('replicas', self.replicas)
+
+        return tested_cls(**kwargs)
+
+
+# _______________________________________________________________________________________
+class TestComponentPositive(BaseTestComponent):
+
+    # -----------------------------------------------------------------------------------
+    def test_read_behavior_round_robins_between_replicas(self) -> None:
+        # Build
+        instance = self.get_instance_of_tested_cls()
+
+        # Operate
+        results: List[Any] = [
+            instance.execute_query_returns_all(1, query='SELECT * FROM berry WHERE id = %s')
+            for _ in range(3)
+        ]
+
+        # Check
+        self.assertListEqual(
+            list1=results,
+            list2=[('replica_0',), ('replica_1',), ('replica_0',)]
+        )
+        self.replicas[1].execute_query_returns_all.assert_called_once_with(
+            1, query='SELECT * FROM berry WHERE id = %s', raw=False, cache_ttl=None, timeout=None
+        )
+        self.primary.execute_query_returns_all.assert_not_called()
+
+        # Post-Check
+        self.assertEqual(
+            first=instance.query_param_placeholder,
+            second='%s'
+        )
+
+    # -----------------------------------------------------------------------------------
+    def test_read_behavior_prefers_replica_with_least_outstanding_requests(self) -> None:
+        # Build
+        instance = self.get_instance_of_tested_cls(balancing=ReplicaBalancing.LEAST_OUTSTANDING)
+        release_event = threading.Event()
+        started_event = threading.Event()
+
+        # Prepare mock
+        def slow_read(*args, **kwargs) -> Any:
+            started_event.set()
+            release_event.wait()
+            return ('replica_0',)
+
+        self.replicas[0].execute_query_returns_all.side_effect = slow_read
+
+        # Operate
+        slow_reader = threading.Thread(
+            target=instance.execute_query_returns_all, kwargs={'query': 'SELECT 1'}
+        )
+        slow_reader.start()
+        started_event.wait(timeout=5)
+
+        results: List[Any] = [
+            instance.execute_query_returns_all(query='SELECT 1') for _ in range(2)
+        ]
+        outstanding = instance.get_outstanding_requests()
+
+        release_event.set()
+        slow_reader.join(timeout=5)
+
+        # Check
+        self.assertListEqual(
+            list1=results,
+            list2=[('replica_1',), ('replica_1',)]
+        )
+        self.assertEqual(
+            first=outstanding,
+            second=(1, 0)
+        )
+
+        # Post-Check
+        self.assertEqual(
+            first=instance.get_outstanding_requests(),
+            second=(0, 0)
+        )
+
+    # -----------------------------------------------------------------------------------
+    def test_write_behavior_goes_to_primary_and_pins_reads_within_window(self) -> None:
+        # Build
+        instance = self.get_instance_of_tested_cls(read_your_writes_window=2.0)
+
+        # Prepare test context
+        with UM.patch.object(target=tested_module.time, attribute='monotonic') as mock_monotonic:
+            mock_monotonic.return_value = 100.0
+
+            # Operate
+            instance.execute_query_no_returns(1, query='UPDATE berry SET cost = %s')
+
+            mock_monotonic.return_value = 101.0
+            pinned_result = instance.execute_query_returns_all(query='SELECT * FROM berry')
+
+            mock_monotonic.return_value = 102.5
+            balanced_result = instance.execute_query_returns_all(query='SELECT * FROM berry')
+
+        # Check
+        self.primary.execute_query_no_returns.assert_called_once_with(
+            1, query='UPDATE berry SET cost = %s', autocommit=None, timeout=None
+        )
+        self.assertEqual(
+            first=(pinned_result, balanced_result),
+            second=(('primary',), ('replica_0',))
+        )
+
+    # -----------------------------------------------------------------------------------
+    def test_read_behavior_uses_primary_inside_transaction(self) -> None:
+        # Build
+        instance = self.get_instance_of_tested_cls()
+        transaction_manager = UM.MagicMock(spec=TransactionManager)
+
+        # Prepare instance
+        instance.set_new_transaction_manager(new_manager=transaction_manager)
+
+        # Prepare mock
+        transaction_manager.is_active.return_value = False
+        transaction_manager.is_in_transaction.return_value = True
+        transaction_manager.get_last_commit_time.return_value = 0.0
+
+        # Operate
+        op_result = instance.execute_query_returns_all(query='SELECT * FROM berry')
+
+        # Check
+        self.primary.set_new_transaction_manager.assert_called_once_with(new_manager=transaction_manager)
+        self.assertEqual(
+            first=op_result,
+            second=('primary',)
+        )
+
+        # Post-Check
+        transaction_manager.is_in_transaction.return_value = False
+        self.assertEqual(
+            first=instance.execute_query_returns_all(query='SELECT * FROM berry'),
+            second=('replica_0',)
+        )
+
+    # -----------------------------------------------------------------------------------
+    def test_read_behavior_pins_reads_to_primary_after_transaction_commit(self) -> None:
+        # Build
+        instance = self.get_instance_of_tested_cls(read_your_writes_window=2.0)
+        transaction_manager = UM.MagicMock(spec=TransactionManager)
+
+        # Prepare instance
+        instance.set_new_transaction_manager(new_manager=transaction_manager)
+
+        # Prepare mock
+        transaction_manager.is_in_transaction.return_value = False
+        transaction_manager.get_last_commit_time.return_value = 100.0
+
+        # Prepare test context
+        with UM.patch.object(target=tested_module.time, attribute='monotonic') as mock_monotonic:
+            mock_monotonic.return_value = 101.0
+
+            # Operate
+            pinned_result = instance.execute_query_returns_all(query='SELECT * FROM berry')
+
+            mock_monotonic.return_value = 102.5
+            balanced_result = instance.execute_query_returns_all(query='SELECT * FROM berry')
+
+        # Check
+        self.assertEqual(
+            first=(pinned_result, balanced_result),
+            second=(('primary',), ('replica_0',))
+        )
+
+    # -----------------------------------------------------------------------------------
+    def test_read_behavior_without_replicas_and_deconstruct(self) -> None:
+        # Build
+        instance = self.get_instance_of_tested_cls(replicas=())
+
+        # Operate
+        op_result = instance.execute_query_returns_all(query='SELECT 1')
+        instance.deconstruct_database_and_components()
+
+        # Check
+        self.assertEqual(
+            first=op_result,
+            second=('primary',)
+        )
+        self.primary.deconstruct_database_and_components.assert_called()
+
+
+# _______________________________________________________________________________________
+class TestComponentNegative(BaseTestComponent):
+
+    # -----------------------------------------------------------------------------------
+    def test_constructor_behavior_when_pass_invalid_arguments(self) -> None:
+        # Build
+        invalid_types: List[Any] = GeneratingToolKit.generate_list_of_basic_python_types()
+
+        # Prepare test cycle
+        for invalid_type in invalid_types:
+            with self.subTest(pattern=invalid_type):
+                # Check
+                with self.assertRaises(expected_exception=InvalidArgumentTypeError):
+                    # Operate
+                    self.get_instance_of_tested_cls(primary=invalid_type)
+
+        # Check
+        with self.assertRaises(expected_exception=InvalidArgumentTypeError):
+            # Operate
+            self.get_instance_of_tested_cls(replicas=[self.primary, 'replica'])
+
+        # Check
+        with self.assertRaises(expected_exception=InvalidArgumentValueError):
+            # Operate
+            self.get_instance_of_tested_cls(read_your_writes_window=-1.0)
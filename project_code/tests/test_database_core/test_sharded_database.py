@@ -0,0 +1,330 @@
+# -*- coding: utf-8 -*-
+
+"""
+Copyright 2025 kichiro-kun (Kei)
+Apache license, version 2.0 (Apache-2.0 license)
+"""
+
+__all__: list[str] = [
+    'TestComponentPositive',
+    'TestComponentNegative',
+    'TestShardMaps',
+]
+
+__author__ = 'kichiro-kun (Kei)'
+__version__ = '0.5.0'
+
+# ========================================================================================
+import threading
+from unittest import TestCase, mock as UM
+from typing import Any, List
+
+from database_core.sharded_database_component.sharded_database import ShardedDataBase as tested_cls
+from database_core.sharded_database_component.realizations.hash_shard_map import HashShardMap
+from database_core.sharded_database_component.realizations.range_shard_map import RangeShardMap
+from database_core.single_connection_database_component.single_connection_database \
+    import SingleConnectionDataBase
+from query_core.result_stream_component.cursor_row_stream import CursorRowStream
+
+from shared.exceptions.common import InvalidArgumentTypeError, InvalidArgumentValueError
+
+from tests.utils.base_test_case_cls import BaseTestCase
+
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+class BaseTestComponent(BaseTestCase[tested_cls]):
+
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    def setUp(self) -> None:
+        super().setUp()
+
+        self.shards: List[UM.MagicMock] = []
+
+        for index in range(3):
+            shard = UM.MagicMock(spec=SingleConnectionDataBase, name=f'shard_{index}')
+            shard.query_param_placeholder = '%s'
+            shard.execute_query_returns_all.return_value = [(index, 'a'), (index, 'b')]
+            shard.execute_query_returns_many.return_value = [(index, 'a'), (index, 'b')]
+            shard.execute_query_returns_one.return_value = (index,) if index > 0 else tuple()
+            self.shards.append(shard)
+
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    def get_instance_of_tested_cls(self, **kwargs) -> tested_cls:
+        kwargs.setdefault('shards', self.shards)
+        kwargs.setdefault('shard_map', HashShardMap(shards_count=len(kwargs['shards'])))
+
+        instance: tested_cls = tested_cls(**kwargs)
+        self.addCleanup(instance.deconstruct_database_and_components)
+
+        return instance
+
+
+# _______________________________________________________________________________________
+class TestComponentPositive(BaseTestComponent):
+
+    # -----------------------------------------------------------------------------------
+    def test_query_behavior_routes_by_shard_key(self) -> None:
+        # Build
+        instance = self.get_instance_of_tested_cls()
+
+        # Operate
+        instance.execute_query_no_returns(7, query='UPDATE tenant SET plan = %s', shard_key=4)
+        op_result = instance.execute_query_returns_all(4, query='SELECT * FROM tenant WHERE id = %s', shard_key=4)
+
+        # Check
+        self.shards[1].execute_query_no_returns.assert_called_once_with(
+            7, query='UPDATE tenant SET plan = %s', autocommit=None, timeout=None
+        )
+        self.assertEqual(
+            first=op_result,
+            second=[(1, 'a'), (1, 'b')]
+        )
+        self.shards[0].execute_query_returns_all.assert_not_called()
+
+    # -----------------------------------------------------------------------------------
+    def test_read_behavior_fans_out_in_parallel_without_shard_key(self) -> None:
+        # Build
+        instance = self.get_instance_of_tested_cls()
+        barrier = threading.Barrier(parties=3, timeout=5)
+
+        # Prepare mock
+        for shard in self.shards:
+            rows = shard.execute_query_returns_all.return_value
+            shard.execute_query_returns_all.side_effect = \
+                lambda *args, rows=rows, **kwargs: barrier.wait() is not None and rows
+
+        # Operate
+        op_result = instance.execute_query_returns_all(query='SELECT * FROM tenant')
+
+        # Check
+        self.assertEqual(
+            first=op_result,
+            second=((0, 'a'), (0, 'b'), (1, 'a'), (1, 'b'), (2, 'a'), (2, 'b'))
+        )
+
+    # -----------------------------------------------------------------------------------
+    def test_fan_out_behavior_serialises_concurrent_calls_per_shard(self) -> None:
+        import time
+
+        # Build
+        instance = self.get_instance_of_tested_cls(max_workers=6)
+        state_lock = threading.Lock()
+        active_calls: List[int] = [0, 0, 0]
+        max_active_calls: List[int] = [0, 0, 0]
+
+        # Prepare mock
+        for index, shard in enumerate(self.shards):
+            def read(*args, index=index, **kwargs) -> List[Any]:
+                with state_lock:
+                    active_calls[index] += 1
+                    max_active_calls[index] = max(max_active_calls[index], active_calls[index])
+
+                time.sleep(0.02)
+
+                with state_lock:
+                    active_calls[index] -= 1
+
+                return [(index,)]
+
+            shard.execute_query_returns_all.side_effect = read
+
+        # Operate
+        callers: List[threading.Thread] = [
+            threading.Thread(target=instance.execute_query_returns_all, kwargs={'query': 'SELECT id FROM tenant'})
+            for _ in range(3)
+        ]
+        callers.append(threading.Thread(
+            target=instance.execute_query_returns_all, kwargs={'query': 'SELECT id FROM tenant', 'shard_key': 4}
+        ))
+
+        for caller in callers:
+            caller.start()
+        for caller in callers:
+            caller.join(timeout=5)
+
+        # Check
+        self.assertListEqual(
+            list1=max_active_calls,
+            list2=[1, 1, 1]
+        )
+        self.assertListEqual(
+            list1=[shard.execute_query_returns_all.call_count for shard in self.shards],
+            list2=[3, 4, 3]
+        )
+
+    # -----------------------------------------------------------------------------------
+    def test_read_behavior_combines_one_and_many_results(self) -> None:
+        # Build
+        instance = self.get_instance_of_tested_cls()
+
+        # Operate
+        one_result = instance.execute_query_returns_one(query='SELECT id FROM tenant')
+        many_result = instance.execute_query_returns_many(query='SELECT * FROM tenant', returns_count=3)
+
+        # Check
+        self.assertEqual(
+            first=one_result,
+            second=(1,)
+        )
+        self.assertEqual(
+            first=many_result,
+            second=((0, 'a'), (0, 'b'), (1, 'a'))
+        )
+
+    # -----------------------------------------------------------------------------------
+    def test_execute_query_returns_merged_behavior_merges_shard_streams(self) -> None:
+        # Build
+        instance = self.get_instance_of_tested_cls()
+        query: str = 'SELECT id FROM tenant ORDER BY id LIMIT 3'
+
+        # Prepare mock
+        for index, shard in enumerate(self.shards):
+            shard.execute_query_returns_stream.return_value = iter([(index,), (index + 3,), (index + 6,)])
+
+        # Operate
+        rows: List[Any] = list(instance.execute_query_returns_merged(query=query, sort_key=lambda row: row[0], limit=3))
+
+        # Check
+        self.assertListEqual(
+            list1=rows,
+            list2=[(0,), (1,), (2,)]
+        )
+        self.shards[2].execute_query_returns_stream.assert_called_once_with(query=query, chunk_size=3)
+
+
+    # -----------------------------------------------------------------------------------
+    def test_execute_query_returns_merged_behavior_holds_shards_until_merger_is_closed(self) -> None:
+        # Build
+        instance = self.get_instance_of_tested_cls()
+        keyed_read_is_done = threading.Event()
+
+        # Prepare mock
+        for index, shard in enumerate(self.shards):
+            shard.execute_query_returns_stream.return_value = iter([(index,), (index + 3,)])
+
+        def keyed_read() -> None:
+            instance.execute_query_returns_all(4, query='SELECT * FROM tenant WHERE id = %s', shard_key=4)
+            keyed_read_is_done.set()
+
+        # Operate
+        merger = instance.execute_query_returns_merged(query='SELECT id FROM tenant ORDER BY id',
+                                                       sort_key=lambda row: row[0])
+        first_row = next(merger)
+
+        reader = threading.Thread(target=keyed_read)
+        reader.start()
+
+        # Check: шард с непрочитанным потоком не принимает запросы по ключу
+        self.assertEqual(
+            first=first_row,
+            second=(0,)
+        )
+        self.assertFalse(
+            expr=keyed_read_is_done.wait(timeout=0.1)
+        )
+
+        # Operate
+        merger.close()
+        reader.join(timeout=5)
+
+        # Post-Check
+        self.assertTrue(
+            expr=keyed_read_is_done.is_set()
+        )
+        self.shards[1].execute_query_returns_all.assert_called_once()
+
+
+# _______________________________________________________________________________________
+class TestComponentNegative(BaseTestComponent):
+
+    # -----------------------------------------------------------------------------------
+    def test_write_behavior_when_shard_key_is_missing(self) -> None:
+        # Build
+        instance = self.get_instance_of_tested_cls()
+
+        # Check
+        with self.assertRaises(expected_exception=InvalidArgumentValueError):
+            # Operate
+            instance.execute_query_no_returns(query='DELETE FROM tenant')
+
+        # Post-Check
+        for shard in self.shards:
+            shard.execute_query_no_returns.assert_not_called()
+
+    # -----------------------------------------------------------------------------------
+    def test_execute_query_returns_merged_behavior_closes_opened_streams_on_shard_error(self) -> None:
+        # Build
+        instance = self.get_instance_of_tested_cls()
+        opened_stream = UM.MagicMock(spec=CursorRowStream)
+
+        # Prepare mock
+        self.shards[0].execute_query_returns_stream.return_value = opened_stream
+        self.shards[1].execute_query_returns_stream.side_effect = RuntimeError('Shard is down')
+
+        # Check
+        with self.assertRaises(expected_exception=RuntimeError):
+            # Operate
+            instance.execute_query_returns_merged(query='SELECT 1', sort_key=lambda row: row[0])
+
+        # Post-Check
+        opened_stream.close.assert_called_once_with()
+
+    # -----------------------------------------------------------------------------------
+    def test_constructor_behavior_when_shard_map_does_not_match_shards(self) -> None:
+        # Check
+        with self.assertRaises(expected_exception=InvalidArgumentValueError):
+            # Operate
+            tested_cls(shards=self.shards, shard_map=HashShardMap(shards_count=2))
+
+        # Check
+        with self.assertRaises(expected_exception=InvalidArgumentTypeError):
+            # Operate
+            tested_cls(shards=['shard'], shard_map=HashShardMap(shards_count=1))
+
+
+# _______________________________________________________________________________________
+class TestShardMaps(TestCase):
+
+    # -----------------------------------------------------------------------------------
+    def test_hash_shard_map_behavior_is_stable(self) -> None:
+        # Build
+        shard_map = HashShardMap(shards_count=4)
+
+        # Operate & Check
+        self.assertEqual(first=shard_map.get_shard_index(shard_key=10), second=2)
+        self.assertEqual(
+            first=shard_map.get_shard_index(shard_key='tenant-42'),
+            second=shard_map.get_shard_index(shard_key=b'tenant-42')
+        )
+
+        # Check
+        with self.assertRaises(expected_exception=InvalidArgumentTypeError):
+            # Operate
+            shard_map.get_shard_index(shard_key=1.5)
+
+    # -----------------------------------------------------------------------------------
+    def test_range_shard_map_behavior(self) -> None:
+        # Build
+        shard_map = RangeShardMap(lower_bounds=(0, 1000, 5000))
+
+        # Operate
+        indexes: List[Any] = [
+            shard_map.get_shard_index(shard_key=key) for key in (0, 999, 1000, 10 ** 9)
+        ]
+
+        # Check
+        self.assertListEqual(
+            list1=indexes,
+            list2=[0, 0, 1, 2]
+        )
+        self.assertEqual(first=shard_map.get_shards_count(), second=3)
+
+        # Check
+        with self.assertRaises(expected_exception=InvalidArgumentValueError):
+            # Operate
+            shard_map.get_shard_index(shard_key=-1)
+
+        # Check
+        with self.assertRaises(expected_exception=InvalidArgumentValueError):
+            # Operate
+            RangeShardMap(lower_bounds=(10, 5))
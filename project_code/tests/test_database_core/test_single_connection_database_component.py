@@ -11,7 +11,7 @@ __all__: list[str] = [
 ]
 
 __author__ = 'kichiro-kun (Kei)'
-__version__ = '0.12.2'
+__version__ = '0.33.0'
 
 # ========================================================================================
 from unittest import mock as UM
@@ -21,13 +21,21 @@ import database_core.single_connection_database_component.single_connection_data
 from database_core.single_connection_database_component.single_connection_database import SingleConnectionDataBase as tested_cls
 
 from database_core.abstract_database_component.database import DataBase
+from database_core.write_behind_queue_component.write_behind_queue import WriteBehindQueue
 from dbms_interaction.single_connection_manager_component.single_connection_manager \
     import SingleConnectionManager, NoSingleConnectionManager
 from dbms_interaction.transaction_manager_component.transaction_manager \
     import TransactionManager, NoTransactionManager
+from dbms_interaction.adapters_component.cursor.abstract.cursor_interface import CursorInterface
 from query_core.query_interface_component.query_interface import QueryInterface
+from query_core.query_cache_component.realizations.lru_query_cache import LRUQueryCache
+from query_core.single_flight_component.single_flight_group import SingleFlightGroup
+from dbms_interaction.circuit_breaker_component.circuit_breaker import CircuitBreaker
+from dbms_interaction.query_watchdog_component.query_watchdog import QueryWatchdog
 
-from shared.exceptions.common import InvalidArgumentTypeError, OperationFailedConnectionIsNotActive
+from shared.exceptions.common import InvalidArgumentTypeError, InvalidArgumentValueError, \
+    OperationFailedConnectionIsNotActive, OperationFailedCircuitIsOpen, OperationFailedQueryTimeoutExceeded, \
+    OperationFailedValueChangedDuringRead
 
 from tests.utils.base_test_case_cls import BaseTestCase
 from tests.utils.toolkit import GeneratingToolKit
@@ -175,6 +183,10 @@ class TestComponentPositive(BaseTestComponent):
             first=transaction_manager.active_connection,
             second=expected_active_connection
         )
+        self.assertIs(
+            expr1=transaction_manager.connection_lock,
+            expr2=instance._connection_lock
+        )
 
     # -----------------------------------------------------------------------------------
     def test_set_new_connection_manager_assigns_connection_manager_correctly(self) -> None:
@@ -549,116 +561,1303 @@ class TestComponentPositive(BaseTestComponent):
             seq2=expected_result
         )
 
+    # -----------------------------------------------------------------------------------
+    def test_execute_query_no_returns_behavior_uses_database_autocommit_mode(self) -> None:
+        # Build
+        instance: tested_cls = self.get_instance_of_tested_cls()
+        conn_manager = self.get_instance_of_single_connection_manager()
+        conn_adapter = UM.MagicMock()
+        query: str = GeneratingToolKit.generate_random_string()
+
+        # Prepare instance
+        instance.set_new_connection_manager(new_manager=conn_manager)
 
-# _______________________________________________________________________________________
-class TestComponentNegative(BaseTestComponent):
+        # Prepare mock
+        conn_manager.get_connection.return_value = conn_adapter  # type:ignore
+
+        # Operate with default mode
+        instance.execute_query_no_returns(query=query)
+
+        # Pre-Check: режим сессии из конфигурации подключения не меняется
+        conn_adapter.set_autocommit.assert_not_called()
+
+        # Operate with enabled mode
+        instance.set_autocommit_mode(enabled=True)
+        instance.execute_query_no_returns(query=query)
+
+        # Check
+        conn_adapter.set_autocommit.assert_called_with(enabled=True)
 
     # -----------------------------------------------------------------------------------
-    def test_set_new_connection_manager_raise_expected_exception_for_invalid_types(self) -> None:
+    def test_execute_query_no_returns_behavior_keeps_configured_session_autocommit(self) -> None:
+        from dbms_interaction.adapters_component.connection.realizations.mysql_adapter_connection \
+            import MySQLAdapterConnection
+
         # Build
-        expected_exception = InvalidArgumentTypeError
-        invalid_managers: List[Any] = GeneratingToolKit.generate_list_of_basic_python_types()
-        instance = self.get_instance_of_tested_cls()
+        instance: tested_cls = self.get_instance_of_tested_cls()
+        conn_manager = self.get_instance_of_single_connection_manager()
+        connector = UM.MagicMock()
+        conn_adapter = MySQLAdapterConnection(connector=connector)
 
-        # Prepare test cycle
-        for invalid_manager in invalid_managers:
-            with self.subTest(pattern=invalid_manager):
-                # Check
-                with self.assertRaises(expected_exception=expected_exception):
-                    # Operate
-                    instance.set_new_connection_manager(
-                        new_manager=invalid_manager
-                    )
+        # Prepare instance
+        instance.set_new_connection_manager(new_manager=conn_manager)
+
+        # Prepare mock
+        connector.autocommit = True
+        conn_adapter.connect(config={'autocommit': True})
+        conn_manager.get_connection.return_value = conn_adapter  # type:ignore
+
+        # Operate
+        instance.execute_query_no_returns(query='UPDATE berry SET cost = 1')
+
+        # Check
+        self.assertIs(
+            expr1=connector.autocommit,
+            expr2=True
+        )
 
     # -----------------------------------------------------------------------------------
-    def test_set_new_transaction_manager_raise_expected_exception_for_invalid_types(self) -> None:
+    def test_execute_query_no_returns_behavior_with_per_call_autocommit(self) -> None:
         # Build
-        expected_exception = InvalidArgumentTypeError
-        invalid_managers: List[Any] = GeneratingToolKit.generate_list_of_basic_python_types()
-        instance = self.get_instance_of_tested_cls()
+        instance: tested_cls = self.get_instance_of_tested_cls()
+        conn_manager = self.get_instance_of_single_connection_manager()
+        conn_adapter = UM.MagicMock()
+        query: str = GeneratingToolKit.generate_random_string()
 
-        # Prepare test cycle
-        for invalid_manager in invalid_managers:
-            with self.subTest(pattern=invalid_manager):
-                # Check
-                with self.assertRaises(expected_exception=expected_exception):
-                    # Operate
-                    instance.set_new_transaction_manager(
-                        new_manager=invalid_manager
-                    )
+        # Prepare instance
+        instance.set_new_connection_manager(new_manager=conn_manager)
+
+        # Prepare mock
+        conn_manager.get_connection.return_value = conn_adapter  # type:ignore
+        conn_adapter.get_autocommit.return_value = False
+
+        # Operate
+        instance.execute_query_no_returns(query=query, autocommit=True)
+
+        # Check: режим отдельного запроса не остаётся для последующих запросов
+        self.assertListEqual(
+            list1=conn_adapter.set_autocommit.call_args_list,
+            list2=[UM.call(enabled=True), UM.call(enabled=False)]
+        )
+        self.assertIsNone(
+            obj=instance._autocommit_mode
+        )
 
     # -----------------------------------------------------------------------------------
-    def test_set_new_config_raise_expected_exception_for_invalid_types(self) -> None:
+    def test_execute_query_no_returns_behavior_commits_plain_write_after_transaction(self) -> None:
+        from dbms_interaction.adapters_component.connection.realizations.mysql_adapter_connection \
+            import MySQLAdapterConnection
+
         # Build
-        expected_exception = InvalidArgumentTypeError
-        invalid_configs: Tuple[Any, ...] = (
-            'real_config', ['key1', 'value1', 'key2', 'value2'],
-            ('key1', 'value1', 'key2', 'value2')
+        instance: tested_cls = self.get_instance_of_tested_cls()
+        conn_manager = self.get_instance_of_single_connection_manager()
+        connector = UM.MagicMock()
+        conn_adapter = MySQLAdapterConnection(connector=connector)
+        transaction_manager = TransactionManager()
+        autocommit_by_query: Dict[str, bool] = {}
+
+        # Prepare instance
+        instance.set_new_connection_manager(new_manager=conn_manager)
+        transaction_manager.active_connection = conn_adapter
+
+        # Prepare mock
+        connector.autocommit = True
+        conn_adapter.connect(config={'autocommit': True})
+        conn_manager.get_connection.return_value = conn_adapter  # type:ignore
+        connector.cursor.return_value.execute.side_effect = \
+            lambda operation, params: autocommit_by_query.setdefault(operation, connector.autocommit)
+
+        # Operate
+        transaction_manager.begin()
+        transaction_manager.execute_in_active_transaction(query='UPDATE berry SET cost = 1')
+        transaction_manager.commit()
+        instance.execute_query_no_returns(query='UPDATE berry SET cost = 2')
+
+        # Check: запись вне транзакции фиксируется сервером сразу
+        self.assertDictEqual(
+            d1=autocommit_by_query,
+            d2={'UPDATE berry SET cost = 1': False, 'UPDATE berry SET cost = 2': True}
         )
-        instance = self.get_instance_of_tested_cls()
+        connector.commit.assert_called_once()
 
-        # Prepare test cycle
-        for invalid_config in invalid_configs:
-            with self.subTest(pattern=invalid_config):
-                # Check
-                with self.assertRaises(expected_exception=expected_exception):
-                    # Operate
-                    instance.set_new_connection_config(
-                        new_config=invalid_config
-                    )
+    # -----------------------------------------------------------------------------------
+    def test_execute_query_returns_methods_behavior_do_not_change_autocommit_mode(self) -> None:
+        # Build
+        instance: tested_cls = self.get_instance_of_tested_cls()
+        conn_manager = self.get_instance_of_single_connection_manager()
+        conn_adapter = UM.MagicMock()
+        query: str = GeneratingToolKit.generate_random_string()
+
+        # Prepare instance
+        instance.set_new_connection_manager(new_manager=conn_manager)
+
+        # Prepare mock
+        conn_manager.get_connection.return_value = conn_adapter  # type:ignore
+
+        # Operate
+        instance.execute_query_returns_one(query=query)
+        instance.execute_query_returns_all(query=query)
+
+        # Check
+        conn_adapter.set_autocommit.assert_not_called()
 
     # -----------------------------------------------------------------------------------
-    def test_invalid_types_of_param_placeholder_raise_expected_exception_when_initialize(self) -> None:
+    def test_execute_bulk_insert_behavior_splits_rows_by_max_allowed_packet(self) -> None:
         # Build
-        expected_exception = InvalidArgumentTypeError
-        invalid_placeholders: Tuple[Any, ...] = (
-            5, False, True, 01.01, ['*'], set('&'), ('$',)
+        instance: tested_cls = self.get_instance_of_tested_cls(query_param_placeholder='?')
+        conn_manager = self.get_instance_of_single_connection_manager()
+        conn_adapter = UM.MagicMock()
+        cursor = UM.MagicMock()
+        rows: List[Tuple[int, str]] = [
+            (index, GeneratingToolKit.generate_random_string(length=10))
+            for index in range(10)
+        ]
+
+        # Prepare instance
+        instance.set_new_connection_manager(new_manager=conn_manager)
+
+        # Prepare mock
+        conn_manager.get_connection.return_value = conn_adapter  # type:ignore
+        conn_adapter.get_cursor.return_value = cursor
+        cursor.fetchone.return_value = (200,)
+
+        # Operate
+        first_count: int = instance.execute_bulk_insert(
+            table='berry', columns=('id', 'title'), rows=rows
+        )
+        second_count: int = instance.execute_bulk_insert(
+            table='berry', columns=('id', 'title'), rows=iter(rows)
+        )
+
+        # Extract
+        insert_calls = [
+            call for call in cursor.execute.call_args_list
+            if call.kwargs['query'].startswith('INSERT')
+        ]
+        sent_params: List[Any] = [
+            param for call in insert_calls for param in call.args
+        ]
+
+        # Check
+        self.assertEqual(
+            first=first_count,
+            second=len(rows)
+        )
+        self.assertEqual(
+            first=second_count,
+            second=len(rows)
+        )
+        self.assertGreater(
+            a=len(insert_calls),
+            b=2
+        )
+        self.assertListEqual(
+            list1=sent_params,
+            list2=[value for row in rows for value in row] * 2
+        )
+
+        # Post-Check
+        cursor.fetchone.assert_called_once()
+        for call in insert_calls:
+            self.assertLessEqual(
+                a=len(call.kwargs['query']),
+                b=200
+            )
+
+    # -----------------------------------------------------------------------------------
+    def test_execute_upsert_behavior_sends_chunks_through_executemany(self) -> None:
+        # Build
+        instance: tested_cls = self.get_instance_of_tested_cls(query_param_placeholder='?')
+        conn_manager = self.get_instance_of_single_connection_manager()
+        conn_adapter = UM.MagicMock()
+        cursor = UM.MagicMock()
+        rows: List[Tuple[int, str, int]] = [
+            (index, GeneratingToolKit.generate_random_string(length=10), index * 10)
+            for index in range(5)
+        ]
+        expected_query: str = (
+            'INSERT INTO berry (id, title, price) VALUES (?, ?, ?) '
+            'ON DUPLICATE KEY UPDATE title = VALUES(title), price = VALUES(price)'
+        )
+
+        # Prepare instance
+        instance.set_new_connection_manager(new_manager=conn_manager)
+
+        # Prepare mock
+        conn_manager.get_connection.return_value = conn_adapter  # type:ignore
+        conn_adapter.get_cursor.return_value = cursor
+
+        # Operate
+        op_result: int = instance.execute_upsert(
+            table='berry',
+            columns=('id', 'title', 'price'),
+            rows=iter(rows),
+            conflict_columns=('id',),
+            chunk_size=2
+        )
+
+        # Check
+        self.assertEqual(
+            first=op_result,
+            second=len(rows)
+        )
+        self.assertListEqual(
+            list1=cursor.executemany.call_args_list,
+            list2=[
+                UM.call(query=expected_query, data=rows[0:2]),
+                UM.call(query=expected_query, data=rows[2:4]),
+                UM.call(query=expected_query, data=rows[4:5]),
+            ]
+        )
+
+        # Post-Check
+        cursor.execute.assert_not_called()
+        self.assertEqual(
+            first=cursor.close.call_count,
+            second=3
         )
 
+    # -----------------------------------------------------------------------------------
+    def test_deconstruct_database_and_components_behavior_drains_write_behind_queue(self) -> None:
+        # Build
+        instance: tested_cls = self.get_instance_of_tested_cls()
+        write_behind_queue = UM.MagicMock(spec=WriteBehindQueue)
+
+        # Prepare instance
+        instance.set_new_write_behind_queue(new_queue=write_behind_queue)
+
+        # Operate
+        instance.deconstruct_database_and_components()
+
+        # Check
+        write_behind_queue.close.assert_called_once()
+
+    # -----------------------------------------------------------------------------------
+    def test_execute_query_returns_methods_behavior_pass_raw_mode(self) -> None:
+        # Build
+        instance: tested_cls = self.get_instance_of_tested_cls()
+        conn_manager = self.get_instance_of_single_connection_manager()
+        conn_adapter = UM.MagicMock()
+        query: str = 'SELECT payload FROM berry'
+        raw_calls: Dict[str, Dict[str, Any]] = {
+            'execute_query_returns_one': {},
+            'execute_query_returns_many': {'returns_count': 2},
+            'execute_query_returns_all': {},
+        }  # Method name & kwargs
+
+        # Prepare instance
+        instance.set_new_connection_manager(new_manager=conn_manager)
+
+        # Prepare mock
+        conn_manager.get_connection.return_value = conn_adapter  # type:ignore
+
         # Prepare test cycle
-        for invalid_placeholder in invalid_placeholders:
-            with self.subTest(pattern=invalid_placeholder):
+        for method_name, kwargs in raw_calls.items():
+            with self.subTest(pattern=method_name):
+                # Prepare mock
+                conn_adapter.get_cursor.reset_mock()
+
+                # Operate
+                getattr(instance, method_name)(query=query, raw=True, **kwargs)
+
                 # Check
-                with self.assertRaises(expected_exception=expected_exception):
-                    # Operate
-                    self.get_instance_of_tested_cls(query_param_placeholder=invalid_placeholder)
+                conn_adapter.get_cursor.assert_called_once_with(
+                    special_placeholder=instance.query_param_placeholder,
+                    raw=True
+                )
 
     # -----------------------------------------------------------------------------------
-    def test_execute_query_methods_behavior_when_connection_is_not_active(self) -> None:
+    def test_execute_blob_stream_behavior_reads_blob_by_slices(self) -> None:
+        import io
+
         # Build
-        expected_exception = OperationFailedConnectionIsNotActive
-        instance = self.get_instance_of_tested_cls()
+        instance: tested_cls = self.get_instance_of_tested_cls(query_param_placeholder='?')
         conn_manager = self.get_instance_of_single_connection_manager()
-        query: str = GeneratingToolKit.generate_random_string()
+        conn_adapter = UM.MagicMock()
+        cursor = UM.MagicMock()
+        blob: bytes = bytes(range(10))
+        sinks: List[Any] = [io.BytesIO(), bytearray(16)]
 
         # Prepare instance
         instance.set_new_connection_manager(new_manager=conn_manager)
 
-        # Prepare additional data
-        execute_query_methods: List[str] = [
-            method_name for method_name in QueryInterface.__abstractmethods__
-            if 'execute_query' in method_name
-        ]
-        execute_methods_count: int = len(execute_query_methods)
+        # Prepare mock
+        conn_manager.get_connection.return_value = conn_adapter  # type:ignore
+        conn_adapter.get_cursor.return_value = cursor
+        conn_adapter.get_autocommit.return_value = True
 
-        # Prepare check context
-        with UM.patch.object(target=conn_manager,
-                             attribute='check_connection_status') as mock_method_check_connection_status:
-            # Prepare mock
-            mock_method_check_connection_status.return_value = False
+        # Prepare test cycle
+        for sink in sinks:
+            with self.subTest(pattern=type(sink).__name__):
+                # Prepare mock
+                cursor.reset_mock()
+                conn_adapter.commit.reset_mock()
+                cursor.fetchone.side_effect = [
+                    (len(blob),), (blob[0:4], len(blob)), (blob[4:8], len(blob)), (blob[8:10], len(blob))
+                ]
+
+                # Operate
+                op_result: int = instance.execute_blob_stream(
+                    7, table='document', column='payload', where='id = ?', sink=sink, slice_size=4
+                )
 
-            # Prepare test cycle
-            for method_name in execute_query_methods:
-                with self.subTest(pattern=method_name):
-                    # Prepare post_check
-                    with self.assertRaises(expected_exception=expected_exception):
-                        execute_query_method = getattr(instance, method_name)
+                # Extract
+                written: bytes = sink.getvalue() if isinstance(sink, io.BytesIO) else bytes(sink[:op_result])
 
-                        # Operate
-                        execute_query_method(query=query)
+                # Check
+                self.assertEqual(
+                    first=op_result,
+                    second=len(blob)
+                )
+                self.assertEqual(
+                    first=written,
+                    second=blob
+                )
+                slice_query: str = \
+                    'SELECT SUBSTRING(payload, ?, ?), OCTET_LENGTH(payload) FROM document WHERE id = ?'
+                self.assertListEqual(
+                    list1=cursor.execute.call_args_list,
+                    list2=[
+                        UM.call(query='START TRANSACTION WITH CONSISTENT SNAPSHOT, READ ONLY'),
+                        UM.call(7, query='SELECT OCTET_LENGTH(payload) FROM document WHERE id = ?'),
+                        UM.call(1, 4, 7, query=slice_query),
+                        UM.call(5, 4, 7, query=slice_query),
+                        UM.call(9, 4, 7, query=slice_query),
+                    ]
+                )
+                conn_adapter.commit.assert_called_once_with()
 
-            # Check
-            self.assertTrue(
-                expr=(mock_method_check_connection_status.call_count == execute_methods_count)
-            )
-            conn_manager.get_connection.assert_not_called()  # type:ignore
+    # -----------------------------------------------------------------------------------
+    def test_set_row_factory_behavior_configures_cursor(self) -> None:
+        from dbms_interaction.row_factory_component.row_factory import RowFactory
+
+        # Build
+        instance: tested_cls = self.get_instance_of_tested_cls()
+        conn_manager = self.get_instance_of_single_connection_manager()
+        conn_adapter = UM.MagicMock()
+        cursor = UM.MagicMock()
+
+        # Prepare instance
+        instance.set_new_connection_manager(new_manager=conn_manager)
+
+        # Prepare mock
+        conn_manager.get_connection.return_value = conn_adapter  # type:ignore
+        conn_adapter.get_cursor.return_value = cursor
+        cursor.fetchall.return_value = [{'id': 1}]
+
+        # Operate
+        instance.execute_query_returns_all(query='SELECT id FROM berry')
+        instance.set_row_factory(factory=RowFactory.DICT)
+        op_result = instance.execute_query_returns_all(query='SELECT id FROM berry')
+
+        # Check
+        cursor.set_row_factory.assert_called_once_with(factory=RowFactory.DICT)
+        self.assertEqual(
+            first=op_result,
+            second=[{'id': 1}]
+        )
+
+        # Check
+        with self.assertRaises(expected_exception=InvalidArgumentTypeError):
+            # Operate
+            instance.set_row_factory(factory='dict')
+
+    # -----------------------------------------------------------------------------------
+    def test_execute_query_returns_columnar_behavior_uses_unbuffered_cursor(self) -> None:
+        # Build
+        instance: tested_cls = self.get_instance_of_tested_cls()
+        conn_manager = self.get_instance_of_single_connection_manager()
+        conn_adapter = UM.MagicMock()
+        cursor = UM.MagicMock()
+        expected_columns: Dict[str, List[Any]] = {'id': [1, 2], 'title': ['a', 'b']}
+
+        # Prepare instance
+        instance.set_new_connection_manager(new_manager=conn_manager)
+
+        # Prepare mock
+        conn_manager.get_connection.return_value = conn_adapter  # type:ignore
+        conn_adapter.get_cursor.return_value = cursor
+        cursor.fetch_columnar.return_value = expected_columns
+
+        # Operate
+        op_result = instance.execute_query_returns_columnar(
+            query='SELECT id, title FROM berry', chunk_size=500, use_numpy=False
+        )
+
+        # Check
+        self.assertDictEqual(
+            d1=op_result,
+            d2=expected_columns
+        )
+        conn_adapter.get_cursor.assert_called_once_with(
+            special_placeholder=instance.query_param_placeholder,
+            unbuffered=True
+        )
+
+        # Post-Check
+        cursor.fetch_columnar.assert_called_once_with(chunk_size=500, use_numpy=False)
+        cursor.close.assert_called_once()
+
+    # -----------------------------------------------------------------------------------
+    def test_export_query_results_behavior_streams_rows_from_unbuffered_cursor(self) -> None:
+        import os
+        import tempfile
+
+        # Build
+        instance: tested_cls = self.get_instance_of_tested_cls()
+        conn_manager = self.get_instance_of_single_connection_manager()
+        conn_adapter = UM.MagicMock()
+        cursor = UM.MagicMock(spec=CursorInterface)
+        query: str = 'SELECT id, title FROM berry WHERE id > ?'
+
+        # Prepare instance
+        instance.set_new_connection_manager(new_manager=conn_manager)
+
+        # Prepare mock
+        conn_manager.get_connection.return_value = conn_adapter  # type:ignore
+        conn_adapter.get_cursor.return_value = cursor
+        cursor.get_column_names.return_value = ('id', 'title')
+        cursor.fetchmany.side_effect = [[(1, 'a'), (2, 'b')], [(3, 'c')], []]
+
+        # Prepare data
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_path: str = os.path.join(temp_dir, 'berry.csv')
+
+            # Operate
+            op_result: int = instance.export_query_results(
+                0, query=query, file_path=file_path, chunk_size=2
+            )
+
+            # Extract
+            with open(file_path, encoding='utf-8', newline='') as export_file:
+                actual_content: str = export_file.read()
+
+        # Check
+        self.assertEqual(
+            first=op_result,
+            second=3
+        )
+        self.assertEqual(
+            first=actual_content,
+            second='id,title\r\n1,a\r\n2,b\r\n3,c\r\n'
+        )
+        conn_adapter.get_cursor.assert_called_once_with(
+            special_placeholder=instance.query_param_placeholder,
+            unbuffered=True
+        )
+
+        # Post-Check
+        cursor.execute.assert_called_once_with(0, query=query)
+        cursor.close.assert_called_once()
+
+    # -----------------------------------------------------------------------------------
+    def test_export_query_results_behavior_writes_values_with_dict_row_factory(self) -> None:
+        import os
+        import tempfile
+
+        from dbms_interaction.adapters_component.connection.realizations.mysql_adapter_connection \
+            import MySQLAdapterConnection
+        from dbms_interaction.row_factory_component.row_factory import RowFactory
+
+        # Build
+        instance: tested_cls = self.get_instance_of_tested_cls()
+        conn_manager = self.get_instance_of_single_connection_manager()
+        connector = UM.MagicMock()
+        conn_adapter = MySQLAdapterConnection(connector=connector)
+        driver_cursor = connector.cursor.return_value
+
+        # Prepare instance
+        instance.set_new_connection_manager(new_manager=conn_manager)
+        instance.set_row_factory(factory=RowFactory.DICT)
+
+        # Prepare mock
+        conn_adapter.connect(config={})
+        conn_manager.get_connection.return_value = conn_adapter  # type:ignore
+        driver_cursor.column_names = ('id', 'title')
+        driver_cursor.fetchmany.side_effect = [[(1, 'a'), (2, 'b')], []]
+
+        # Prepare data
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_path: str = os.path.join(temp_dir, 'berry.csv')
+
+            # Operate
+            op_result: int = instance.export_query_results(
+                query='SELECT id, title FROM berry', file_path=file_path
+            )
+
+            # Extract
+            with open(file_path, encoding='utf-8', newline='') as export_file:
+                actual_content: str = export_file.read()
+
+        # Check
+        self.assertEqual(
+            first=op_result,
+            second=2
+        )
+        self.assertEqual(
+            first=actual_content,
+            second='id,title\r\n1,a\r\n2,b\r\n'
+        )
+
+        # Post-Check
+        driver_cursor.close.assert_called_once()
+
+    # -----------------------------------------------------------------------------------
+    def test_execute_query_returns_stream_behavior_holds_connection_until_closed(self) -> None:
+        import threading
+
+        # Build
+        instance: tested_cls = self.get_instance_of_tested_cls()
+        conn_manager = self.get_instance_of_single_connection_manager()
+        conn_adapter = UM.MagicMock()
+        cursor = UM.MagicMock(spec=CursorInterface)
+        write_is_done = threading.Event()
+
+        # Prepare instance
+        instance.set_new_connection_manager(new_manager=conn_manager)
+
+        # Prepare mock
+        conn_manager.get_connection.return_value = conn_adapter  # type:ignore
+        conn_adapter.get_cursor.return_value = cursor
+        cursor.fetchmany.side_effect = [[(1,)], [(2,)], []]
+
+        def write() -> None:
+            instance.execute_query_no_returns(query='UPDATE berry SET cost = 1')
+            write_is_done.set()
+
+        # Operate
+        stream = instance.execute_query_returns_stream(query='SELECT id FROM berry', chunk_size=1)
+        writer = threading.Thread(target=write)
+        writer.start()
+
+        # Check: запись ждёт, пока в подключении есть непрочитанные строки
+        self.assertFalse(
+            expr=write_is_done.wait(timeout=0.1)
+        )
+        self.assertEqual(
+            first=next(stream),
+            second=(1,)
+        )
+        self.assertFalse(
+            expr=write_is_done.is_set()
+        )
+
+        # Operate
+        stream.close()
+        writer.join(timeout=5)
+
+        # Post-Check
+        self.assertTrue(
+            expr=write_is_done.is_set()
+        )
+
+    # -----------------------------------------------------------------------------------
+    def test_execute_query_returns_spillable_behavior_reads_rows_from_stream(self) -> None:
+        # Build
+        instance: tested_cls = self.get_instance_of_tested_cls()
+        conn_manager = self.get_instance_of_single_connection_manager()
+        conn_adapter = UM.MagicMock()
+        cursor = UM.MagicMock(spec=CursorInterface)
+        query: str = 'SELECT id, title FROM berry WHERE id > ?'
+
+        # Prepare instance
+        instance.set_new_connection_manager(new_manager=conn_manager)
+
+        # Prepare mock
+        conn_manager.get_connection.return_value = conn_adapter  # type:ignore
+        conn_adapter.get_cursor.return_value = cursor
+        cursor.fetchmany.side_effect = [[(1, 'a'), (2, 'b')], [(3, 'c')], []]
+
+        # Operate
+        with instance.execute_query_returns_spillable(0, query=query, memory_limit=1, chunk_size=2) as op_result:
+            # Check
+            self.assertTrue(
+                expr=op_result.is_spilled()
+            )
+            self.assertListEqual(
+                list1=list(op_result),
+                list2=[(1, 'a'), (2, 'b'), (3, 'c')]
+            )
+
+        conn_adapter.get_cursor.assert_called_once_with(
+            special_placeholder=instance.query_param_placeholder,
+            unbuffered=True
+        )
+
+        # Post-Check
+        cursor.execute.assert_called_once_with(0, query=query)
+        cursor.close.assert_called_once()
+
+    # -----------------------------------------------------------------------------------
+    def test_execute_bulk_load_behavior_delegates_to_adapter(self) -> None:
+        # Build
+        instance: tested_cls = self.get_instance_of_tested_cls()
+        conn_manager = self.get_instance_of_single_connection_manager()
+        conn_adapter = UM.MagicMock()
+        expected_result = UM.sentinel.bulk_load_result
+        rows: List[Tuple[int, str]] = [(1, GeneratingToolKit.generate_random_string())]
+
+        # Prepare instance
+        instance.set_new_connection_manager(new_manager=conn_manager)
+
+        # Prepare mock
+        conn_manager.get_connection.return_value = conn_adapter  # type:ignore
+        conn_adapter.bulk_load.return_value = expected_result
+
+        # Operate
+        op_result = instance.execute_bulk_load(
+            table='berry', columns=('id', 'title'), rows=rows
+        )
+
+        # Check
+        conn_adapter.bulk_load.assert_called_once_with(
+            table='berry', columns=('id', 'title'), rows=rows, file_path=''
+        )
+        self.assertIs(
+            expr1=op_result,
+            expr2=expected_result
+        )
+
+    # -----------------------------------------------------------------------------------
+    def test_execute_bulk_load_behavior_applies_session_autocommit_mode(self) -> None:
+        # Build
+        instance: tested_cls = self.get_instance_of_tested_cls()
+        conn_manager = self.get_instance_of_single_connection_manager()
+        conn_adapter = UM.MagicMock()
+
+        # Prepare instance
+        instance.set_new_connection_manager(new_manager=conn_manager)
+        instance.set_autocommit_mode(enabled=True)
+
+        # Prepare mock
+        conn_manager.get_connection.return_value = conn_adapter  # type:ignore
+
+        # Operate
+        instance.execute_bulk_load(table='berry', columns=('id',), rows=[(1,)])
+
+        # Check
+        self.assertEqual(
+            first=conn_adapter.method_calls,
+            second=[
+                UM.call.set_autocommit(enabled=True),
+                UM.call.bulk_load(table='berry', columns=('id',), rows=[(1,)], file_path='')
+            ]
+        )
+
+
+    # -----------------------------------------------------------------------------------
+    def test_execute_query_returns_methods_behavior_use_query_cache(self) -> None:
+        # Build
+        instance: tested_cls = self.get_instance_of_tested_cls()
+        conn_manager = self.get_instance_of_single_connection_manager()
+        conn_adapter = UM.MagicMock()
+        cursor = UM.MagicMock()
+        query_cache = LRUQueryCache()
+        select_query: str = 'SELECT id FROM berry WHERE cost > ?'
+
+        # Prepare instance
+        instance.set_new_connection_manager(new_manager=conn_manager)
+        instance.set_new_query_cache(new_cache=query_cache)
+
+        # Prepare mock
+        conn_manager.get_connection.return_value = conn_adapter  # type:ignore
+        conn_adapter.get_cursor.return_value = cursor
+        cursor.fetchall.return_value = [(1,), (2,)]
+
+        # Operate
+        first_result = instance.execute_query_returns_all(10, query=select_query)
+        second_result = instance.execute_query_returns_all(10, query=select_query)
+        instance.execute_query_returns_all(20, query=select_query)
+        instance.execute_query_returns_all(10, query=select_query, cache_ttl=0)
+
+        # Check
+        self.assertEqual(
+            first=cursor.fetchall.call_count,
+            second=3
+        )
+        self.assertEqual(
+            first=first_result,
+            second=((1,), (2,))
+        )
+        self.assertIs(
+            expr1=second_result,
+            expr2=first_result
+        )
+
+        # Operate
+        instance.execute_query_no_returns(1, query='UPDATE `berry` SET cost = ?')
+        instance.execute_query_returns_all(10, query=select_query)
+
+        # Post-Check
+        self.assertEqual(
+            first=cursor.fetchall.call_count,
+            second=4
+        )
+        self.assertEqual(
+            first=query_cache.get_statistics()[:4],
+            second=(1, 3, 0, 2)
+        )
+
+    # -----------------------------------------------------------------------------------
+    def test_execute_query_returns_methods_behavior_copies_cached_mutable_rows(self) -> None:
+        from dbms_interaction.row_factory_component.row_factory import RowFactory
+
+        # Build
+        instance: tested_cls = self.get_instance_of_tested_cls()
+        conn_manager = self.get_instance_of_single_connection_manager()
+        conn_adapter = UM.MagicMock()
+        cursor = UM.MagicMock()
+        select_query: str = 'SELECT id FROM berry'
+
+        # Prepare instance
+        instance.set_new_connection_manager(new_manager=conn_manager)
+        instance.set_new_query_cache(new_cache=LRUQueryCache())
+        instance.set_row_factory(factory=RowFactory.DICT)
+
+        # Prepare mock
+        conn_manager.get_connection.return_value = conn_adapter  # type:ignore
+        conn_adapter.get_cursor.return_value = cursor
+        cursor.fetchall.side_effect = lambda: [{'id': 1}]
+        cursor.fetchone.side_effect = lambda: {'id': 1}
+
+        for method in (instance.execute_query_returns_all, instance.execute_query_returns_one):
+            with self.subTest(pattern=method.__name__):
+                # Operate
+                first_result = method(query=select_query)
+                first_row = first_result[0] if isinstance(first_result, tuple) else first_result
+                first_row['id'] = 2
+                second_result = method(query=select_query)
+
+                # Check
+                self.assertEqual(
+                    first=second_result,
+                    second=({'id': 1},) if isinstance(second_result, tuple) else {'id': 1}
+                )
+
+        # Post-Check
+        self.assertEqual(
+            first=cursor.fetchall.call_count + cursor.fetchone.call_count,
+            second=2
+        )
+
+    # -----------------------------------------------------------------------------------
+    def test_set_new_query_cache_behavior_shares_cache_with_transaction_manager(self) -> None:
+        # Build
+        instance: tested_cls = self.get_instance_of_tested_cls()
+        transaction_manager = self.get_instance_of_transaction_manager()
+        query_cache = LRUQueryCache()
+
+        # Prepare instance
+        instance.set_new_connection_manager(new_manager=self.get_instance_of_single_connection_manager())
+        instance.set_new_transaction_manager(new_manager=transaction_manager)
+
+        # Operate
+        instance.set_new_query_cache(new_cache=query_cache)
+
+        # Check
+        self.assertIs(
+            expr1=transaction_manager.query_cache,
+            expr2=query_cache
+        )
+
+        # Check
+        with self.assertRaises(expected_exception=InvalidArgumentTypeError):
+            # Operate
+            instance.set_new_query_cache(new_cache=dict())
+
+    # -----------------------------------------------------------------------------------
+    def test_execute_query_returns_all_behavior_shares_concurrent_identical_reads(self) -> None:
+        import threading
+        import time
+        from concurrent.futures import ThreadPoolExecutor
+
+        # Build
+        instance: tested_cls = self.get_instance_of_tested_cls()
+        conn_manager = self.get_instance_of_single_connection_manager()
+        conn_adapter = UM.MagicMock()
+        cursor = UM.MagicMock()
+        single_flight_group = SingleFlightGroup()
+        release_event = threading.Event()
+        select_query: str = 'SELECT id FROM berry WHERE cost > ?'
+
+        # Prepare instance
+        instance.set_new_connection_manager(new_manager=conn_manager)
+        instance.set_new_single_flight_group(new_group=single_flight_group)
+
+        # Prepare mock
+        conn_manager.get_connection.return_value = conn_adapter  # type:ignore
+        conn_adapter.get_cursor.return_value = cursor
+        cursor.fetchall.side_effect = lambda: release_event.wait() and [(1,), (2,)]
+
+        # Operate
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [
+                executor.submit(instance.execute_query_returns_all, 10, query=select_query)
+                for _ in range(4)
+            ]
+
+            deadline: float = time.monotonic() + 5
+            while single_flight_group.get_shared_calls_count() < 3 and time.monotonic() < deadline:
+                time.sleep(0.001)
+
+            release_event.set()
+            results: List[Any] = [future.result() for future in futures]
+
+        # Check
+        cursor.execute.assert_called_once_with(10, query=select_query)
+        self.assertTrue(
+            expr=all(result == ((1,), (2,)) for result in results)
+        )
+
+        # Post-Check
+        instance.execute_query_returns_all(query='SELECT id FROM berry FOR UPDATE')
+        self.assertEqual(
+            first=single_flight_group.get_shared_calls_count(),
+            second=3
+        )
+
+    # -----------------------------------------------------------------------------------
+    def test_execute_query_behavior_fails_fast_when_circuit_breaker_is_open(self) -> None:
+        # Build
+        instance: tested_cls = self.get_instance_of_tested_cls()
+        conn_manager = self.get_instance_of_single_connection_manager()
+        conn_adapter = UM.MagicMock()
+        cursor = UM.MagicMock()
+        circuit_breaker = CircuitBreaker(window_size=2, minimum_calls=2, open_duration=60.0)
+
+        # Prepare instance
+        instance.set_new_connection_manager(new_manager=conn_manager)
+        instance.set_new_circuit_breaker(new_breaker=circuit_breaker)
+
+        # Prepare mock
+        conn_manager.get_connection.return_value = conn_adapter  # type:ignore
+        conn_adapter.get_cursor.return_value = cursor
+        cursor.execute.side_effect = TimeoutError('Lock wait timeout')
+
+        for _ in range(2):
+            with self.assertRaises(expected_exception=TimeoutError):
+                instance.execute_query_returns_all(query='SELECT id FROM berry')
+
+        # Check
+        with self.assertRaises(expected_exception=OperationFailedCircuitIsOpen):
+            # Operate
+            instance.execute_query_no_returns(query='DELETE FROM berry')
+
+        # Post-Check
+        self.assertEqual(
+            first=cursor.execute.call_count,
+            second=2
+        )
+
+
+    # -----------------------------------------------------------------------------------
+    def test_execute_query_behavior_applies_timeout(self) -> None:
+        # Build
+        instance: tested_cls = self.get_instance_of_tested_cls()
+        conn_manager = self.get_instance_of_single_connection_manager()
+        conn_adapter = UM.MagicMock()
+        cursor = UM.MagicMock()
+        query_watchdog = UM.MagicMock(spec=QueryWatchdog)
+
+        # Prepare instance
+        instance.set_new_connection_manager(new_manager=conn_manager)
+        instance.set_new_query_watchdog(new_watchdog=query_watchdog)
+
+        # Prepare mock
+        conn_manager.get_connection.return_value = conn_adapter  # type:ignore
+        conn_adapter.get_cursor.return_value = cursor
+        conn_adapter.get_connection_id.return_value = 42
+        query_watchdog.watch.return_value = 7
+        query_watchdog.unwatch.return_value = True
+
+        # Operate
+        instance.execute_query_returns_all(5, query='SELECT id FROM berry WHERE cost > ?', timeout=0.5)
+
+        # Check
+        cursor.execute.assert_called_once_with(5, query='SELECT /*+ MAX_EXECUTION_TIME(500) */ id FROM berry WHERE cost > ?')
+        query_watchdog.watch.assert_not_called()
+
+        # Operate
+        instance.execute_query_no_returns(query='DELETE FROM berry', timeout=2)
+
+        # Check
+        query_watchdog.watch.assert_called_once_with(connection_id=42, timeout=2)
+        query_watchdog.unwatch.assert_called_once_with(token=7)
+        cursor.execute.assert_called_with(query='DELETE FROM berry')
+
+
+# _______________________________________________________________________________________
+class TestComponentNegative(BaseTestComponent):
+
+    # -----------------------------------------------------------------------------------
+    def test_set_new_connection_manager_raise_expected_exception_for_invalid_types(self) -> None:
+        # Build
+        expected_exception = InvalidArgumentTypeError
+        invalid_managers: List[Any] = GeneratingToolKit.generate_list_of_basic_python_types()
+        instance = self.get_instance_of_tested_cls()
+
+        # Prepare test cycle
+        for invalid_manager in invalid_managers:
+            with self.subTest(pattern=invalid_manager):
+                # Check
+                with self.assertRaises(expected_exception=expected_exception):
+                    # Operate
+                    instance.set_new_connection_manager(
+                        new_manager=invalid_manager
+                    )
+
+    # -----------------------------------------------------------------------------------
+    def test_set_new_transaction_manager_raise_expected_exception_for_invalid_types(self) -> None:
+        # Build
+        expected_exception = InvalidArgumentTypeError
+        invalid_managers: List[Any] = GeneratingToolKit.generate_list_of_basic_python_types()
+        instance = self.get_instance_of_tested_cls()
+
+        # Prepare test cycle
+        for invalid_manager in invalid_managers:
+            with self.subTest(pattern=invalid_manager):
+                # Check
+                with self.assertRaises(expected_exception=expected_exception):
+                    # Operate
+                    instance.set_new_transaction_manager(
+                        new_manager=invalid_manager
+                    )
+
+    # -----------------------------------------------------------------------------------
+    def test_set_new_write_behind_queue_raise_expected_exception_for_invalid_types(self) -> None:
+        # Build
+        expected_exception = InvalidArgumentTypeError
+        instance: tested_cls = self.get_instance_of_tested_cls()
+        invalid_types: List[Any] = GeneratingToolKit.generate_list_of_basic_python_types()
+
+        # Prepare test cycle
+        for invalid_type in invalid_types:
+            with self.subTest(pattern=invalid_type):
+                # Check
+                with self.assertRaises(expected_exception=expected_exception):
+                    # Operate
+                    instance.set_new_write_behind_queue(new_queue=invalid_type)
+
+    # -----------------------------------------------------------------------------------
+    def test_set_new_single_flight_group_raise_expected_exception_for_invalid_types(self) -> None:
+        # Build
+        expected_exception = InvalidArgumentTypeError
+        instance: tested_cls = self.get_instance_of_tested_cls()
+        invalid_types: List[Any] = GeneratingToolKit.generate_list_of_basic_python_types()
+
+        # Prepare test cycle
+        for invalid_type in invalid_types:
+            with self.subTest(pattern=invalid_type):
+                # Check
+                with self.assertRaises(expected_exception=expected_exception):
+                    # Operate
+                    instance.set_new_single_flight_group(new_group=invalid_type)
+
+    # -----------------------------------------------------------------------------------
+    def test_set_new_circuit_breaker_raise_expected_exception_for_invalid_types(self) -> None:
+        # Build
+        expected_exception = InvalidArgumentTypeError
+        instance: tested_cls = self.get_instance_of_tested_cls()
+        invalid_types: List[Any] = GeneratingToolKit.generate_list_of_basic_python_types()
+
+        # Prepare test cycle
+        for invalid_type in invalid_types:
+            with self.subTest(pattern=invalid_type):
+                # Check
+                with self.assertRaises(expected_exception=expected_exception):
+                    # Operate
+                    instance.set_new_circuit_breaker(new_breaker=invalid_type)
+
+    # -----------------------------------------------------------------------------------
+    def test_execute_query_behavior_when_timeout_is_exceeded(self) -> None:
+        # Build
+        instance: tested_cls = self.get_instance_of_tested_cls()
+        conn_manager = self.get_instance_of_single_connection_manager()
+        conn_adapter = UM.MagicMock()
+        cursor = UM.MagicMock()
+        query_watchdog = UM.MagicMock(spec=QueryWatchdog)
+        max_execution_time_error = RuntimeError('Query execution was interrupted, maximum statement execution time exceeded')
+        max_execution_time_error.errno = 3024
+
+        # Prepare instance
+        instance.set_new_connection_manager(new_manager=conn_manager)
+
+        # Prepare mock
+        conn_manager.get_connection.return_value = conn_adapter  # type:ignore
+        conn_adapter.get_cursor.return_value = cursor
+        cursor.execute.side_effect = max_execution_time_error
+
+        # Check
+        with self.assertRaises(expected_exception=OperationFailedQueryTimeoutExceeded):
+            # Operate
+            instance.execute_query_returns_one(query='SELECT SLEEP(10)', timeout=0.1)
+
+        # Check
+        with self.assertRaises(expected_exception=InvalidArgumentValueError):
+            # Operate
+            instance.execute_query_no_returns(query='UPDATE berry SET cost = 1', timeout=0.1)
+
+        # Prepare mock
+        instance.set_new_query_watchdog(new_watchdog=query_watchdog)
+        query_watchdog.unwatch.return_value = False
+        cursor.execute.side_effect = RuntimeError('Query execution was interrupted')
+
+        # Check
+        with self.assertRaises(expected_exception=OperationFailedQueryTimeoutExceeded):
+            # Operate
+            instance.execute_query_no_returns(query='UPDATE berry SET cost = 1', timeout=0.1)
+
+        # Check
+        for invalid_timeout, expected_exception in (('1', InvalidArgumentTypeError), (0, InvalidArgumentValueError)):
+            with self.subTest(pattern=invalid_timeout):
+                with self.assertRaises(expected_exception=expected_exception):
+                    # Operate
+                    instance.execute_query_returns_all(query='SELECT 1', timeout=invalid_timeout)
+
+    # -----------------------------------------------------------------------------------
+    def test_set_new_query_watchdog_raise_expected_exception_for_invalid_types(self) -> None:
+        # Build
+        expected_exception = InvalidArgumentTypeError
+        instance: tested_cls = self.get_instance_of_tested_cls()
+        invalid_types: List[Any] = GeneratingToolKit.generate_list_of_basic_python_types()
+
+        # Prepare test cycle
+        for invalid_type in invalid_types:
+            with self.subTest(pattern=invalid_type):
+                # Check
+                with self.assertRaises(expected_exception=expected_exception):
+                    # Operate
+                    instance.set_new_query_watchdog(new_watchdog=invalid_type)
+
+    # -----------------------------------------------------------------------------------
+    def test_set_new_config_raise_expected_exception_for_invalid_types(self) -> None:
+        # Build
+        expected_exception = InvalidArgumentTypeError
+        invalid_configs: Tuple[Any, ...] = (
+            'real_config', ['key1', 'value1', 'key2', 'value2'],
+            ('key1', 'value1', 'key2', 'value2')
+        )
+        instance = self.get_instance_of_tested_cls()
+
+        # Prepare test cycle
+        for invalid_config in invalid_configs:
+            with self.subTest(pattern=invalid_config):
+                # Check
+                with self.assertRaises(expected_exception=expected_exception):
+                    # Operate
+                    instance.set_new_connection_config(
+                        new_config=invalid_config
+                    )
+
+    # -----------------------------------------------------------------------------------
+    def test_invalid_types_of_param_placeholder_raise_expected_exception_when_initialize(self) -> None:
+        # Build
+        expected_exception = InvalidArgumentTypeError
+        invalid_placeholders: Tuple[Any, ...] = (
+            5, False, True, 01.01, ['*'], set('&'), ('$',)
+        )
+
+        # Prepare test cycle
+        for invalid_placeholder in invalid_placeholders:
+            with self.subTest(pattern=invalid_placeholder):
+                # Check
+                with self.assertRaises(expected_exception=expected_exception):
+                    # Operate
+                    self.get_instance_of_tested_cls(query_param_placeholder=invalid_placeholder)
+
+    # -----------------------------------------------------------------------------------
+    def test_execute_query_methods_behavior_when_connection_is_not_active(self) -> None:
+        # Build
+        expected_exception = OperationFailedConnectionIsNotActive
+        instance = self.get_instance_of_tested_cls()
+        conn_manager = self.get_instance_of_single_connection_manager()
+        query: str = GeneratingToolKit.generate_random_string()
+
+        # Prepare instance
+        instance.set_new_connection_manager(new_manager=conn_manager)
+
+        # Prepare additional data
+        execute_query_methods: List[str] = [
+            method_name for method_name in QueryInterface.__abstractmethods__
+            if 'execute_query' in method_name
+        ]
+        execute_methods_count: int = len(execute_query_methods)
+
+        # Prepare check context
+        with UM.patch.object(target=conn_manager,
+                             attribute='check_connection_status') as mock_method_check_connection_status:
+            # Prepare mock
+            mock_method_check_connection_status.return_value = False
+
+            # Prepare test cycle
+            for method_name in execute_query_methods:
+                with self.subTest(pattern=method_name):
+                    # Prepare post_check
+                    with self.assertRaises(expected_exception=expected_exception):
+                        execute_query_method = getattr(instance, method_name)
+
+                        # Operate
+                        execute_query_method(query=query)
+
+            # Check
+            self.assertTrue(
+                expr=(mock_method_check_connection_status.call_count == execute_methods_count)
+            )
+            conn_manager.get_connection.assert_not_called()  # type:ignore
+
+    # -----------------------------------------------------------------------------------
+    def test_set_autocommit_mode_raise_expected_exception_for_invalid_types(self) -> None:
+        # Build
+        expected_exception = InvalidArgumentTypeError
+        invalid_modes: List[Any] = [
+            invalid_mode for invalid_mode in GeneratingToolKit.generate_list_of_basic_python_types()
+            if not isinstance(invalid_mode, bool)
+        ]
+        instance = self.get_instance_of_tested_cls()
+
+        # Prepare test cycle
+        for invalid_mode in invalid_modes:
+            with self.subTest(pattern=invalid_mode):
+                # Check
+                with self.assertRaises(expected_exception=expected_exception):
+                    # Operate
+                    instance.set_autocommit_mode(enabled=invalid_mode)
+
+    # -----------------------------------------------------------------------------------
+    def test_execute_bulk_insert_behavior_when_row_has_wrong_length(self) -> None:
+        # Build
+        expected_exception = InvalidArgumentValueError
+        instance: tested_cls = self.get_instance_of_tested_cls()
+
+        # Prepare instance
+        instance._max_allowed_packet = 1024
+
+        # Prepare check context
+        with self.assertRaises(expected_exception=expected_exception):
+            # Operate
+            instance.execute_bulk_insert(
+                table='berry', columns=('id', 'title'), rows=[(1,)]
+            )
+
+    # -----------------------------------------------------------------------------------
+    def test_execute_upsert_behavior_when_pass_invalid_columns(self) -> None:
+        # Build
+        expected_exception = InvalidArgumentValueError
+        instance: tested_cls = self.get_instance_of_tested_cls()
+        invalid_arguments: List[Dict[str, Any]] = [
+            {'conflict_columns': ()},
+            {'conflict_columns': ('uuid',)},
+            {'conflict_columns': ('id',), 'update_columns': ('weight',)},
+            {'conflict_columns': ('id',), 'chunk_size': 0},
+        ]
+
+        # Prepare test cycle
+        for arguments in invalid_arguments:
+            with self.subTest(pattern=arguments):
+                # Check
+                with self.assertRaises(expected_exception=expected_exception):
+                    # Operate
+                    instance.execute_upsert(
+                        table='berry', columns=('id', 'title'), rows=[(1, 'a')], **arguments
+                    )
+
+    # -----------------------------------------------------------------------------------
+    def test_execute_query_returns_stream_behavior_when_connection_is_not_active(self) -> None:
+        # Build
+        expected_exception = OperationFailedConnectionIsNotActive
+        instance: tested_cls = self.get_instance_of_tested_cls()
+        conn_manager = self.get_instance_of_single_connection_manager()
+
+        # Prepare instance
+        instance.set_new_connection_manager(new_manager=conn_manager)
+
+        # Prepare mock
+        conn_manager.check_connection_status.return_value = False  # type:ignore
+
+        # Prepare check context
+        with self.assertRaises(expected_exception=expected_exception):
+            # Operate
+            instance.execute_query_returns_stream(query='SELECT 1')
+
+    # -----------------------------------------------------------------------------------
+    def test_execute_blob_stream_behavior_when_blob_is_missing_or_sink_is_invalid(self) -> None:
+        # Build
+        instance: tested_cls = self.get_instance_of_tested_cls()
+        conn_manager = self.get_instance_of_single_connection_manager()
+        conn_adapter = UM.MagicMock()
+        cursor = UM.MagicMock()
+
+        # Prepare instance
+        instance.set_new_connection_manager(new_manager=conn_manager)
+
+        # Prepare mock
+        conn_manager.get_connection.return_value = conn_adapter  # type:ignore
+        conn_adapter.get_cursor.return_value = cursor
+        cursor.fetchone.side_effect = [(None,), (100,)]
+
+        # Operate
+        op_result: int = instance.execute_blob_stream(
+            table='document', column='payload', where='id = 1', sink=bytearray(8)
+        )
+
+        # Check
+        self.assertEqual(
+            first=op_result,
+            second=0
+        )
+
+        # Check
+        with self.assertRaises(expected_exception=InvalidArgumentValueError):
+            # Operate
+            instance.execute_blob_stream(
+                table='document', column='payload', where='id = 1', sink=bytearray(8)
+            )
+
+        # Check
+        with self.assertRaises(expected_exception=InvalidArgumentTypeError):
+            # Operate
+            instance.execute_blob_stream(
+                table='document', column='payload', where='id = 1', sink='file.bin'
+            )
+
+        # Prepare mock
+        cursor.fetchone.side_effect = [(8,), (b'1234', 6)]
+
+        # Check
+        with self.assertRaises(expected_exception=OperationFailedValueChangedDuringRead):
+            # Operate
+            instance.execute_blob_stream(
+                table='document', column='payload', where='id = 1', sink=bytearray(8), slice_size=4
+            )
+
+        # Check
+        for identifiers in (
+            {'table': 'document; DROP TABLE berry', 'column': 'payload', 'where': 'id = 1'},
+            {'table': 'document', 'column': 'd.payload', 'where': 'id = 1'},
+            {'table': 'document', 'column': 'payload', 'where': 'id = 1 -- '},
+        ):
+            with self.subTest(pattern=identifiers):
+                with self.assertRaises(expected_exception=InvalidArgumentValueError):
+                    # Operate
+                    instance.execute_blob_stream(sink=bytearray(8), **identifiers)
+
+    # -----------------------------------------------------------------------------------
+    def test_execute_bulk_load_behavior_when_connection_is_not_active(self) -> None:
+        # Build
+        expected_exception = OperationFailedConnectionIsNotActive
+        instance: tested_cls = self.get_instance_of_tested_cls()
+        conn_manager = self.get_instance_of_single_connection_manager()
+
+        # Prepare instance
+        instance.set_new_connection_manager(new_manager=conn_manager)
+
+        # Prepare mock
+        conn_manager.check_connection_status.return_value = False  # type:ignore
+
+        # Prepare check context
+        with self.assertRaises(expected_exception=expected_exception):
+            # Operate
+            instance.execute_bulk_load(table='berry', columns=('id',), rows=[(1,)])
+
+        # Check
+        conn_manager.get_connection.assert_not_called()  # type:ignore
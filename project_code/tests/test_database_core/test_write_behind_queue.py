@@ -0,0 +1,265 @@
+# -*- coding: utf-8 -*-
+
+"""
+Copyright 2025 kichiro-kun (Kei)
+Apache license, version 2.0 (Apache-2.0 license)
+"""
+
+__all__: list[str] = [
+    'TestComponentPositive',
+    'TestComponentNegative',
+]
+
+__author__ = 'kichiro-kun (Kei)'
+__version__ = '0.2.0'
+
+# ========================================================================================
+import threading
+import time
+from unittest import mock as UM
+from typing import Any, Dict, List
+
+from database_core.write_behind_queue_component.write_behind_queue \
+    import NoWriteBehindQueue, WriteBehindQueue as tested_cls
+from database_core.single_connection_database_component.single_connection_database \
+    import SingleConnectionDataBase
+from dbms_interaction.single_connection_manager_component.single_connection_manager \
+    import SingleConnectionManager
+
+from shared.exceptions.common import InvalidArgumentTypeError, IsNullObjectOperation, \
+    OperationFailedComponentIsClosed, OperationFailedQueueIsFull, OperationFailedWritesAreLost
+
+from tests.utils.base_test_case_cls import BaseTestCase
+from tests.utils.toolkit import GeneratingToolKit, InspectingToolKit, MethodCall
+
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+class BaseTestComponent(BaseTestCase[tested_cls]):
+
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    def setUp(self) -> None:
+        super().setUp()
+
+        self._database: UM.MagicMock = UM.MagicMock(spec=SingleConnectionDataBase)
+
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    def get_instance_of_tested_cls(self, **kwargs) -> tested_cls:
+        kwargs.setdefault('database', self._database)
+
+        return tested_cls(**kwargs)
+
+
+# _______________________________________________________________________________________
+class TestComponentPositive(BaseTestComponent):
+
+    # -----------------------------------------------------------------------------------
+    def test_flush_behavior_coalesces_consecutive_rows_of_one_query(self) -> None:
+        # Build
+        first_query: str = 'INSERT INTO berry (title) VALUES (?)'
+        second_query: str = 'INSERT INTO fruit (title, price) VALUES (?, ?)'
+        first_rows: List[tuple] = [(GeneratingToolKit.generate_random_string(),) for _ in range(3)]
+        second_rows: List[tuple] = [(GeneratingToolKit.generate_random_string(), 10) for _ in range(2)]
+
+        instance = self.get_instance_of_tested_cls(batch_size=5, flush_interval_ms=10_000)
+
+        # Operate
+        instance.enqueue(query=first_query, *first_rows[0])
+        instance.enqueue(query=first_query, *first_rows[1])
+        instance.enqueue(query=second_query, *second_rows[0])
+        instance.enqueue(query=second_query, *second_rows[1])
+        instance.enqueue(query=first_query, *first_rows[2])
+        instance.flush()
+
+        # Check: чередующиеся инструкции не переставляются
+        self.assertListEqual(
+            list1=self._database.execute_batch_no_returns.call_args_list,
+            list2=[
+                UM.call(query=first_query, params_sequence=first_rows[:2]),
+                UM.call(query=second_query, params_sequence=second_rows),
+                UM.call(query=first_query, params_sequence=first_rows[2:]),
+            ]
+        )
+
+        # Post-Check
+        self.assertEqual(
+            first=instance.get_pending_count(),
+            second=0
+        )
+        instance.close()
+
+    # -----------------------------------------------------------------------------------
+    def test_close_behavior_drains_rows_in_batches_of_batch_size(self) -> None:
+        # Build
+        query: str = 'INSERT INTO berry (id) VALUES (?)'
+        rows_count: int = 5
+
+        instance = self.get_instance_of_tested_cls(batch_size=2, flush_interval_ms=10_000)
+
+        # Operate
+        for index in range(rows_count):
+            instance.enqueue(index, query=query)
+        instance.close()
+
+        # Extract
+        written_batches: List[List[Any]] = [
+            call.kwargs['params_sequence']
+            for call in self._database.execute_batch_no_returns.call_args_list
+        ]
+
+        # Check
+        self.assertListEqual(
+            list1=written_batches,
+            list2=[[(0,), (1,)], [(2,), (3,)], [(4,)]]
+        )
+
+    # -----------------------------------------------------------------------------------
+    def test_write_error_behavior_is_reported_to_logger_observers(self) -> None:
+        # Build
+        query: str = 'INSERT INTO berry (id) VALUES (?)'
+
+        # Prepare mock
+        self._database.execute_batch_no_returns.side_effect = RuntimeError('Lost connection')
+
+        instance = self.get_instance_of_tested_cls(flush_interval_ms=0)
+
+        # Operate
+        instance.enqueue(1, query=query)
+
+        # Check
+        with self.assertRaises(expected_exception=OperationFailedWritesAreLost):
+            instance.flush()
+
+        # Operate
+        instance.enqueue(2, query=query)
+
+        # Check
+        with self.assertRaises(expected_exception=OperationFailedWritesAreLost):
+            instance.close()
+
+        self.assertEqual(
+            first=self._database.notify_logger_observers.call_count,
+            second=2
+        )
+        self._database.log_entry_factory.create_new_log_entry.assert_called_with(
+            level='Error',
+            msg_text=UM.ANY,
+            context=f'WriteBehindQueue: {query}'
+        )
+
+    # -----------------------------------------------------------------------------------
+    def test_flush_behavior_waits_for_database_connection_lock(self) -> None:
+        # Build
+        database = SingleConnectionDataBase()
+        conn_manager = UM.MagicMock(spec=SingleConnectionManager)
+        cursor = conn_manager.get_connection.return_value.get_cursor.return_value
+        query: str = 'INSERT INTO berry (id) VALUES (?)'
+
+        # Prepare instance
+        database.set_new_connection_manager(new_manager=conn_manager)
+        instance = self.get_instance_of_tested_cls(database=database, flush_interval_ms=0)
+
+        # Operate: подключение занято потоком теста
+        with database._connection_lock:
+            instance.enqueue(1, query=query)
+            time.sleep(0.05)
+
+            # Check
+            cursor.executemany.assert_not_called()
+
+        instance.flush()
+
+        # Post-Check
+        cursor.executemany.assert_called_once_with(query=query, data=[(1,)])
+        instance.close()
+
+    # -----------------------------------------------------------------------------------
+    def test_null_object_behavior(self) -> None:
+        # Build
+        method_calls: Dict[str, Dict[str, Any]] = {
+            'enqueue': {
+                'query': GeneratingToolKit.generate_random_string()
+            },
+            'flush': {},
+            'get_pending_count': {},
+            'close': {},
+        }  # Param name & kwargs
+
+        # Prepare data
+        calls: List[MethodCall] = [
+            MethodCall(method_name=name, kwargs=kwargs)
+            for name, kwargs in method_calls.items()
+        ]
+
+        # Operate
+        instance = NoWriteBehindQueue()
+
+        # Check
+        self.assertTrue(
+            expr=InspectingToolKit.check_all_methods_raise_expected_exception_for_null_object(
+                obj=instance,
+                method_calls=calls,
+                exception_type=IsNullObjectOperation
+            )
+        )
+
+
+# _______________________________________________________________________________________
+class TestComponentNegative(BaseTestComponent):
+
+    # -----------------------------------------------------------------------------------
+    def test_enqueue_behavior_applies_backpressure_when_queue_is_full(self) -> None:
+        # Build
+        expected_exception = OperationFailedQueueIsFull
+        query: str = 'INSERT INTO berry (id) VALUES (?)'
+        write_is_released = threading.Event()
+
+        # Prepare mock
+        self._database.execute_batch_no_returns.side_effect = \
+            lambda **kwargs: write_is_released.wait(timeout=5)
+
+        instance = self.get_instance_of_tested_cls(max_queue_size=1, batch_size=1)
+
+        # Operate
+        instance.enqueue(1, query=query)  # Забирается обработчиком и блокирует его
+        instance.enqueue(2, query=query)  # Занимает единственное место в очереди
+
+        # Check
+        with self.assertRaises(expected_exception=expected_exception):
+            # Operate
+            instance.enqueue(3, query=query, timeout=0.05)
+
+        # Post-Check
+        write_is_released.set()
+        instance.close()
+        self.assertEqual(
+            first=self._database.execute_batch_no_returns.call_count,
+            second=2
+        )
+
+    # -----------------------------------------------------------------------------------
+    def test_enqueue_behavior_when_queue_is_closed(self) -> None:
+        # Build
+        expected_exception = OperationFailedComponentIsClosed
+        instance = self.get_instance_of_tested_cls()
+
+        # Prepare instance
+        instance.close()
+
+        # Prepare check context
+        with self.assertRaises(expected_exception=expected_exception):
+            # Operate
+            instance.enqueue(1, query='INSERT INTO berry (id) VALUES (?)')
+
+    # -----------------------------------------------------------------------------------
+    def test_constructor_behavior_when_pass_invalid_types(self) -> None:
+        # Build
+        expected_exception = InvalidArgumentTypeError
+        invalid_types: List[Any] = GeneratingToolKit.generate_list_of_basic_python_types()
+
+        # Prepare test cycle
+        for invalid_type in invalid_types:
+            with self.subTest(pattern=invalid_type):
+                # Check
+                with self.assertRaises(expected_exception=expected_exception):
+                    # Operate
+                    tested_cls(database=invalid_type)
@@ -10,10 +10,10 @@ __all__: list[str] = [
 ]
 
 __author__ = 'kichiro-kun (Kei)'
-__version__ = '0.1.2'
+__version__ = '0.4.1'
 
 # =======================================================================================
-from typing import Dict, Any
+from typing import Dict, Any, Iterable, Sequence
 
 from dbms_interaction.adapters_component.connection.abstract.connection_interface import ConnectionInterface
 
@@ -43,3 +43,16 @@ class AdapterStub(ConnectionInterface):
 
     def rollback(self) -> bool:
         pass
+
+    def set_autocommit(self, enabled: bool) -> bool:
+        pass
+
+    def get_autocommit(self) -> bool:
+        pass
+
+    def get_connection_id(self) -> int:
+        pass
+
+    def bulk_load(self, table: str, columns: Sequence[str],
+                  rows: Iterable[Sequence[Any]] = (), file_path: str = '') -> Any:
+        pass
@@ -11,7 +11,7 @@ __all__: list[str] = [
 ]
 
 __author__ = 'kichiro-kun (Kei)'
-__version__ = '0.7.0'
+__version__ = '0.13.0'
 
 # ========================================================================================
 from unittest import mock as UM
@@ -202,6 +202,28 @@ class TestMySQLAdapterPositive(BaseConnectionTestCase):
             second=expected_answer
         )
 
+    # -----------------------------------------------------------------------------------
+    def test_get_connection_id_behavior(self) -> None:
+        # Build
+        connector: UM.MagicMock = self._connector
+
+        instance = self.get_instance_of_tested_cls(
+            connector=connector
+        )
+
+        # Prepare mock
+        connector.is_connected.return_value = True
+        connector.connection_id = 42
+
+        # Operate
+        actual_id: int = instance.get_connection_id()
+
+        # Check
+        self.assertEqual(
+            first=actual_id,
+            second=42
+        )
+
     # -----------------------------------------------------------------------------------
     def test_ping_behavior_when_not_raise_exception(self) -> None:
         # Build
@@ -303,6 +325,38 @@ class TestMySQLAdapterPositive(BaseConnectionTestCase):
                 special_placeholder=placeholder
             )
 
+    # -----------------------------------------------------------------------------------
+    def test_get_cursor_behavior_pass_unbuffered_and_raw_modes(self) -> None:
+        # Build
+        connector: UM.MagicMock = self._connector
+
+        # Prepare instance
+        instance = self.get_instance_of_tested_cls(
+            connector=connector
+        )
+
+        # Prepare test context
+        with UM.patch.object(target=tested_module,
+                             attribute='MySQLAdapterCursor',
+                             autospec=True) as mock_cursor_adapter:
+
+            # Operate
+            instance.get_cursor(
+                unbuffered=True
+            )
+            instance.get_cursor(
+                raw=True
+            )
+
+            # Check
+            self.assertListEqual(
+                list1=mock_cursor_adapter.call_args_list,
+                list2=[
+                    UM.call(connector=connector, unbuffered=True),
+                    UM.call(connector=connector, raw=True),
+                ]
+            )
+
     # -----------------------------------------------------------------------------------
     def test_commit_behavior_when_connection_is_exists(self) -> None:
         # Build
@@ -332,6 +386,219 @@ class TestMySQLAdapterPositive(BaseConnectionTestCase):
             expr=InspectingToolKit.is_boolean_True(obj=op_result)
         )
 
+    # -----------------------------------------------------------------------------------
+    def test_rollback_behavior_when_connection_is_exists(self) -> None:
+        # Build
+        connector: UM.MagicMock = self._connector
+
+        instance = self.get_instance_of_tested_cls(
+            connector=connector
+        )
+
+        # Prepare check context
+        with UM.patch.object(target=instance, attribute='is_active') as mock_method_is_active:
+            # Prepare mock
+            mock_method_is_active.return_value = True
+
+            # Operate
+            op_result: bool = instance.rollback()
+
+            # Check
+            mock_method_is_active.assert_called_once()
+            connector.rollback.assert_called_once()
+
+            # Post-Check
+            self.assertTrue(
+                expr=InspectingToolKit.is_boolean_True(obj=op_result)
+            )
+
+    # -----------------------------------------------------------------------------------
+    def test_set_autocommit_behavior_sends_only_changed_mode(self) -> None:
+        # Build
+        connector: UM.MagicMock = self._connector
+
+        instance = self.get_instance_of_tested_cls(
+            connector=connector
+        )
+
+        # Prepare check context
+        with UM.patch.object(target=instance, attribute='is_active') as mock_method_is_active:
+            # Prepare mock
+            mock_method_is_active.return_value = True
+
+            # Operate
+            first_result: bool = instance.set_autocommit(enabled=True)
+            second_result: bool = instance.set_autocommit(enabled=True)
+
+            # Check
+            self.assertIs(
+                expr1=connector.autocommit,
+                expr2=True
+            )
+            self.assertTrue(
+                expr=InspectingToolKit.is_boolean_True(obj=first_result)
+            )
+            self.assertTrue(
+                expr=InspectingToolKit.is_boolean_False(obj=second_result)
+            )
+
+            # Operate
+            third_result: bool = instance.set_autocommit(enabled=False)
+
+            # Post-Check
+            self.assertIs(
+                expr1=connector.autocommit,
+                expr2=False
+            )
+            self.assertTrue(
+                expr=InspectingToolKit.is_boolean_True(obj=third_result)
+            )
+
+    # -----------------------------------------------------------------------------------
+    def test_set_autocommit_behavior_after_connect(self) -> None:
+        # Build
+        config: Dict[str, Any] = self.get_new_connection_config()
+        connector: UM.MagicMock = self._connector
+
+        instance = self.get_instance_of_tested_cls(
+            connector=connector
+        )
+
+        # Prepare check context
+        with UM.patch.object(target=instance, attribute='is_active') as mock_method_is_active:
+            # Prepare mock
+            mock_method_is_active.return_value = True
+
+            # Pre-Operate
+            instance.connect(config=config)
+
+            # Operate
+            op_result: bool = instance.set_autocommit(enabled=False)
+
+            # Check
+            self.assertTrue(
+                expr=InspectingToolKit.is_boolean_False(obj=op_result)
+            )
+
+    # -----------------------------------------------------------------------------------
+    def test_bulk_load_behavior_streams_escaped_rows_through_temporary_file(self) -> None:
+        import os
+
+        # Build
+        connector: UM.MagicMock = self._connector
+        cursor: UM.MagicMock = connector.cursor.return_value
+        rows = [
+            (1, 'plain', None),
+            (2, 'tab\tnew\nline\\slash', b'\x00bin'),
+            (3, 'skipped', True),
+        ]
+        expected_content: bytes = (
+            b'1\tplain\t\\N\n'
+            b'2\ttab\\tnew\\nline\\\\slash\t\\0bin\n'
+            b'3\tskipped\t1\n'
+        )
+        captured: Dict[str, Any] = {}
+
+        instance = self.get_instance_of_tested_cls(
+            connector=connector
+        )
+
+        # Prepare mock
+        def capture_load_data_file(statement: str, params: Tuple[str]) -> None:
+            captured['statement'] = statement
+            captured['path'] = params[0]
+
+            with open(params[0], mode='rb') as load_file:
+                captured['content'] = load_file.read()
+
+        cursor.execute.side_effect = capture_load_data_file
+        cursor.rowcount = 2
+        cursor.warning_count = 1
+
+        # Prepare check context
+        with UM.patch.object(target=instance, attribute='is_active') as mock_method_is_active:
+            # Prepare mock
+            mock_method_is_active.return_value = True
+
+            # Operate
+            op_result = instance.bulk_load(
+                table='berry', columns=('id', 'title', 'payload'), rows=iter(rows)
+            )
+
+        # Check
+        self.assertTrue(
+            expr=captured['statement'].startswith('LOAD DATA LOCAL INFILE %s INTO TABLE berry')
+        )
+        self.assertTrue(
+            expr=captured['statement'].endswith('(id, title, payload)')
+        )
+        self.assertEqual(
+            first=captured['content'],
+            second=expected_content
+        )
+        self.assertEqual(
+            first=op_result,
+            second=(2, 1, 1)
+        )
+
+        # Post-Check
+        cursor.close.assert_called_once()
+        self.assertFalse(
+            expr=os.path.exists(captured['path'])
+        )
+
+    # -----------------------------------------------------------------------------------
+    def test_bulk_load_behavior_loads_csv_file(self) -> None:
+        import os
+        import tempfile
+
+        # Build
+        connector: UM.MagicMock = self._connector
+        cursor: UM.MagicMock = connector.cursor.return_value
+
+        instance = self.get_instance_of_tested_cls(
+            connector=connector
+        )
+
+        # Prepare data
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False,
+                                         encoding='utf-8', newline='') as csv_file:
+            csv_file.write('1,"multi\nline"\n2,plain\n3,plain\n')
+
+        # Prepare mock
+        cursor.rowcount = 3
+        cursor.warning_count = 0
+
+        try:
+            # Prepare check context
+            with UM.patch.object(target=instance, attribute='is_active') as mock_method_is_active:
+                # Prepare mock
+                mock_method_is_active.return_value = True
+
+                # Operate
+                op_result = instance.bulk_load(
+                    table='berry', columns=('id', 'title'), file_path=csv_file.name
+                )
+        finally:
+            os.remove(csv_file.name)
+
+        # Extract
+        statement, params = cursor.execute.call_args.args
+
+        # Check
+        self.assertIn(
+            member="OPTIONALLY ENCLOSED BY '\"'",
+            container=statement
+        )
+        self.assertEqual(
+            first=params,
+            second=(csv_file.name,)
+        )
+        self.assertEqual(
+            first=op_result,
+            second=(3, 0, 0)
+        )
+
 
 # _______________________________________________________________________________________
 class TestMySQLAdapterNegative(BaseConnectionTestCase):
@@ -441,3 +708,107 @@ class TestMySQLAdapterNegative(BaseConnectionTestCase):
             self.assertTrue(
                 expr=InspectingToolKit.is_boolean_False(obj=op_result)
             )
+
+    # -----------------------------------------------------------------------------------
+    def test_rollback_behavior_when_connection_is_not_exists(self) -> None:
+        # Build
+        connector: UM.MagicMock = self._connector
+
+        instance = self.get_instance_of_tested_cls(
+            connector=connector
+        )
+
+        # Prepare check context
+        with UM.patch.object(target=instance, attribute='is_active') as mock_method_is_active:
+            # Prepare mock
+            mock_method_is_active.return_value = False
+
+            # Operate
+            op_result: bool = instance.rollback()
+
+            # Check
+            mock_method_is_active.assert_called_once()
+            connector.rollback.assert_not_called()
+
+            # Post-Check
+            self.assertTrue(
+                expr=InspectingToolKit.is_boolean_False(obj=op_result)
+            )
+
+    # -----------------------------------------------------------------------------------
+    def test_set_autocommit_behavior_when_connection_is_not_exists(self) -> None:
+        # Build
+        connector: UM.MagicMock = self._connector
+        expected_mode = UM.sentinel.untouched_mode
+
+        instance = self.get_instance_of_tested_cls(
+            connector=connector
+        )
+
+        # Prepare mock
+        connector.autocommit = expected_mode
+
+        # Prepare check context
+        with UM.patch.object(target=instance, attribute='is_active') as mock_method_is_active:
+            # Prepare mock
+            mock_method_is_active.return_value = False
+
+            # Operate
+            op_result: bool = instance.set_autocommit(enabled=True)
+
+            # Check
+            self.assertIs(
+                expr1=connector.autocommit,
+                expr2=expected_mode
+            )
+            self.assertTrue(
+                expr=InspectingToolKit.is_boolean_False(obj=op_result)
+            )
+
+    # -----------------------------------------------------------------------------------
+    def test_set_autocommit_behavior_when_pass_invalid_types(self) -> None:
+        from shared.exceptions.common import InvalidArgumentTypeError
+
+        # Build
+        expected_exception = InvalidArgumentTypeError
+        invalid_types = [
+            invalid_type for invalid_type in GeneratingToolKit.generate_list_of_basic_python_types()
+            if not isinstance(invalid_type, bool)
+        ]
+
+        instance = self.get_instance_of_tested_cls(
+            connector=self._connector
+        )
+
+        # Prepare test cycle
+        for invalid_type in invalid_types:
+            with self.subTest(pattern=invalid_type):
+                # Check
+                with self.assertRaises(expected_exception=expected_exception):
+                    # Operate
+                    instance.set_autocommit(enabled=invalid_type)
+
+    # -----------------------------------------------------------------------------------
+    def test_bulk_load_behavior_when_connection_is_not_exists(self) -> None:
+        from shared.exceptions.common import OperationFailedConnectionIsNotActive
+
+        # Build
+        connector: UM.MagicMock = self._connector
+        expected_exception = OperationFailedConnectionIsNotActive
+
+        instance = self.get_instance_of_tested_cls(
+            connector=connector
+        )
+
+        # Prepare check context
+        with UM.patch.object(target=instance, attribute='is_active') as mock_method_is_active:
+            # Prepare mock
+            mock_method_is_active.return_value = False
+
+            # Prepare check context
+            with self.assertRaises(expected_exception=expected_exception):
+                # Operate
+                instance.bulk_load(table='berry', columns=('id',), rows=[(1,)])
+
+            # Post-Check
+            connector.cursor.assert_not_called()
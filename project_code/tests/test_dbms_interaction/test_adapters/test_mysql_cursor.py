@@ -10,7 +10,7 @@ __all__: list[str] = [
 ]
 
 __author__ = 'kichiro-kun (Kei)'
-__version__ = '0.4.0'
+__version__ = '0.8.0'
 
 # ========================================================================================
 from unittest import mock as UM
@@ -89,6 +89,35 @@ class TestMySQLAdapterPositive(BaseTestCase):
         # Check
         expected_connection.cursor.assert_called_once()
 
+    # -----------------------------------------------------------------------------------
+    def test_constructor_behavior_when_pass_unbuffered_mode(self) -> None:
+        # Build
+        expected_connection: UM.MagicMock = self._current_connection
+
+        # Operate
+        self.get_instance_of_tested_cls(
+            connector=expected_connection,
+            unbuffered=True
+        )
+
+        # Check
+        expected_connection.cursor.assert_called_once_with(buffered=False)
+
+    # -----------------------------------------------------------------------------------
+    def test_constructor_behavior_when_pass_raw_mode(self) -> None:
+        # Build
+        expected_connection: UM.MagicMock = self._current_connection
+
+        # Operate
+        self.get_instance_of_tested_cls(
+            connector=expected_connection,
+            unbuffered=True,
+            raw=True
+        )
+
+        # Check
+        expected_connection.cursor.assert_called_once_with(buffered=False, raw=True)
+
     # -----------------------------------------------------------------------------------
     def test_method_execute_behavior(self) -> None:
         # Build
@@ -303,6 +332,116 @@ class TestMySQLAdapterPositive(BaseTestCase):
             second=fetched_data
         )
 
+    # -----------------------------------------------------------------------------------
+    def test_fetch_methods_behavior_apply_row_factory(self) -> None:
+        from dbms_interaction.row_factory_component.row_factory import RowFactory
+
+        # Build
+        expected_cursor: UM.MagicMock = self._current_cursor
+        rows: List[Tuple[int, str]] = [(1, 'a'), (2, 'b')]
+
+        # Prepare mock
+        expected_cursor.column_names = ['id', 'title']
+        expected_cursor.fetchall.return_value = rows
+        expected_cursor.fetchmany.return_value = rows[:1]
+        expected_cursor.fetchone.side_effect = [rows[1], None]
+
+        # Prepare instance
+        instance = self.get_instance_of_tested_cls(
+            connector=self._current_connection
+        )
+        instance.set_row_factory(factory=RowFactory.DICT)
+
+        # Operate
+        all_rows = instance.fetchall()
+        many_rows = instance.fetchmany(count=1)
+        one_row = instance.fetchone()
+        missing_row = instance.fetchone()
+
+        # Check
+        self.assertListEqual(
+            list1=all_rows,
+            list2=[{'id': 1, 'title': 'a'}, {'id': 2, 'title': 'b'}]
+        )
+        self.assertListEqual(
+            list1=many_rows,
+            list2=[{'id': 1, 'title': 'a'}]
+        )
+        self.assertDictEqual(
+            d1=one_row,
+            d2={'id': 2, 'title': 'b'}
+        )
+
+        # Post-Check
+        self.assertIsNone(obj=missing_row)
+
+    # -----------------------------------------------------------------------------------
+    def test_method_set_row_factory_behavior_when_pass_invalid_types(self) -> None:
+        from shared.exceptions.common import InvalidArgumentTypeError
+
+        # Build
+        invalid_types: List[Any] = GeneratingToolKit.generate_list_of_basic_python_types()
+        instance = self.get_instance_of_tested_cls(
+            connector=self._current_connection
+        )
+
+        # Prepare test cycle
+        for invalid_type in invalid_types:
+            with self.subTest(pattern=invalid_type):
+                # Check
+                with self.assertRaises(expected_exception=InvalidArgumentTypeError):
+                    # Operate
+                    instance.set_row_factory(factory=invalid_type)
+
+    # -----------------------------------------------------------------------------------
+    def test_method_fetch_columnar_behavior(self) -> None:
+        from array import array
+
+        # Build
+        expected_cursor: UM.MagicMock = self._current_cursor
+
+        # Prepare mock
+        expected_cursor.column_names = ['id', 'title']
+        expected_cursor.fetchmany.side_effect = [[(1, 'a'), (2, 'b')], [(3, 'c')], []]
+
+        # Prepare instance
+        instance = self.get_instance_of_tested_cls(
+            connector=self._current_connection
+        )
+
+        # Operate
+        op_result = instance.fetch_columnar(chunk_size=2, use_numpy=False)
+
+        # Check
+        self.assertDictEqual(
+            d1=op_result,
+            d2={'id': array('q', [1, 2, 3]), 'title': ['a', 'b', 'c']}
+        )
+        expected_cursor.fetchmany.assert_called_with(size=2)
+
+    # -----------------------------------------------------------------------------------
+    def test_method_get_column_names_behavior(self) -> None:
+        # Build
+        expected_cursor: UM.MagicMock = self._current_cursor
+        expected_names: Tuple[str, ...] = ('id', 'title', 'price')
+
+        # Prepare mock
+        expected_cursor.column_names = list(expected_names)
+
+        # Prepare instance
+        instance = self.get_instance_of_tested_cls(
+            connector=self._current_connection
+        )
+
+        # Operate
+        op_result = instance.get_column_names()
+
+        # Check
+        self.assertEqual(
+            first=op_result,
+            second=expected_names
+        )
+
     # -----------------------------------------------------------------------------------
     def test_method_replace_placeholder_to_dbms_default_behavior_calls(self) -> None:
         # Build
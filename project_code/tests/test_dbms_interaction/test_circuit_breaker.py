@@ -0,0 +1,232 @@
+# -*- coding: utf-8 -*-
+
+"""
+Copyright 2025 kichiro-kun (Kei)
+Apache license, version 2.0 (Apache-2.0 license)
+"""
+
+__all__: list[str] = [
+    'TestComponentPositive',
+    'TestComponentNegative',
+]
+
+__author__ = 'kichiro-kun (Kei)'
+__version__ = '0.2.0'
+
+# ========================================================================================
+from unittest import mock as UM
+from typing import Any, List
+
+from dbms_interaction.circuit_breaker_component.circuit_breaker \
+    import CircuitBreakerState, NoCircuitBreaker, CircuitBreaker as tested_cls
+
+from shared.exceptions.common import InvalidArgumentTypeError, InvalidArgumentValueError, \
+    IsNullObjectOperation, OperationFailedCircuitIsOpen
+
+from tests.utils.base_test_case_cls import BaseTestCase
+from tests.utils.toolkit import *
+
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+class BaseTestComponent(BaseTestCase[tested_cls]):
+
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    def setUp(self) -> None:
+        super().setUp()
+
+        # Часы предохранителя управляются тестом
+        self.now: float = 1000.0
+        time_patcher = UM.patch(
+            target='dbms_interaction.circuit_breaker_component.circuit_breaker.time'
+        )
+        mock_time: UM.MagicMock = time_patcher.start()
+        mock_time.monotonic.side_effect = lambda: self.now
+        self.addCleanup(time_patcher.stop)
+
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    def get_instance_of_tested_cls(self, **kwargs) -> tested_cls:
+        kwargs.setdefault('window_size', 4)
+        kwargs.setdefault('minimum_calls', 4)
+        kwargs.setdefault('open_duration', 10.0)
+        kwargs.setdefault('half_open_calls', 2)
+
+        return tested_cls(**kwargs)
+
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    def record_failures(self, instance: tested_cls, times: int = 1) -> None:
+        for _ in range(times):
+            with self.assertRaises(expected_exception=ConnectionError):
+                instance.call(operation=UM.MagicMock(side_effect=ConnectionError('Server is gone')))
+
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    def slow_call(self, duration: float) -> Any:
+        self.now += duration
+
+        return 'slow'
+
+
+# _______________________________________________________________________________________
+class TestComponentPositive(BaseTestComponent):
+
+    # -----------------------------------------------------------------------------------
+    def test_null_object_realization(self) -> None:
+        # Build
+        calls: List[MethodCall] = [
+            MethodCall(method_name='call', kwargs={'operation': None}),
+            MethodCall(method_name='get_state', kwargs={}),
+            MethodCall(method_name='reset', kwargs={}),
+        ]
+
+        # Operate
+        instance = NoCircuitBreaker()
+
+        # Check
+        self.assertTrue(
+            expr=InspectingToolKit.check_all_methods_raise_expected_exception_for_null_object(
+                obj=instance,
+                method_calls=calls,
+                exception_type=IsNullObjectOperation
+            )
+        )
+
+    # -----------------------------------------------------------------------------------
+    def test_call_behavior_opens_on_failure_rate_and_fails_fast(self) -> None:
+        # Build
+        instance = self.get_instance_of_tested_cls()
+        operation = UM.MagicMock(return_value='row')
+
+        # Operate
+        instance.call(operation=operation)
+        instance.call(operation=operation)
+        self.record_failures(instance=instance, times=2)
+
+        # Check
+        self.assertIs(
+            expr1=instance.get_state(),
+            expr2=CircuitBreakerState.OPEN
+        )
+
+        operation.reset_mock()
+        with self.assertRaises(expected_exception=OperationFailedCircuitIsOpen):
+            # Operate
+            instance.call(operation=operation)
+
+        # Post-Check
+        operation.assert_not_called()
+
+    # -----------------------------------------------------------------------------------
+    def test_call_behavior_opens_on_slow_call_rate(self) -> None:
+        # Build
+        instance = self.get_instance_of_tested_cls(slow_call_duration=1.0, slow_call_rate_threshold=0.5)
+
+        # Operate
+        for duration in (0.1, 2.0, 0.1, 3.0):
+            instance.call(operation=lambda duration=duration: self.slow_call(duration=duration))
+
+        # Check
+        self.assertIs(
+            expr1=instance.get_state(),
+            expr2=CircuitBreakerState.OPEN
+        )
+
+    # -----------------------------------------------------------------------------------
+    def test_call_behavior_closes_after_successful_half_open_trials(self) -> None:
+        # Build
+        instance = self.get_instance_of_tested_cls()
+        self.record_failures(instance=instance, times=4)
+
+        # Operate
+        self.now += 10.0
+
+        # Check
+        self.assertIs(
+            expr1=instance.get_state(),
+            expr2=CircuitBreakerState.HALF_OPEN
+        )
+
+        # Operate
+        instance.call(operation=UM.MagicMock(return_value='row'))
+        instance.call(operation=UM.MagicMock(return_value='row'))
+
+        # Check
+        self.assertIs(
+            expr1=instance.get_state(),
+            expr2=CircuitBreakerState.CLOSED
+        )
+
+    # -----------------------------------------------------------------------------------
+    def test_call_behavior_ignores_caller_errors(self) -> None:
+        # Build
+        instance = self.get_instance_of_tested_cls()
+
+        # Operate
+        for _ in range(4):
+            with self.assertRaises(expected_exception=InvalidArgumentValueError):
+                instance.call(operation=UM.MagicMock(side_effect=InvalidArgumentValueError()))
+
+        # Check
+        self.assertIs(
+            expr1=instance.get_state(),
+            expr2=CircuitBreakerState.CLOSED
+        )
+
+
+    # -----------------------------------------------------------------------------------
+    def test_call_behavior_does_not_record_query_errors(self) -> None:
+        from mysql.connector.errors import IntegrityError
+
+        # Build
+        instance = self.get_instance_of_tested_cls()
+
+        # Operate: серия вставок с дубликатом ключа не говорит о недоступности сервера
+        for _ in range(10):
+            with self.assertRaises(expected_exception=IntegrityError):
+                instance.call(operation=UM.MagicMock(side_effect=IntegrityError(msg='Duplicate entry', errno=1062)))
+
+        # Check
+        self.assertIs(
+            expr1=instance.get_state(),
+            expr2=CircuitBreakerState.CLOSED
+        )
+
+
+# _______________________________________________________________________________________
+class TestComponentNegative(BaseTestComponent):
+
+    # -----------------------------------------------------------------------------------
+    def test_call_behavior_reopens_when_half_open_trial_fails(self) -> None:
+        # Build
+        instance = self.get_instance_of_tested_cls()
+        self.record_failures(instance=instance, times=4)
+        self.now += 10.0
+
+        # Operate
+        self.record_failures(instance=instance)
+
+        # Check
+        self.assertIs(
+            expr1=instance.get_state(),
+            expr2=CircuitBreakerState.OPEN
+        )
+
+    # -----------------------------------------------------------------------------------
+    def test_constructor_behavior_when_pass_invalid_arguments(self) -> None:
+        # Check
+        with self.assertRaises(expected_exception=InvalidArgumentTypeError):
+            # Operate
+            self.get_instance_of_tested_cls(failure_rate_threshold='half')
+
+        # Check
+        with self.assertRaises(expected_exception=InvalidArgumentValueError):
+            # Operate
+            self.get_instance_of_tested_cls(window_size=0)
+
+        # Check
+        with self.assertRaises(expected_exception=InvalidArgumentTypeError):
+            # Operate
+            self.get_instance_of_tested_cls().call(operation='SELECT 1')
+
+        # Check
+        with self.assertRaises(expected_exception=InvalidArgumentTypeError):
+            # Operate
+            self.get_instance_of_tested_cls(recorded_exceptions=(KeyboardInterrupt,))
@@ -0,0 +1,161 @@
+# -*- coding: utf-8 -*-
+
+"""
+Copyright 2025 kichiro-kun (Kei)
+Apache license, version 2.0 (Apache-2.0 license)
+"""
+
+__all__: list[str] = [
+    'TestComponentPositive',
+]
+
+__author__ = 'kichiro-kun (Kei)'
+__version__ = '0.2.0'
+
+# ========================================================================================
+from array import array
+from decimal import Decimal
+from unittest import mock as UM
+from typing import Any, Dict
+
+import dbms_interaction.columnar_fetch_component.columnar_result_builder as tested_module
+from dbms_interaction.columnar_fetch_component.columnar_result_builder \
+    import ColumnarResultBuilder as tested_cls
+
+from shared.exceptions.common import InvalidArgumentTypeError
+
+from tests.utils.base_test_case_cls import BaseTestCase
+
+
+# _______________________________________________________________________________________
+class TestComponentPositive(BaseTestCase[tested_cls]):
+
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    def get_instance_of_tested_cls(self, **kwargs) -> tested_cls:
+        kwargs.setdefault('column_names', ('id', 'price', 'title', 'weight'))
+
+        return tested_cls(**kwargs)
+
+    # -----------------------------------------------------------------------------------
+    def test_build_behavior_fills_typed_arrays_by_chunks(self) -> None:
+        # Build
+        instance = self.get_instance_of_tested_cls()
+
+        # Operate
+        instance.append_rows(rows=[(1, 1.5, 'a', 10), (2, 2.5, 'b', 20)])
+        instance.append_rows(rows=[(3, 3, 'c', None)])
+        columns: Dict[str, Any] = instance.build(use_numpy=False)
+
+        # Check
+        self.assertEqual(
+            first=columns['id'],
+            second=array('q', [1, 2, 3])
+        )
+        self.assertEqual(
+            first=columns['price'],
+            second=array('d', [1.5, 2.5, 3.0])
+        )
+        self.assertListEqual(
+            list1=columns['title'],
+            list2=['a', 'b', 'c']
+        )
+
+        # Post-Check
+        self.assertListEqual(
+            list1=columns['weight'],
+            list2=[10, 20, None]
+        )
+        self.assertEqual(
+            first=instance.get_rows_count(),
+            second=3
+        )
+
+    # -----------------------------------------------------------------------------------
+    def test_build_behavior_keeps_unsupported_and_overflowed_values_in_lists(self) -> None:
+        # Build
+        instance = self.get_instance_of_tested_cls(column_names=('amount', 'big'))
+
+        # Operate
+        instance.append_rows(rows=[(Decimal('1.10'), 1), (Decimal('2.20'), 2 ** 64)])
+        columns: Dict[str, Any] = instance.build(use_numpy=False)
+
+        # Check
+        self.assertListEqual(
+            list1=columns['amount'],
+            list2=[Decimal('1.10'), Decimal('2.20')]
+        )
+        self.assertListEqual(
+            list1=columns['big'],
+            list2=[1, 2 ** 64]
+        )
+
+    # -----------------------------------------------------------------------------------
+    def test_append_rows_behavior_does_not_duplicate_values_on_mid_chunk_fallback(self) -> None:
+        # Build
+        null_instance = self.get_instance_of_tested_cls(column_names=('id',))
+        overflow_instance = self.get_instance_of_tested_cls(column_names=('id',))
+
+        # Operate
+        for instance, second_chunk in ((null_instance, [(3,), (None,), (5,)]),
+                                       (overflow_instance, [(3,), (2 ** 70,)])):
+            instance.append_rows(rows=[(1,), (2,)])
+            instance.append_rows(rows=second_chunk)
+
+        # Check
+        self.assertListEqual(
+            list1=null_instance.build(use_numpy=False)['id'],
+            list2=[1, 2, 3, None, 5]
+        )
+        self.assertListEqual(
+            list1=overflow_instance.build(use_numpy=False)['id'],
+            list2=[1, 2, 3, 2 ** 70]
+        )
+
+    # -----------------------------------------------------------------------------------
+    def test_build_behavior_wraps_arrays_with_numpy_when_available(self) -> None:
+        # Build
+        instance = self.get_instance_of_tested_cls(column_names=('id', 'title'))
+        mock_numpy = UM.MagicMock()
+
+        # Prepare instance
+        instance.append_rows(rows=[(1, 'a'), (2, 'b')])
+
+        # Prepare test context
+        with UM.patch.object(target=tested_module, attribute='np', new=mock_numpy):
+            # Operate
+            columns: Dict[str, Any] = instance.build()
+
+        # Check
+        mock_numpy.frombuffer.assert_called_once_with(
+            array('q', [1, 2]), dtype=mock_numpy.dtype.return_value
+        )
+        mock_numpy.dtype.assert_called_once_with('q')
+        self.assertIs(
+            expr1=columns['id'],
+            expr2=mock_numpy.frombuffer.return_value
+        )
+
+        # Post-Check
+        self.assertListEqual(
+            list1=columns['title'],
+            list2=['a', 'b']
+        )
+
+    # -----------------------------------------------------------------------------------
+    def test_build_behavior_when_no_rows_and_invalid_flag(self) -> None:
+        # Build
+        instance = self.get_instance_of_tested_cls(column_names=('id',))
+
+        # Operate
+        columns: Dict[str, Any] = instance.build(use_numpy=False)
+
+        # Check
+        self.assertDictEqual(
+            d1=columns,
+            d2={'id': []}
+        )
+
+        # Check
+        with self.assertRaises(expected_exception=InvalidArgumentTypeError):
+            # Operate
+            instance.build(use_numpy='yes')
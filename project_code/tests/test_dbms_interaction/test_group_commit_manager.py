@@ -0,0 +1,306 @@
+# -*- coding: utf-8 -*-
+
+"""
+Copyright 2025 kichiro-kun (Kei)
+Apache license, version 2.0 (Apache-2.0 license)
+"""
+
+__all__: list[str] = [
+    'TestComponentPositive',
+    'TestComponentNegative',
+]
+
+__author__ = 'kichiro-kun (Kei)'
+__version__ = '0.3.0'
+
+# ========================================================================================
+import threading
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from unittest import mock as UM
+from typing import Any, List
+
+from dbms_interaction.group_commit_component.group_commit_manager \
+    import GroupCommitManager as tested_cls
+from dbms_interaction.transaction_manager_component.transaction_manager import TransactionManager
+from dbms_interaction.adapters_component.connection.realizations.mysql_adapter_connection \
+    import MySQLAdapterConnection
+
+from shared.exceptions.common import InvalidArgumentTypeError, OperationFailedComponentIsClosed, \
+    OperationFailedComponentIsReserved
+
+from tests.utils.base_test_case_cls import BaseTestCase
+from tests.utils.toolkit import GeneratingToolKit
+
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+class BaseTestComponent(BaseTestCase[tested_cls]):
+
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    def setUp(self) -> None:
+        super().setUp()
+
+        self._transaction_manager: UM.MagicMock = UM.MagicMock(spec=TransactionManager)
+        self._transaction_manager.connection_lock = threading.RLock()
+
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    def get_instance_of_tested_cls(self, **kwargs) -> tested_cls:
+        kwargs.setdefault('transaction_manager', self._transaction_manager)
+
+        return tested_cls(**kwargs)
+
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    def get_executed_queries(self) -> List[str]:
+        return [
+            call.kwargs['query']
+            for call in self._transaction_manager.execute_in_active_transaction.call_args_list
+        ]
+
+
+# _______________________________________________________________________________________
+class TestComponentPositive(BaseTestComponent):
+
+    # -----------------------------------------------------------------------------------
+    def test_submit_behavior_applies_units_in_one_transaction(self) -> None:
+        # Build
+        units_count: int = 4
+        expected_results: List[str] = [
+            GeneratingToolKit.generate_random_string() for _ in range(units_count)
+        ]
+        units: List[UM.MagicMock] = [
+            UM.MagicMock(return_value=result) for result in expected_results
+        ]
+
+        instance = self.get_instance_of_tested_cls(
+            max_batch_size=units_count, max_delay_ms=10_000
+        )
+
+        # Operate
+        futures: List[Future] = [instance.submit(unit=unit) for unit in units]
+        actual_results: List[Any] = [future.result(timeout=5) for future in futures]
+        instance.close()
+
+        # Check
+        self.assertListEqual(
+            list1=actual_results,
+            list2=expected_results
+        )
+        self._transaction_manager.begin.assert_called_once()
+        self._transaction_manager.commit.assert_called_once()
+        self._transaction_manager.rollback.assert_not_called()
+
+        # Post-Check
+        for unit in units:
+            unit.assert_called_once_with(self._transaction_manager)
+
+    # -----------------------------------------------------------------------------------
+    def test_submit_behavior_with_real_transaction_manager_and_mysql_adapter(self) -> None:
+        # Build
+        connector = UM.MagicMock()
+        transaction_manager = TransactionManager()
+        transaction_manager.active_connection = MySQLAdapterConnection(connector=connector)
+        transaction_manager.query_param_placeholder = '?'
+
+        instance = self.get_instance_of_tested_cls(
+            transaction_manager=transaction_manager, max_batch_size=2, max_delay_ms=10_000
+        )
+
+        # Prepare mock
+        connector.is_connected.return_value = True
+
+        # Operate
+        futures: List[Future] = [
+            instance.submit(
+                unit=lambda manager, title=title: manager.execute_in_active_transaction(
+                    title, query='INSERT INTO berry (title) VALUES (?)'
+                )
+            )
+            for title in ('apple', 'plum')
+        ]
+        for future in futures:
+            future.result(timeout=5)
+        instance.close()
+
+        # Check
+        self.assertListEqual(
+            list1=connector.cursor.return_value.execute.call_args_list,
+            list2=[
+                UM.call(operation='SAVEPOINT group_commit_unit_0', params=()),
+                UM.call(operation='INSERT INTO berry (title) VALUES (%s)', params=('apple',)),
+                UM.call(operation='RELEASE SAVEPOINT group_commit_unit_0', params=()),
+                UM.call(operation='SAVEPOINT group_commit_unit_1', params=()),
+                UM.call(operation='INSERT INTO berry (title) VALUES (%s)', params=('plum',)),
+                UM.call(operation='RELEASE SAVEPOINT group_commit_unit_1', params=()),
+            ]
+        )
+        connector.commit.assert_called_once()
+
+    # -----------------------------------------------------------------------------------
+    def test_constructor_behavior_reserves_transaction_manager_until_closed(self) -> None:
+        # Build
+        transaction_manager = TransactionManager()
+        transaction_manager.active_connection = UM.MagicMock()
+
+        instance = self.get_instance_of_tested_cls(transaction_manager=transaction_manager)
+
+        # Check
+        with self.assertRaises(expected_exception=OperationFailedComponentIsReserved):
+            # Operate
+            transaction_manager.begin()
+
+        with self.assertRaises(expected_exception=OperationFailedComponentIsReserved):
+            # Operate
+            self.get_instance_of_tested_cls(transaction_manager=transaction_manager)
+
+        # Operate
+        instance.close()
+        transaction_manager.begin()
+
+        # Post-Check
+        self.assertTrue(expr=transaction_manager.is_in_transaction())
+
+    # -----------------------------------------------------------------------------------
+    def test_submit_behavior_waits_for_shared_connection_lock(self) -> None:
+        # Build
+        unit = UM.MagicMock(return_value='done')
+        instance = self.get_instance_of_tested_cls(max_batch_size=1)
+        connection_lock = self._transaction_manager.connection_lock
+
+        # Operate
+        with connection_lock:
+            future: Future = instance.submit(unit=unit)
+
+            # Check
+            with self.assertRaises(expected_exception=FutureTimeoutError):
+                future.result(timeout=0.1)
+            unit.assert_not_called()
+
+        # Post-Check
+        self.assertEqual(
+            first=future.result(timeout=5),
+            second='done'
+        )
+        instance.close()
+
+    # -----------------------------------------------------------------------------------
+    def test_submit_behavior_isolates_failed_unit_with_savepoint(self) -> None:
+        # Build
+        expected_error = ValueError(GeneratingToolKit.generate_random_string())
+        expected_result: str = GeneratingToolKit.generate_random_string()
+        failed_unit = UM.MagicMock(side_effect=expected_error)
+        successful_unit = UM.MagicMock(return_value=expected_result)
+
+        instance = self.get_instance_of_tested_cls(
+            max_batch_size=2, max_delay_ms=10_000
+        )
+
+        # Operate
+        failed_future: Future = instance.submit(unit=failed_unit)
+        successful_future: Future = instance.submit(unit=successful_unit)
+
+        # Check
+        self.assertIs(
+            expr1=failed_future.exception(timeout=5),
+            expr2=expected_error
+        )
+        self.assertEqual(
+            first=successful_future.result(timeout=5),
+            second=expected_result
+        )
+        self._transaction_manager.commit.assert_called_once()
+
+        # Post-Check
+        instance.close()
+        self.assertListEqual(
+            list1=self.get_executed_queries(),
+            list2=[
+                'SAVEPOINT group_commit_unit_0',
+                'ROLLBACK TO SAVEPOINT group_commit_unit_0',
+                'SAVEPOINT group_commit_unit_1',
+                'RELEASE SAVEPOINT group_commit_unit_1',
+            ]
+        )
+
+    # -----------------------------------------------------------------------------------
+    def test_close_behavior_drains_pending_units(self) -> None:
+        # Build
+        unit = UM.MagicMock(return_value=None)
+
+        instance = self.get_instance_of_tested_cls(
+            max_batch_size=100, max_delay_ms=10_000
+        )
+
+        # Operate
+        future: Future = instance.submit(unit=unit)
+        instance.close()
+
+        # Check
+        self.assertTrue(expr=future.done())
+        unit.assert_called_once()
+        self._transaction_manager.commit.assert_called_once()
+
+
+# _______________________________________________________________________________________
+class TestComponentNegative(BaseTestComponent):
+
+    # -----------------------------------------------------------------------------------
+    def test_submit_behavior_when_commit_failed(self) -> None:
+        # Build
+        expected_error = RuntimeError(GeneratingToolKit.generate_random_string())
+        units: List[UM.MagicMock] = [UM.MagicMock(return_value=None) for _ in range(3)]
+
+        # Prepare mock
+        self._transaction_manager.commit.side_effect = expected_error
+
+        instance = self.get_instance_of_tested_cls(
+            max_batch_size=len(units), max_delay_ms=10_000
+        )
+
+        # Operate
+        futures: List[Future] = [instance.submit(unit=unit) for unit in units]
+
+        # Check
+        for future in futures:
+            self.assertIs(
+                expr1=future.exception(timeout=5),
+                expr2=expected_error
+            )
+
+        # Post-Check
+        instance.close()
+        self._transaction_manager.rollback.assert_called_once()
+
+    # -----------------------------------------------------------------------------------
+    def test_submit_behavior_when_manager_is_closed(self) -> None:
+        # Build
+        expected_exception = OperationFailedComponentIsClosed
+        instance = self.get_instance_of_tested_cls()
+
+        # Prepare instance
+        instance.close()
+
+        # Prepare check context
+        with self.assertRaises(expected_exception=expected_exception):
+            # Operate
+            instance.submit(unit=lambda manager: None)
+
+    # -----------------------------------------------------------------------------------
+    def test_constructor_and_submit_behavior_when_pass_invalid_types(self) -> None:
+        # Build
+        expected_exception = InvalidArgumentTypeError
+        invalid_types: List[Any] = GeneratingToolKit.generate_list_of_basic_python_types()
+        instance = self.get_instance_of_tested_cls()
+
+        # Prepare test cycle
+        for invalid_type in invalid_types:
+            with self.subTest(pattern=invalid_type):
+                # Check
+                with self.assertRaises(expected_exception=expected_exception):
+                    # Operate
+                    tested_cls(transaction_manager=invalid_type)
+
+                with self.assertRaises(expected_exception=expected_exception):
+                    # Operate
+                    instance.submit(unit=invalid_type)
+
+        # Post-Check
+        instance.close()
@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+
+"""
+Copyright 2025 kichiro-kun (Kei)
+Apache license, version 2.0 (Apache-2.0 license)
+"""
+
+__all__: list[str] = [
+    'TestComponentPositive',
+    'TestComponentNegative',
+]
+
+__author__ = 'kichiro-kun (Kei)'
+__version__ = '0.1.0'
+
+# ========================================================================================
+import time
+from unittest import mock as UM
+from typing import List
+
+from dbms_interaction.query_watchdog_component.query_watchdog \
+    import NoQueryWatchdog, QueryWatchdog as tested_cls
+from dbms_interaction.single_connection_manager_component.single_connection_manager \
+    import SingleConnectionManager
+
+from shared.exceptions.common import InvalidArgumentTypeError, InvalidArgumentValueError, \
+    IsNullObjectOperation, OperationFailedComponentIsClosed
+
+from tests.utils.base_test_case_cls import BaseTestCase
+from tests.utils.toolkit import *
+
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+class BaseTestComponent(BaseTestCase[tested_cls]):
+
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    def setUp(self) -> None:
+        super().setUp()
+
+        self.control_manager = UM.MagicMock(spec=SingleConnectionManager)
+        self.control_cursor = self.control_manager.get_connection.return_value.get_cursor.return_value
+
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    def get_instance_of_tested_cls(self, **kwargs) -> tested_cls:
+        kwargs.setdefault('control_manager', self.control_manager)
+
+        instance: tested_cls = tested_cls(**kwargs)
+        self.addCleanup(instance.close)
+
+        return instance
+
+
+# _______________________________________________________________________________________
+class TestComponentPositive(BaseTestComponent):
+
+    # -----------------------------------------------------------------------------------
+    def test_null_object_realization(self) -> None:
+        # Build
+        calls: List[MethodCall] = [
+            MethodCall(method_name='watch', kwargs={'connection_id': 1, 'timeout': 1.0}),
+            MethodCall(method_name='unwatch', kwargs={'token': 1}),
+            MethodCall(method_name='get_killed_queries_count', kwargs={}),
+            MethodCall(method_name='close', kwargs={}),
+        ]
+
+        # Operate
+        instance = NoQueryWatchdog()
+
+        # Check
+        self.assertTrue(
+            expr=InspectingToolKit.check_all_methods_raise_expected_exception_for_null_object(
+                obj=instance,
+                method_calls=calls,
+                exception_type=IsNullObjectOperation
+            )
+        )
+
+    # -----------------------------------------------------------------------------------
+    def test_watch_behavior_kills_query_after_deadline(self) -> None:
+        # Build
+        instance = self.get_instance_of_tested_cls()
+
+        # Operate
+        token: int = instance.watch(connection_id=42, timeout=0.01)
+
+        deadline: float = time.monotonic() + 5
+        while instance.get_killed_queries_count() < 1 and time.monotonic() < deadline:
+            time.sleep(0.001)
+
+        # Check
+        self.control_cursor.execute.assert_called_once_with(query='KILL QUERY 42')
+        self.control_cursor.close.assert_called_once_with()
+
+        # Post-Check
+        self.assertFalse(
+            expr=instance.unwatch(token=token)
+        )
+
+    # -----------------------------------------------------------------------------------
+    def test_unwatch_behavior_before_deadline(self) -> None:
+        # Build
+        instance = self.get_instance_of_tested_cls()
+
+        # Operate
+        token: int = instance.watch(connection_id=42, timeout=60.0)
+        op_result: bool = instance.unwatch(token=token)
+        instance.close()
+
+        # Check
+        self.assertTrue(
+            expr=op_result
+        )
+        self.control_cursor.execute.assert_not_called()
+
+
+# _______________________________________________________________________________________
+class TestComponentNegative(BaseTestComponent):
+
+    # -----------------------------------------------------------------------------------
+    def test_watch_behavior_when_pass_invalid_arguments(self) -> None:
+        # Build
+        instance = self.get_instance_of_tested_cls()
+
+        # Check
+        with self.assertRaises(expected_exception=InvalidArgumentTypeError):
+            # Operate
+            instance.watch(connection_id='42', timeout=1.0)
+
+        # Check
+        with self.assertRaises(expected_exception=InvalidArgumentValueError):
+            # Operate
+            instance.watch(connection_id=42, timeout=0)
+
+    # -----------------------------------------------------------------------------------
+    def test_watch_behavior_when_watchdog_is_closed(self) -> None:
+        # Build
+        instance = self.get_instance_of_tested_cls()
+        instance.close()
+
+        # Check
+        with self.assertRaises(expected_exception=OperationFailedComponentIsClosed):
+            # Operate
+            instance.watch(connection_id=42, timeout=1.0)
@@ -0,0 +1,161 @@
+# -*- coding: utf-8 -*-
+
+"""
+Copyright 2025 kichiro-kun (Kei)
+Apache license, version 2.0 (Apache-2.0 license)
+"""
+
+__all__: list[str] = [
+    'TestComponentPositive',
+]
+
+__author__ = 'kichiro-kun (Kei)'
+__version__ = '0.2.0'
+
+# ========================================================================================
+from unittest import TestCase
+from typing import Any, Tuple
+
+from dbms_interaction.row_factory_component.row_factory \
+    import RowFactory, RowConverterFactory as tested_cls
+
+
+# _______________________________________________________________________________________
+class TestComponentPositive(TestCase):
+
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    def setUp(self) -> None:
+        super().setUp()
+
+        self._column_names: Tuple[str, ...] = ('id', 'title', 'price')
+        self._row: Tuple[Any, ...] = (1, 'berry', 2.5)
+
+    # -----------------------------------------------------------------------------------
+    def test_get_row_converter_behavior_for_tuple_factory(self) -> None:
+        # Operate
+        converter = tested_cls.get_row_converter(
+            factory=RowFactory.TUPLE, column_names=self._column_names
+        )
+
+        # Check
+        self.assertIsNone(obj=converter)
+
+    # -----------------------------------------------------------------------------------
+    def test_get_row_converter_behavior_for_mapping_factories(self) -> None:
+        # Build
+        dict_converter = tested_cls.get_row_converter(
+            factory=RowFactory.DICT, column_names=self._column_names
+        )
+        namedtuple_converter = tested_cls.get_row_converter(
+            factory=RowFactory.NAMEDTUPLE, column_names=self._column_names
+        )
+
+        # Operate
+        dict_row = dict_converter(self._row)
+        namedtuple_row = namedtuple_converter(self._row)
+
+        # Check
+        self.assertDictEqual(
+            d1=dict_row,
+            d2={'id': 1, 'title': 'berry', 'price': 2.5}
+        )
+        self.assertEqual(
+            first=(namedtuple_row.id, namedtuple_row.title, namedtuple_row.price),
+            second=self._row
+        )
+
+    # -----------------------------------------------------------------------------------
+    def test_get_row_converter_behavior_for_record_factory(self) -> None:
+        # Build
+        converter = tested_cls.get_row_converter(
+            factory=RowFactory.RECORD, column_names=self._column_names
+        )
+
+        # Operate
+        record = converter(self._row)
+
+        # Check
+        self.assertEqual(
+            first=(record.id, record.title, record.price),
+            second=self._row
+        )
+        self.assertEqual(
+            first=tuple(record),
+            second=self._row
+        )
+        self.assertFalse(
+            expr=hasattr(record, '__dict__')
+        )
+
+        # Post-Check
+        self.assertEqual(
+            first=record,
+            second=converter(self._row)
+        )
+
+    # -----------------------------------------------------------------------------------
+    def test_get_row_converter_behavior_caches_converter_per_columns(self) -> None:
+        # Build
+        other_column_names: Tuple[str, ...] = ('id', 'name')
+
+        # Operate
+        first_converter = tested_cls.get_row_converter(
+            factory=RowFactory.RECORD, column_names=list(self._column_names)
+        )
+        second_converter = tested_cls.get_row_converter(
+            factory=RowFactory.RECORD, column_names=self._column_names
+        )
+        other_converter = tested_cls.get_row_converter(
+            factory=RowFactory.RECORD, column_names=other_column_names
+        )
+
+        # Check
+        self.assertIs(
+            expr1=first_converter,
+            expr2=second_converter
+        )
+        self.assertIsNot(
+            expr1=first_converter,
+            expr2=other_converter
+        )
+
+    # -----------------------------------------------------------------------------------
+    def test_get_row_converter_behavior_renames_invalid_identifiers(self) -> None:
+        # Build
+        column_names: Tuple[str, ...] = ('self', 'COUNT(*)', 'class', 'id')
+
+        # Operate
+        record = tested_cls.get_row_converter(
+            factory=RowFactory.RECORD, column_names=column_names
+        )((1, 2, 3, 4))
+
+        # Check
+        self.assertEqual(
+            first=record._fields,
+            second=('self', '_1', '_2', 'id')
+        )
+        self.assertEqual(
+            first=tuple(record),
+            second=(1, 2, 3, 4)
+        )
+
+    # -----------------------------------------------------------------------------------
+    def test_get_row_value_behavior_for_all_factories(self) -> None:
+        # Build
+        row: Tuple[Any, ...] = (7, 'berry', 10)
+
+        for factory in RowFactory:
+            with self.subTest(factory=factory):
+                converter = tested_cls.get_row_converter(factory=factory, column_names=self._column_names)
+                converted_row: Any = row if converter is None else converter(row)
+
+                # Operate
+                op_result: Any = tested_cls.get_row_value(
+                    row=converted_row, column_name='title', column_position=1
+                )
+
+                # Check
+                self.assertEqual(
+                    first=op_result,
+                    second='berry'
+                )
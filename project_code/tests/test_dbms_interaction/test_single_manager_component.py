@@ -11,7 +11,7 @@ __all__: list[str] = [
 ]
 
 __author__ = 'kichiro-kun (Kei)'
-__version__ = '0.8.2'
+__version__ = '0.10.0'
 
 # ========================================================================================
 from unittest import mock as UM
@@ -22,7 +22,9 @@ from dbms_interaction.single_connection_manager_component.single_connection_mana
 
 from tests.test_dbms_interaction.common import *
 
-from shared.exceptions.common import InvalidArgumentTypeError, IsNullObjectOperation
+from shared.constants.global_configuration import MYSQL_CONNECT_TIMEOUT_CONFIG_KEY
+from shared.exceptions.common import InvalidArgumentTypeError, IsNullObjectOperation, \
+    OperationFailedAllHostsUnavailable
 
 from tests.utils.base_test_case_cls import BaseTestCase
 from tests.utils.toolkit import GeneratingToolKit, InspectingToolKit, MethodCall
@@ -81,6 +83,8 @@ class TestComponentPositive(BaseTestComponent):
                 'new_config': None
             },
             'get_connection': {},
+            'get_active_host': {},
+            'get_host_health_scores': {},
             'initialize_new_connection': {},
             'reinitialize_connection': {},
             'check_connection_status': {},
@@ -390,6 +394,143 @@ class TestComponentPositive(BaseTestComponent):
             mock_method_close.assert_called_once()
 
 
+    # -----------------------------------------------------------------------------------
+    def test_initialize_new_connection_behavior_fails_over_to_next_host(self) -> None:
+        # Build
+        adapter = self._adapter
+        hosts: List[Dict[str, Any]] = [{'host': 'db-1'}, {'host': 'db-2'}, {'host': 'db-3'}]
+
+        instance = self.get_instance_of_tested_cls(
+            adapter=adapter, config=self._config, hosts=hosts, connect_timeout=1
+        )
+
+        # Prepare check context
+        with UM.patch.object(target=adapter, attribute='connect') as mock_method_connect, \
+                UM.patch.object(target=adapter, attribute='is_active') as mock_method_is_active:
+            # Prepare mock
+            mock_method_is_active.return_value = False
+            mock_method_connect.side_effect = [ConnectionError('db-1 is down'), True]
+
+            # Operate
+            op_result = instance.initialize_new_connection()
+
+            # Check
+            self.assertListEqual(
+                list1=[call.kwargs['config']['host'] for call in mock_method_connect.call_args_list],
+                list2=['db-1', 'db-2']
+            )
+            self.assertEqual(
+                first=mock_method_connect.call_args.kwargs['config'],
+                second={**self._config, 'host': 'db-2', MYSQL_CONNECT_TIMEOUT_CONFIG_KEY: 1}
+            )
+
+            # Prepare mock
+            mock_method_connect.reset_mock(side_effect=True)
+
+            # Operate
+            instance.initialize_new_connection()
+
+            # Check
+            mock_method_connect.assert_called_once()
+            self.assertEqual(
+                first=mock_method_connect.call_args.kwargs['config']['host'],
+                second='db-2'
+            )
+
+        # Post-Check
+        self.assertTrue(
+            expr=InspectingToolKit.is_boolean_True(obj=op_result)
+        )
+        self.assertDictEqual(
+            d1=instance.get_active_host(),
+            d2={'host': 'db-2'}
+        )
+        self.assertTupleEqual(
+            tuple1=instance.get_host_health_scores(),
+            tuple2=(0.5, 1.0, 1.0)
+        )
+
+    # -----------------------------------------------------------------------------------
+    def test_reinitialize_connection_behavior_fails_over_when_reconnect_fails(self) -> None:
+        # Build
+        adapter = self._adapter
+        hosts: List[Dict[str, Any]] = [{'host': 'db-1'}, {'host': 'db-2'}]
+
+        instance = self.get_instance_of_tested_cls(
+            adapter=adapter, config=self._config, hosts=hosts
+        )
+
+        # Prepare check context
+        with UM.patch.object(target=adapter, attribute='connect') as mock_method_connect, \
+                UM.patch.object(target=adapter, attribute='reconnect') as mock_method_reconnect, \
+                UM.patch.object(target=adapter, attribute='close'), \
+                UM.patch.object(target=adapter, attribute='is_active') as mock_method_is_active:
+            # Prepare mock
+            mock_method_is_active.return_value = False
+            instance.initialize_new_connection()
+
+            mock_method_is_active.return_value = True
+            mock_method_reconnect.side_effect = ConnectionError('db-1 is down')
+            mock_method_connect.reset_mock()
+
+            # Operate
+            op_result = instance.reinitialize_connection()
+
+            # Check
+            mock_method_reconnect.assert_called_once()
+            self.assertListEqual(
+                list1=[call.kwargs['config']['host'] for call in mock_method_connect.call_args_list],
+                list2=['db-2']
+            )
+
+        # Post-Check
+        self.assertTrue(
+            expr=InspectingToolKit.is_boolean_True(obj=op_result)
+        )
+        self.assertDictEqual(
+            d1=instance.get_active_host(),
+            d2={'host': 'db-2'}
+        )
+
+    # -----------------------------------------------------------------------------------
+    def test_reinitialize_connection_behavior_fails_over_when_adapter_is_not_active(self) -> None:
+        # Build
+        adapter = self._adapter
+        hosts: List[Dict[str, Any]] = [{'host': 'db-1'}, {'host': 'db-2'}]
+
+        instance = self.get_instance_of_tested_cls(
+            adapter=adapter, config=self._config, hosts=hosts
+        )
+
+        # Prepare check context
+        with UM.patch.object(target=adapter, attribute='connect') as mock_method_connect, \
+                UM.patch.object(target=adapter, attribute='reconnect') as mock_method_reconnect, \
+                UM.patch.object(target=adapter, attribute='is_active') as mock_method_is_active:
+            # Prepare mock
+            mock_method_is_active.return_value = False
+            instance.initialize_new_connection()
+            mock_method_connect.reset_mock()
+
+            # Operate
+            op_result = instance.reinitialize_connection()
+
+            # Check
+            mock_method_reconnect.assert_not_called()
+            self.assertListEqual(
+                list1=[call.kwargs['config']['host'] for call in mock_method_connect.call_args_list],
+                list2=['db-2']
+            )
+
+        # Post-Check
+        self.assertTrue(
+            expr=InspectingToolKit.is_boolean_True(obj=op_result)
+        )
+        self.assertTupleEqual(
+            tuple1=instance.get_host_health_scores(),
+            tuple2=(0.5, 1.0)
+        )
+
+
 # _______________________________________________________________________________________
 class TestComponentNegative(BaseTestComponent):
 
@@ -706,3 +847,36 @@ class TestComponentNegative(BaseTestComponent):
                 expr1=actual_adapter,
                 expr2=expected_adapter
             )
+
+    # -----------------------------------------------------------------------------------
+    def test_initialize_new_connection_behavior_when_all_hosts_are_unavailable(self) -> None:
+        # Build
+        adapter = self._adapter
+
+        instance = self.get_instance_of_tested_cls(
+            adapter=adapter, config=self._config, hosts=[{'host': 'db-1'}, {'host': 'db-2'}]
+        )
+
+        # Prepare check context
+        with UM.patch.object(target=adapter, attribute='connect') as mock_method_connect, \
+                UM.patch.object(target=adapter, attribute='is_active') as mock_method_is_active:
+            # Prepare mock
+            mock_method_is_active.return_value = False
+            mock_method_connect.side_effect = ConnectionError('Host is down')
+
+            # Check
+            with self.assertRaises(expected_exception=OperationFailedAllHostsUnavailable):
+                # Operate
+                instance.initialize_new_connection()
+
+            # Post-Check
+            self.assertEqual(
+                first=mock_method_connect.call_count,
+                second=2
+            )
+
+        # Post-Check
+        self.assertDictEqual(
+            d1=instance.get_active_host(),
+            d2={}
+        )
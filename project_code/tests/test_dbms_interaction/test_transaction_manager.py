@@ -11,7 +11,7 @@ __all__: list[str] = [
 ]
 
 __author__ = 'kichiro-kun (Kei)'
-__version__ = '0.4.1'
+__version__ = '0.10.0'
 
 # ========================================================================================
 from unittest import TestCase, mock as UM
@@ -23,13 +23,24 @@ from dbms_interaction.transaction_manager_component.transaction_manager \
 from dbms_interaction.transaction_manager_component.abstract.transaction_state_interface \
     import TransactionStateInterface
 from dbms_interaction.transaction_manager_component.states import *
+from query_core.query_cache_component.abstract.query_cache_interface import QueryCacheInterface
 
-from shared.exceptions.common import InvalidArgumentTypeError, IsNullObjectOperation
+from shared.constants.global_configuration import MYSQL_DEADLOCK_ERROR_CODE, \
+    MYSQL_LOCK_WAIT_TIMEOUT_ERROR_CODE
+from shared.exceptions.common import InvalidArgumentTypeError, IsNullObjectOperation, \
+    TransactionRetryLimitExceeded, OperationFailedComponentIsReserved
 
 from tests.utils.base_test_case_cls import BaseTestCase
 from tests.utils.toolkit import *
 
 
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+class DBMSErrorStub(Exception):
+    def __init__(self, errno: int) -> None:
+        super().__init__(f'DBMS error: {errno}')
+        self.errno: int = errno
+
+
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 class CheckIsolationLevelEnumeration(TestCase):
 
@@ -315,6 +326,262 @@ class TestComponentPositive(BaseTestCase[tested_cls]):
         instance.begin()
         new_state_obj.begin.assert_called_once()  # type:ignore
 
+    # -----------------------------------------------------------------------------------
+    def test_execute_retryable_transaction_behavior_without_conflicts(self) -> None:
+        # Build
+        instance = self.get_instance_of_tested_cls()
+        state = self.get_mock_instance_of_transaction_manager_state()
+        expected_result: str = GeneratingToolKit.generate_random_string()
+        operation = UM.MagicMock(return_value=expected_result)
+
+        # Prepare instance
+        instance.set_state(new_state=state)
+
+        # Operate
+        op_result = instance.execute_retryable_transaction(operation=operation)
+
+        # Check
+        operation.assert_called_once_with(instance)
+        state.begin.assert_called_once()  # type: ignore
+        state.commit.assert_called_once()  # type: ignore
+        state.rollback.assert_not_called()  # type: ignore
+        self.assertEqual(
+            first=op_result,
+            second=expected_result
+        )
+
+        # Post-Check
+        self.assertEqual(
+            first=instance.get_retry_statistics().retried_attempts,
+            second=0
+        )
+
+    # -----------------------------------------------------------------------------------
+    def test_execute_retryable_transaction_behavior_retries_lock_conflicts(self) -> None:
+        # Build
+        instance = self.get_instance_of_tested_cls()
+        state = self.get_mock_instance_of_transaction_manager_state()
+        expected_result: str = GeneratingToolKit.generate_random_string()
+        operation = UM.MagicMock(
+            side_effect=[
+                DBMSErrorStub(errno=MYSQL_DEADLOCK_ERROR_CODE),
+                DBMSErrorStub(errno=MYSQL_LOCK_WAIT_TIMEOUT_ERROR_CODE),
+                expected_result
+            ]
+        )
+
+        # Prepare instance
+        instance.set_state(new_state=state)
+
+        # Prepare test context
+        with UM.patch.object(target=tested_module.time, attribute='sleep') as mock_sleep:
+            # Operate
+            op_result = instance.execute_retryable_transaction(operation=operation)
+
+            # Check
+            self.assertEqual(
+                first=mock_sleep.call_count,
+                second=2
+            )
+
+        # Extract
+        statistics = instance.get_retry_statistics()
+
+        # Check
+        self.assertEqual(
+            first=op_result,
+            second=expected_result
+        )
+        self.assertEqual(
+            first=operation.call_count,
+            second=3
+        )
+        self.assertEqual(
+            first=state.rollback.call_count,  # type: ignore
+            second=2
+        )
+        self.assertEqual(
+            first=statistics.retried_attempts,
+            second=2
+        )
+        self.assertDictEqual(
+            d1=statistics.retries_by_error_code,
+            d2={
+                MYSQL_DEADLOCK_ERROR_CODE: 1,
+                MYSQL_LOCK_WAIT_TIMEOUT_ERROR_CODE: 1
+            }
+        )
+
+    # -----------------------------------------------------------------------------------
+    def test_reset_retry_statistics_behavior(self) -> None:
+        # Build
+        instance = self.get_instance_of_tested_cls()
+        state = self.get_mock_instance_of_transaction_manager_state()
+        operation = UM.MagicMock(
+            side_effect=[DBMSErrorStub(errno=MYSQL_DEADLOCK_ERROR_CODE), None]
+        )
+
+        # Prepare instance
+        instance.set_state(new_state=state)
+
+        with UM.patch.object(target=tested_module.time, attribute='sleep'):
+            instance.execute_retryable_transaction(operation=operation)
+
+        # Operate
+        instance.reset_retry_statistics()
+
+        # Check
+        self.assertEqual(
+            first=instance.get_retry_statistics(),
+            second=(0, 0, {})
+        )
+
+    # -----------------------------------------------------------------------------------
+    def test_is_active_behavior(self) -> None:
+        # Build
+        instance = self.get_instance_of_tested_cls()
+        active_state = self.get_mock_instance_of_transaction_manager_state()
+
+        # Prepare instance
+        instance.active_state = active_state
+
+        # Operate
+        instance.set_state(new_state=active_state)
+
+        # Check
+        self.assertTrue(expr=instance.is_active())
+
+        # Operate
+        instance.set_state(new_state=self.get_mock_instance_of_transaction_manager_state())
+
+        # Check
+        self.assertFalse(expr=instance.is_active())
+
+    # -----------------------------------------------------------------------------------
+    def test_is_in_transaction_behavior(self) -> None:
+        # Build
+        instance = self.get_instance_of_tested_cls()
+
+        # Prepare instance
+        instance.set_state(new_state=self.get_mock_instance_of_transaction_manager_state())
+
+        # Operate
+        instance.begin()
+
+        # Check
+        self.assertTrue(expr=instance.is_in_transaction())
+        self.assertFalse(expr=instance.is_active())
+
+        # Operate
+        with UM.patch.object(target=tested_module.time, attribute='monotonic', return_value=100.0):
+            instance.commit()
+            instance.commit()
+
+        # Check
+        self.assertFalse(expr=instance.is_in_transaction())
+        self.assertEqual(
+            first=instance.get_last_commit_time(),
+            second=100.0
+        )
+
+        # Operate
+        instance.begin()
+        instance.rollback()
+
+        # Post-Check
+        self.assertFalse(expr=instance.is_in_transaction())
+        self.assertEqual(
+            first=instance.get_last_commit_time(),
+            second=100.0
+        )
+
+    # -----------------------------------------------------------------------------------
+    def test_reserve_for_thread_behavior_rejects_calls_from_other_threads(self) -> None:
+        import threading
+
+        # Build
+        instance = self.get_instance_of_tested_cls()
+        state = self.get_mock_instance_of_transaction_manager_state()
+        owner = threading.Thread(target=instance.begin)
+
+        # Prepare instance
+        instance.set_state(new_state=state)
+
+        # Operate
+        instance.reserve_for_thread(owner=owner)
+        owner.start()
+        owner.join()
+
+        # Check
+        state.begin.assert_called_once()
+        for method_name in ('begin', 'commit', 'rollback'):
+            with self.subTest(pattern=method_name):
+                with self.assertRaises(expected_exception=OperationFailedComponentIsReserved):
+                    # Operate
+                    getattr(instance, method_name)()
+
+        with self.assertRaises(expected_exception=OperationFailedComponentIsReserved):
+            # Operate
+            instance.reserve_for_thread(owner=threading.current_thread())
+
+        # Operate
+        instance.release_reservation()
+        instance.begin()
+
+        # Post-Check
+        self.assertEqual(
+            first=state.begin.call_count,
+            second=2
+        )
+
+    # -----------------------------------------------------------------------------------
+    def test_query_cache_invalidation_behavior(self) -> None:
+        # Build
+        instance = self.get_instance_of_tested_cls()
+        state = self.get_mock_instance_of_transaction_manager_state()
+        query_cache = UM.MagicMock(spec=QueryCacheInterface)
+
+        # Prepare instance
+        instance.set_state(new_state=state)
+        instance.query_cache = query_cache
+
+        # Operate
+        instance.begin()
+        instance.execute_in_active_transaction(1, query='UPDATE berry SET cost = ?')
+        instance.commit()
+
+        # Check
+        self.assertEqual(
+            first=query_cache.invalidate_tables.call_args_list,
+            second=[
+                UM.call(tables=frozenset({'berry'})),
+                UM.call(tables={'berry'})
+            ]
+        )
+
+        # Operate
+        instance.rollback()
+        instance.execute_in_active_transaction(query='SAVEPOINT group_commit_1')
+        instance.execute_in_active_transaction(query='SET @cost = 1')
+        instance.rollback()
+
+        # Check
+        query_cache.clear.assert_not_called()
+
+        # Operate
+        instance.execute_in_active_transaction(query='CALL refresh_prices()')
+        instance.rollback()
+
+        # Post-Check
+        self.assertEqual(
+            first=query_cache.invalidate_tables.call_count,
+            second=2
+        )
+        self.assertEqual(
+            first=query_cache.clear.call_count,
+            second=2
+        )
+
     # -----------------------------------------------------------------------------------
     def test_null_object_realization(self) -> None:
         # Build
@@ -325,12 +592,22 @@ class TestComponentPositive(BaseTestCase[tested_cls]):
             'set_state': {
                 'new_state': None
             },
+            'is_active': {},
+            'is_in_transaction': {},
+            'get_last_commit_time': {},
+            'reserve_for_thread': {
+                'owner': None
+            },
+            'release_reservation': {},
             'begin': {},
             'execute_in_active_transaction': {
                 'query': GeneratingToolKit.generate_random_string()
             },
             'commit': {},
-            'rollback': {}
+            'rollback': {},
+            'execute_retryable_transaction': {
+                'operation': lambda manager: None
+            }
         }  # Param name & kwargs
 
         # Prepare data
@@ -378,3 +655,79 @@ class TestComponentNegative(BaseTestCase[tested_cls]):
             with self.assertRaises(expected_exception=expected_exception):
                 # Operate & Check
                 instance.set_state(new_state=invalid_type)
+
+    # -----------------------------------------------------------------------------------
+    def test_execute_retryable_transaction_behavior_when_error_is_not_retryable(self) -> None:
+        # Build
+        instance = self.get_instance_of_tested_cls()
+        state = UM.MagicMock(spec=TransactionStateInterface)
+        expected_exception = DBMSErrorStub
+        operation = UM.MagicMock(side_effect=DBMSErrorStub(errno=1064))
+
+        # Prepare instance
+        instance.set_state(new_state=state)
+
+        # Prepare check context
+        with self.assertRaises(expected_exception=expected_exception):
+            # Operate
+            instance.execute_retryable_transaction(operation=operation)
+
+        # Check
+        operation.assert_called_once()
+        state.rollback.assert_called_once()  # type: ignore
+        self.assertEqual(
+            first=instance.get_retry_statistics().retried_attempts,
+            second=0
+        )
+
+    # -----------------------------------------------------------------------------------
+    def test_execute_retryable_transaction_behavior_when_attempts_are_exhausted(self) -> None:
+        # Build
+        instance = self.get_instance_of_tested_cls()
+        state = UM.MagicMock(spec=TransactionStateInterface)
+        expected_exception = TransactionRetryLimitExceeded
+        max_attempts: int = 3
+        operation = UM.MagicMock(side_effect=DBMSErrorStub(errno=MYSQL_DEADLOCK_ERROR_CODE))
+
+        # Prepare instance
+        instance.set_state(new_state=state)
+
+        # Prepare check context
+        with UM.patch.object(target=tested_module.time, attribute='sleep'), \
+                self.assertRaises(expected_exception=expected_exception):
+            # Operate
+            instance.execute_retryable_transaction(
+                operation=operation, max_attempts=max_attempts
+            )
+
+        # Extract
+        statistics = instance.get_retry_statistics()
+
+        # Check
+        self.assertEqual(
+            first=operation.call_count,
+            second=max_attempts
+        )
+        self.assertEqual(
+            first=statistics.retried_attempts,
+            second=max_attempts
+        )
+        self.assertEqual(
+            first=statistics.exhausted_transactions,
+            second=1
+        )
+
+    # -----------------------------------------------------------------------------------
+    def test_execute_retryable_transaction_behavior_when_pass_invalid_types(self) -> None:
+        # Build
+        instance = self.get_instance_of_tested_cls()
+        invalid_types = GeneratingToolKit.generate_list_of_basic_python_types()
+        expected_exception = InvalidArgumentTypeError
+
+        # Prepare test cycle
+        for invalid_type in invalid_types:
+            with self.subTest(pattern=invalid_type):
+                # Prepare check context
+                with self.assertRaises(expected_exception=expected_exception):
+                    # Operate & Check
+                    instance.execute_retryable_transaction(operation=invalid_type)
@@ -6,7 +6,7 @@ Apache license, version 2.0 (Apache-2.0 license)
 """
 
 __author__ = 'kichiro-kun (Kei)'
-__version__ = '0.3.0'
+__version__ = '0.6.0'
 
 # =======================================================================================
 from unittest import TestCase, mock as UM
@@ -15,6 +15,8 @@ from dbms_interaction.transaction_manager_component.transaction_manager import T
 from dbms_interaction.transaction_manager_component.states import *
 
 from dbms_interaction.adapters_component.connection.abstract.connection_interface import ConnectionInterface
+from dbms_interaction.adapters_component.connection.realizations.mysql_adapter_connection \
+    import MySQLAdapterConnection
 
 from tests.utils.toolkit import GeneratingToolKit
 
@@ -74,6 +76,9 @@ class TestComponentPositive(TestCase):
             mock_attr_active_connection.is_active.assert_called_once()
             mock_attr_active_connection.reconnect.assert_not_called()
 
+            # Check
+            mock_attr_active_connection.set_autocommit.assert_called_once_with(enabled=False)
+
     # -----------------------------------------------------------------------------------
     def test_active_state_behavior_next_state_logic(self) -> None:
         # Build
@@ -127,8 +132,68 @@ class TestComponentPositive(TestCase):
             transaction_manager.execute_in_active_transaction(query=test_query, *query_params)
 
             # Check
-            mock_attr_active_connection.get_cursor.assert_called_once()
-            mock_cursor.execute.assert_called_once_with(test_query, *query_params)
+            mock_attr_active_connection.get_cursor.assert_called_once_with(
+                special_placeholder=transaction_manager.query_param_placeholder
+            )
+            mock_cursor.execute.assert_called_once_with(*query_params, query=test_query)
+            mock_cursor.close.assert_called_once()
+
+    # -----------------------------------------------------------------------------------
+    def test_execute_retryable_transaction_behavior_with_mysql_adapter(self) -> None:
+        # Build
+        transaction_manager = self.get_instance_of_transaction_manager()
+        connector = UM.MagicMock()
+        deadlock_error = Exception('Deadlock found when trying to get lock')
+        deadlock_error.errno = 1213
+
+        # Prepare transaction manager
+        transaction_manager.active_connection = MySQLAdapterConnection(connector=connector)
+        transaction_manager.query_param_placeholder = '?'
+
+        # Prepare mock
+        connector.is_connected.return_value = True
+        connector.cursor.return_value.execute.side_effect = [deadlock_error, None]
+
+        # Operate
+        with UM.patch('dbms_interaction.transaction_manager_component.transaction_manager.time.sleep'):
+            transaction_manager.execute_retryable_transaction(
+                operation=lambda manager: manager.execute_in_active_transaction(
+                    5, 1, query='UPDATE berry SET cost = ? WHERE id = ?'
+                )
+            )
+
+        # Check
+        self.assertListEqual(
+            list1=connector.cursor.return_value.execute.call_args_list,
+            list2=[UM.call(operation='UPDATE berry SET cost = %s WHERE id = %s', params=(5, 1))] * 2
+        )
+        connector.rollback.assert_called_once()
+        connector.commit.assert_called_once()
+        self.assertEqual(
+            first=connector.cursor.return_value.close.call_count,
+            second=2
+        )
+
+    # -----------------------------------------------------------------------------------
+    def test_active_state_method_rollback_behavior_next_state_logic(self) -> None:
+        # Build
+        transaction_manager = self.get_instance_of_transaction_manager()
+
+        # Extract
+        active_state = transaction_manager.active_state
+        rolledback_state = transaction_manager.rolledback_state
+
+        # Prepare transaction manager
+        transaction_manager.set_state(new_state=active_state)
+
+        # Prepare check context
+        with UM.patch.object(target=rolledback_state,
+                             attribute='rollback') as mock_method_rollback:
+            # Operate
+            transaction_manager.rollback()
+
+            # Check
+            mock_method_rollback.assert_called_once()
 
     # -----------------------------------------------------------------------------------
     def test_committed_state_behavior_next_state_logic(self) -> None:
@@ -160,6 +225,27 @@ class TestComponentPositive(TestCase):
             # Check
             mock_method_rollback.assert_called_once()
 
+    # -----------------------------------------------------------------------------------
+    def test_committed_state_method_begin_behavior_next_state_logic(self) -> None:
+        # Build
+        transaction_manager = self.get_instance_of_transaction_manager()
+
+        # Extract
+        committed_state = transaction_manager.committed_state
+        initialized_state = transaction_manager.initialized_state
+
+        # Prepare transaction manager
+        transaction_manager.set_state(new_state=committed_state)
+
+        # Prepare check context
+        with UM.patch.object(target=initialized_state,
+                             attribute='begin') as mock_method_begin:
+            # Operate
+            transaction_manager.begin()
+
+            # Check
+            mock_method_begin.assert_called_once()
+
     # -----------------------------------------------------------------------------------
     def test_committed_state_method_commit_behavior(self) -> None:
         # Build
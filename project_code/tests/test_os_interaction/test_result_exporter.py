@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+
+"""
+Copyright 2025 kichiro-kun (Kei)
+Apache license, version 2.0 (Apache-2.0 license)
+"""
+
+__all__: list[str] = [
+    'TestComponentPositive',
+    'TestComponentNegative',
+]
+
+__author__ = 'kichiro-kun (Kei)'
+__version__ = '0.1.0'
+
+# ========================================================================================
+import csv
+import gzip
+import json
+import os
+import tempfile
+from datetime import date
+from decimal import Decimal
+from unittest import TestCase
+from typing import Any, Dict, List, Tuple
+
+from os_interaction.result_export_component.result_exporter \
+    import ExportFormat, ResultExporter as tested_cls
+
+from shared.exceptions.common import InvalidArgumentTypeError, InvalidArgumentValueError
+
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+class BaseTestComponent(TestCase):
+
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    def setUp(self) -> None:
+        super().setUp()
+
+        self._temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self._temp_dir.cleanup)
+
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    def get_export_path(self, file_name: str) -> str:
+        return os.path.join(self._temp_dir.name, file_name)
+
+
+# _______________________________________________________________________________________
+class TestComponentPositive(BaseTestComponent):
+
+    # -----------------------------------------------------------------------------------
+    def test_export_rows_behavior_writes_csv_in_chunks(self) -> None:
+        # Build
+        file_path: str = self.get_export_path(file_name='berries.csv')
+        rows: List[Tuple[Any, ...]] = [
+            (1, 'straw,berry', None),
+            (2, 'multi\nline', 2.5),
+            (3, 'plain', 0),
+        ]
+
+        # Operate
+        op_result: int = tested_cls.export_rows(
+            rows=iter(rows),
+            column_names=('id', 'title', 'price'),
+            file_path=file_path,
+            chunk_size=2
+        )
+
+        # Extract
+        with open(file_path, encoding='utf-8', newline='') as export_file:
+            actual_rows: List[List[str]] = list(csv.reader(export_file))
+
+        # Check
+        self.assertEqual(
+            first=op_result,
+            second=len(rows)
+        )
+        self.assertListEqual(
+            list1=actual_rows,
+            list2=[
+                ['id', 'title', 'price'],
+                ['1', 'straw,berry', ''],
+                ['2', 'multi\nline', '2.5'],
+                ['3', 'plain', '0'],
+            ]
+        )
+
+    # -----------------------------------------------------------------------------------
+    def test_export_chunks_behavior_writes_compressed_jsonl(self) -> None:
+        # Build
+        file_path: str = self.get_export_path(file_name='berries.jsonl.gz')
+        chunks: List[List[Tuple[Any, ...]]] = [
+            [(1, 'клубника', Decimal('10.50'))],
+            [(2, None, date(2025, 1, 31)), (3, b'\x00\xff', True)],
+        ]
+
+        # Operate
+        op_result: int = tested_cls.export_chunks(
+            chunks=chunks,
+            column_names=('id', 'title', 'price'),
+            file_path=file_path,
+            export_format=ExportFormat.JSONL,
+            compress=True
+        )
+
+        # Extract
+        with gzip.open(file_path, mode='rt', encoding='utf-8') as export_file:
+            actual_records: List[Dict[str, Any]] = [json.loads(line) for line in export_file]
+
+        # Check
+        self.assertEqual(
+            first=op_result,
+            second=3
+        )
+        self.assertListEqual(
+            list1=actual_records,
+            list2=[
+                {'id': 1, 'title': 'клубника', 'price': '10.50'},
+                {'id': 2, 'title': None, 'price': '2025-01-31'},
+                {'id': 3, 'title': '00ff', 'price': True},
+            ]
+        )
+
+
+# _______________________________________________________________________________________
+class TestComponentNegative(BaseTestComponent):
+
+    # -----------------------------------------------------------------------------------
+    def test_export_methods_behavior_when_pass_invalid_arguments(self) -> None:
+        # Build
+        file_path: str = self.get_export_path(file_name='berries.csv')
+
+        # Check
+        with self.assertRaises(expected_exception=InvalidArgumentTypeError):
+            # Operate
+            tested_cls.export_chunks(
+                chunks=[], column_names=('id',), file_path=file_path, export_format='csv'
+            )
+
+        # Check
+        with self.assertRaises(expected_exception=InvalidArgumentValueError):
+            # Operate
+            tested_cls.export_rows(
+                rows=[], column_names=('id',), file_path=file_path, chunk_size=0
+            )
+
+        # Post-Check
+        self.assertFalse(
+            expr=os.path.exists(file_path)
+        )
@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+
+"""
+Copyright 2025 kichiro-kun (Kei)
+Apache license, version 2.0 (Apache-2.0 license)
+"""
+
+__all__: list[str] = [
+    'TestComponentPositive',
+    'TestComponentNegative',
+]
+
+__author__ = 'kichiro-kun (Kei)'
+__version__ = '0.1.0'
+
+# ========================================================================================
+from unittest import TestCase
+from typing import Any, List, Tuple
+
+from query_core.result_stream_component.adaptive_chunk_sizer import AdaptiveChunkSizer as tested_cls
+
+from shared.exceptions.common import InvalidArgumentTypeError, InvalidArgumentValueError
+
+
+# _______________________________________________________________________________________
+class TestComponentPositive(TestCase):
+
+    # -----------------------------------------------------------------------------------
+    def test_record_fetch_behavior_converges_to_target_bytes(self) -> None:
+        # Build
+        instance = tested_cls(
+            target_chunk_bytes=10000, max_chunk_bytes=100000, min_chunk_size=1,
+            initial_chunk_size=10, max_fetch_latency=0
+        )
+        rows: List[Tuple[Any, ...]] = [(index, 'x' * 92) for index in range(10)]
+
+        # Operate
+        chunk_sizes: List[int] = [instance.record_fetch(rows=rows, duration=0.001) for _ in range(5)]
+
+        # Check
+        self.assertListEqual(
+            list1=chunk_sizes,
+            list2=[20, 40, 80, 100, 100]
+        )
+        self.assertEqual(
+            first=instance.get_statistics().row_bytes,
+            second=100
+        )
+
+    # -----------------------------------------------------------------------------------
+    def test_record_fetch_behavior_shrinks_for_slow_fetches_and_memory_bound(self) -> None:
+        # Build
+        instance = tested_cls(
+            target_chunk_bytes=500000, max_chunk_bytes=1000000, min_chunk_size=1,
+            initial_chunk_size=1000, max_fetch_latency=0.1
+        )
+        rows: List[Tuple[Any, ...]] = [(b'\x00' * 1000,)] * 1000
+
+        # Operate: 1 МБ за секунду - в 0.1 секунды укладывается 100 строк
+        instance.record_fetch(rows=rows, duration=1.0)
+        instance.record_fetch(rows=rows[:500], duration=0.5)
+        chunk_size: int = instance.record_fetch(rows=rows[:250], duration=0.25)
+
+        # Check
+        self.assertEqual(
+            first=chunk_size,
+            second=125
+        )
+
+        # Operate
+        instance = tested_cls(target_chunk_bytes=100000, max_chunk_bytes=200000, max_fetch_latency=0)
+        instance.record_fetch(rows=[(b'\x00' * 10000,)], duration=0.001)
+
+        # Check
+        self.assertLessEqual(
+            a=instance.get_chunk_size(),
+            b=20
+        )
+
+
+# _______________________________________________________________________________________
+class TestComponentNegative(TestCase):
+
+    # -----------------------------------------------------------------------------------
+    def test_constructor_behavior_when_pass_invalid_arguments(self) -> None:
+        # Check
+        with self.assertRaises(expected_exception=InvalidArgumentTypeError):
+            # Operate
+            tested_cls(target_chunk_bytes=1.5)
+
+        # Check
+        with self.assertRaises(expected_exception=InvalidArgumentValueError):
+            # Operate
+            tested_cls(min_chunk_size=100, max_chunk_size=10)
+
+        # Check
+        with self.assertRaises(expected_exception=InvalidArgumentTypeError):
+            # Operate
+            tested_cls(max_fetch_latency='fast')
@@ -0,0 +1,186 @@
+# -*- coding: utf-8 -*-
+
+"""
+Copyright 2025 kichiro-kun (Kei)
+Apache license, version 2.0 (Apache-2.0 license)
+"""
+
+__all__: list[str] = [
+    'TestComponentPositive',
+    'TestComponentNegative',
+]
+
+__author__ = 'kichiro-kun (Kei)'
+__version__ = '0.3.0'
+
+# ========================================================================================
+from unittest import mock as UM
+from typing import Any, List, Sequence, Tuple
+
+from query_core.result_stream_component.cursor_row_stream import CursorRowStream as tested_cls
+from query_core.result_stream_component.adaptive_chunk_sizer import AdaptiveChunkSizer
+from dbms_interaction.adapters_component.cursor.abstract.cursor_interface import CursorInterface
+
+from shared.exceptions.common import InvalidArgumentTypeError, InvalidArgumentValueError
+
+from tests.utils.base_test_case_cls import BaseTestCase
+from tests.utils.toolkit import GeneratingToolKit
+
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+class BaseTestComponent(BaseTestCase[tested_cls]):
+
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    def setUp(self) -> None:
+        super().setUp()
+
+        self._rows: List[Tuple[int, str]] = [
+            (index, GeneratingToolKit.generate_random_string(length=8)) for index in range(5)
+        ]
+        self._cursor: UM.MagicMock = UM.MagicMock(spec=CursorInterface)
+        self._cursor.fetchmany.side_effect = self.__fetch_rows_by_chunks(chunk_size=2)
+
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    def __fetch_rows_by_chunks(self, chunk_size: int) -> List[Sequence[Any]]:
+        chunks: List[Sequence[Any]] = [
+            self._rows[index:index + chunk_size] for index in range(0, len(self._rows), chunk_size)
+        ]
+
+        # Повторная выборка после исчерпания результата возвращает пустой чанк
+        return chunks + [[] for _ in range(3)]
+
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    def get_instance_of_tested_cls(self, **kwargs) -> tested_cls:
+        kwargs.setdefault('cursor', self._cursor)
+        kwargs.setdefault('chunk_size', 2)
+
+        return tested_cls(**kwargs)
+
+
+# _______________________________________________________________________________________
+class TestComponentPositive(BaseTestComponent):
+
+    # -----------------------------------------------------------------------------------
+    def test_iteration_behavior_yields_all_rows_and_closes_cursor(self) -> None:
+        # Build
+        instance = self.get_instance_of_tested_cls()
+
+        # Operate
+        actual_rows: List[Sequence[Any]] = list(instance)
+
+        # Check
+        self.assertListEqual(
+            list1=actual_rows,
+            list2=self._rows
+        )
+        self._cursor.fetchmany.assert_called_with(count=2)
+
+        # Post-Check
+        self._cursor.close.assert_called_once()
+        self.assertEqual(
+            first=self._cursor.fetchmany.call_count,
+            second=4
+        )
+
+    # -----------------------------------------------------------------------------------
+    def test_iter_chunks_behavior_continues_after_single_rows(self) -> None:
+        # Build
+        instance = self.get_instance_of_tested_cls()
+
+        # Operate
+        first_row: Sequence[Any] = next(instance)
+        actual_chunks: List[Sequence[Any]] = list(instance.iter_chunks())
+
+        # Check
+        self.assertEqual(
+            first=first_row,
+            second=self._rows[0]
+        )
+        self.assertListEqual(
+            list1=actual_chunks,
+            list2=[self._rows[1:2], self._rows[2:4], self._rows[4:5]]
+        )
+
+        # Post-Check
+        self._cursor.close.assert_called_once()
+
+    # -----------------------------------------------------------------------------------
+    def test_close_behavior_drains_unread_rows(self) -> None:
+        # Build
+        instance = self.get_instance_of_tested_cls()
+
+        # Operate
+        with instance as stream:
+            next(stream)
+
+        # Check
+        self.assertEqual(
+            first=self._cursor.fetchmany.call_count,
+            second=4
+        )
+        self._cursor.close.assert_called_once()
+
+        # Post-Check
+        self.assertListEqual(
+            list1=list(instance),
+            list2=[]
+        )
+
+    # -----------------------------------------------------------------------------------
+    def test_close_behavior_calls_on_close_once_after_cursor_is_closed(self) -> None:
+        # Build
+        on_close = UM.MagicMock()
+        instance = self.get_instance_of_tested_cls(on_close=on_close)
+
+        # Prepare mock
+        on_close.side_effect = lambda: self._cursor.close.assert_called_once()
+
+        # Operate
+        list(instance)
+        instance.close()
+
+        # Check
+        on_close.assert_called_once_with()
+
+
+    # -----------------------------------------------------------------------------------
+    def test_iteration_behavior_requests_chunk_size_from_chunk_sizer(self) -> None:
+        # Build
+        chunk_sizer = UM.MagicMock(spec=AdaptiveChunkSizer)
+        instance = self.get_instance_of_tested_cls(chunk_sizer=chunk_sizer)
+
+        # Prepare mock
+        chunk_sizer.get_chunk_size.return_value = 3
+
+        # Operate
+        actual_rows: List[Sequence[Any]] = list(instance)
+
+        # Check
+        self.assertListEqual(
+            list1=actual_rows,
+            list2=self._rows
+        )
+        self._cursor.fetchmany.assert_called_with(count=3)
+        chunk_sizer.record_fetch.assert_any_call(rows=self._rows[0:2], duration=UM.ANY)
+
+
+# _______________________________________________________________________________________
+class TestComponentNegative(BaseTestComponent):
+
+    # -----------------------------------------------------------------------------------
+    def test_constructor_behavior_when_pass_invalid_arguments(self) -> None:
+        # Build
+        invalid_types: List[Any] = GeneratingToolKit.generate_list_of_basic_python_types()
+
+        # Prepare test cycle
+        for invalid_type in invalid_types:
+            with self.subTest(pattern=invalid_type):
+                # Check
+                with self.assertRaises(expected_exception=InvalidArgumentTypeError):
+                    # Operate
+                    tested_cls(cursor=invalid_type)
+
+        # Check
+        with self.assertRaises(expected_exception=InvalidArgumentValueError):
+            # Operate
+            self.get_instance_of_tested_cls(chunk_size=0)
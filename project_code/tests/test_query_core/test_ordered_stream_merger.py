@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+
+"""
+Copyright 2025 kichiro-kun (Kei)
+Apache license, version 2.0 (Apache-2.0 license)
+"""
+
+__all__: list[str] = [
+    'TestComponentPositive',
+    'TestComponentNegative',
+]
+
+__author__ = 'kichiro-kun (Kei)'
+__version__ = '0.1.0'
+
+# ========================================================================================
+from operator import itemgetter
+from unittest import TestCase, mock as UM
+from typing import Any, Iterator, List, Sequence, Tuple
+
+from query_core.result_stream_component.ordered_stream_merger import OrderedStreamMerger as tested_cls
+
+from shared.exceptions.common import InvalidArgumentTypeError, InvalidArgumentValueError
+
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+class StreamStub(Iterator[Sequence[Any]]):
+    def __init__(self, rows: List[Tuple[Any, ...]]) -> None:
+        self.rows: Iterator[Tuple[Any, ...]] = iter(rows)
+        self.pulled_count: int = 0
+        self.close = UM.MagicMock()
+
+    def __next__(self) -> Tuple[Any, ...]:
+        row: Tuple[Any, ...] = next(self.rows)
+        self.pulled_count += 1
+
+        return row
+
+
+# _______________________________________________________________________________________
+class TestComponentPositive(TestCase):
+
+    # -----------------------------------------------------------------------------------
+    def test_iteration_behavior_merges_ordered_streams(self) -> None:
+        # Build
+        streams: List[StreamStub] = [
+            StreamStub(rows=[(1, 'a'), (4, 'a'), (7, 'a')]),
+            StreamStub(rows=[(2, 'b'), (5, 'b')]),
+            StreamStub(rows=[(3, 'c'), (6, 'c'), (8, 'c')]),
+        ]
+
+        # Operate
+        with tested_cls(streams=streams, sort_key=itemgetter(0)) as instance:
+            rows: List[Any] = list(instance)
+
+        # Check
+        self.assertListEqual(
+            list1=[row[0] for row in rows],
+            list2=[1, 2, 3, 4, 5, 6, 7, 8]
+        )
+        for stream in streams:
+            stream.close.assert_called_once_with()
+
+    # -----------------------------------------------------------------------------------
+    def test_iteration_behavior_stops_pulling_rows_at_limit(self) -> None:
+        # Build
+        streams: List[StreamStub] = [
+            StreamStub(rows=[(9,), (6,), (3,)]),
+            StreamStub(rows=[(8,), (5,), (2,)]),
+            StreamStub(rows=[(7,), (4,), (1,)]),
+        ]
+        instance = tested_cls(streams=streams, sort_key=itemgetter(0), limit=4, reverse=True)
+
+        # Operate
+        rows: List[Any] = list(instance)
+
+        # Check
+        self.assertListEqual(
+            list1=rows,
+            list2=[(9,), (8,), (7,), (6,)]
+        )
+        self.assertLessEqual(
+            a=sum(stream.pulled_count for stream in streams),
+            b=4 + len(streams)
+        )
+
+        # Post-Check
+        for stream in streams:
+            stream.close.assert_called_once_with()
+
+
+# _______________________________________________________________________________________
+class TestComponentNegative(TestCase):
+
+    # -----------------------------------------------------------------------------------
+    def test_constructor_behavior_when_pass_invalid_arguments(self) -> None:
+        # Check
+        with self.assertRaises(expected_exception=InvalidArgumentTypeError):
+            # Operate
+            tested_cls(streams=[], sort_key='id')
+
+        # Check
+        with self.assertRaises(expected_exception=InvalidArgumentValueError):
+            # Operate
+            tested_cls(streams=[], sort_key=itemgetter(0), limit=-1)
+
+    # -----------------------------------------------------------------------------------
+    def test_iteration_behavior_closes_streams_when_stream_fails(self) -> None:
+        # Build
+        def lost_connection() -> Iterator[Tuple[Any, ...]]:
+            raise RuntimeError('Lost connection')
+            yield
+
+        failing_stream = StreamStub(rows=[])
+        failing_stream.rows = lost_connection()
+        healthy_stream = StreamStub(rows=[(1,)])
+
+        # Check
+        with self.assertRaises(expected_exception=RuntimeError):
+            # Operate
+            list(tested_cls(streams=[healthy_stream, failing_stream], sort_key=itemgetter(0)))
+
+        # Post-Check
+        healthy_stream.close.assert_called_once_with()
+        failing_stream.close.assert_called_once_with()
@@ -0,0 +1,261 @@
+# -*- coding: utf-8 -*-
+
+"""
+Copyright 2025 kichiro-kun (Kei)
+Apache license, version 2.0 (Apache-2.0 license)
+"""
+
+__all__: list[str] = [
+    'TestComponentPositive',
+    'TestComponentNegative',
+]
+
+__author__ = 'kichiro-kun (Kei)'
+__version__ = '0.7.0'
+
+# ========================================================================================
+from unittest import TestCase
+from typing import Any, List, Tuple
+
+from query_core.query_builder_component.query_builder import QueryBuilder as tested_cls
+
+from shared.exceptions.common import InvalidArgumentValueError
+
+
+# _______________________________________________________________________________________
+class TestComponentPositive(TestCase):
+
+    # -----------------------------------------------------------------------------------
+    def test_build_values_group_behavior(self) -> None:
+        # Build
+        expected_group: str = '(?, ?, ?)'
+
+        # Operate
+        actual_group: str = tested_cls.build_values_group(columns_count=3, placeholder='?')
+
+        # Check
+        self.assertEqual(
+            first=actual_group,
+            second=expected_group
+        )
+
+    # -----------------------------------------------------------------------------------
+    def test_build_insert_query_behavior(self) -> None:
+        # Build
+        expected_query: str = 'INSERT INTO berry (title, price) VALUES (%s, %s),(%s, %s)'
+
+        # Operate
+        actual_query: str = tested_cls.build_insert_query(
+            table='berry', columns=('title', 'price'), rows_count=2, placeholder='%s'
+        )
+
+        # Check
+        self.assertEqual(
+            first=actual_query,
+            second=expected_query
+        )
+
+    # -----------------------------------------------------------------------------------
+    def test_build_upsert_query_behavior(self) -> None:
+        # Build
+        expected_queries: List[Tuple[Tuple[str, ...], str]] = [
+            (
+                ('title', 'price'),
+                'INSERT INTO berry (id, title, price) VALUES (?, ?, ?) '
+                'ON DUPLICATE KEY UPDATE title = VALUES(title), price = VALUES(price)'
+            ),
+            (
+                (),
+                'INSERT INTO berry (id, title, price) VALUES (?, ?, ?) '
+                'ON DUPLICATE KEY UPDATE id = id'
+            ),
+        ]
+
+        # Prepare test cycle
+        for update_columns, expected_query in expected_queries:
+            with self.subTest(pattern=update_columns):
+                # Operate
+                actual_query: str = tested_cls.build_upsert_query(
+                    table='berry',
+                    columns=('id', 'title', 'price'),
+                    update_columns=update_columns,
+                    placeholder='?'
+                )
+
+                # Check
+                self.assertEqual(
+                    first=actual_query,
+                    second=expected_query
+                )
+
+    # -----------------------------------------------------------------------------------
+    def test_estimate_row_size_behavior_covers_escaped_literal(self) -> None:
+        # Build
+        rows: List[Tuple[Any, ...]] = [
+            (1, None, 2.5),
+            ("it's", b'\x00\x01'),
+            ('',),
+        ]
+
+        # Prepare test cycle
+        for row in rows:
+            with self.subTest(pattern=row):
+                # Build
+                minimal_size: int = len(
+                    '(' + ', '.join(repr(value) for value in row) + ')'
+                )
+
+                # Operate
+                actual_size: int = tested_cls.estimate_row_size(row=row)
+
+                # Check
+                self.assertGreaterEqual(
+                    a=actual_size,
+                    b=minimal_size
+                )
+
+
+    # -----------------------------------------------------------------------------------
+    def test_build_max_execution_time_query_behavior(self) -> None:
+        # Operate
+        actual_query: str = tested_cls.build_max_execution_time_query(
+            query='  select id FROM berry WHERE cost > ?', timeout=1.2501
+        )
+
+        # Check
+        self.assertEqual(
+            first=actual_query,
+            second='  select /*+ MAX_EXECUTION_TIME(1251) */ id FROM berry WHERE cost > ?'
+        )
+        self.assertFalse(
+            expr=tested_cls.supports_max_execution_time_hint(query='SELECT id FROM berry FOR UPDATE')
+        )
+        self.assertFalse(
+            expr=tested_cls.supports_max_execution_time_hint(query='UPDATE berry SET cost = 1')
+        )
+
+    # -----------------------------------------------------------------------------------
+    def test_build_keyset_page_query_behavior(self) -> None:
+        # Operate
+        first_page_query: str = tested_cls.build_keyset_page_query(
+            query='SELECT id FROM berry WHERE cost > %s; ', key_column='id', page_size=50,
+            placeholder='%s', is_first_page=True
+        )
+        next_page_query: str = tested_cls.build_keyset_page_query(
+            query='SELECT id FROM berry', key_column='id', page_size=50,
+            placeholder='%s', is_first_page=False, descending=True
+        )
+
+        # Check
+        self.assertEqual(
+            first=first_page_query,
+            second='SELECT * FROM (SELECT id FROM berry WHERE cost > %s) AS keyset_page '
+                   'ORDER BY keyset_page.id ASC LIMIT 50'
+        )
+        self.assertEqual(
+            first=next_page_query,
+            second='SELECT * FROM (SELECT id FROM berry) AS keyset_page '
+                   'WHERE keyset_page.id < %s ORDER BY keyset_page.id DESC LIMIT 50'
+        )
+
+    # -----------------------------------------------------------------------------------
+    def test_build_blob_queries_behavior(self) -> None:
+        # Operate
+        length_query: str = tested_cls.build_blob_length_query(
+            table='shop.`document`', column='payload', where='id = ?'
+        )
+        slice_query: str = tested_cls.build_blob_slice_query(
+            table='shop.`document`', column='payload', where='id = ?', placeholder='?'
+        )
+
+        # Check
+        self.assertEqual(
+            first=length_query,
+            second='SELECT OCTET_LENGTH(payload) FROM shop.`document` WHERE id = ?'
+        )
+        self.assertEqual(
+            first=slice_query,
+            second='SELECT SUBSTRING(payload, ?, ?), OCTET_LENGTH(payload) FROM shop.`document` WHERE id = ?'
+        )
+
+    # -----------------------------------------------------------------------------------
+    def test_build_key_lookup_query_behavior(self) -> None:
+        # Operate
+        actual_query: str = tested_cls.build_key_lookup_query(
+            table='berry', columns=('id', 'title'), key_column='id', keys_count=3, placeholder='?'
+        )
+
+        # Check
+        self.assertEqual(
+            first=actual_query,
+            second='SELECT id, title FROM berry WHERE id IN (?, ?, ?)'
+        )
+
+
+# _______________________________________________________________________________________
+class TestComponentNegative(TestCase):
+
+    # -----------------------------------------------------------------------------------
+    def test_build_methods_behavior_when_pass_invalid_values(self) -> None:
+        # Build
+        expected_exception = InvalidArgumentValueError
+
+        # Check
+        with self.assertRaises(expected_exception=expected_exception):
+            # Operate
+            tested_cls.build_values_group(columns_count=0, placeholder='?')
+
+        # Check
+        with self.assertRaises(expected_exception=expected_exception):
+            # Operate
+            tested_cls.build_insert_header(table='berry', columns=())
+
+        # Check
+        with self.assertRaises(expected_exception=expected_exception):
+            # Operate
+            tested_cls.build_max_execution_time_query(query='DELETE FROM berry', timeout=1.0)
+
+        # Check
+        with self.assertRaises(expected_exception=expected_exception):
+            # Operate
+            tested_cls.build_keyset_page_query(
+                query='SELECT id FROM berry', key_column='id', page_size=0, placeholder='?', is_first_page=True
+            )
+
+        # Check
+        for invalid_key_column in ('t.id', '`t`.`id`', 'id DESC', ''):
+            with self.subTest(pattern=invalid_key_column):
+                with self.assertRaises(expected_exception=expected_exception):
+                    # Operate
+                    tested_cls.build_keyset_page_query(
+                        query='SELECT t.id FROM berry AS t', key_column=invalid_key_column, page_size=10,
+                        placeholder='?', is_first_page=True
+                    )
+
+        # Check
+        for unmergeable_query in (
+            'SELECT cost, COUNT(*) AS id FROM berry GROUP BY cost',
+            'SELECT DISTINCT id FROM berry',
+            'SELECT id FROM berry ORDER BY cost LIMIT 100',
+            'SELECT id FROM berry UNION SELECT id FROM fruit',
+            'select max(id) as id from berry',
+        ):
+            with self.subTest(pattern=unmergeable_query):
+                with self.assertRaises(expected_exception=expected_exception):
+                    # Operate
+                    tested_cls.build_keyset_page_query(
+                        query=unmergeable_query, key_column='id', page_size=10, placeholder='?', is_first_page=True
+                    )
+
+        # Check
+        for table, column, where in (
+            ('document d', 'payload', 'id = ?'),
+            ('document', 'payload, secret', 'id = ?'),
+            ('document', 'payload', 'id = ?; DELETE FROM document'),
+            ('document', 'payload', 'id = ? /* */'),
+            ('document', 'payload', ' '),
+        ):
+            with self.subTest(pattern=(table, column, where)):
+                with self.assertRaises(expected_exception=expected_exception):
+                    # Operate
+                    tested_cls.build_blob_slice_query(table=table, column=column, where=where, placeholder='?')
@@ -0,0 +1,341 @@
+# -*- coding: utf-8 -*-
+
+"""
+Copyright 2025 kichiro-kun (Kei)
+Apache license, version 2.0 (Apache-2.0 license)
+"""
+
+__all__: list[str] = [
+    'TestComponentPositive',
+    'TestComponentNegative',
+    'TestSQLTableExtractor',
+]
+
+__author__ = 'kichiro-kun (Kei)'
+__version__ = '0.2.0'
+
+# ========================================================================================
+from unittest import TestCase, mock as UM
+from typing import Any, Dict, List
+
+import query_core.query_cache_component.realizations.lru_query_cache as tested_module
+from query_core.query_cache_component.realizations.lru_query_cache \
+    import LRUQueryCache as tested_cls
+from query_core.query_cache_component.abstract.query_cache_interface import NoQueryCache
+from query_core.query_cache_component.sql_table_extractor import SQLTableExtractor
+
+from shared.exceptions.common import InvalidArgumentTypeError, InvalidArgumentValueError, \
+    IsNullObjectOperation
+
+from tests.utils.base_test_case_cls import BaseTestCase
+from tests.utils.toolkit import *
+
+
+# _______________________________________________________________________________________
+class TestComponentPositive(BaseTestCase[tested_cls]):
+
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    def get_instance_of_tested_cls(self, **kwargs) -> tested_cls:
+        return tested_cls(**kwargs)
+
+    # -----------------------------------------------------------------------------------
+    def test_get_behavior_returns_stored_value_until_ttl_expires(self) -> None:
+        # Build
+        instance = self.get_instance_of_tested_cls(default_ttl=10.0)
+        expected_value = ((1, 'berry'),)
+
+        # Prepare test context
+        with UM.patch.object(target=tested_module.time, attribute='monotonic') as mock_monotonic:
+            mock_monotonic.return_value = 100.0
+            instance.put(key='key', value=expected_value, tables=('berry',))
+
+            # Operate
+            mock_monotonic.return_value = 109.0
+            fresh_result = instance.get(key='key')
+
+            mock_monotonic.return_value = 110.0
+            expired_result = instance.get(key='key')
+
+        # Check
+        self.assertEqual(
+            first=fresh_result,
+            second=(True, expected_value)
+        )
+        self.assertEqual(
+            first=expired_result,
+            second=(False, None)
+        )
+
+        # Post-Check
+        self.assertEqual(
+            first=instance.get_statistics(),
+            second=(1, 1, 0, 0, 0, 0)
+        )
+
+    # -----------------------------------------------------------------------------------
+    def test_put_behavior_evicts_least_recently_used_entries(self) -> None:
+        # Build
+        instance = self.get_instance_of_tested_cls(max_entries=2)
+
+        # Prepare instance
+        instance.put(key='first', value=(1,), tables=())
+        instance.put(key='second', value=(2,), tables=())
+        instance.get(key='first')
+
+        # Operate
+        instance.put(key='third', value=(3,), tables=())
+
+        # Check
+        self.assertTrue(expr=instance.get(key='first')[0])
+        self.assertFalse(expr=instance.get(key='second')[0])
+        self.assertTrue(expr=instance.get(key='third')[0])
+
+        # Post-Check
+        self.assertEqual(
+            first=instance.get_statistics().evictions,
+            second=1
+        )
+
+    # -----------------------------------------------------------------------------------
+    def test_put_behavior_keeps_cache_within_memory_budget(self) -> None:
+        # Build
+        value = tuple((index, 'x' * 100) for index in range(10))
+        instance = self.get_instance_of_tested_cls()
+
+        # Prepare instance
+        instance.put(key='probe', value=value, tables=())
+        value_size: int = instance.get_statistics().size_bytes
+
+        instance = self.get_instance_of_tested_cls(max_bytes=value_size * 2)
+
+        # Operate
+        for key in range(3):
+            instance.put(key=key, value=value, tables=())
+
+        instance.put(key='huge', value=value * 3, tables=())
+
+        # Check
+        self.assertEqual(
+            first=instance.get_statistics().entries,
+            second=2
+        )
+        self.assertFalse(expr=instance.get(key=0)[0])
+        self.assertFalse(expr=instance.get(key='huge')[0])
+
+        # Post-Check
+        self.assertLessEqual(
+            a=instance.get_statistics().size_bytes,
+            b=value_size * 2
+        )
+
+    # -----------------------------------------------------------------------------------
+    def test_invalidate_tables_behavior(self) -> None:
+        # Build
+        instance = self.get_instance_of_tested_cls()
+
+        # Prepare instance
+        instance.put(key='berries', value=(1,), tables=('berry',))
+        instance.put(key='joined', value=(2,), tables=('berry', 'price'))
+        instance.put(key='prices', value=(3,), tables=('price',))
+
+        # Operate
+        removed_count: int = instance.invalidate_tables(tables=('BERRY',))
+
+        # Check
+        self.assertEqual(
+            first=removed_count,
+            second=2
+        )
+        self.assertFalse(expr=instance.get(key='joined')[0])
+        self.assertTrue(expr=instance.get(key='prices')[0])
+
+        # Post-Check
+        instance.clear()
+        self.assertEqual(
+            first=instance.get_statistics()[3:],
+            second=(3, 0, 0)
+        )
+
+    # -----------------------------------------------------------------------------------
+    def test_put_behavior_skips_result_read_before_invalidation(self) -> None:
+        # Build
+        instance = self.get_instance_of_tested_cls()
+
+        # Prepare instance
+        instance.get(key='berries')
+        instance.invalidate_tables(tables=('price',))
+
+        # Operate
+        instance.put(key='berries', value=(1,), tables=('berry',))
+
+        # Check
+        self.assertTrue(expr=instance.get(key='berries')[0])
+
+        invalidations: Dict[str, Any] = {
+            'invalidate_tables': lambda: instance.invalidate_tables(tables=('BERRY',)),
+            'clear': instance.clear,
+        }  # Method name & invalidation
+
+        for method_name, invalidate in invalidations.items():
+            with self.subTest(pattern=method_name):
+                # Prepare instance
+                instance.invalidate_tables(tables=('berry',))
+                instance.get(key='berries')
+                invalidate()
+
+                # Operate
+                instance.put(key='berries', value=(2,), tables=('berry',))
+
+                # Check
+                self.assertEqual(
+                    first=instance.get(key='berries'),
+                    second=(False, None)
+                )
+
+    # -----------------------------------------------------------------------------------
+    def test_put_behavior_when_ttl_is_zero(self) -> None:
+        # Build
+        instance = self.get_instance_of_tested_cls()
+
+        # Operate
+        instance.put(key='key', value=(1,), tables=(), ttl=0)
+
+        # Check
+        self.assertEqual(
+            first=instance.get(key='key'),
+            second=(False, None)
+        )
+
+    # -----------------------------------------------------------------------------------
+    def test_null_object_realization(self) -> None:
+        # Build
+        method_calls: Dict[str, Dict[str, Any]] = {
+            'get': {'key': 'key'},
+            'put': {'key': 'key', 'value': (), 'tables': ()},
+            'invalidate_tables': {'tables': ()},
+            'clear': {},
+            'get_statistics': {},
+        }  # Param name & kwargs
+
+        # Prepare data
+        calls: List[MethodCall] = [
+            MethodCall(method_name=name, kwargs=kwargs)
+            for name, kwargs in method_calls.items()
+        ]
+
+        # Operate
+        instance = NoQueryCache()
+
+        # Check
+        self.assertTrue(
+            expr=InspectingToolKit.check_all_methods_raise_expected_exception_for_null_object(
+                obj=instance,
+                method_calls=calls,
+                exception_type=IsNullObjectOperation
+            )
+        )
+
+
+# _______________________________________________________________________________________
+class TestComponentNegative(BaseTestCase[tested_cls]):
+
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    def get_instance_of_tested_cls(self, **kwargs) -> tested_cls:
+        return tested_cls(**kwargs)
+
+    # -----------------------------------------------------------------------------------
+    def test_constructor_behavior_when_pass_invalid_arguments(self) -> None:
+        # Build
+        invalid_types: List[Any] = GeneratingToolKit.generate_list_of_basic_python_types()
+
+        # Check
+        for invalid_type in invalid_types:
+            if isinstance(invalid_type, (int, float)) and not isinstance(invalid_type, bool):
+                continue
+
+            with self.subTest(pattern=invalid_type):
+                with self.assertRaises(expected_exception=InvalidArgumentTypeError):
+                    # Operate
+                    self.get_instance_of_tested_cls(default_ttl=invalid_type)
+
+        # Check
+        with self.assertRaises(expected_exception=InvalidArgumentValueError):
+            # Operate
+            self.get_instance_of_tested_cls(max_entries=0)
+
+        # Check
+        with self.assertRaises(expected_exception=InvalidArgumentValueError):
+            # Operate
+            self.get_instance_of_tested_cls().put(key='key', value=(), tables=(), ttl=-1)
+
+
+# _______________________________________________________________________________________
+class TestSQLTableExtractor(TestCase):
+
+    # -----------------------------------------------------------------------------------
+    def test_extract_tables_behavior(self) -> None:
+        # Build
+        queries: Dict[str, frozenset] = {
+            'SELECT * FROM berry b JOIN shop.`Price` AS p ON b.id = p.id': frozenset({'berry', 'price'}),
+            'SELECT * FROM berry JOIN price USING (id)': frozenset({'berry', 'price'}),
+            'SELECT * FROM berry, price p WHERE id IN (SELECT id FROM stock)':
+                frozenset({'berry', 'price', 'stock'}),
+            'INSERT INTO berry (title) VALUES (?)': frozenset({'berry'}),
+            'UPDATE berry, price SET berry.cost = price.cost': frozenset({'berry', 'price'}),
+            'DELETE FROM berry WHERE id = ?': frozenset({'berry'}),
+            'TRUNCATE TABLE berry': frozenset({'berry'}),
+            'SELECT 1': frozenset(),
+        }  # Query & expected tables
+
+        for query, expected_tables in queries.items():
+            with self.subTest(pattern=query):
+                # Operate
+                tables = SQLTableExtractor.extract_tables(query)
+
+                # Check
+                self.assertSetEqual(
+                    set1=set(tables),
+                    set2=set(expected_tables)
+                )
+
+    # -----------------------------------------------------------------------------------
+    def test_is_cacheable_query_behavior(self) -> None:
+        # Build
+        queries: Dict[str, bool] = {
+            'SELECT * FROM berry': True,
+            '  with t AS (SELECT 1) SELECT * FROM t': True,
+            'SELECT * FROM berry FOR UPDATE': False,
+            'SELECT * FROM berry LOCK IN SHARE MODE': False,
+            'UPDATE berry SET cost = 1': False,
+            'INSERT INTO berry SELECT * FROM price': False,
+        }  # Query & expected flag
+
+        for query, expected_flag in queries.items():
+            with self.subTest(pattern=query):
+                # Operate & Check
+                self.assertEqual(
+                    first=SQLTableExtractor.is_cacheable_query(query),
+                    second=expected_flag
+                )
+
+    # -----------------------------------------------------------------------------------
+    def test_is_data_modifying_query_behavior(self) -> None:
+        # Build
+        queries: Dict[str, bool] = {
+            'SELECT * FROM berry': False,
+            'SAVEPOINT group_commit_1': False,
+            'release savepoint group_commit_1': False,
+            'SET autocommit = 0': False,
+            'START TRANSACTION': False,
+            'ROLLBACK TO SAVEPOINT group_commit_1': True,
+            'UPDATE berry SET cost = 1': True,
+            'CALL refresh_prices()': True,
+        }  # Query & expected flag
+
+        for query, expected_flag in queries.items():
+            with self.subTest(pattern=query):
+                # Operate & Check
+                self.assertEqual(
+                    first=SQLTableExtractor.is_data_modifying_query(query),
+                    second=expected_flag
+                )
@@ -0,0 +1,243 @@
+# -*- coding: utf-8 -*-
+
+"""
+Copyright 2025 kichiro-kun (Kei)
+Apache license, version 2.0 (Apache-2.0 license)
+"""
+
+__all__: list[str] = [
+    'TestComponentPositive',
+    'TestComponentNegative',
+    'TestTieredQueryCache',
+]
+
+__author__ = 'kichiro-kun (Kei)'
+__version__ = '0.1.0'
+
+# ========================================================================================
+import os
+import tempfile
+from unittest import TestCase, mock as UM
+
+from query_core.query_cache_component.realizations.sqlite_query_cache \
+    import SQLiteQueryCache as tested_cls
+from query_core.query_cache_component.realizations.tiered_query_cache import TieredQueryCache
+from query_core.query_cache_component.realizations.lru_query_cache import LRUQueryCache
+from query_core.query_cache_component.abstract.query_cache_interface import QueryCacheInterface
+
+from shared.exceptions.common import InvalidArgumentTypeError, InvalidArgumentValueError
+
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+class BaseTestComponent(TestCase):
+
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    def setUp(self) -> None:
+        super().setUp()
+
+        self._temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self._temp_dir.cleanup)
+
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    def get_instance_of_tested_cls(self, **kwargs) -> tested_cls:
+        kwargs.setdefault('file_path', os.path.join(self._temp_dir.name, 'query_cache.sqlite3'))
+
+        return tested_cls(**kwargs)
+
+
+# _______________________________________________________________________________________
+class TestComponentPositive(BaseTestComponent):
+
+    # -----------------------------------------------------------------------------------
+    def test_put_behavior_shares_entries_between_instances(self) -> None:
+        # Build
+        first_worker = self.get_instance_of_tested_cls()
+        second_worker = self.get_instance_of_tested_cls()
+        key = ('all', 'SELECT * FROM berry WHERE id = ?', (1,))
+
+        # Operate
+        first_worker.put(key=key, value=((1, 'berry'),), tables=('berry',))
+
+        # Check
+        self.assertEqual(
+            first=second_worker.get(key=key),
+            second=(True, ((1, 'berry'),))
+        )
+        self.assertEqual(
+            first=second_worker.get(key=('all', 'SELECT 1', ())),
+            second=(False, None)
+        )
+
+    # -----------------------------------------------------------------------------------
+    def test_invalidate_tables_behavior_is_visible_to_other_instances(self) -> None:
+        # Build
+        first_worker = self.get_instance_of_tested_cls()
+        second_worker = self.get_instance_of_tested_cls()
+
+        # Prepare instance
+        first_worker.put(key='berries', value=(1,), tables=('berry',))
+        first_worker.put(key='prices', value=(2,), tables=('price',))
+
+        # Operate
+        removed_count: int = second_worker.invalidate_tables(tables=('BERRY',))
+
+        # Check
+        self.assertEqual(
+            first=removed_count,
+            second=1
+        )
+        self.assertFalse(expr=first_worker.get(key='berries')[0])
+        self.assertTrue(expr=first_worker.get(key='prices')[0])
+
+        # Operate
+        second_worker.clear()
+
+        # Post-Check
+        self.assertFalse(expr=first_worker.get(key='prices')[0])
+
+    # -----------------------------------------------------------------------------------
+    def test_put_behavior_rejects_result_read_before_concurrent_invalidation(self) -> None:
+        # Build
+        reader = self.get_instance_of_tested_cls()
+        writer = self.get_instance_of_tested_cls()
+
+        # Prepare instance
+        reader.get(key='berries')  # Промах фиксирует поколение до чтения из СУБД
+
+        # Operate
+        writer.invalidate_tables(tables=('berry',))
+        reader.put(key='berries', value=('stale',), tables=('berry',))
+
+        # Check
+        self.assertEqual(
+            first=reader.get(key='berries'),
+            second=(False, None)
+        )
+
+        # Post-Check
+        reader.put(key='berries', value=('fresh',), tables=('berry',))
+        self.assertEqual(
+            first=writer.get(key='berries'),
+            second=(True, ('fresh',))
+        )
+
+    # -----------------------------------------------------------------------------------
+    def test_put_behavior_keeps_file_within_size_cap(self) -> None:
+        # Build
+        value = tuple(str(index) * 100 for index in range(10))
+        instance = self.get_instance_of_tested_cls(max_bytes=2500)
+
+        # Operate
+        for key in range(3):
+            instance.put(key=key, value=value, tables=())
+
+        # Check
+        statistics = instance.get_statistics()
+
+        self.assertEqual(
+            first=(statistics.entries, statistics.evictions),
+            second=(2, 1)
+        )
+        self.assertFalse(expr=instance.get(key=0)[0])
+        self.assertTrue(expr=instance.get(key=2)[0])
+
+    # -----------------------------------------------------------------------------------
+    def test_get_behavior_when_entry_is_expired(self) -> None:
+        # Build
+        instance = self.get_instance_of_tested_cls()
+
+        # Prepare instance
+        instance.put(key='key', value=(1,), tables=(), ttl=0.001)
+
+        # Prepare test context
+        with UM.patch('time.time', return_value=10 ** 10):
+            # Operate
+            op_result = instance.get(key='key')
+
+        # Check
+        self.assertEqual(
+            first=op_result,
+            second=(False, None)
+        )
+
+
+# _______________________________________________________________________________________
+class TestComponentNegative(BaseTestComponent):
+
+    # -----------------------------------------------------------------------------------
+    def test_constructor_behavior_when_pass_invalid_arguments(self) -> None:
+        # Check
+        with self.assertRaises(expected_exception=InvalidArgumentTypeError):
+            # Operate
+            self.get_instance_of_tested_cls(file_path=None)
+
+        # Check
+        with self.assertRaises(expected_exception=InvalidArgumentValueError):
+            # Operate
+            self.get_instance_of_tested_cls(max_bytes=0)
+
+    # -----------------------------------------------------------------------------------
+    def test_put_and_get_behavior_when_key_or_value_is_not_supported(self) -> None:
+        # Build
+        instance = self.get_instance_of_tested_cls()
+
+        # Operate
+        instance.put(key='key', value=(lambda: None,), tables=())
+
+        # Check
+        self.assertFalse(expr=instance.get(key='key')[0])
+
+        # Check
+        with self.assertRaises(expected_exception=TypeError):
+            # Operate
+            instance.get(key=('all', [1, 2]))
+
+
+# _______________________________________________________________________________________
+class TestTieredQueryCache(TestCase):
+
+    # -----------------------------------------------------------------------------------
+    def test_get_behavior_fills_local_tier_from_shared_tier(self) -> None:
+        # Build
+        local_cache = LRUQueryCache()
+        shared_cache = UM.MagicMock(spec=QueryCacheInterface)
+        instance = TieredQueryCache(local_cache=local_cache, shared_cache=shared_cache, local_ttl=5.0)
+
+        # Prepare mock
+        shared_cache.get.return_value = (True, (frozenset({'berry'}), ((1,),)))
+
+        # Operate
+        first_result = instance.get(key='key')
+        second_result = instance.get(key='key')
+
+        # Check
+        self.assertEqual(
+            first=(first_result, second_result),
+            second=((True, ((1,),)), (True, ((1,),)))
+        )
+        shared_cache.get.assert_called_once_with(key='key')
+
+        # Operate
+        instance.invalidate_tables(tables=('berry',))
+
+        # Post-Check
+        self.assertFalse(expr=local_cache.get(key='key')[0])
+        shared_cache.invalidate_tables.assert_called_once_with(tables=frozenset({'berry'}))
+
+    # -----------------------------------------------------------------------------------
+    def test_put_behavior_writes_both_tiers(self) -> None:
+        # Build
+        local_cache = UM.MagicMock(spec=QueryCacheInterface)
+        shared_cache = UM.MagicMock(spec=QueryCacheInterface)
+        instance = TieredQueryCache(local_cache=local_cache, shared_cache=shared_cache, local_ttl=1.0)
+
+        # Operate
+        instance.put(key='key', value=(1,), tables=['berry'], ttl=30.0)
+
+        # Check
+        local_cache.put.assert_called_once_with(
+            key='key', value=(1,), tables=frozenset({'berry'}), ttl=1.0
+        )
+        shared_cache.put.assert_called_once_with(
+            key='key', value=(frozenset({'berry'}), (1,)), tables=frozenset({'berry'}), ttl=30.0
+        )
@@ -0,0 +1,151 @@
+# -*- coding: utf-8 -*-
+
+"""
+Copyright 2025 kichiro-kun (Kei)
+Apache license, version 2.0 (Apache-2.0 license)
+"""
+
+__all__: list[str] = [
+    'TestComponentPositive',
+    'TestComponentNegative',
+]
+
+__author__ = 'kichiro-kun (Kei)'
+__version__ = '0.1.0'
+
+# ========================================================================================
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock as UM
+from typing import Any, List
+
+from query_core.single_flight_component.single_flight_group \
+    import NoSingleFlightGroup, SingleFlightGroup as tested_cls
+
+from shared.exceptions.common import InvalidArgumentTypeError, IsNullObjectOperation
+
+from tests.utils.base_test_case_cls import BaseTestCase
+from tests.utils.toolkit import *
+
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+class BaseTestComponent(BaseTestCase[tested_cls]):
+
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    def get_instance_of_tested_cls(self, **kwargs) -> tested_cls:
+        return tested_cls(**kwargs)
+
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    def run_concurrent_calls(self, instance: tested_cls, operation: UM.MagicMock,
+                             release_event: threading.Event, calls_count: int) -> List[Any]:
+        with ThreadPoolExecutor(max_workers=calls_count) as executor:
+            futures = [
+                executor.submit(instance.execute, 'key', operation)
+                for _ in range(calls_count)
+            ]
+
+            # Ведущий вызов удерживается, пока остальные не присоединятся к нему
+            deadline: float = time.monotonic() + 5
+            while instance.get_shared_calls_count() < calls_count - 1 and time.monotonic() < deadline:
+                time.sleep(0.001)
+
+            release_event.set()
+
+            return [future.exception() or future.result() for future in futures]
+
+
+# _______________________________________________________________________________________
+class TestComponentPositive(BaseTestComponent):
+
+    # -----------------------------------------------------------------------------------
+    def test_execute_behavior_shares_one_execution_between_concurrent_calls(self) -> None:
+        # Build
+        instance = self.get_instance_of_tested_cls()
+        release_event = threading.Event()
+        expected_result = ((1, 'berry'),)
+        operation = UM.MagicMock(side_effect=lambda: release_event.wait() and expected_result)
+
+        # Operate
+        results: List[Any] = self.run_concurrent_calls(
+            instance=instance, operation=operation, release_event=release_event, calls_count=5
+        )
+
+        # Check
+        operation.assert_called_once_with()
+        self.assertTrue(
+            expr=all(result is expected_result for result in results)
+        )
+
+        # Post-Check
+        self.assertEqual(
+            first=instance.get_in_flight_count(),
+            second=0
+        )
+        self.assertEqual(
+            first=instance.execute(key='key', operation=lambda: 'next'),
+            second='next'
+        )
+
+    # -----------------------------------------------------------------------------------
+    def test_execute_behavior_shares_error_between_concurrent_calls(self) -> None:
+        # Build
+        instance = self.get_instance_of_tested_cls()
+        release_event = threading.Event()
+        expected_error = RuntimeError('Server has gone away')
+
+        def operation() -> None:
+            release_event.wait()
+            raise expected_error
+
+        mock_operation = UM.MagicMock(side_effect=operation)
+
+        # Operate
+        results: List[Any] = self.run_concurrent_calls(
+            instance=instance, operation=mock_operation, release_event=release_event, calls_count=3
+        )
+
+        # Check
+        mock_operation.assert_called_once_with()
+        self.assertTrue(
+            expr=all(result is expected_error for result in results)
+        )
+
+    # -----------------------------------------------------------------------------------
+    def test_null_object_realization(self) -> None:
+        # Build
+        calls: List[MethodCall] = [
+            MethodCall(method_name='execute', kwargs={'key': 'key', 'operation': lambda: None}),
+            MethodCall(method_name='get_in_flight_count', kwargs={}),
+            MethodCall(method_name='get_shared_calls_count', kwargs={}),
+        ]
+
+        # Operate
+        instance = NoSingleFlightGroup()
+
+        # Check
+        self.assertTrue(
+            expr=InspectingToolKit.check_all_methods_raise_expected_exception_for_null_object(
+                obj=instance,
+                method_calls=calls,
+                exception_type=IsNullObjectOperation
+            )
+        )
+
+
+# _______________________________________________________________________________________
+class TestComponentNegative(BaseTestComponent):
+
+    # -----------------------------------------------------------------------------------
+    def test_execute_behavior_when_operation_is_not_callable(self) -> None:
+        # Build
+        instance = self.get_instance_of_tested_cls()
+        invalid_types: List[Any] = GeneratingToolKit.generate_list_of_basic_python_types()
+
+        # Prepare test cycle
+        for invalid_type in invalid_types:
+            with self.subTest(pattern=invalid_type):
+                # Check
+                with self.assertRaises(expected_exception=InvalidArgumentTypeError):
+                    # Operate
+                    instance.execute(key='key', operation=invalid_type)
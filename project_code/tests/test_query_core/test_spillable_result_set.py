@@ -0,0 +1,194 @@
+# -*- coding: utf-8 -*-
+
+"""
+Copyright 2025 kichiro-kun (Kei)
+Apache license, version 2.0 (Apache-2.0 license)
+"""
+
+__all__: list[str] = [
+    'TestComponentPositive',
+    'TestComponentNegative',
+]
+
+__author__ = 'kichiro-kun (Kei)'
+__version__ = '0.2.0'
+
+# ========================================================================================
+import os
+import tempfile
+import tracemalloc
+from collections import namedtuple
+from unittest import TestCase
+from typing import Any, Iterator, List, Tuple
+
+from query_core.result_stream_component.spillable_result_set import SpillableResultSet as tested_cls
+
+from shared.exceptions.common import InvalidArgumentTypeError, InvalidArgumentValueError, \
+    OperationFailedComponentIsClosed
+
+
+# _______________________________________________________________________________________
+class TestComponentPositive(TestCase):
+
+    # -----------------------------------------------------------------------------------
+    def test_constructor_behavior_keeps_small_result_in_memory(self) -> None:
+        # Build
+        rows: List[Tuple[Any, ...]] = [(1, 'apple'), (2, 'banana')]
+
+        # Operate
+        with tested_cls(rows=iter(rows), memory_limit=1024) as instance:
+            # Check
+            self.assertFalse(
+                expr=instance.is_spilled()
+            )
+            self.assertEqual(
+                first=instance.get_spilled_bytes(),
+                second=0
+            )
+            self.assertListEqual(
+                list1=list(instance),
+                list2=rows
+            )
+
+    # -----------------------------------------------------------------------------------
+    def test_constructor_behavior_spills_rows_past_memory_limit(self) -> None:
+        # Build
+        rows: List[Tuple[Any, ...]] = [(index, 'x' * 100, None) for index in range(50)]
+
+        with tempfile.TemporaryDirectory() as spill_directory:
+            # Operate
+            with tested_cls(rows=iter(rows), memory_limit=1000, spill_directory=spill_directory) as instance:
+                # Check
+                self.assertTrue(
+                    expr=instance.is_spilled()
+                )
+                self.assertGreater(
+                    a=instance.get_spilled_bytes(),
+                    b=0
+                )
+                self.assertEqual(
+                    first=len(instance),
+                    second=50
+                )
+                self.assertEqual(
+                    first=instance[0],
+                    second=rows[0]
+                )
+                self.assertEqual(
+                    first=instance[-1],
+                    second=rows[-1]
+                )
+                self.assertListEqual(
+                    list1=instance[10:13],
+                    list2=rows[10:13]
+                )
+                self.assertListEqual(
+                    list1=list(instance),
+                    list2=rows
+                )
+
+            # Post-Check: временный файл не остаётся в каталоге
+            self.assertListEqual(
+                list1=os.listdir(spill_directory),
+                list2=[]
+            )
+
+    # -----------------------------------------------------------------------------------
+    def test_constructor_behavior_keeps_rows_in_memory_within_memory_limit(self) -> None:
+        # Build
+        memory_limit: int = 128 * 1024
+
+        # Строки создаются по мере чтения, как у курсора, чтобы их память попала в замер
+        def generate_rows(rows_count: int) -> Iterator[Tuple[int, int, int]]:
+            for index in range(rows_count):
+                yield (index + 100000, index + 200000, index + 300000)
+
+        # Строка из трёх чисел занимает в памяти около 170 байт
+        for rows_count, expected_spill in ((memory_limit // 200, False), (memory_limit // 100, True)):
+            with self.subTest(pattern=rows_count):
+                tracemalloc.start()
+
+                try:
+                    # Operate
+                    baseline_memory: int = tracemalloc.get_traced_memory()[0]
+                    instance = tested_cls(rows=generate_rows(rows_count=rows_count), memory_limit=memory_limit)
+                    used_memory: int = tracemalloc.get_traced_memory()[0] - baseline_memory
+                finally:
+                    tracemalloc.stop()
+
+                with instance:
+                    # Check
+                    self.assertEqual(
+                        first=len(instance),
+                        second=rows_count
+                    )
+
+                    # Check: строки в памяти не превышают лимит, иначе результат перенесён в файл
+                    if not instance.is_spilled():
+                        self.assertLessEqual(
+                            a=used_memory,
+                            b=memory_limit
+                        )
+
+                    self.assertEqual(
+                        first=instance.is_spilled(),
+                        second=expected_spill
+                    )
+
+    # -----------------------------------------------------------------------------------
+    def test_getitem_behavior_restores_row_factory_types_after_spill(self) -> None:
+        # Build
+        Row = namedtuple('Row', ('id', 'title'))
+        named_rows: List[Any] = [Row(index, 'berry') for index in range(5)]
+        dict_rows: List[Any] = [{'id': index, 'title': 'berry'} for index in range(5)]
+
+        # Operate
+        with tested_cls(rows=named_rows, memory_limit=1) as named_instance, \
+                tested_cls(rows=dict_rows, memory_limit=1) as dict_instance:
+            # Check
+            self.assertEqual(
+                first=named_instance[3].title,
+                second='berry'
+            )
+            self.assertIsInstance(
+                obj=named_instance[3],
+                cls=Row
+            )
+            self.assertDictEqual(
+                d1=dict_instance[2],
+                d2={'id': 2, 'title': 'berry'}
+            )
+
+
+# _______________________________________________________________________________________
+class TestComponentNegative(TestCase):
+
+    # -----------------------------------------------------------------------------------
+    def test_constructor_behavior_when_pass_invalid_arguments(self) -> None:
+        # Check
+        with self.assertRaises(expected_exception=InvalidArgumentTypeError):
+            # Operate
+            tested_cls(rows=[], memory_limit='1MB')
+
+        # Check
+        with self.assertRaises(expected_exception=InvalidArgumentValueError):
+            # Operate
+            tested_cls(rows=[], memory_limit=0)
+
+    # -----------------------------------------------------------------------------------
+    def test_getitem_behavior_when_index_is_out_of_range_or_set_is_closed(self) -> None:
+        # Build
+        instance = tested_cls(rows=[(1,), (2,)], memory_limit=1)
+
+        # Check
+        with self.assertRaises(expected_exception=IndexError):
+            # Operate
+            instance[2]
+
+        # Operate
+        instance.close()
+
+        # Check
+        with self.assertRaises(expected_exception=OperationFailedComponentIsClosed):
+            # Operate
+            instance[0]
@@ -10,7 +10,7 @@ __all__: list[str] = [
 ]
 
 __author__ = 'kichiro-kun (Kei)'
-__version__ = '0.2.2'
+__version__ = '0.4.0'
 
 # ========================================================================================
 from unittest import TestCase
@@ -32,8 +32,12 @@ class TestExceptionList(TestCase):
         cls.__exception_list: List[Type[Exception]] = [
             UnsupportedLogLevelError,
             InvalidArgumentTypeError,
+            InvalidArgumentValueError,
             OperationFailedConnectionIsNotActive,
             IsNullObjectOperation,
+            TransactionRetryLimitExceeded,
+            OperationFailedComponentIsClosed,
+            OperationFailedQueueIsFull,
         ]
 
     # -----------------------------------------------------------------------------------
@@ -88,3 +92,51 @@ class TestExceptionList(TestCase):
                 first=str(actual_msg),
                 second=expected_msg
             )
+
+    # -----------------------------------------------------------------------------------
+    def test_check_exception_returns_expected_default_message_3(self) -> None:
+        # Build
+        exception = TransactionRetryLimitExceeded
+        expected_msg: str = "Failure! Transaction retry limit is exceeded!"
+
+        # Operate
+        try:
+            raise exception()
+        except Exception as actual_msg:
+            # Check
+            self.assertEqual(
+                first=str(actual_msg),
+                second=expected_msg
+            )
+
+    # -----------------------------------------------------------------------------------
+    def test_check_exception_returns_expected_default_message_4(self) -> None:
+        # Build
+        exception = OperationFailedComponentIsClosed
+        expected_msg: str = "Failure! Component is already closed!"
+
+        # Operate
+        try:
+            raise exception()
+        except Exception as actual_msg:
+            # Check
+            self.assertEqual(
+                first=str(actual_msg),
+                second=expected_msg
+            )
+
+    # -----------------------------------------------------------------------------------
+    def test_check_exception_returns_expected_default_message_5(self) -> None:
+        # Build
+        exception = OperationFailedQueueIsFull
+        expected_msg: str = "Failure! Queue is full!"
+
+        # Operate
+        try:
+            raise exception()
+        except Exception as actual_msg:
+            # Check
+            self.assertEqual(
+                first=str(actual_msg),
+                second=expected_msg
+            )